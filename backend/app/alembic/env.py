@@ -27,6 +27,13 @@ target_metadata = MappedBase.metadata
 from app.config.setting import settings
 config.set_main_option("sqlalchemy.url", settings.ASYNC_DB_URI)
 
+from app.core.text_search import TextSearch
+
+
+def include_name(name, type_, parent_names) -> bool:
+    """全文检索索引不在 ORM 元数据中，由 TextSearch.upgrade/downgrade 维护，autogenerate 时忽略"""
+    return not TextSearch.is_search_object(name, type_)
+
 
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
@@ -50,6 +57,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_name=include_name,
     )
 
     with context.begin_transaction():
@@ -80,6 +88,7 @@ def run_migrations_online() -> None:
             target_metadata=target_metadata,
             compare_type=True,
             compare_server_default=True,
+            include_name=include_name,
         )
 
         with context.begin_transaction():
@@ -1,14 +1,18 @@
 # -*- coding: utf-8 -*-
 
-from fastapi import APIRouter, Depends, Path, Body, WebSocket
+from typing import Optional
+from fastapi import APIRouter, Depends, Path, Body, Query, WebSocket
 from fastapi.responses import JSONResponse, StreamingResponse
 
 from app.common.response import StreamResponse, SuccessResponse
 from app.common.request import PaginationService
 from app.core.base_params import PaginationQueryParam
 from app.core.dependencies import AuthPermission
+from app.core.exceptions import CustomException
 from app.core.router_class import OperationLogRoute
 from app.core.logger import logger
+from app.core.security import decode_session_token
+from app.core.session_store import SessionStore
 from app.api.v1.module_system.auth.schema import AuthSchema
 from .param import McpQueryParam
 from .service import McpService
@@ -35,12 +39,16 @@ async def chat_controller(
     user_name = auth.user.name if auth.user else "未知用户"
     logger.info(f"用户 {user_name} 发起智能对话: {query.message[:50]}...")
     
+    user_key = f"user:{auth.user.id}" if auth.user else "user:anonymous"
+
     async def generate_response():
         try:
-            async for chunk in McpService.chat_query(query=query):
+            async for chunk in McpService.chat_query(query=query, user_key=user_key):
                 # 确保返回的是字节串
                 if chunk:
                     yield chunk.encode('utf-8') if isinstance(chunk, str) else chunk
+        except CustomException as e:
+            yield e.msg.encode('utf-8')
         except Exception as e:
             logger.error(f"流式响应出错: {str(e)}")
             yield f"抱歉，处理您的请求时出现了错误: {str(e)}".encode('utf-8')
@@ -152,24 +160,65 @@ async def delete_controller(
     return SuccessResponse(msg="删除 MCP 服务器成功")
 
 
+async def _websocket_user_key(websocket: WebSocket, token: Optional[str]) -> str:
+    """
+    获取 WebSocket 连接的并发限制标识
+
+    携带有效访问令牌时按用户计数(与 HTTP 对话共用名额)，否则按客户端真实地址计数。
+    经反向代理时 websocket.client 为代理地址，需取代理写入的 X-Real-IP / X-Forwarded-For。
+
+    参数:
+    - websocket (WebSocket): WebSocket 连接。
+    - token (Optional[str]): 访问令牌。
+
+    返回:
+    - str: 并发限制标识。
+    """
+    if token:
+        try:
+            payload, user_info = decode_session_token(token.removeprefix('Bearer').strip())
+            session_id = user_info.get("session_id")
+            user_id = user_info.get("user_id")
+            if not payload.is_refresh and session_id and user_id:
+                access_jti = await SessionStore.get_access_jti(redis=websocket.app.state.redis, session_id=session_id)
+                if access_jti == payload.jti:
+                    return f"user:{user_id}"
+        except CustomException:
+            pass
+
+    # X-Real-IP 由代理以 $remote_addr 覆盖写入，客户端无法伪造；X-Forwarded-For 取第一个地址
+    client_ip = websocket.headers.get('X-Real-IP')
+    if not client_ip:
+        x_forwarded_for = websocket.headers.get('X-Forwarded-For')
+        if x_forwarded_for:
+            client_ip = x_forwarded_for.split(',')[0].strip()
+    if not client_ip:
+        client_ip = websocket.client.host if websocket.client else "unknown"
+    return f"ws:{client_ip}"
+
+
 @AIRouter.websocket("/ws/chat", name="WebSocket聊天")
 async def websocket_chat_controller(
     websocket: WebSocket,
+    token: Optional[str] = Query(None, description="访问令牌(可选)，携带时按用户限制并发"),
 ):
     """
     WebSocket聊天接口
     
-    ws://127.0.0.1:8001/api/v1/ai/mcp/ws/chat
+    ws://127.0.0.1:8001/api/v1/ai/mcp/ws/chat?token=<访问令牌>
     """
     await websocket.accept()
+    user_key = await _websocket_user_key(websocket, token)
     try:
         while True:
             data = await websocket.receive_text()
             # 流式发送响应
             try:
-                async for chunk in McpService.chat_query(query=ChatQuerySchema(message=data)):
+                async for chunk in McpService.chat_query(query=ChatQuerySchema(message=data), user_key=user_key):
                     if chunk:
                         await websocket.send_text(chunk)
+            except CustomException as e:
+                await websocket.send_text(e.msg)
             except Exception as e:
                 logger.error(f"处理聊天查询出错: {str(e)}")
                 await websocket.send_text(f"抱歉，处理您的请求时出现了错误: {str(e)}")
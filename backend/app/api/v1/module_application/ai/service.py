@@ -109,22 +109,21 @@ class McpService:
         await McpCRUD(auth).delete_crud(ids=ids)
     
     @classmethod
-    async def chat_query(cls, query: ChatQuerySchema):
+    async def chat_query(cls, query: ChatQuerySchema, user_key: str):
         """
         处理聊天查询
         
         参数:
         - query (ChatQuerySchema): 聊天查询模型
+        - user_key (str): 用户标识，用于限制单用户并发对话数
         
         返回:
-        - AsyncGenerator[str, None]: 异步生成器,每次返回一个聊天响应
+        - AsyncGenerator[str, None]: 异步生成器,每次返回一段合并后的聊天响应
+        
+        异常:
+        - CustomException: 用户并发对话数超限时抛出
         """
-        # 创建MCP客户端实例
-        mcp_client = AIClient()
-        try:
-            # 处理消息
-            async for response in mcp_client.process(query.message):
+        # 复用应用级共享客户端，不再逐请求建立连接
+        async with AIClient.acquire(user_key):
+            async for response in AIClient.process(query.message):
                 yield response
-        finally:
-            # 确保关闭客户端连接
-            await mcp_client.close()
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+from typing import Optional
 from fastapi import APIRouter, Body, Depends, Path, Query
 from fastapi.responses import JSONResponse, StreamingResponse
 
@@ -166,6 +167,30 @@ async def clear_obj_log_controller(
     logger.info(f"清空定时任务成功")
     return SuccessResponse(msg="清空定时任务成功")
 
+@JobRouter.get("/preview", summary="预览定时任务执行时间", description="预览触发器的后 N 次执行时间", dependencies=[Depends(AuthPermission(["app:job:query"]))])
+async def preview_job_controller(
+    trigger: str = Query(..., description="触发器类型 date/interval/cron"),
+    trigger_args: str = Query(..., description="触发器参数"),
+    start_date: Optional[str] = Query(None, description="开始时间"),
+    end_date: Optional[str] = Query(None, description="结束时间"),
+    count: int = Query(5, ge=1, le=50, description="预览次数")
+) -> JSONResponse:
+    """
+    预览定时任务执行时间
+    
+    参数:
+    - trigger (str): 触发器类型 date/interval/cron
+    - trigger_args (str): 触发器参数
+    - start_date (Optional[str]): 开始时间
+    - end_date (Optional[str]): 结束时间
+    - count (int): 预览次数
+    
+    返回:
+    - JSONResponse: 包含后 N 次执行时间的JSON响应
+    """
+    data = await JobService.preview_job_service(trigger=trigger, trigger_args=trigger_args, start_date=start_date, end_date=end_date, count=count)
+    return SuccessResponse(msg="预览定时任务执行时间成功", data=data)
+
 @JobRouter.put("/option", summary="暂停/恢复/重启定时任务", description="暂停/恢复/重启定时任务")
 async def option_obj_controller(
     id: int = Body(..., description="定时任务ID"),
@@ -217,6 +242,18 @@ async def get_job_log_controller():
     return SuccessResponse(msg="获取定时任务日志成功", data=data)
 
 
+@JobRouter.get("/metrics", summary="获取定时任务运行指标", description="获取调度执行器排队/执行耗时与任务错过触发、超时次数", dependencies=[Depends(AuthPermission(["app:job:query"]))])
+async def get_job_metrics_controller() -> JSONResponse:
+    """
+    获取定时任务运行指标(主节点发布，非主节点读取最近一次发布的指标)
+    
+    返回:
+    - JSONResponse: 包含执行器与任务运行指标的JSON响应
+    """
+    data = await JobService.get_job_metrics_service()
+    return SuccessResponse(msg="获取定时任务运行指标成功", data=data)
+
+
 # 定时任务日志管理接口
 @JobRouter.get("/log/detail/{id}", summary="获取定时任务日志详情", description="获取定时任务日志详情")
 async def get_job_log_detail_controller(
@@ -255,9 +292,14 @@ async def get_job_log_list_controller(
     返回:
     - JSONResponse: 查询定时任务日志列表的JSON响应
     """
-    order_by = [{"create_time": "desc"}]
-    result_dict_list = await JobLogService.get_job_log_list_service(auth=auth, search=search, order_by=order_by)
-    result_dict = await PaginationService.paginate(data_list=result_dict_list, page_no=page.page_no, page_size=page.page_size)
+    order_by = [{"id": "desc"}]
+    result_dict = await JobLogService.get_job_log_page_service(
+        auth=auth,
+        page_no=page.page_no if page.page_no is not None else 1,
+        page_size=page.page_size if page.page_size is not None else 10,
+        search=search,
+        order_by=order_by
+    )
     logger.info(f"查询定时任务日志列表成功")
     return SuccessResponse(data=result_dict, msg="查询定时任务日志列表成功")
 
@@ -1,11 +1,12 @@
 # -*- coding: utf-8 -*-
 
 from typing import Dict, List, Optional, Sequence, Union, Any
+from sqlalchemy import delete
 
 from app.core.base_crud import CRUDBase
 from app.api.v1.module_system.auth.schema import AuthSchema
-from .model import JobModel, JobLogModel
-from .schema import JobCreateSchema,JobUpdateSchema,JobLogCreateSchema,JobLogUpdateSchema
+from .model import JobModel, JobLogModel, JobStatsModel
+from .schema import JobCreateSchema,JobUpdateSchema,JobLogCreateSchema,JobLogUpdateSchema,JobLogOutSchema
 
 
 class JobCRUD(CRUDBase[JobModel, JobCreateSchema, JobUpdateSchema]):
@@ -101,6 +102,19 @@ class JobCRUD(CRUDBase[JobModel, JobCreateSchema, JobUpdateSchema]):
         """
         return await self.clear()
 
+    async def delete_obj_stats_crud(self, ids: Optional[List[int]] = None) -> None:
+        """
+        删除定时任务执行统计
+        
+        参数:
+        - ids (Optional[List[int]]): 定时任务ID列表,为空时删除全部统计
+        """
+        sql = delete(JobStatsModel)
+        if ids is not None:
+            sql = sql.where(JobStatsModel.job_id.in_(ids))
+        await self.db.execute(sql)
+        await self.db.flush()
+
 
 class JobLogCRUD(CRUDBase[JobLogModel, JobLogCreateSchema, JobLogUpdateSchema]):
     """定时任务日志数据层"""
@@ -141,6 +155,27 @@ class JobLogCRUD(CRUDBase[JobLogModel, JobLogCreateSchema, JobLogUpdateSchema]):
         - Sequence[JobLogModel]: 定时任务日志模型序列
         """
         return await self.list(search=search, order_by=order_by, preload=preload)
+
+    async def page_obj_log_crud(self, offset: int, limit: int, order_by: Optional[List[Dict[str, str]]] = None, search: Optional[Dict] = None) -> Dict:
+        """
+        分页查询定时任务日志(数据库分页)
+        
+        参数:
+        - offset (int): 偏移量
+        - limit (int): 每页数量
+        - order_by (Optional[List[Dict[str, str]]]): 排序参数列表
+        - search (Optional[Dict]): 查询参数字典
+        
+        返回:
+        - Dict: 分页数据
+        """
+        return await self.page(
+            offset=offset,
+            limit=limit,
+            order_by=order_by or [{'id': 'desc'}],
+            search=search or {},
+            out_schema=JobLogOutSchema
+        )
     
     async def delete_obj_log_crud(self, ids: List[int]) -> None:
         """
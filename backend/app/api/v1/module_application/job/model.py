@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import Boolean, String, Integer, Text, ForeignKey, DateTime
+from sqlalchemy import Boolean, String, Integer, Text, ForeignKey, DateTime, Float
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.base_model import CreatorMixin, MappedBase
@@ -14,7 +14,7 @@ class JobModel(CreatorMixin):
     """
     __tablename__ = 'app_job'
     __table_args__ = ({'comment': '定时任务调度表'})
-    __loader_options__ = ["job_logs", "creator"]
+    __loader_options__ = ["stats", "creator"]
 
     name: Mapped[Optional[str]] = mapped_column(String(64), nullable=True, default='', comment='任务名称')
     jobstore: Mapped[Optional[str]] = mapped_column(String(64), nullable=True, default='default', comment='存储器')
@@ -26,10 +26,31 @@ class JobModel(CreatorMixin):
     kwargs: Mapped[Optional[str]] = mapped_column(Text, nullable=True, comment='关键字参数')
     coalesce: Mapped[bool] = mapped_column(Boolean, nullable=True, default=False, comment='是否合并运行:是否在多个运行时间到期时仅运行作业一次')
     max_instances: Mapped[int] = mapped_column(Integer, nullable=True, default=1, comment='最大实例数:允许的最大并发执行实例数 工作')
+    timeout: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, comment='超时时间(秒):超时后取消本次执行，为空不限制')
     start_date: Mapped[Optional[str]] = mapped_column(String(64), nullable=True, comment='开始时间')
     end_date: Mapped[Optional[str]] = mapped_column(String(64), nullable=True, comment='结束时间')
     status: Mapped[bool] = mapped_column(Boolean(), default=True, nullable=False, comment="是否启用(True:启用 False:禁用)")
-    job_logs: Mapped[Optional[list['JobLogModel']]] = relationship(back_populates="job", lazy="selectin")
+    # 执行历史可能非常大，只能通过日志分页接口访问，不随任务加载
+    job_logs: Mapped[Optional[list['JobLogModel']]] = relationship(back_populates="job", lazy="noload")
+    stats: Mapped[Optional['JobStatsModel']] = relationship(lazy="selectin", uselist=False, viewonly=True)
+
+
+class JobStatsModel(MappedBase):
+    """
+    定时任务执行统计表(每个任务一行，任务执行结束时增量更新)
+    """
+    __tablename__ = 'app_job_stats'
+    __table_args__ = ({'comment': '定时任务执行统计表'})
+
+    job_id: Mapped[int] = mapped_column(ForeignKey('app_job.id', ondelete='CASCADE'), primary_key=True, comment='任务ID')
+    last_run_time: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True, comment='最近执行时间')
+    last_status: Mapped[Optional[bool]] = mapped_column(Boolean(), nullable=True, comment='最近执行状态(True:成功 False:失败)')
+    last_duration: Mapped[Optional[float]] = mapped_column(Float, nullable=True, comment='最近执行耗时(毫秒)')
+    success_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, comment='成功次数')
+    failure_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, comment='失败次数')
+    p50_duration: Mapped[Optional[float]] = mapped_column(Float, nullable=True, comment='耗时P50(毫秒)')
+    p95_duration: Mapped[Optional[float]] = mapped_column(Float, nullable=True, comment='耗时P95(毫秒)')
+    duration_histogram: Mapped[Optional[str]] = mapped_column(Text, nullable=True, comment='耗时直方图(JSON分桶计数，用于增量计算分位数)')
 
 
 class JobLogModel(MappedBase):
@@ -38,7 +59,6 @@ class JobLogModel(MappedBase):
     """
     __tablename__ = 'app_job_log'
     __table_args__ = ({'comment': '定时任务调度日志表'})
-    __loader_options__ = ["job"]
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True, comment='主键ID')
     job_name: Mapped[str] = mapped_column(String(64),nullable=False,comment='任务名称')
@@ -54,4 +74,4 @@ class JobLogModel(MappedBase):
     status: Mapped[bool] = mapped_column(Boolean(), default=True, nullable=False, comment="是否启用(True:启用 False:禁用)")
     create_time: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True, default=datetime.now, comment='创建时间')
     # 任务关联关系
-    job: Mapped[Optional["JobModel"]] = relationship(back_populates="job_logs", lazy="selectin")
\ No newline at end of file
+    job: Mapped[Optional["JobModel"]] = relationship(back_populates="job_logs", lazy="noload")
\ No newline at end of file
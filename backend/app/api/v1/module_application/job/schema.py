@@ -20,6 +20,7 @@ class JobCreateSchema(BaseModel):
     max_instances: Optional[int] = Field(default=1, ge=1, description='最大实例数:允许的最大并发执行实例数')
     jobstore: Optional[str] = Field(..., max_length=64, description='任务存储')
     executor: Optional[str] = Field(..., max_length=64, description='任务执行器:将运行此作业的执行程序的名称')
+    timeout: Optional[int] = Field(default=None, ge=1, description='超时时间(秒):超时后取消本次执行，为空不限制')
     trigger_args: Optional[str] = Field(default=None, description='触发器参数')
     start_date: Optional[str] = Field(default=None, description='开始时间')
     end_date: Optional[str] = Field(default=None, description='结束时间')
@@ -45,9 +46,10 @@ class JobCreateSchema(BaseModel):
                         data[bkey] = False
                 elif isinstance(val, int):
                     data[bkey] = bool(val)
-            val = data.get('max_instances')
-            if isinstance(val, str) and val.strip().isdigit():
-                data['max_instances'] = int(val.strip())
+            for ikey in ('max_instances', 'timeout'):
+                val = data.get(ikey)
+                if isinstance(val, str) and val.strip().isdigit():
+                    data[ikey] = int(val.strip())
         return data
 
     @field_validator('trigger')
@@ -59,6 +61,15 @@ class JobCreateSchema(BaseModel):
             raise ValueError('触发器必须为 cron/interval/date')
         return v
 
+    @field_validator('executor')
+    @classmethod
+    def _validate_executor(cls, v: Optional[str]) -> Optional[str]:
+        # default/processpool 为历史名称，加载时分别解析为 async|io-thread 与 cpu-process
+        allowed = {'async', 'io-thread', 'cpu-process', 'default', 'processpool'}
+        if v and v not in allowed:
+            raise ValueError('执行器必须为 async/io-thread/cpu-process')
+        return v
+
     @model_validator(mode='after')
     def _validate_dates(self):
         """跨字段校验：结束时间不得早于开始时间。"""
@@ -78,10 +89,24 @@ class JobUpdateSchema(JobCreateSchema):
     ...
     
 
+class JobStatsOutSchema(BaseModel):
+    """定时任务执行统计响应模型"""
+    model_config = ConfigDict(from_attributes=True)
+
+    last_run_time: Optional[DateTimeStr] = Field(default=None, description='最近执行时间')
+    last_status: Optional[bool] = Field(default=None, description='最近执行状态')
+    last_duration: Optional[float] = Field(default=None, description='最近执行耗时(毫秒)')
+    success_count: int = Field(default=0, description='成功次数')
+    failure_count: int = Field(default=0, description='失败次数')
+    p50_duration: Optional[float] = Field(default=None, description='耗时P50(毫秒)')
+    p95_duration: Optional[float] = Field(default=None, description='耗时P95(毫秒)')
+
+
 class JobOutSchema(JobCreateSchema, BaseSchema):
     """定时任务响应模型"""
     model_config = ConfigDict(from_attributes=True)
-    ...
+    
+    stats: Optional[JobStatsOutSchema] = Field(default=None, description='执行统计')
 
 
 class JobLogCreateSchema(BaseModel):
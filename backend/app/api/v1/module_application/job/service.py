@@ -3,6 +3,7 @@
 from typing import Any, List, Dict, Optional
 
 from app.core.ap_scheduler import SchedulerUtil
+from app.core.scheduler_leader import SchedulerLeader
 from app.core.exceptions import CustomException
 from app.utils.cron_util import CronUtil
 from app.utils.excel_util import ExcelUtil
@@ -48,6 +49,47 @@ class JobService:
         obj_list = await JobCRUD(auth).get_obj_list_crud(search=search.__dict__, order_by=order_by)
         return [JobOutSchema.model_validate(obj).model_dump() for obj in obj_list]
     
+    @classmethod
+    def _validate_trigger(cls, data: JobCreateSchema) -> None:
+        """
+        校验触发器参数(与调度时使用同一解析器)
+        
+        参数:
+        - data (JobCreateSchema): 定时任务创建/更新模型
+        
+        异常:
+        - CustomException: 触发器参数不合法时抛出
+        """
+        if not data.trigger_args:
+            raise CustomException(msg=f'定时任务{data.name}缺少触发器参数')
+        try:
+            SchedulerUtil.build_trigger(data.trigger, data.trigger_args, data.start_date, data.end_date)
+        except Exception as e:
+            raise CustomException(msg=f'定时任务{data.name}触发器参数不正确: {str(e)}')
+        if data.trigger == 'cron' and not CronUtil.validate_cron_expression(data.trigger_args):
+            raise CustomException(msg=f'定时任务{data.name}触发器参数不正确: Cron表达式在2099年前没有触发时间')
+
+    @classmethod
+    async def preview_job_service(cls, trigger: str, trigger_args: str, start_date: Optional[str] = None, end_date: Optional[str] = None, count: int = 5) -> List[str]:
+        """
+        预览触发器的后 N 次执行时间
+        
+        参数:
+        - trigger (str): 触发器类型 date/interval/cron
+        - trigger_args (str): 触发器参数
+        - start_date (Optional[str]): 开始时间
+        - end_date (Optional[str]): 结束时间
+        - count (int): 预览次数
+        
+        返回:
+        - List[str]: 执行时间字符串列表
+        """
+        try:
+            fire_times = SchedulerUtil.preview_fire_times(trigger, trigger_args, start_date, end_date, count)
+        except Exception as e:
+            raise CustomException(msg=f'触发器参数不正确: {str(e)}')
+        return [fire_time.strftime('%Y-%m-%d %H:%M:%S') for fire_time in fire_times]
+
     @classmethod
     async def create_job_service(cls, auth: AuthSchema, data: JobCreateSchema) -> Dict:
         """
@@ -63,11 +105,12 @@ class JobService:
         exist_obj = await JobCRUD(auth).get(name=data.name)
         if exist_obj:
             raise CustomException(msg='创建失败，该定时任务已存在')
+        cls._validate_trigger(data)
         
         obj = await JobCRUD(auth).create_obj_crud(data=data)
         if not obj:
             raise CustomException(msg='创建失败，该数据定时任务不存在')
-        SchedulerUtil().add_job(job_info=obj)
+        await SchedulerLeader.dispatch('add', job_id=obj.id, job_info=obj, db=auth.db)
         return JobOutSchema.model_validate(obj).model_dump()
     
     @classmethod
@@ -86,12 +129,11 @@ class JobService:
         exist_obj = await JobCRUD(auth).get_obj_by_id_crud(id=id)
         if not exist_obj:
             raise CustomException(msg='更新失败，该定时任务不存在')
-        if data.trigger == 'cron' and data.trigger_args and not CronUtil.validate_cron_expression(data.trigger_args):
-            raise CustomException(msg=f'新增定时任务{data.name}失败, Cron表达式不正确')
+        cls._validate_trigger(data)
         obj = await JobCRUD(auth).update_obj_crud(id=id, data=data)
         if not obj:
             raise CustomException(msg='更新失败，该数据定时任务不存在')
-        SchedulerUtil().modify_job(job_id=obj.id)
+        await SchedulerLeader.dispatch('modify', job_id=obj.id, job_info=obj, db=auth.db)
         return JobOutSchema.model_validate(obj).model_dump()
     
     @classmethod
@@ -113,7 +155,8 @@ class JobService:
             if obj:
                 raise CustomException(msg=f'删除失败，该定时任务存 {exist_obj.name} 在日志记录')
 
-            SchedulerUtil.remove_job(job_id=id)
+            await SchedulerLeader.dispatch('remove', job_id=id, db=auth.db)
+        await JobCRUD(auth).delete_obj_stats_crud(ids=ids)
         await JobCRUD(auth).delete_obj_crud(ids=ids)
         
 
@@ -125,8 +168,9 @@ class JobService:
         参数:
         - auth (AuthSchema): 认证信息模型
         """
-        SchedulerUtil().clear_jobs()
+        await SchedulerLeader.dispatch('clear', db=auth.db)
         await JobLogCRUD(auth).clear_obj_log_crud()
+        await JobCRUD(auth).delete_obj_stats_crud()
         await JobCRUD(auth).clear_obj_crud()
 
     @classmethod
@@ -144,15 +188,25 @@ class JobService:
         if not obj:
             raise CustomException(msg='操作失败，该数据定时任务不存在')
         if option == 1:
-            SchedulerUtil().pause_job(job_id=id)
+            await SchedulerLeader.dispatch('pause', job_id=id, db=auth.db)
             await JobCRUD(auth).set_obj_field_crud(ids=[id], status=False)
         elif option == 2:
-            SchedulerUtil().resume_job(job_id=id)
+            await SchedulerLeader.dispatch('resume', job_id=id, db=auth.db)
             await JobCRUD(auth).set_obj_field_crud(ids=[id], status=True)
         # elif option == 3:
         #     SchedulerUtil().reschedule_job(job_id=id)
         #     await JobCRUD(auth).set_obj_field_crud(ids=[id], status=False)
 
+    @classmethod
+    async def get_job_metrics_service(cls) -> Dict:
+        """
+        获取定时任务运行指标(由主节点发布，任意进程均可读取)
+        
+        返回:
+        - Dict: 当前节点状态、主节点令牌与采集时间、各执行器指标(排队/执行中/耗时)与各任务指标(错过触发/实例数已满/超时)
+        """
+        return {'node': SchedulerLeader.get_status(), **await SchedulerLeader.get_metrics()}
+
     @classmethod
     async def export_job_service(cls, data_list: List[Dict[str, Any]]) -> bytes:
         """
@@ -229,6 +283,29 @@ class JobLogService:
         """
         obj_list = await JobLogCRUD(auth).get_obj_log_list_crud(search=search.__dict__, order_by=order_by)
         return [JobLogOutSchema.model_validate(obj).model_dump() for obj in obj_list]
+
+    @classmethod
+    async def get_job_log_page_service(cls, auth: AuthSchema, page_no: int, page_size: int, search: Optional[JobLogQueryParam] = None, order_by: Optional[List[Dict[str, str]]] = None) -> Dict:
+        """
+        分页查询定时任务日志(在数据库中分页，避免加载全部执行历史)
+        
+        参数:
+        - auth (AuthSchema): 认证信息模型
+        - page_no (int): 页码
+        - page_size (int): 每页数量
+        - search (Optional[JobLogQueryParam]): 查询参数模型
+        - order_by (Optional[List[Dict[str, str]]]): 排序参数列表
+        
+        返回:
+        - Dict: 分页数据
+        """
+        offset = (page_no - 1) * page_size
+        return await JobLogCRUD(auth).page_obj_log_crud(
+            offset=offset,
+            limit=page_size,
+            order_by=order_by,
+            search=search.__dict__ if search else None
+        )
     
     @classmethod
     async def delete_job_log_service(cls, auth: AuthSchema, ids: list[int]) -> None:
@@ -255,11 +332,9 @@ class JobLogService:
         参数:
         - auth (AuthSchema): 认证信息模型
         """
-        # 获取所有日志ID并批量删除
-        all_logs = await JobLogCRUD(auth).get_obj_log_list_crud()
-        if all_logs:
-            ids = [log.id for log in all_logs]
-            await JobLogCRUD(auth).delete_obj_log_crud(ids=ids)
+        # 直接清空日志表与执行统计，避免加载全部执行历史
+        await JobLogCRUD(auth).clear_obj_log_crud()
+        await JobCRUD(auth).delete_obj_stats_crud()
 
     @classmethod
     async def export_job_log_service(cls, data_list: List[Dict[str, Any]]) -> bytes:
@@ -1,14 +1,19 @@
 # -*- coding: utf-8 -*-
 
 from pathlib import Path
+from typing import Optional
 from fastapi import APIRouter, BackgroundTasks, Body, Depends, UploadFile, Request
+from fastapi import Path as PathParam, Query
 from fastapi.responses import JSONResponse, FileResponse
+from redis.asyncio.client import Redis
 
-from app.core.dependencies import AuthPermission
+from app.core.dependencies import AuthPermission, redis_getter
 from app.core.router_class import OperationLogRoute
 from app.core.logger import logger
 from app.common.response import SuccessResponse, UploadFileResponse
 from app.utils.upload_util import UploadUtil
+from app.api.v1.module_system.auth.schema import AuthSchema
+from .schema import ChunkUploadInitSchema
 from .service import FileService
 
 FileRouter = APIRouter(route_class=OperationLogRoute, prefix="/file", tags=["文件管理"])
@@ -32,6 +37,124 @@ async def upload_controller(
     logger.info(f"上传文件成功 {result_dict}")
     return SuccessResponse(data=result_dict, msg="上传文件成功")
 
+@FileRouter.post("/chunk/init", summary="初始化分片上传", description="初始化分片上传，当前用户已上传相同文件时秒传，未完成的相同文件返回已上传分片")
+async def chunk_init_controller(
+    data: ChunkUploadInitSchema,
+    request: Request,
+    redis: Redis = Depends(redis_getter),
+    auth: AuthSchema = Depends(AuthPermission(["common:file:upload"])),
+) -> JSONResponse:
+    """
+    初始化分片上传
+    
+    参数:
+    - data (ChunkUploadInitSchema): 文件名称、大小与SHA-256
+    - request (Request): 请求对象
+    - redis (Redis): Redis连接
+    - auth (AuthSchema): 认证信息模型
+    
+    返回:
+    - JSONResponse: 包含分片上传任务状态的JSON响应
+    """
+    result_dict = await FileService.chunk_init_service(redis=redis, base_url=str(request.base_url), data=data, user_id=auth.user.id)
+    return SuccessResponse(data=result_dict, msg="初始化分片上传成功")
+
+@FileRouter.get("/chunk/{upload_id}", summary="查询分片上传", description="查询分片上传任务已上传的分片")
+async def chunk_status_controller(
+    upload_id: str = PathParam(..., description="上传任务ID"),
+    redis: Redis = Depends(redis_getter),
+    auth: AuthSchema = Depends(AuthPermission(["common:file:upload"])),
+) -> JSONResponse:
+    """
+    查询分片上传任务状态
+    
+    参数:
+    - upload_id (str): 上传任务ID
+    - redis (Redis): Redis连接
+    - auth (AuthSchema): 认证信息模型
+    
+    返回:
+    - JSONResponse: 包含分片上传任务状态的JSON响应
+    """
+    result_dict = await FileService.chunk_status_service(redis=redis, upload_id=upload_id, user_id=auth.user.id)
+    return SuccessResponse(data=result_dict, msg="查询分片上传成功")
+
+@FileRouter.put("/chunk/{upload_id}/{index}", summary="上传分片", description="以原始请求体上传单个分片(application/octet-stream)")
+async def upload_chunk_controller(
+    request: Request,
+    upload_id: str = PathParam(..., description="上传任务ID"),
+    index: int = PathParam(..., ge=0, description="分片序号(从0开始)"),
+    checksum: Optional[str] = Query(None, description="分片SHA-256"),
+    redis: Redis = Depends(redis_getter),
+    auth: AuthSchema = Depends(AuthPermission(["common:file:upload"])),
+) -> JSONResponse:
+    """
+    上传分片
+    
+    参数:
+    - request (Request): 请求对象(请求体为分片数据)
+    - upload_id (str): 上传任务ID
+    - index (int): 分片序号
+    - checksum (Optional[str]): 分片SHA-256
+    - redis (Redis): Redis连接
+    - auth (AuthSchema): 认证信息模型
+    
+    返回:
+    - JSONResponse: 包含分片上传任务状态的JSON响应
+    """
+    result_dict = await FileService.chunk_upload_service(
+        redis=redis,
+        upload_id=upload_id,
+        user_id=auth.user.id,
+        index=index,
+        stream=request.stream(),
+        checksum=checksum
+    )
+    return SuccessResponse(data=result_dict, msg="上传分片成功")
+
+@FileRouter.post("/chunk/{upload_id}/complete", summary="完成分片上传", description="合并分片并校验文件")
+async def chunk_complete_controller(
+    request: Request,
+    upload_id: str = PathParam(..., description="上传任务ID"),
+    redis: Redis = Depends(redis_getter),
+    auth: AuthSchema = Depends(AuthPermission(["common:file:upload"])),
+) -> JSONResponse:
+    """
+    完成分片上传
+    
+    参数:
+    - request (Request): 请求对象
+    - upload_id (str): 上传任务ID
+    - redis (Redis): Redis连接
+    - auth (AuthSchema): 认证信息模型
+    
+    返回:
+    - JSONResponse: 包含上传文件详情的JSON响应
+    """
+    result_dict = await FileService.chunk_complete_service(redis=redis, base_url=str(request.base_url), upload_id=upload_id, user_id=auth.user.id)
+    logger.info(f"分片上传文件成功 {result_dict}")
+    return SuccessResponse(data=result_dict, msg="上传文件成功")
+
+@FileRouter.delete("/chunk/{upload_id}", summary="取消分片上传", description="取消分片上传并清理已上传分片")
+async def chunk_abort_controller(
+    upload_id: str = PathParam(..., description="上传任务ID"),
+    redis: Redis = Depends(redis_getter),
+    auth: AuthSchema = Depends(AuthPermission(["common:file:upload"])),
+) -> JSONResponse:
+    """
+    取消分片上传
+    
+    参数:
+    - upload_id (str): 上传任务ID
+    - redis (Redis): Redis连接
+    - auth (AuthSchema): 认证信息模型
+    
+    返回:
+    - JSONResponse: 操作结果的JSON响应
+    """
+    await FileService.chunk_abort_service(redis=redis, upload_id=upload_id, user_id=auth.user.id)
+    return SuccessResponse(msg="取消分片上传成功")
+
 @FileRouter.post("/download", summary="下载文件", description="下载文件", dependencies=[Depends(AuthPermission(["common:file:download"]))])
 async def download_controller(
     background_tasks: BackgroundTasks,
@@ -53,4 +176,8 @@ async def download_controller(
     if delete:
         background_tasks.add_task(UploadUtil.delete_file, Path(file_path))
     logger.info(f"下载文件成功")
-    return UploadFileResponse(file_path=result.file_path, filename=result.file_name)
+    return UploadFileResponse(
+        file_path=result.file_path,
+        filename=result.file_name,
+        stat_result=result.stat_result
+    )
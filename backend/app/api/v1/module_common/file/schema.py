@@ -1,6 +1,8 @@
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from pydantic.alias_generators import to_camel
-from typing import Optional
+from typing import List, Optional
+
+from app.core.base_schema import UploadResponseSchema
 
 
 class ImportFieldModel(BaseModel):
@@ -74,3 +76,24 @@ class ImportModel(BaseModel):
                     seen.add(key)
         return self
 
+
+class ChunkUploadInitSchema(BaseModel):
+    """分片上传初始化模型"""
+    file_name: str = Field(..., min_length=1, max_length=255, description='原文件名称')
+    file_size: int = Field(..., gt=0, description='文件大小(字节)')
+    file_hash: str = Field(..., pattern=r'^[0-9a-fA-F]{64}$', description='文件SHA-256，用于校验与秒传')
+
+    @field_validator('file_hash')
+    @classmethod
+    def _lower_hash(cls, value: str) -> str:
+        return value.lower()
+
+
+class ChunkUploadOutSchema(BaseModel):
+    """分片上传任务状态模型"""
+    upload_id: Optional[str] = Field(default=None, description='上传任务ID，秒传时为空')
+    chunk_size: int = Field(..., description='分片大小(字节)，最后一片可小于该值')
+    total_chunks: int = Field(..., description='分片总数')
+    uploaded_chunks: List[int] = Field(default_factory=list, description='已上传的分片序号(从0开始)，用于断点续传')
+    finished: bool = Field(default=False, description='是否已完成(秒传命中时为True)')
+    file: Optional[UploadResponseSchema] = Field(default=None, description='已完成时的文件信息')
@@ -1,12 +1,26 @@
 # -*- coding: utf-8 -*-
 
+import os
+import json
+import math
+import uuid
+import hashlib
+from datetime import datetime
 from pathlib import Path
-from typing import Dict
+from typing import AsyncIterator, Dict, Optional
+from urllib.parse import urljoin
+import aiofiles
 from fastapi import UploadFile, BackgroundTasks
+from redis.asyncio.client import Redis
 
+from app.common.enums import RedisInitKeyConfig
+from app.config.setting import settings
 from app.core.exceptions import CustomException
+from app.core.logger import logger
 from app.core.base_schema import UploadResponseSchema, DownloadFileSchema
+from app.utils.fs_util import FsUtil
 from app.utils.upload_util import UploadUtil
+from .schema import ChunkUploadInitSchema, ChunkUploadOutSchema
 
 class FileService:
     """
@@ -60,11 +74,299 @@ class FileService:
         """
         if not file_path:
             raise CustomException(msg="请选择要下载的文件")
-        if not UploadUtil.check_file_exists(file_path):
-            raise CustomException(msg="文件不存在")
-        file_name = UploadUtil.download_file(file_path)
+        file_name, stat_result = await UploadUtil.download_file(file_path)
 
         return DownloadFileSchema(
             file_path=file_path,
-            file_name=str(file_name),
-        )
\ No newline at end of file
+            file_name=file_name,
+            stat_result=stat_result,
+        )
+
+    @staticmethod
+    def _chunk_key(upload_id: str) -> str:
+        return f'{RedisInitKeyConfig.UPLOAD_CHUNK.key}:{upload_id}'
+
+    @staticmethod
+    def _chunk_hash_key(user_id: int, file_hash: str) -> str:
+        return f'{RedisInitKeyConfig.UPLOAD_CHUNK.key}:hash:{user_id}:{file_hash}'
+
+    @staticmethod
+    def _dedup_key(user_id: int, file_hash: str) -> str:
+        # 秒传索引按用户隔离，否则知道哈希与大小即可取得他人文件地址
+        return f'{RedisInitKeyConfig.UPLOAD_HASH.key}:{user_id}:{file_hash}'
+
+    @classmethod
+    async def _get_dedup_file(cls, redis: Redis, user_id: int, file_hash: str, file_size: int, origin_name: str, base_url: str) -> Optional[Dict]:
+        """
+        按文件哈希查找当前用户已上传的相同文件（秒传）。
+        
+        参数:
+        - redis (Redis): Redis 连接。
+        - user_id (int): 当前用户ID。
+        - file_hash (str): 文件 SHA-256。
+        - file_size (int): 文件大小。
+        - origin_name (str): 原文件名称。
+        - base_url (str): 基础访问 URL。
+        
+        返回:
+        - Optional[Dict]: 已存在时返回上传响应字典，否则返回 None。
+        """
+        cached = await redis.get(cls._dedup_key(user_id, file_hash))
+        if not cached:
+            return None
+        info = json.loads(cached)
+        try:
+            st = await FsUtil.run(os.stat, info['file_path'])
+        except OSError:
+            st = None
+        if st is None or st.st_size != file_size:
+            # 文件已被删除或替换，索引失效
+            await redis.delete(cls._dedup_key(user_id, file_hash))
+            return None
+        return UploadResponseSchema(
+            file_path=info['file_path'],
+            file_name=info['file_name'],
+            origin_name=origin_name,
+            file_url=urljoin(base_url, info['file_path']),
+        ).model_dump()
+
+    @classmethod
+    async def _get_chunk_meta(cls, redis: Redis, upload_id: str, user_id: int) -> Dict[str, str]:
+        meta = await redis.hgetall(cls._chunk_key(upload_id))
+        if not meta or meta.get('user_id') != str(user_id):
+            raise CustomException(msg="上传任务不存在或已过期")
+        return meta
+
+    @classmethod
+    async def _chunk_status(cls, redis: Redis, upload_id: str, meta: Dict[str, str]) -> Dict:
+        parts = await redis.smembers(f'{cls._chunk_key(upload_id)}:parts')
+        return ChunkUploadOutSchema(
+            upload_id=upload_id,
+            chunk_size=int(meta['chunk_size']),
+            total_chunks=int(meta['total_chunks']),
+            uploaded_chunks=sorted(int(index) for index in parts),
+        ).model_dump()
+
+    @classmethod
+    async def _clear_chunk_upload(cls, redis: Redis, upload_id: str, meta: Dict[str, str]) -> None:
+        """删除分片上传任务的 Redis 记录与临时分片。"""
+        key = cls._chunk_key(upload_id)
+        keys = [key, f'{key}:parts', f'{key}:lock', cls._chunk_hash_key(meta['user_id'], meta['file_hash'])]
+        await redis.delete(*keys)
+        await FsUtil.run(UploadUtil.remove_chunks, upload_id)
+
+    @classmethod
+    async def chunk_init_service(cls, redis: Redis, base_url: str, data: ChunkUploadInitSchema, user_id: int) -> Dict:
+        """
+        初始化分片上传。当前用户已上传过相同文件时直接返回文件信息(秒传)，存在未完成的相同文件任务时返回该任务以断点续传。
+        
+        参数:
+        - redis (Redis): Redis 连接。
+        - base_url (str): 基础访问 URL。
+        - data (ChunkUploadInitSchema): 初始化参数。
+        - user_id (int): 当前用户ID。
+        
+        返回:
+        - Dict: 分片上传任务状态。
+        
+        异常:
+        - CustomException: 文件类型不支持或大小超限时抛出。
+        """
+        if not UploadUtil.check_file_name_extension(data.file_name):
+            raise CustomException(msg="文件类型不支持")
+        if data.file_size > settings.UPLOAD_CHUNK_MAX_FILE_SIZE:
+            raise CustomException(msg="文件大小超出限制")
+
+        chunk_size = settings.UPLOAD_CHUNK_SIZE
+        total_chunks = math.ceil(data.file_size / chunk_size)
+
+        file = await cls._get_dedup_file(redis, user_id, data.file_hash, data.file_size, data.file_name, base_url)
+        if file:
+            return ChunkUploadOutSchema(
+                chunk_size=chunk_size,
+                total_chunks=total_chunks,
+                uploaded_chunks=list(range(total_chunks)),
+                finished=True,
+                file=file,
+            ).model_dump()
+
+        upload_id = await redis.get(cls._chunk_hash_key(user_id, data.file_hash))
+        if upload_id:
+            meta = await redis.hgetall(cls._chunk_key(upload_id))
+            if meta and meta.get('user_id') == str(user_id) and int(meta['file_size']) == data.file_size:
+                return await cls._chunk_status(redis, upload_id, meta)
+
+        await FsUtil.run(UploadUtil.prune_chunks)
+        upload_id = uuid.uuid4().hex
+        meta = {
+            'file_name': data.file_name,
+            'file_size': data.file_size,
+            'file_hash': data.file_hash,
+            'user_id': user_id,
+            'chunk_size': chunk_size,
+            'total_chunks': total_chunks,
+        }
+        await FsUtil.run(UploadUtil.get_chunk_dir(upload_id).mkdir, parents=True, exist_ok=True)
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.hset(cls._chunk_key(upload_id), mapping=meta)
+            pipe.expire(cls._chunk_key(upload_id), settings.UPLOAD_CHUNK_EXPIRE)
+            pipe.set(cls._chunk_hash_key(user_id, data.file_hash), upload_id, ex=settings.UPLOAD_CHUNK_EXPIRE)
+            await pipe.execute()
+        return ChunkUploadOutSchema(
+            upload_id=upload_id,
+            chunk_size=chunk_size,
+            total_chunks=total_chunks,
+        ).model_dump()
+
+    @classmethod
+    async def chunk_status_service(cls, redis: Redis, upload_id: str, user_id: int) -> Dict:
+        """
+        查询分片上传任务状态（断点续传时获取已上传分片）。
+        
+        参数:
+        - redis (Redis): Redis 连接。
+        - upload_id (str): 上传任务ID。
+        - user_id (int): 当前用户ID。
+        
+        返回:
+        - Dict: 分片上传任务状态。
+        """
+        meta = await cls._get_chunk_meta(redis, upload_id, user_id)
+        return await cls._chunk_status(redis, upload_id, meta)
+
+    @classmethod
+    async def chunk_upload_service(cls, redis: Redis, upload_id: str, user_id: int, index: int, stream: AsyncIterator[bytes], checksum: Optional[str] = None) -> Dict:
+        """
+        上传单个分片。分片先写入临时文件，校验大小与(可选)SHA-256 后原子替换，可重复上传。
+        
+        参数:
+        - redis (Redis): Redis 连接。
+        - upload_id (str): 上传任务ID。
+        - user_id (int): 当前用户ID。
+        - index (int): 分片序号(从0开始)。
+        - stream (AsyncIterator[bytes]): 请求体数据流。
+        - checksum (Optional[str]): 分片 SHA-256。
+        
+        返回:
+        - Dict: 分片上传任务状态。
+        
+        异常:
+        - CustomException: 任务不存在、分片序号或大小不合法、校验失败时抛出。
+        """
+        meta = await cls._get_chunk_meta(redis, upload_id, user_id)
+        chunk_size = int(meta['chunk_size'])
+        total_chunks = int(meta['total_chunks'])
+        if not 0 <= index < total_chunks:
+            raise CustomException(msg="分片序号不合法")
+        expected_size = min(chunk_size, int(meta['file_size']) - index * chunk_size)
+
+        chunk_path = UploadUtil.get_chunk_path(upload_id, index)
+        temp_path = chunk_path.with_name(f'{chunk_path.name}.{uuid.uuid4().hex}.tmp')
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            async with aiofiles.open(temp_path, 'wb') as f:
+                async for data in stream:
+                    size += len(data)
+                    if size > expected_size:
+                        raise CustomException(msg="分片大小不合法")
+                    digest.update(data)
+                    await f.write(data)
+            if size != expected_size:
+                raise CustomException(msg="分片大小不合法")
+            if checksum and digest.hexdigest() != checksum.lower():
+                raise CustomException(msg="分片校验失败")
+            await FsUtil.run(os.replace, temp_path, chunk_path)
+        except FileNotFoundError:
+            raise CustomException(msg="上传任务不存在或已过期")
+        finally:
+            await FsUtil.run(temp_path.unlink, missing_ok=True)
+
+        key = cls._chunk_key(upload_id)
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.sadd(f'{key}:parts', index)
+            pipe.expire(f'{key}:parts', settings.UPLOAD_CHUNK_EXPIRE)
+            pipe.expire(key, settings.UPLOAD_CHUNK_EXPIRE)
+            pipe.expire(cls._chunk_hash_key(user_id, meta['file_hash']), settings.UPLOAD_CHUNK_EXPIRE)
+            await pipe.execute()
+        return await cls._chunk_status(redis, upload_id, meta)
+
+    @classmethod
+    async def chunk_complete_service(cls, redis: Redis, base_url: str, upload_id: str, user_id: int) -> Dict:
+        """
+        完成分片上传：在线程池中并行合并分片，校验 SHA-256 并登记哈希索引。
+        
+        参数:
+        - redis (Redis): Redis 连接。
+        - base_url (str): 基础访问 URL。
+        - upload_id (str): 上传任务ID。
+        - user_id (int): 当前用户ID。
+        
+        返回:
+        - Dict: 上传响应字典。
+        
+        异常:
+        - CustomException: 分片未上传完整、任务正在合并或校验失败时抛出。
+        """
+        meta = await cls._get_chunk_meta(redis, upload_id, user_id)
+        key = cls._chunk_key(upload_id)
+        file_name = meta['file_name']
+        file_size = int(meta['file_size'])
+        file_hash = meta['file_hash']
+        chunk_size = int(meta['chunk_size'])
+        total_chunks = int(meta['total_chunks'])
+
+        parts = await redis.smembers(f'{key}:parts')
+        missing = sorted(set(range(total_chunks)) - {int(index) for index in parts})
+        if missing:
+            raise CustomException(msg=f"分片未上传完整，缺少分片: {missing[:10]}")
+        if not await redis.set(f'{key}:lock', 1, nx=True, ex=settings.UPLOAD_CHUNK_EXPIRE):
+            raise CustomException(msg="上传任务正在合并，请稍后")
+
+        try:
+            file = await cls._get_dedup_file(redis, user_id, file_hash, file_size, file_name, base_url)
+            if file:
+                await cls._clear_chunk_upload(redis, upload_id, meta)
+                return file
+
+            dir_path = settings.UPLOAD_FILE_PATH.joinpath(datetime.now().strftime("%Y/%m/%d"))
+            filename = UploadUtil.generate_file_name(file_name)
+            filepath = dir_path.joinpath(filename)
+            digest = await FsUtil.run(UploadUtil.assemble_chunks, upload_id, total_chunks, chunk_size, file_size, filepath)
+        except FileExistsError:
+            await redis.delete(f'{key}:lock')
+            raise CustomException(msg="文件已存在，请重试")
+        except Exception:
+            await redis.delete(f'{key}:lock')
+            raise
+
+        # 无论校验是否通过，分片都已不可再用于合并
+        await cls._clear_chunk_upload(redis, upload_id, meta)
+        if digest != file_hash:
+            await FsUtil.run(filepath.unlink, missing_ok=True)
+            raise CustomException(msg="文件校验失败，请重新上传")
+
+        await redis.set(cls._dedup_key(user_id, file_hash), json.dumps({
+            'file_path': str(filepath),
+            'file_name': filename,
+        }))
+        logger.info(f"分片上传合并完成: {filepath}")
+        return UploadResponseSchema(
+            file_path=str(filepath),
+            file_name=filename,
+            origin_name=file_name,
+            file_url=urljoin(base_url, str(filepath)),
+        ).model_dump()
+
+    @classmethod
+    async def chunk_abort_service(cls, redis: Redis, upload_id: str, user_id: int) -> None:
+        """
+        取消分片上传并清理临时分片。
+        
+        参数:
+        - redis (Redis): Redis 连接。
+        - upload_id (str): 上传任务ID。
+        - user_id (int): 当前用户ID。
+        """
+        meta = await cls._get_chunk_meta(redis, upload_id, user_id)
+        await cls._clear_chunk_upload(redis, upload_id, meta)
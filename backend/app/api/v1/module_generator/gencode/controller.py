@@ -25,7 +25,7 @@ GenRouter = APIRouter(route_class=OperationLogRoute, prefix='/gencode', tags=["
 async def gen_table_list_controller(
     page: PaginationQueryParam = Depends(),
     search: GenTableQueryParam = Depends(),
-    auth: AuthSchema = Depends(AuthPermission(["generator:gencode:query"]))
+    auth: AuthSchema = Depends(AuthPermission(["generator:gencode:query"], read_only=True))
 ) -> JSONResponse:
     """
     查询代码生成业务表列表
@@ -48,7 +48,7 @@ async def gen_table_list_controller(
 async def get_gen_db_table_list_controller(
     page: PaginationQueryParam = Depends(),
     search: GenTableQueryParam = Depends(),
-    auth: AuthSchema = Depends(AuthPermission(["generator:dblist:query"]))
+    auth: AuthSchema = Depends(AuthPermission(["generator:dblist:query"], read_only=True))
 ) -> JSONResponse:
     """
     查询数据库表列表
@@ -217,7 +217,7 @@ async def gen_code_local_controller(
 @GenRouter.get("/preview/{table_id}", summary="预览代码", description="预览代码")
 async def preview_code_controller(
     table_id: int = Path(..., description="业务表ID"),
-    auth: AuthSchema = Depends(AuthPermission(["generator:gencode:query"]))
+    auth: AuthSchema = Depends(AuthPermission(["generator:gencode:query"], read_only=True))
 ) -> JSONResponse:
     """
     预览代码
@@ -522,6 +522,30 @@ class GenTableColumnCRUD(CRUDBase[GenTableColumnModel, GenTableColumnSchema, Gen
         """
         return await self.update(id=id, data=data)
 
+    async def create_gen_table_columns_crud(self, datas: List[GenTableColumnSchema]) -> int:
+        """批量创建业务表字段。
+
+        参数:
+        - datas (List[GenTableColumnSchema]): 业务表字段模型列表。
+
+        返回:
+        - int: 创建条数。
+        """
+        return await self.bulk_create(data=datas)
+
+    async def update_gen_table_columns_crud(self, datas: List[GenTableColumnOutSchema]) -> int:
+        """按ID批量更新业务表字段。
+
+        参数:
+        - datas (List[GenTableColumnOutSchema]): 业务表字段模型列表（需包含id）。
+
+        返回:
+        - int: 更新条数。
+        """
+        return await self.bulk_update(data=[
+            {**data.model_dump(exclude_unset=True, exclude={"id"}), "id": data.id} for data in datas
+        ])
+
     async def delete_gen_table_column_by_table_id_dao(self, table_ids: List[int]) -> None:
         """根据业务表ID批量删除业务表字段。
 
@@ -141,7 +141,8 @@ class GenTableService:
                     # 获取数据库表的字段信息
                     gen_table_columns = await GenTableColumnCRUD(auth).get_gen_db_table_columns_by_name(table_name)
                     
-                    # 为每个字段初始化并保存到数据库
+                    # 为每个字段初始化后批量保存到数据库
+                    column_schemas = []
                     for column in gen_table_columns:
                         # 将GenTableColumnOutSchema转换为GenTableColumnSchema
                         column_schema = GenTableColumnSchema(
@@ -156,8 +157,8 @@ class GenTableService:
                         )
                         # 初始化字段属性
                         GenUtils.init_column_field(column_schema, table)
-                        # 保存到数据库
-                        await GenTableColumnCRUD(auth).create_gen_table_column_crud(column_schema)
+                        column_schemas.append(column_schema)
+                    await GenTableColumnCRUD(auth).create_gen_table_columns_crud(column_schemas)
             return True
         except Exception as e:
             raise CustomException(msg=f'导入失败, {str(e)}')
@@ -250,10 +251,10 @@ class GenTableService:
                 result = await GenTableCRUD(auth).edit_gen_table(table_id, gen_table_schema)
                 # 处理data.columns为None的情况
                 if data.columns:
-                    for gen_table_column in data.columns:
-                        # 确保column有id字段
-                        if hasattr(gen_table_column, 'id') and gen_table_column.id:
-                            await GenTableColumnCRUD(auth).update_gen_table_column_crud(gen_table_column.id, gen_table_column)
+                    # 确保column有id字段
+                    await GenTableColumnCRUD(auth).update_gen_table_columns_crud(
+                        [gen_table_column for gen_table_column in data.columns if getattr(gen_table_column, 'id', None)]
+                    )
                 return result.model_dump()
             except Exception as e:
                 raise CustomException(msg=str(e))
@@ -421,6 +422,7 @@ class GenTableService:
         db_table_columns = await GenTableColumnCRUD(auth).get_gen_db_table_columns_by_name(table_name)
         db_table_column_names = [column.column_name for column in db_table_columns]
         try:
+            update_columns = []
             for column in db_table_columns:
                 # 仅在缺省时初始化默认属性（包含 table_id 关联）
                 GenUtils.init_column_field(column, table)
@@ -452,18 +454,21 @@ class GenTableService:
                     column.is_query = keep_str(prev_column.is_query, column.is_query)
 
                     if hasattr(column, 'id') and column.id:
-                        await GenTableColumnCRUD(auth).update_gen_table_column_crud(column.id, column)
+                        update_columns.append(column)
                     else:
                         await GenTableColumnCRUD(auth).create_gen_table_column_crud(column)
                 else:
                     # 设置table_id以确保新字段能正确关联到表
                     column.table_id = table.table_id
                     await GenTableColumnCRUD(auth).create_gen_table_column_crud(column)
-            del_columns = [column for column in table_columns if column.column_name not in db_table_column_names]
-            if del_columns:
-                for column in del_columns:
-                    if hasattr(column, 'id') and column.id:
-                        await GenTableColumnCRUD(auth).delete_gen_table_column_by_column_id_dao([column.id])
+            if update_columns:
+                await GenTableColumnCRUD(auth).update_gen_table_columns_crud(update_columns)
+            del_column_ids = [
+                column.id for column in table_columns
+                if column.column_name not in db_table_column_names and getattr(column, 'id', None)
+            ]
+            if del_column_ids:
+                await GenTableColumnCRUD(auth).delete_gen_table_column_by_column_id_dao(del_column_ids)
         except Exception as e:
             raise CustomException(msg=f'同步失败: {str(e)}')
 
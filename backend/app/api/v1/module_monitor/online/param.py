@@ -14,8 +14,7 @@ class OnlineQueryParam:
         login_location: Optional[str] = Query(None, description="登录所属地"),
     ) -> None:
         
-        # 模糊查询字段
-        self.name = ("like", f"%{name}%") if name else None
-        self.login_location = ("like", f"%{login_location}%") if login_location else None
-        self.ipaddr = ("like", f"%{ipaddr}%") if ipaddr else None
-
+        # 前缀查询字段(大小写不敏感)，由在线会话索引在 Redis 端完成匹配
+        self.name = ("like", f"{name}%") if name else None
+        self.login_location = ("like", f"{login_location}%") if login_location else None
+        self.ipaddr = ("like", f"{ipaddr}%") if ipaddr else None
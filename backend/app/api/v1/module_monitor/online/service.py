@@ -1,12 +1,9 @@
 # -*- coding: utf-8 -*-
 
-import json
-from typing import Dict, List, Optional
+from typing import Dict, Optional
 from redis.asyncio.client import Redis
 
-from app.common.enums import RedisInitKeyConfig
-from app.core.redis_crud import RedisCURD
-from app.core.security import decode_access_token
+from app.core.session_store import SessionStore
 from app.core.logger import logger
 from .param import OnlineQueryParam
 
@@ -15,38 +12,42 @@ class OnlineService:
     """在线用户管理模块服务层"""
 
     @classmethod
-    async def get_online_list_service(cls, redis: Redis, search: Optional[OnlineQueryParam] = None) ->  List[Dict]:
+    async def get_online_list_service(cls, redis: Redis, search: Optional[OnlineQueryParam] = None, page_no: Optional[int] = None, page_size: Optional[int] = None) -> Dict:
         """
-        获取在线用户列表信息（支持分页和搜索）
+        获取在线用户列表信息（支持分页和前缀搜索）
         
         参数:
         - redis (Redis): Redis异步客户端实例。
         - search (Optional[OnlineQueryParam]): 查询参数模型。
+        - page_no (Optional[int]): 当前页码，与 page_size 同时为空时返回全部。
+        - page_size (Optional[int]): 每页数量。
         
         返回:
-        - List[Dict]: 在线用户详情字典列表。
+        - Dict: 分页结果，结构与 PaginationService.paginate 一致，按登录时间倒序。
         """
-
-        keys = await RedisCURD(redis).get_keys(f"{RedisInitKeyConfig.ACCESS_TOKEN.key}:*")
-        tokens = await RedisCURD(redis).mget(keys)
-
-        online_users = []
-        for token in tokens:
-            if not token:
-                continue
-            try:
-                payload = decode_access_token(token=token)
-                session_info = json.loads(payload.sub)  
-                if cls._match_search_conditions(session_info, search):
-                    online_users.append(session_info)
-            except Exception as e:
-                logger.error(f"解析在线用户数据失败: {e}")
-                continue
-        # 按照 login_time 倒序排序
-        online_users.sort(key=lambda x: x.get('login_time', ''), reverse=True)
-        
-        return online_users
-
+        prefixes = {}
+        if search:
+            for field in SessionStore.SEARCH_FIELDS:
+                condition = getattr(search, field, None)
+                if condition and condition[1]:
+                    prefixes[field] = condition[1].rstrip('%')
+
+        paged = page_no is not None and page_size is not None
+        offset = (page_no - 1) * page_size if paged else 0
+        total, online_users = await SessionStore.page(
+            redis=redis,
+            offset=offset,
+            limit=page_size if paged else None,
+            prefixes=prefixes
+        )
+
+        return {
+            "items": online_users,
+            "total": total,
+            "page_no": page_no if paged else None,
+            "page_size": page_size if paged else None,
+            "has_next": paged and offset + len(online_users) < total
+        }
 
     @classmethod
     async def delete_online_service(cls, redis: Redis, session_id: str) -> bool:
@@ -60,10 +61,8 @@ class OnlineService:
         返回:
         - bool: 如果操作成功则返回True，否则返回False。
         """
-        # 删除 token
-        await RedisCURD(redis).delete(f"{RedisInitKeyConfig.ACCESS_TOKEN.key}:{session_id}")
-        await RedisCURD(redis).delete(f"{RedisInitKeyConfig.REFRESH_TOKEN.key}:{session_id}")
-
+        # 删除会话，访问令牌与刷新令牌随之失效
+        await SessionStore.delete(redis=redis, session_id=session_id)
 
         logger.info(f"强制下线用户会话: {session_id}")
         return True
@@ -79,42 +78,8 @@ class OnlineService:
         返回:
         - bool: 如果操作成功则返回True，否则返回False。
         """
-        # 删除 token
-        await RedisCURD(redis).clear(f"{RedisInitKeyConfig.ACCESS_TOKEN.key}:*")
-        await RedisCURD(redis).clear(f"{RedisInitKeyConfig.REFRESH_TOKEN.key}:*")
+        # 删除全部会话及在线索引
+        await SessionStore.clear(redis=redis)
 
         logger.info(f"清除所有在线用户会话成功")
         return True
-
-    
-    @staticmethod
-    def _match_search_conditions(online_info: Dict, search: Optional[OnlineQueryParam]) -> bool:
-        """
-        检查是否匹配搜索条件
-        
-        参数:
-        - online_info (Dict): 在线用户信息字典。
-        - search (Optional[OnlineQueryParam]): 查询参数模型。
-        
-        返回:
-        - bool: 如果匹配则返回True，否则返回False。
-        """
-        if not search:
-            return True
-
-        if search.name and search.name[1]:
-            keyword = search.name[1].strip('%')
-            if keyword.lower() not in online_info.get("name", "").lower():
-                return False
-
-        if search.ipaddr and search.ipaddr[1]:
-            keyword = search.ipaddr[1].strip('%')
-            if keyword not in online_info.get("ipaddr", ""):
-                return False
-
-        if search.login_location and search.login_location[1]:
-            keyword = search.login_location[1].strip('%')
-            if keyword.lower() not in online_info.get("login_location", "").lower():
-                return False
-
-        return True
@@ -1,12 +1,13 @@
 # -*- coding: utf-8 -*-
 
+import os
 from fastapi import APIRouter, Body, Depends, Path, Query, Request, UploadFile, Form
 from fastapi.responses import JSONResponse, StreamingResponse, FileResponse
 from typing import List, Optional
 
 # from oss2 import auth # 预留阿里云OSS，后期使用
 
-from app.common.response import StreamResponse, SuccessResponse, ErrorResponse
+from app.common.response import StreamResponse, SuccessResponse, ErrorResponse, UploadFileResponse
 from app.common.request import PaginationService
 from app.utils.common_util import bytes2file_response
 from app.core.base_params import PaginationQueryParam
@@ -62,6 +63,28 @@ async def get_directory_list_controller(
     return SuccessResponse(data=result_dict, msg="获取目录列表成功")
 
 
+@ResourceRouter.get(
+    "/stats", 
+    summary="获取目录统计", 
+    description="获取指定目录递归的文件数、目录数和总大小",
+    dependencies=[Depends(AuthPermission(["monitor:resource:query"]))]
+)
+async def get_directory_stats_controller(
+    path: Optional[str] = Query(None, description="目录路径")
+) -> JSONResponse:
+    """
+    获取目录统计
+    
+    参数:
+    - path (Optional[str]): 目录路径，默认静态文件根目录。
+    
+    返回:
+    - JSONResponse: 包含目录统计的JSON响应。
+    """
+    result_dict = await ResourceService.get_directory_stats_service(path=path)
+    return SuccessResponse(data=result_dict, msg="获取目录统计成功")
+
+
 @ResourceRouter.post(
     "/upload", 
     summary="上传文件", 
@@ -112,20 +135,19 @@ async def download_file_controller(
     返回:
     - FileResponse: 包含文件内容的文件响应。
     """
-    file_path = await ResourceService.download_file_service(
+    file_path, stat_result = await ResourceService.download_file_service(
         file_path=path,
         base_url=str(request.base_url)
     )
     
     # 获取文件名
-    import os
     filename = os.path.basename(file_path)
     
     logger.info(f"下载文件成功: {filename}")
-    return FileResponse(
-        path=file_path,
+    return UploadFileResponse(
+        file_path=file_path,
         filename=filename,
-        media_type='application/octet-stream'
+        stat_result=stat_result
     )
 
 
@@ -145,9 +167,12 @@ async def delete_files_controller(
     - paths (List[str]): 文件路径列表。
     
     返回:
-    - JSONResponse: 包含删除结果的JSON响应。
+    - JSONResponse: 包含删除结果的JSON响应，删除目录时返回后台任务信息。
     """
-    await ResourceService.delete_file_service(paths=paths)
+    task = await ResourceService.delete_file_service(paths=paths)
+    if task:
+        logger.info(f"已提交删除任务: {paths}")
+        return SuccessResponse(data=task, msg="删除任务已提交")
     logger.info(f"删除文件成功: {paths}")
     return SuccessResponse(msg="删除文件成功")
 
@@ -168,9 +193,12 @@ async def move_file_controller(
     - data (ResourceMoveSchema): 移动文件参数模型。
     
     返回:
-    - JSONResponse: 包含移动结果的JSON响应。
+    - JSONResponse: 包含移动结果的JSON响应，移动目录时返回后台任务信息。
     """
-    await ResourceService.move_file_service(data=data)
+    task = await ResourceService.move_file_service(data=data)
+    if task:
+        logger.info(f"已提交移动任务: {data.source_path} -> {data.target_path}")
+        return SuccessResponse(data=task, msg="移动任务已提交")
     logger.info(f"移动文件成功: {data.source_path} -> {data.target_path}")
     return SuccessResponse(msg="移动文件成功")
 
@@ -191,13 +219,38 @@ async def copy_file_controller(
     - data (ResourceCopySchema): 复制文件参数模型。
     
     返回:
-    - JSONResponse: 包含复制结果的JSON响应。
+    - JSONResponse: 包含复制结果的JSON响应，复制目录时返回后台任务信息。
     """
-    await ResourceService.copy_file_service(data=data)
+    task = await ResourceService.copy_file_service(data=data)
+    if task:
+        logger.info(f"已提交复制任务: {data.source_path} -> {data.target_path}")
+        return SuccessResponse(data=task, msg="复制任务已提交")
     logger.info(f"复制文件成功: {data.source_path} -> {data.target_path}")
     return SuccessResponse(msg="复制文件成功")
 
 
+@ResourceRouter.get(
+    "/task/{task_id}", 
+    summary="获取后台任务进度", 
+    description="获取复制/移动/删除目录等后台文件任务的进度",
+    dependencies=[Depends(AuthPermission(["monitor:resource:query"]))]
+)
+async def get_task_progress_controller(
+    task_id: str = Path(..., description="任务ID")
+) -> JSONResponse:
+    """
+    获取后台任务进度
+    
+    参数:
+    - task_id (str): 任务ID。
+    
+    返回:
+    - JSONResponse: 包含任务进度的JSON响应。
+    """
+    result_dict = await ResourceService.get_task_service(task_id=task_id)
+    return SuccessResponse(data=result_dict, msg="获取任务进度成功")
+
+
 @ResourceRouter.post(
     "/rename", 
     summary="重命名文件", 
@@ -61,6 +61,16 @@ class ResourceDirectorySchema(BaseModel):
     total_size: int = Field(0, description="总大小")
 
 
+class ResourceStatsSchema(BaseModel):
+    """资源目录统计模型"""
+    model_config = ConfigDict(from_attributes=True)
+    
+    path: str = Field(..., description="目录路径")
+    total_files: int = Field(0, description="递归文件总数")
+    total_dirs: int = Field(0, description="递归目录总数")
+    total_size: int = Field(0, description="递归总大小(字节)")
+
+
 class ResourceUploadSchema(BaseModel):
     """资源上传响应模型"""
     model_config = ConfigDict(from_attributes=True)
@@ -138,4 +148,18 @@ class ResourceCreateDirSchema(BaseModel):
                 raise ValueError("参数不能为空")
             if '..' in value or value.startswith('/') or value.startswith('\\'):
                 raise ValueError("参数包含不安全字符")
-        return value.strip()
\ No newline at end of file
+        return value.strip()
+
+class ResourceTaskSchema(BaseModel):
+    """后台文件任务模型"""
+    model_config = ConfigDict(from_attributes=True)
+
+    task_id: str = Field(..., description="任务ID")
+    action: str = Field(..., description="操作类型(copy/move/delete)")
+    status: str = Field(..., description="任务状态(pending/running/success/failed)")
+    total: Optional[int] = Field(None, description="待处理文件总数")
+    done: int = Field(0, description="已处理文件数")
+    percent: float = Field(0.0, description="进度百分比")
+    error: Optional[str] = Field(None, description="错误信息")
+    created_time: datetime = Field(..., description="创建时间")
+    finished_time: Optional[datetime] = Field(None, description="结束时间")
@@ -1,9 +1,9 @@
 # -*- coding: utf-8 -*-
 
 import os
-import shutil
+from stat import S_ISDIR, S_ISREG
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 from urllib.parse import urlparse
 from fastapi import UploadFile
@@ -11,6 +11,8 @@ from fastapi import UploadFile
 from app.core.exceptions import CustomException
 from app.core.logger import logger
 from app.utils.excel_util import ExcelUtil
+from app.utils.fs_util import FsUtil, FsTaskManager
+from app.utils.file_index_util import FileIndexUtil
 from app.config.setting import settings
 from .param import ResourceSearchQueryParam
 from .schema import (
@@ -20,7 +22,9 @@ from .schema import (
     ResourceMoveSchema,
     ResourceCopySchema,
     ResourceRenameSchema,
-    ResourceCreateDirSchema
+    ResourceCreateDirSchema,
+    ResourceTaskSchema,
+    ResourceStatsSchema
 )
 
 
@@ -157,10 +161,47 @@ class ResourceService:
         
         return http_url
     
+    @classmethod
+    def _build_file_info(cls, file_path: str, name: str, st: os.stat_result, resource_root: str, base_url: Optional[str] = None) -> Dict[str, Any]:
+        """
+        根据已获取的 stat 结果构造文件或目录信息，不再产生额外的文件系统调用。
+        
+        参数:
+        - file_path (str): 文件或目录的绝对路径。
+        - name (str): 文件或目录名称。
+        - st (os.stat_result): 文件状态。
+        - resource_root (str): 资源管理根目录。
+        - base_url (Optional[str]): 基础URL，用于生成完整URL。
+        
+        返回:
+        - Dict[str, Any]: 文件或目录的详细信息字典。
+        """
+        # 计算相对路径
+        try:
+            relative_path = os.path.relpath(file_path, resource_root)
+        except ValueError:
+            relative_path = os.path.basename(file_path)
+        
+        is_file = S_ISREG(st.st_mode)
+        
+        return {
+            'name': name,
+            'file_url': cls._generate_http_url(file_path, base_url),  # 统一使用file_url字段
+            'relative_path': relative_path,
+            'is_file': is_file,
+            'is_dir': S_ISDIR(st.st_mode),
+            'size': st.st_size if is_file else None,
+            # 将datetime对象转换为ISO格式的字符串，确保JSON序列化成功
+            'created_time': datetime.fromtimestamp(st.st_ctime).isoformat(),
+            'modified_time': datetime.fromtimestamp(st.st_mtime).isoformat(),
+            'is_hidden': name.startswith('.')
+        }
+    
     @classmethod
     def _get_file_info(cls, file_path: str, base_url: Optional[str] = None) -> Dict[str, Any]:
         """
-        获取文件或目录的详细信息，如名称、大小、创建时间、修改时间、路径、深度、HTTP URL、是否隐藏、是否为目录等。
+        获取文件或目录的详细信息，如名称、大小、创建时间、修改时间、路径、HTTP URL、是否隐藏、是否为目录等。
+        (阻塞调用，需在 FsUtil 线程池中执行)
         
         参数:
         - file_path (str): 文件或目录的路径。
@@ -171,53 +212,107 @@ class ResourceService:
         """
         try:
             safe_path = cls._get_safe_path(file_path)
-            if not os.path.exists(safe_path):
-                return {}
-                
-            stat = os.stat(safe_path)
-            path_obj = Path(safe_path)
-            resource_root = cls._get_resource_root()
-            
-            # 计算相对路径
             try:
-                relative_path = os.path.relpath(safe_path, resource_root)
-            except ValueError:
-                relative_path = os.path.basename(safe_path)
-            
-            # 计算深度
-            try:
-                depth = len(Path(safe_path).relative_to(resource_root).parts)
-            except ValueError:
-                depth = 0
-            
-            # 生成HTTP URL路径而不是文件系统路径
-            http_url = cls._generate_http_url(safe_path, base_url)
-            
-            # 检查是否为隐藏文件（文件名以点开头）
-            is_hidden = path_obj.name.startswith('.')
-            
-            # 对于目录，设置is_directory字段（兼容前端）
-            is_directory = os.path.isdir(safe_path)
-            
-            # 将datetime对象转换为ISO格式的字符串，确保JSON序列化成功
-            created_time = datetime.fromtimestamp(stat.st_ctime).isoformat()
-            modified_time = datetime.fromtimestamp(stat.st_mtime).isoformat()
-            
-            return {
-                'name': path_obj.name,
-                'file_url': http_url,  # 统一使用file_url字段
-                'relative_path': relative_path,
-                'is_file': os.path.isfile(safe_path),
-                'is_dir': is_directory,
-                'size': stat.st_size if os.path.isfile(safe_path) else None,
-                'created_time': created_time,
-                'modified_time': modified_time,
-                'is_hidden': is_hidden
-            }
+                st = os.stat(safe_path)
+            except FileNotFoundError:
+                return {}
+            return cls._build_file_info(safe_path, os.path.basename(safe_path), st, cls._get_resource_root(), base_url)
         except Exception as e:
             logger.error(f'获取文件信息失败: {str(e)}')
             return {}
     
+    @classmethod
+    def _scan_directory(cls, safe_path: str, base_url: Optional[str] = None, include_hidden: bool = False, keyword: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        使用 os.scandir 列出单层目录，复用 DirEntry 的 stat 结果。
+        (阻塞调用，需在 FsUtil 线程池中执行)
+        
+        参数:
+        - safe_path (str): 已校验的目录路径。
+        - base_url (Optional[str]): 基础URL，用于生成完整URL。
+        - include_hidden (bool): 是否包含隐藏文件。
+        - keyword (Optional[str]): 名称过滤关键词(不区分大小写)。
+        
+        返回:
+        - List[Dict[str, Any]]: 文件或目录信息列表。
+        """
+        if not os.path.exists(safe_path):
+            raise CustomException(msg='目录不存在')
+        if not os.path.isdir(safe_path):
+            raise CustomException(msg='路径不是目录')
+        
+        resource_root = cls._get_resource_root()
+        keyword = keyword.lower() if keyword else None
+        items = []
+        try:
+            with os.scandir(safe_path) as it:
+                for entry in it:
+                    # 跳过隐藏文件
+                    if not include_hidden and entry.name.startswith('.'):
+                        continue
+                    # 应用名称过滤
+                    if keyword and keyword not in entry.name.lower():
+                        continue
+                    try:
+                        st = entry.stat()
+                    except OSError as e:
+                        logger.error(f'获取文件信息失败: {str(e)}')
+                        continue
+                    items.append(cls._build_file_info(entry.path, entry.name, st, resource_root, base_url))
+        except PermissionError:
+            raise CustomException(msg='没有权限访问此目录')
+        return items
+    
+    @classmethod
+    def _search_index(cls, safe_path: str, keyword: str, base_url: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        通过文件索引递归搜索名称包含关键词的文件和目录（阻塞调用，需在 FsUtil 线程池中执行）
+        
+        参数:
+        - safe_path (str): 已校验的搜索目录。
+        - keyword (str): 名称关键词。
+        - base_url (Optional[str]): 基础URL，用于生成完整URL。
+        
+        返回:
+        - Optional[List[Dict[str, Any]]]: 文件或目录信息列表，索引未就绪时返回None。
+        """
+        rows = FileIndexUtil.search(keyword=keyword, abs_dir=safe_path, limit=cls.MAX_SEARCH_RESULTS)
+        if rows is None:
+            return None
+        resource_root = cls._get_resource_root()
+        items = []
+        for row in rows:
+            file_path = os.path.join(resource_root, *row['path'].split('/'))
+            items.append({
+                'name': row['name'],
+                'file_url': cls._generate_http_url(file_path, base_url),
+                'relative_path': os.path.relpath(file_path, resource_root),
+                'is_file': not row['is_dir'],
+                'is_dir': bool(row['is_dir']),
+                'size': None if row['is_dir'] else row['size'],
+                'created_time': datetime.fromtimestamp(row['ctime']).isoformat(),
+                'modified_time': datetime.fromtimestamp(row['mtime']).isoformat(),
+                'is_hidden': row['name'].startswith('.')
+            })
+        return items
+    
+    @classmethod
+    def _sync_index(cls, added: Optional[List[str]] = None, removed: Optional[List[str]] = None) -> None:
+        """
+        文件变更后同步文件索引，索引异常不影响文件操作本身（阻塞调用）
+        
+        参数:
+        - added (Optional[List[str]]): 新增或变更的路径。
+        - removed (Optional[List[str]]): 已移除的路径。
+        """
+        try:
+            for path in removed or []:
+                FileIndexUtil.remove_path(path)
+            for path in added or []:
+                FileIndexUtil.add_path(path)
+        except Exception as e:
+            logger.error(f'同步文件索引失败: {str(e)}')
+    
     @classmethod
     async def get_directory_list_service(cls, path: Optional[str] = None, include_hidden: bool = False, base_url: Optional[str] = None) -> Dict:
         """
@@ -240,37 +335,12 @@ class ResourceService:
                 safe_path = cls._get_safe_path(path)
                 display_path = cls._generate_http_url(safe_path, base_url)
             
-            if not os.path.exists(safe_path):
-                raise CustomException(msg='目录不存在')
-                
-            if not os.path.isdir(safe_path):
-                raise CustomException(msg='路径不是目录')
-            
-            items = []
-            total_files = 0
-            total_dirs = 0
-            total_size = 0
+            file_infos = await FsUtil.run(cls._scan_directory, safe_path, base_url, include_hidden)
             
-            try:
-                for item_name in os.listdir(safe_path):
-                    # 跳过隐藏文件
-                    if not include_hidden and item_name.startswith('.'):
-                        continue
-                        
-                    item_path = os.path.join(safe_path, item_name)
-                    file_info = cls._get_file_info(item_path, base_url)
-                    
-                    if file_info:
-                        items.append(ResourceItemSchema(**file_info))
-                        
-                        if file_info['is_file']:
-                            total_files += 1
-                            total_size += file_info.get('size', 0) or 0
-                        elif file_info['is_dir']:
-                            total_dirs += 1
-                                
-            except PermissionError:
-                raise CustomException(msg='没有权限访问此目录')
+            items = [ResourceItemSchema(**file_info) for file_info in file_infos]
+            total_files = sum(1 for file_info in file_infos if file_info['is_file'])
+            total_dirs = sum(1 for file_info in file_infos if file_info['is_dir'])
+            total_size = sum(file_info.get('size', 0) or 0 for file_info in file_infos if file_info['is_file'])
             
             return ResourceDirectorySchema(
                 path=display_path,  # 返回HTTP URL路径而不是文件系统路径
@@ -290,7 +360,7 @@ class ResourceService:
     @classmethod
     async def get_resources_list_service(cls, search: Optional[ResourceSearchQueryParam] = None, order_by: Optional[str] = None, base_url: Optional[str] = None) -> List[Dict]:
         """
-        搜索资源列表（用于分页和导出）
+        搜索资源列表（用于分页和导出），按名称搜索时递归搜索子目录
         
         参数:
         - search (Optional[ResourceSearchQueryParam]): 查询参数模型。
@@ -307,36 +377,17 @@ class ResourceService:
             else:
                 resource_root = cls._get_resource_root()
             
-            # 检查路径是否存在
-            if not os.path.exists(resource_root):
-                raise CustomException(msg='目录不存在')
-                
-            if not os.path.isdir(resource_root):
-                raise CustomException(msg='路径不是目录')
-            
-            # 收集资源
-            all_resources = []
+            # 应用名称过滤
+            keyword = None
+            if search and hasattr(search, 'name') and search.name and search.name[1]:
+                keyword = search.name[1]
             
-            try:
-                for item_name in os.listdir(resource_root):
-                    # 跳过隐藏文件
-                    if item_name.startswith('.'):
-                        continue
-                    
-                    item_path = os.path.join(resource_root, item_name)
-                    file_info = cls._get_file_info(item_path, base_url)
-                    
-                    if file_info:
-                        # 应用名称过滤
-                        if search and hasattr(search, 'name') and search.name and search.name[1]:
-                            search_keyword = search.name[1].lower()
-                            if search_keyword not in file_info.get('name', '').lower():
-                                continue
-                        
-                        all_resources.append(file_info)
-                                
-            except PermissionError:
-                raise CustomException(msg='没有权限访问此目录')
+            # 收集资源：有关键词时通过文件索引递归搜索，否则(或索引未就绪时)列出当前目录
+            all_resources = None
+            if keyword:
+                all_resources = await FsUtil.run(cls._search_index, resource_root, keyword, base_url)
+            if all_resources is None:
+                all_resources = await FsUtil.run(cls._scan_directory, resource_root, base_url, False, keyword)
             
             # 应用排序
             sorted_resources = cls._sort_results(all_resources, order_by)
@@ -379,43 +430,25 @@ class ResourceService:
             if item.get('size'):
                 item['size'] = cls._format_file_size(item['size'])
 
-        return ExcelUtil.export_list2excel(list_data=export_data, mapping_dict=mapping_dict)
+        return await FsUtil.run(ExcelUtil.export_list2excel, list_data=export_data, mapping_dict=mapping_dict)
 
     @classmethod
     async def _get_directory_stats(cls, path: str, include_hidden: bool = False) -> Dict[str, int]:
         """
-        递归获取目录统计信息
+        递归获取目录统计信息（优先从文件索引 O(1) 读取，否则在线程池中基于 scandir 遍历）
         
         参数:
         - path (str): 目录路径。
-        - include_hidden (bool): 是否包含隐藏文件。
+        - include_hidden (bool): 是否包含隐藏文件（文件索引统计包含隐藏文件）。
         
         返回:
         - Dict[str, int]: 包含文件数、目录数和总大小的字典。
         """
-        stats = {'files': 0, 'dirs': 0, 'size': 0}
-        
-        try:
-            for root, dirs, files in os.walk(path):
-                # 过滤隐藏目录
-                if not include_hidden:
-                    dirs[:] = [d for d in dirs if not d.startswith('.')]
-                    files = [f for f in files if not f.startswith('.')]
-                
-                stats['dirs'] += len(dirs)
-                stats['files'] += len(files)
-                
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    try:
-                        stats['size'] += os.path.getsize(file_path)
-                    except (OSError, IOError):
-                        continue
-                        
-        except Exception:
-            pass
-            
-        return stats
+        if include_hidden:
+            stats = await FsUtil.run(FileIndexUtil.get_stats, path)
+            if stats is not None:
+                return stats
+        return await FsUtil.run(FsUtil.scan_tree, path, include_hidden)
     
     @classmethod
     def _sort_results(cls, results: List[Dict], order_by: Optional[str] = None) -> List[Dict]:
@@ -467,6 +500,51 @@ class ResourceService:
         except:
             return results
 
+    @classmethod
+    def _stat_or_none(cls, path: str) -> Optional[os.stat_result]:
+        """
+        获取路径状态，不存在时返回None（阻塞调用，需在 FsUtil 线程池中执行）
+        
+        参数:
+        - path (str): 路径。
+        
+        返回:
+        - Optional[os.stat_result]: 路径状态。
+        """
+        try:
+            return os.stat(path)
+        except FileNotFoundError:
+            return None
+
+    @classmethod
+    def _save_upload(cls, safe_dir: str, filename: str, content: bytes) -> str:
+        """
+        将上传内容写入目录，文件名冲突时自动追加序号（阻塞调用，需在 FsUtil 线程池中执行）
+        
+        参数:
+        - safe_dir (str): 已校验的目标目录。
+        - filename (str): 原始文件名。
+        - content (bytes): 文件内容。
+        
+        返回:
+        - str: 实际写入的文件路径。
+        """
+        # 创建目录（如果不存在）
+        os.makedirs(safe_dir, exist_ok=True)
+        
+        base_name, ext = os.path.splitext(filename)
+        file_path = os.path.join(safe_dir, filename)
+        counter = 1
+        while True:
+            try:
+                # 以独占模式创建，避免并发上传同名文件时互相覆盖
+                with open(file_path, 'xb') as f:
+                    f.write(content)
+                return file_path
+            except FileExistsError:
+                file_path = os.path.join(safe_dir, f"{base_name}_{counter}{ext}")
+                counter += 1
+
     @classmethod
     async def upload_file_service(cls,  file: UploadFile, target_path: Optional[str] = None, base_url: Optional[str] = None) -> Dict:
         """
@@ -499,30 +577,11 @@ class ResourceService:
             else:
                 safe_dir = cls._get_safe_path(target_path)
             
-            # 创建目录（如果不存在）
-            os.makedirs(safe_dir, exist_ok=True)
-            
-            # 生成文件路径
-            filename = file.filename
-            file_path = os.path.join(safe_dir, filename)
-            
-            # 检查文件是否已存在
-            if os.path.exists(file_path):
-                # 生成唯一文件名
-                base_name, ext = os.path.splitext(filename)
-                counter = 1
-                while os.path.exists(file_path):
-                    new_filename = f"{base_name}_{counter}{ext}"
-                    file_path = os.path.join(safe_dir, new_filename)
-                    counter += 1
-                filename = os.path.basename(file_path)
-            
-            # 保存文件（使用已读取的内容）
-            with open(file_path, 'wb') as f:
-                f.write(content)
-            
-            # 获取文件信息
-            file_info = cls._get_file_info(file_path, base_url)
+            # 保存文件并获取文件信息
+            file_path = await FsUtil.run(cls._save_upload, safe_dir, file.filename, content)
+            filename = os.path.basename(file_path)
+            await FsUtil.run(cls._sync_index, added=[file_path])
+            file_info = await FsUtil.run(cls._get_file_info, file_path, base_url)
             
             # 生成文件URL
             file_url = cls._generate_http_url(file_path, base_url)
@@ -541,29 +600,30 @@ class ResourceService:
             raise CustomException(msg=f"文件上传失败: {str(e)}")
 
     @classmethod
-    async def download_file_service(cls, file_path: str, base_url: Optional[str] = None) -> str:
+    async def download_file_service(cls, file_path: str, base_url: Optional[str] = None) -> Tuple[str, os.stat_result]:
         """
-        下载文件（返回本地文件系统路径）
+        下载文件（返回本地文件系统路径及文件状态，供 UploadFileResponse 生成 ETag/Range 响应）
         
         参数:
         - file_path (str): 文件路径（可为相对路径、绝对路径或完整URL）。
         - base_url (Optional[str]): 基础URL，用于生成完整URL（不再直接返回URL）。
         
         返回:
-        - str: 本地文件系统路径。
+        - Tuple[str, os.stat_result]: (本地文件系统路径, 文件状态)。
         """
         try:
             safe_path = cls._get_safe_path(file_path)
             
-            if not os.path.exists(safe_path):
+            st = await FsUtil.run(cls._stat_or_none, safe_path)
+            if st is None:
                 raise CustomException(msg='文件不存在')
             
-            if not os.path.isfile(safe_path):
+            if not S_ISREG(st.st_mode):
                 raise CustomException(msg='路径不是文件')
             
-            # 返回本地文件路径给 FileResponse 使用
+            # 返回本地文件路径给 UploadFileResponse 使用
             logger.info(f"定位文件路径: {safe_path}")
-            return safe_path
+            return safe_path, st
             
         except CustomException:
             raise
@@ -572,42 +632,67 @@ class ResourceService:
             raise CustomException(msg=f"下载文件失败: {str(e)}")
 
     @classmethod
-    async def delete_file_service(cls, paths: List[str]) -> None:
+    def _delete_files(cls, safe_paths: List[str]) -> List[str]:
+        """
+        删除文件，并返回需要后台删除的目录列表（阻塞调用，需在 FsUtil 线程池中执行）
+        
+        参数:
+        - safe_paths (List[str]): 已校验的路径列表。
+        
+        返回:
+        - List[str]: 目录路径列表。
+        """
+        dir_paths = []
+        for safe_path in safe_paths:
+            st = cls._stat_or_none(safe_path)
+            if st is None:
+                logger.warning(f"路径不存在，跳过: {safe_path}")
+                continue
+            if S_ISDIR(st.st_mode):
+                dir_paths.append(safe_path)
+            else:
+                os.remove(safe_path)
+                cls._sync_index(removed=[safe_path])
+                logger.info(f"删除文件成功: {safe_path}")
+        return dir_paths
+
+    @classmethod
+    async def delete_file_service(cls, paths: List[str]) -> Optional[Dict]:
         """
-        删除文件或目录
+        删除文件或目录。文件在线程池中直接删除，目录作为后台任务删除。
         
         参数:
         - paths (List[str]): 文件或目录路径列表。
         
         返回:
-        - None
+        - Optional[Dict]: 存在目录时返回后台任务信息，否则返回None。
         """
         if not paths:
             raise CustomException(msg='删除失败，删除路径不能为空')
         
-        for path in paths:
-            try:
-                safe_path = cls._get_safe_path(path)
-                
-                if not os.path.exists(safe_path):
-                    logger.warning(f"路径不存在，跳过: {path}")
-                    continue
-                
-                if os.path.isfile(safe_path):
-                    os.remove(safe_path)
-                    logger.info(f"删除文件成功: {safe_path}")
-                elif os.path.isdir(safe_path):
-                    shutil.rmtree(safe_path)
-                    logger.info(f"删除目录成功: {safe_path}")
-                    
-            except Exception as e:
-                logger.error(f"删除失败 {path}: {str(e)}")
-                raise CustomException(msg=f"删除失败 {path}: {str(e)}")
+        try:
+            safe_paths = [cls._get_safe_path(path) for path in paths]
+            dir_paths = await FsUtil.run(cls._delete_files, safe_paths)
+        except CustomException:
+            raise
+        except Exception as e:
+            logger.error(f"删除失败 {paths}: {str(e)}")
+            raise CustomException(msg=f"删除失败 {paths}: {str(e)}")
+        
+        if not dir_paths:
+            return None
+        
+        def _remove(source: str, target: Optional[str], progress) -> None:
+            FsUtil.remove_tree(source, progress)
+            cls._sync_index(removed=[source])
+            logger.info(f"删除目录成功: {source}")
+        
+        return await cls._submit_task(action='delete', jobs=[(path, None) for path in dir_paths], func=_remove)
 
     @classmethod
-    async def batch_delete_service(cls, paths: List[str]) -> Dict[str, List[str]]:
+    def _batch_delete(cls, paths: List[str]) -> Dict[str, List[str]]:
         """
-        批量删除文件或目录
+        批量删除文件或目录（阻塞调用，需在 FsUtil 线程池中执行）
         
         参数:
         - paths (List[str]): 文件或目录路径列表。
@@ -615,9 +700,6 @@ class ResourceService:
         返回:
         - Dict[str, List[str]]: 包含成功删除路径和失败删除路径的字典。
         """
-        if not paths:
-            raise CustomException(msg='删除失败，删除路径不能为空')
-        
         success_paths = []
         failed_paths = []
         
@@ -625,18 +707,14 @@ class ResourceService:
             try:
                 safe_path = cls._get_safe_path(path)
                 
-                if not os.path.exists(safe_path):
+                if not os.path.lexists(safe_path):
                     failed_paths.append(path)
                     continue
                 
-                if os.path.isfile(safe_path):
-                    os.remove(safe_path)
-                    success_paths.append(path)
-                    logger.info(f"删除文件成功: {safe_path}")
-                elif os.path.isdir(safe_path):
-                    shutil.rmtree(safe_path)
-                    success_paths.append(path)
-                    logger.info(f"删除目录成功: {safe_path}")
+                FsUtil.remove_tree(safe_path)
+                cls._sync_index(removed=[safe_path])
+                success_paths.append(path)
+                logger.info(f"删除成功: {safe_path}")
                     
             except Exception as e:
                 logger.error(f"删除失败 {path}: {str(e)}")
@@ -648,41 +726,72 @@ class ResourceService:
         }
 
     @classmethod
-    async def move_file_service(cls, data: ResourceMoveSchema) -> None:
+    async def batch_delete_service(cls, paths: List[str]) -> Dict[str, List[str]]:
+        """
+        批量删除文件或目录
+        
+        参数:
+        - paths (List[str]): 文件或目录路径列表。
+        
+        返回:
+        - Dict[str, List[str]]: 包含成功删除路径和失败删除路径的字典。
+        """
+        if not paths:
+            raise CustomException(msg='删除失败，删除路径不能为空')
+        
+        return await FsUtil.run(cls._batch_delete, paths)
+
+    @classmethod
+    def _move(cls, source_path: str, target_path: str, overwrite: bool, progress=None) -> None:
         """
-        移动文件或目录
+        移动文件或目录，必要时先删除已存在的目标（阻塞调用）
+        
+        参数:
+        - source_path (str): 源路径。
+        - target_path (str): 目标路径。
+        - overwrite (bool): 是否覆盖。
+        - progress (ProgressCallback | None): 进度回调。
+        """
+        if os.path.lexists(target_path):
+            if not overwrite:
+                raise CustomException(msg='目标路径已存在')
+            FsUtil.remove_tree(target_path)
+        FsUtil.move_tree(source_path, target_path, progress)
+        cls._sync_index(added=[target_path], removed=[source_path])
+        logger.info(f"移动成功: {source_path} -> {target_path}")
+
+    @classmethod
+    async def move_file_service(cls, data: ResourceMoveSchema) -> Optional[Dict]:
+        """
+        移动文件或目录。文件在线程池中直接移动，目录作为后台任务移动。
         
         参数:
         - data (ResourceMoveSchema): 包含源路径和目标路径的模型。
         
         返回:
-        - None
+        - Optional[Dict]: 移动目录时返回后台任务信息，否则返回None。
         """
         try:
             source_path = cls._get_safe_path(data.source_path)
             target_path = cls._get_safe_path(data.target_path)
             
-            if not os.path.exists(source_path):
+            source_stat = await FsUtil.run(cls._stat_or_none, source_path)
+            if source_stat is None:
                 raise CustomException(msg='源路径不存在')
             
             # 检查目标路径是否已存在
-            if os.path.exists(target_path):
-                if not data.overwrite:
-                    raise CustomException(msg='目标路径已存在')
-                else:
-                    # 删除目标路径
-                    if os.path.isfile(target_path):
-                        os.remove(target_path)
-                    else:
-                        shutil.rmtree(target_path)
-            
-            # 确保目标目录存在
-            target_dir = os.path.dirname(target_path)
-            os.makedirs(target_dir, exist_ok=True)
-            
-            # 移动文件
-            shutil.move(source_path, target_path)
-            logger.info(f"移动成功: {source_path} -> {target_path}")
+            if not data.overwrite and await FsUtil.run(os.path.lexists, target_path):
+                raise CustomException(msg='目标路径已存在')
+            
+            if S_ISDIR(source_stat.st_mode):
+                return await cls._submit_task(
+                    action='move',
+                    jobs=[(source_path, target_path)],
+                    func=lambda source, target, progress: cls._move(source, target, data.overwrite, progress)
+                )
+            
+            await FsUtil.run(cls._move, source_path, target_path, data.overwrite)
+            return None
             
         except CustomException:
             raise
@@ -691,38 +800,38 @@ class ResourceService:
             raise CustomException(msg=f"移动失败: {str(e)}")
 
     @classmethod
-    async def copy_file_service(cls, data: ResourceCopySchema) -> None:
+    async def copy_file_service(cls, data: ResourceCopySchema) -> Optional[Dict]:
         """
-        复制文件或目录
+        复制文件或目录。文件在线程池中直接复制，目录作为后台任务复制。
         
         参数:
         - data (ResourceCopySchema): 包含源路径和目标路径的模型。
         
         返回:
-        - None
+        - Optional[Dict]: 复制目录时返回后台任务信息，否则返回None。
         """
         try:
             source_path = cls._get_safe_path(data.source_path)
             target_path = cls._get_safe_path(data.target_path)
             
-            if not os.path.exists(source_path):
+            source_stat = await FsUtil.run(cls._stat_or_none, source_path)
+            if source_stat is None:
                 raise CustomException(msg='源路径不存在')
             
             # 检查目标路径是否已存在
-            if os.path.exists(target_path) and not data.overwrite:
+            if not data.overwrite and await FsUtil.run(os.path.lexists, target_path):
                 raise CustomException(msg='目标路径已存在')
             
-            # 确保目标目录存在
-            target_dir = os.path.dirname(target_path)
-            os.makedirs(target_dir, exist_ok=True)
+            def _copy(source: str, target: Optional[str], progress=None) -> None:
+                FsUtil.copy_tree(source, target, overwrite=data.overwrite, progress=progress)
+                cls._sync_index(added=[target])
+                logger.info(f"复制成功: {source} -> {target}")
             
-            # 复制文件或目录
-            if os.path.isfile(source_path):
-                shutil.copy2(source_path, target_path)
-            else:
-                shutil.copytree(source_path, target_path, dirs_exist_ok=data.overwrite)
+            if S_ISDIR(source_stat.st_mode):
+                return await cls._submit_task(action='copy', jobs=[(source_path, target_path)], func=_copy)
             
-            logger.info(f"复制成功: {source_path} -> {target_path}")
+            await FsUtil.run(_copy, source_path, target_path)
+            return None
             
         except CustomException:
             raise
@@ -730,6 +839,33 @@ class ResourceService:
             logger.error(f"复制失败: {str(e)}")
             raise CustomException(msg=f"复制失败: {str(e)}")
 
+    @classmethod
+    def _rename(cls, old_path: str, new_name: str) -> str:
+        """
+        重命名文件或目录（阻塞调用，需在 FsUtil 线程池中执行）
+        
+        参数:
+        - old_path (str): 已校验的原路径。
+        - new_name (str): 新名称。
+        
+        返回:
+        - str: 新路径。
+        """
+        if not os.path.lexists(old_path):
+            raise CustomException(msg='文件或目录不存在')
+        
+        # 生成新路径
+        parent_dir = os.path.dirname(old_path)
+        new_path = os.path.join(parent_dir, new_name)
+        
+        if os.path.lexists(new_path):
+            raise CustomException(msg='目标名称已存在')
+        
+        # 重命名
+        os.rename(old_path, new_path)
+        cls._sync_index(added=[new_path], removed=[old_path])
+        return new_path
+
     @classmethod
     async def rename_file_service(cls, data: ResourceRenameSchema) -> None:
         """
@@ -743,19 +879,7 @@ class ResourceService:
         """
         try:
             old_path = cls._get_safe_path(data.old_path)
-            
-            if not os.path.exists(old_path):
-                raise CustomException(msg='文件或目录不存在')
-            
-            # 生成新路径
-            parent_dir = os.path.dirname(old_path)
-            new_path = os.path.join(parent_dir, data.new_name)
-            
-            if os.path.exists(new_path):
-                raise CustomException(msg='目标名称已存在')
-            
-            # 重命名
-            os.rename(old_path, new_path)
+            new_path = await FsUtil.run(cls._rename, old_path, data.new_name)
             logger.info(f"重命名成功: {old_path} -> {new_path}")
             
         except CustomException:
@@ -764,6 +888,35 @@ class ResourceService:
             logger.error(f"重命名失败: {str(e)}")
             raise CustomException(msg=f"重命名失败: {str(e)}")
 
+    @classmethod
+    def _create_directory(cls, parent_path: str, dir_name: str) -> str:
+        """
+        创建目录（阻塞调用，需在 FsUtil 线程池中执行）
+        
+        参数:
+        - parent_path (str): 已校验的父目录路径。
+        - dir_name (str): 目录名称。
+        
+        返回:
+        - str: 新目录路径。
+        """
+        if not os.path.exists(parent_path):
+            raise CustomException(msg='父目录不存在')
+        
+        if not os.path.isdir(parent_path):
+            raise CustomException(msg='父路径不是目录')
+        
+        # 生成新目录路径
+        new_dir_path = os.path.join(parent_path, dir_name)
+        
+        if os.path.exists(new_dir_path):
+            raise CustomException(msg='目录已存在')
+        
+        # 创建目录
+        os.makedirs(new_dir_path)
+        cls._sync_index(added=[new_dir_path])
+        return new_dir_path
+
     @classmethod
     async def create_directory_service(cls, data: ResourceCreateDirSchema) -> None:
         """
@@ -776,26 +929,12 @@ class ResourceService:
         - None
         """
         try:
-            parent_path = cls._get_safe_path(data.parent_path)
-            
-            if not os.path.exists(parent_path):
-                raise CustomException(msg='父目录不存在')
-            
-            if not os.path.isdir(parent_path):
-                raise CustomException(msg='父路径不是目录')
-            
-            # 生成新目录路径
-            new_dir_path = os.path.join(parent_path, data.dir_name)
-            
             # 安全检查：确保新目录名称不包含路径遍历字符
             if '..' in data.dir_name or '/' in data.dir_name or '\\' in data.dir_name:
                 raise CustomException(msg='目录名称包含不安全字符')
             
-            if os.path.exists(new_dir_path):
-                raise CustomException(msg='目录已存在')
-            
-            # 创建目录
-            os.makedirs(new_dir_path)
+            parent_path = cls._get_safe_path(data.parent_path)
+            new_dir_path = await FsUtil.run(cls._create_directory, parent_path, data.dir_name)
             logger.info(f"创建目录成功: {new_dir_path}")
             
         except CustomException:
@@ -804,6 +943,61 @@ class ResourceService:
             logger.error(f"创建目录失败: {str(e)}")
             raise CustomException(msg=f"创建目录失败: {str(e)}")
 
+    @classmethod
+    async def get_directory_stats_service(cls, path: Optional[str] = None) -> Dict:
+        """
+        获取目录递归统计（文件数、目录数、总大小）
+        
+        参数:
+        - path (Optional[str]): 目录路径，默认静态文件根目录。
+        
+        返回:
+        - Dict: 目录统计信息。
+        """
+        safe_path = cls._get_safe_path(path)
+        st = await FsUtil.run(cls._stat_or_none, safe_path)
+        if st is None:
+            raise CustomException(msg='目录不存在')
+        if not S_ISDIR(st.st_mode):
+            raise CustomException(msg='路径不是目录')
+        stats = await cls._get_directory_stats(safe_path, include_hidden=True)
+        return ResourceStatsSchema(
+            path=cls._generate_http_url(safe_path),
+            total_files=stats['files'],
+            total_dirs=stats['dirs'],
+            total_size=stats['size']
+        ).model_dump()
+
+    @classmethod
+    async def _submit_task(cls, action: str, jobs: List, func) -> Dict:
+        """
+        提交后台文件任务
+        
+        参数:
+        - action (str): 操作类型。
+        - jobs (List): (源路径, 目标路径) 列表。
+        - func (Callable): 执行函数 func(source, target, progress)。
+        
+        返回:
+        - Dict: 任务信息。
+        """
+        task = await FsTaskManager.submit(action=action, jobs=jobs, func=func)
+        logger.info(f"已提交后台文件任务: {action} {task['task_id']}")
+        return ResourceTaskSchema(**task).model_dump(mode='json')
+
+    @classmethod
+    async def get_task_service(cls, task_id: str) -> Dict:
+        """
+        获取后台文件任务进度
+        
+        参数:
+        - task_id (str): 任务ID。
+        
+        返回:
+        - Dict: 任务进度信息。
+        """
+        return ResourceTaskSchema(**await FsTaskManager.get(task_id)).model_dump(mode='json')
+
     @classmethod
     def _format_file_size(cls, size_bytes: int) -> str:
         """
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 
 from pydantic import BaseModel, ConfigDict, Field
-from typing import List
+from typing import List, Optional
 
 
 class CpuInfoSchema(BaseModel):
@@ -68,6 +68,38 @@ class DiskInfoSchema(BaseModel):
     usage: float = Field(ge=0, le=100, description="使用率(%)")
 
 
+class CaptchaPoolSchema(BaseModel):
+    """验证码预生成池统计模型(当前进程)"""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    enabled: bool = Field(description="是否启用")
+    capacity: int = Field(description="池容量")
+    size: int = Field(description="当前预生成数量")
+    hits: int = Field(description="命中次数")
+    misses: int = Field(description="未命中(同步渲染)次数")
+    hit_rate: float = Field(ge=0, le=100, description="命中率(%)")
+
+
+class DbPoolSchema(BaseModel):
+    """数据库连接池统计模型(当前进程)"""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    name: str = Field(description="引擎(async异步/sync同步)")
+    dialect: str = Field(description="数据库类型")
+    pool_class: str = Field(description="连接池类型")
+    size: int = Field(description="连接池大小")
+    max_overflow: int = Field(description="最大溢出连接数")
+    checked_out: int = Field(description="借出连接数")
+    checked_in: int = Field(description="空闲连接数")
+    overflow: int = Field(description="当前溢出连接数")
+    checkouts: int = Field(description="累计借出次数")
+    timeouts: int = Field(description="借出超时次数")
+    wait_avg_ms: float = Field(description="平均借出等待(毫秒)")
+    wait_max_ms: float = Field(description="最大借出等待(毫秒)")
+
+
 class ServerMonitorSchema(BaseModel):
     """服务器监控信息模型"""
 
@@ -78,3 +110,5 @@ class ServerMonitorSchema(BaseModel):
     py: PyInfoSchema = Field(description="Python运行信息")
     sys: SysInfoSchema = Field(description="系统信息")
     disks: List[DiskInfoSchema] = Field(default_factory=list, description="磁盘信息")
+    captcha: Optional[CaptchaPoolSchema] = Field(default=None, description="验证码预生成池统计")
+    db_pools: List[DbPoolSchema] = Field(default_factory=list, description="数据库连接池统计")
@@ -8,7 +8,11 @@ from pathlib import Path
 from typing import List, Dict
 
 from app.utils.common_util import bytes2human
+from app.utils.captcha_util import CaptchaPool
+from app.core.database import pool_status
 from .schema import (
+    CaptchaPoolSchema,
+    DbPoolSchema,
     CpuInfoSchema,
     MemoryInfoSchema,
     PyInfoSchema,
@@ -34,7 +38,9 @@ class ServerService:
             mem=cls._get_memory_info(),
             sys=cls._get_system_info(),
             py=cls._get_python_info(),
-            disks=cls._get_disk_info()
+            disks=cls._get_disk_info(),
+            captcha=CaptchaPoolSchema(**CaptchaPool.stats()),
+            db_pools=[DbPoolSchema(**item) for item in pool_status()]
         ).model_dump()
 
     @classmethod
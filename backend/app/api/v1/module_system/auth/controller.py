@@ -67,7 +67,6 @@ async def login_for_access_token_controller(
 async def get_new_token_controller(
     request: Request,
     payload: RefreshTokenPayloadSchema,
-    db: AsyncSession = Depends(db_getter),
     redis: Redis = Depends(redis_getter) 
 ) -> JSONResponse:
     """
@@ -76,6 +75,7 @@ async def get_new_token_controller(
     参数:
     - request (Request): FastAPI请求对象
     - payload (RefreshTokenPayloadSchema): 刷新令牌负载模型
+    - redis (Redis): Redis客户端对象
         
     返回:
     - JWTOutSchema: 包含新的访问令牌和刷新令牌的响应模型
@@ -84,7 +84,7 @@ async def get_new_token_controller(
     - CustomException: 刷新令牌失败时抛出异常。
     """
     # 解析当前的访问Token以获取用户名
-    new_token = await LoginService.refresh_token_service(db=db, request=request, redis=redis, refresh_token=payload)
+    new_token = await LoginService.refresh_token_service(request=request, redis=redis, refresh_token=payload)
     token_dict = new_token.model_dump()
     logger.info(f"刷新token成功: {token_dict}")
     return SuccessResponse(data=token_dict, msg="刷新成功")
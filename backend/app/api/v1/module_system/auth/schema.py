@@ -22,6 +22,7 @@ class JWTPayloadSchema(BaseModel):
     sub: str = Field(..., description='用户登录信息')
     is_refresh: bool = Field(default=False, description='是否刷新token')
     exp: Union[datetime, int] = Field(..., description='过期时间')
+    jti: Optional[str] = Field(default=None, description='令牌编号')
 
     @model_validator(mode='after')
     def validate_fields(self):
@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 
-import json
 import uuid
-from typing import Dict, Union, NewType
+from typing import Dict, Tuple, Union, NewType
 from fastapi import Request
 from redis.asyncio.client import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -11,15 +10,16 @@ from user_agents import parse
 
 from app.common.enums import RedisInitKeyConfig
 from app.utils.common_util import get_random_character
-from app.utils.captcha_util import CaptchaUtil
+from app.utils.captcha_util import CaptchaPool
 from app.utils.ip_local_util import IpLocalUtil
 from app.utils.hash_bcrpy_util import PwdUtil
 from app.core.security import (
     CustomOAuth2PasswordRequestForm,
     create_access_token,
-    decode_access_token
+    decode_session_token
 )
 from app.core.redis_crud import RedisCURD
+from app.core.session_store import SessionStore
 from app.core.exceptions import CustomException
 from app.core.logger import logger
 from app.config.setting import settings
@@ -133,11 +133,7 @@ class LoginService:
         # 确保在请求上下文中设置用户名
         request.scope["user_username"] = user.username
 
-        access_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-        refresh_expires = timedelta(minutes=settings.REFRESH_TOKEN_EXPIRE_MINUTES)
-        
-        now = datetime.now()
-        session_info=OnlineOutSchema(
+        session_info = OnlineOutSchema(
             session_id=session_id,
             user_id=user.id, 
             name=user.name,
@@ -150,44 +146,26 @@ class LoginService:
             login_type=login_type
         ).model_dump_json()
 
-        access_token = create_access_token(payload=JWTPayloadSchema(
-            sub=session_info,
-            is_refresh=False,
-            exp=now + access_expires,
-        ))
-        refresh_token = create_access_token(payload=JWTPayloadSchema(
-            sub=session_info,
-            is_refresh=True,
-            exp=now + refresh_expires,
-        ))
-
-        # 设置新的token
-        await RedisCURD(redis).set(
-            key=f'{RedisInitKeyConfig.ACCESS_TOKEN.key}:{session_id}',
-            value=access_token,
-            expire=int(access_expires.total_seconds())
-        )
+        token, access_jti, refresh_jti = cls._issue_tokens(session_info=session_info)
 
-        await RedisCURD(redis).set(
-            key=f'{RedisInitKeyConfig.REFRESH_TOKEN.key}:{session_id}',
-            value=refresh_token,
-            expire=int(refresh_expires.total_seconds())
+        # 会话哈希一次写入：令牌编号与会话信息
+        await SessionStore.create(
+            redis=redis,
+            session_id=session_id,
+            access_jti=access_jti,
+            refresh_jti=refresh_jti,
+            info=session_info,
+            expire=settings.REFRESH_TOKEN_EXPIRE_MINUTES * 60
         )
 
-        return JWTOutSchema(
-            access_token=access_token,
-            refresh_token=refresh_token,
-            expires_in=int(access_expires.total_seconds()),
-            token_type=settings.TOKEN_TYPE
-        )
+        return token
 
     @classmethod
-    async def refresh_token_service(cls, db: AsyncSession, redis: Redis, request: Request, refresh_token: RefreshTokenPayloadSchema) -> JWTOutSchema:
+    async def refresh_token_service(cls, redis: Redis, request: Request, refresh_token: RefreshTokenPayloadSchema) -> JWTOutSchema:
         """
         刷新访问令牌
         
         参数:
-        - db (AsyncSession): 数据库会话对象
         - redis (Redis): Redis客户端对象
         - request (Request): FastAPI请求对象
         - refresh_token (RefreshTokenPayloadSchema): 刷新令牌数据
@@ -198,60 +176,32 @@ class LoginService:
         异常:
         - CustomException: 刷新令牌无效时抛出异常
         """
-        token_payload: JWTPayloadSchema = decode_access_token(token = refresh_token.refresh_token)
+        token_payload, session_info = decode_session_token(token=refresh_token.refresh_token)
         if not token_payload.is_refresh:
             raise CustomException(msg="非法凭证，请传入刷新令牌")
         
-        # 去 Redis 查完整信息
-        session_info = json.loads(token_payload.sub)
         session_id = session_info.get("session_id")
         user_id = session_info.get("user_id")
 
-        if not session_id or not user_id:
+        if not session_id or not user_id or not token_payload.jti:
             raise CustomException(msg="非法凭证,无法获取会话编号或用户ID")
 
-        # 用户认证
-        auth = AuthSchema(db=db)
-        user = await UserCRUD(auth).get_by_id_crud(id=user_id)
-
-        # 设置新的 token
-        access_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-        refresh_expires = timedelta(minutes=settings.REFRESH_TOKEN_EXPIRE_MINUTES)
-        now = datetime.now()
-
-        session_info_json = json.dumps(session_info)
-
-        access_token = create_access_token(payload=JWTPayloadSchema(
-            sub=session_info_json,
-            is_refresh=False,
-            exp=now + access_expires,
-        ))
+        # 会话信息取自刷新令牌本身，无需回查用户
+        token, access_jti, refresh_jti = cls._issue_tokens(session_info=token_payload.sub)
 
-        refresh_token_new = create_access_token(payload=JWTPayloadSchema(
-            sub=session_info_json,
-            is_refresh=True,
-            exp=now + refresh_expires,
-        ))
-        
-        # 覆盖写入 Redis
-        await RedisCURD(redis).set(
-            key=f'{RedisInitKeyConfig.ACCESS_TOKEN.key}:{session_id}',
-            value=access_token,
-            expire=int(access_expires.total_seconds())
-        )
-
-        await RedisCURD(redis).set(
-            key=f'{RedisInitKeyConfig.REFRESH_TOKEN.key}:{session_id}',
-            value=refresh_token_new,
-            expire=int(refresh_expires.total_seconds())
+        # 原子轮换：会话已下线或刷新令牌已被使用过时失败
+        rotated = await SessionStore.rotate(
+            redis=redis,
+            session_id=session_id,
+            refresh_jti=token_payload.jti,
+            new_access_jti=access_jti,
+            new_refresh_jti=refresh_jti,
+            expire=settings.REFRESH_TOKEN_EXPIRE_MINUTES * 60
         )
+        if not rotated:
+            raise CustomException(msg="刷新令牌已失效,请重新登录", code=10401, status_code=401)
 
-        return JWTOutSchema(
-            access_token=access_token,
-            refresh_token=refresh_token_new,
-            expires_in=int(access_expires.total_seconds()),
-            token_type=settings.TOKEN_TYPE
-        )
+        return token
 
     @classmethod
     async def logout_service(cls, redis: Redis, token: LogoutPayloadSchema) -> bool:
@@ -268,21 +218,57 @@ class LoginService:
         异常:
         - CustomException: 令牌无效时抛出异常
         """
-        payload: JWTPayloadSchema = decode_access_token(token=token.token)
-        session_info = json.loads(payload.sub)
+        _, session_info = decode_session_token(token=token.token)
         session_id = session_info.get("session_id")
         
         if not session_id:
             raise CustomException(msg="非法凭证,无法获取会话编号")
 
-        # 删除Redis中的在线用户、访问令牌、刷新令牌
-        await RedisCURD(redis).delete(f"{RedisInitKeyConfig.ACCESS_TOKEN.key}:{session_id}")
-        await RedisCURD(redis).delete(f"{RedisInitKeyConfig.REFRESH_TOKEN.key}:{session_id}")
+        # 删除会话，访问令牌与刷新令牌随之失效
+        await SessionStore.delete(redis=redis, session_id=session_id)
         
         logger.info(f"用户退出登录成功,会话编号:{session_id}")
 
         return True
 
+    @staticmethod
+    def _issue_tokens(session_info: str) -> Tuple[JWTOutSchema, str, str]:
+        """
+        签发一对访问令牌与刷新令牌
+        
+        参数:
+        - session_info (str): 会话信息 JSON
+            
+        返回:
+        - Tuple[JWTOutSchema, str, str]: 令牌响应模型、访问令牌编号、刷新令牌编号
+        """
+        access_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        refresh_expires = timedelta(minutes=settings.REFRESH_TOKEN_EXPIRE_MINUTES)
+        now = datetime.now()
+        access_jti = uuid.uuid4().hex
+        refresh_jti = uuid.uuid4().hex
+
+        access_token = create_access_token(payload=JWTPayloadSchema(
+            sub=session_info,
+            is_refresh=False,
+            exp=now + access_expires,
+            jti=access_jti,
+        ))
+        refresh_token = create_access_token(payload=JWTPayloadSchema(
+            sub=session_info,
+            is_refresh=True,
+            exp=now + refresh_expires,
+            jti=refresh_jti,
+        ))
+
+        token = JWTOutSchema(
+            access_token=access_token,
+            refresh_token=refresh_token,
+            expires_in=int(access_expires.total_seconds()),
+            token_type=settings.TOKEN_TYPE
+        )
+        return token, access_jti, refresh_jti
+
 
 class CaptchaService:
     """验证码服务"""
@@ -305,7 +291,7 @@ class CaptchaService:
             raise CustomException(msg="未开启验证码服务")
 
         # 生成验证码图片和值
-        captcha_base64, captcha_value = CaptchaUtil.captcha_arithmetic()
+        captcha_base64, captcha_value = CaptchaPool.get()
         captcha_key = get_random_character()
 
         # 保存到Redis并设置过期时间
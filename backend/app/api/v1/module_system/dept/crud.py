@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 from typing import Dict, List, Optional, Sequence, Union, Any
+from sqlalchemy.engine import Row
 
 from app.core.base_crud import CRUDBase
 from ..auth.schema import AuthSchema
@@ -58,7 +59,16 @@ class DeptCRUD(CRUDBase[DeptModel, DeptCreateSchema, DeptUpdateSchema]):
         返回:
         - Sequence[DeptModel]: 部门树形列表。
         """
-        return await self.tree_list(search=search, order_by=order_by, children_attr='children', preload=preload)
+        return await self.tree_list(search=search, order_by=order_by, preload=preload)
+
+    async def get_tree_nodes_crud(self) -> Sequence[Row]:
+        """
+        获取部门树节点关系（仅 id 与 parent_id）。
+        
+        返回:
+        - Sequence[Row]: 部门节点关系列表。
+        """
+        return await self.tree_nodes()
 
     async def set_available_crud(self, ids: List[int], status: bool) -> None:
         """
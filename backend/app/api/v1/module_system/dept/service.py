@@ -58,11 +58,11 @@ class DeptService:
         返回:
         - List[Dict]: 部门树形列表对象。
         """
-        # 使用树形结构查询，预加载children关系
+        # 单次查询获取扁平列表
         dept_list = await DeptCRUD(auth).get_tree_list_crud(search=search.__dict__, order_by=order_by)
         # 转换为字典列表
         dept_dict_list = [DeptOutSchema.model_validate(dept).model_dump() for dept in dept_list]
-        # 使用traversal_to_tree构建树形结构
+        # 使用traversal_to_tree按id索引构建树形结构
         return traversal_to_tree(dept_dict_list)
 
     @classmethod
@@ -132,16 +132,13 @@ class DeptService:
         """
         if len(ids) < 1:
             raise CustomException(msg='删除失败，删除对象不能为空')
-        for id in ids:
-            dept = await DeptCRUD(auth).get_by_id_crud(id=id)
-            if not dept:
-                raise CustomException(msg='删除失败，该部门不存在')
+        if len(await DeptCRUD(auth).get_many(ids=ids)) < len(set(ids)):
+            raise CustomException(msg='删除失败，该部门不存在')
         # 校验是否存在子级部门，存在则禁止删除
-        dept_list = await DeptCRUD(auth).get_list_crud()
-        id_map = get_child_id_map(model_list=dept_list)
+        dept_nodes = await DeptCRUD(auth).get_tree_nodes_crud()
+        id_map = get_child_id_map(model_list=dept_nodes)
         for id in ids:
-            descendants = get_child_recursion(id=id, id_map=id_map)
-            if len(descendants) > 1:
+            if id_map.get(id):
                 raise CustomException(msg='删除失败，存在子级部门，请先删除子级部门')
         await DeptCRUD(auth).delete(ids=ids)
 
@@ -157,16 +154,16 @@ class DeptService:
         返回:
         - None
         """
-        dept_list = await DeptCRUD(auth).get_list_crud()
+        dept_nodes = await DeptCRUD(auth).get_tree_nodes_crud()
         total_ids = []
         
         if data.status:
-            id_map = get_parent_id_map(model_list=dept_list)
+            id_map = get_parent_id_map(model_list=dept_nodes)
             for dept_id in data.ids:
                 enable_ids = get_parent_recursion(id=dept_id, id_map=id_map)
                 total_ids.extend(enable_ids)
         else:
-            id_map = get_child_id_map(model_list=dept_list)
+            id_map = get_child_id_map(model_list=dept_nodes)
             for dept_id in data.ids:
                 disable_ids = get_child_recursion(id=dept_id, id_map=id_map)
                 total_ids.extend(disable_ids)
@@ -1,11 +1,10 @@
 # -*- coding: utf-8 -*-
 
-import json
 from fastapi import APIRouter, Body, Depends, Path, Query
 from fastapi.responses import JSONResponse, StreamingResponse
 from redis.asyncio.client import Redis
 
-from app.common.response import StreamResponse, SuccessResponse
+from app.common.response import RawJSON, StreamResponse, SuccessResponse
 from app.core.base_params import PaginationQueryParam
 from app.core.base_schema import BatchSetAvailable
 from app.core.dependencies import AuthPermission, redis_getter
@@ -52,7 +51,7 @@ async def get_type_detail_controller(
 async def get_type_list_controller(
     page: PaginationQueryParam = Depends(),
     search: DictTypeQueryParam = Depends(),
-    auth: AuthSchema = Depends(AuthPermission(["system:dict_type:query"]))
+    auth: AuthSchema = Depends(AuthPermission(["system:dict_type:query"], read_only=True))
 ) -> JSONResponse:
     """
     查询字典类型列表
@@ -75,7 +74,7 @@ async def get_type_list_controller(
 
 @DictRouter.get("/type/optionselect", summary="获取全部字典类型", description="获取全部字典类型")
 async def get_type_loptionselect_controller(
-    auth: AuthSchema = Depends(AuthPermission(["system:dict_type:query"]))
+    auth: AuthSchema = Depends(AuthPermission(["system:dict_type:query"], read_only=True))
 ) -> JSONResponse:
     """
     获取全部字典类型
@@ -192,7 +191,7 @@ async def batch_set_available_dict_type_controller(
 @DictRouter.post('/type/export', summary="导出字典类型", description="导出字典类型")
 async def export_type_list_controller(
     search: DictTypeQueryParam = Depends(),
-    auth: AuthSchema = Depends(AuthPermission(["system:dict_type:export"]))
+    auth: AuthSchema = Depends(AuthPermission(["system:dict_type:export"], read_only=True))
 ) -> StreamingResponse:
     """
     导出字典类型
@@ -246,7 +245,7 @@ async def get_data_detail_controller(
 async def get_data_list_controller(
     page: PaginationQueryParam = Depends(),
     search: DictDataQueryParam = Depends(),
-    auth: AuthSchema = Depends(AuthPermission(["system:dict_data:query"]))
+    auth: AuthSchema = Depends(AuthPermission(["system:dict_data:query"], read_only=True))
 ) -> JSONResponse:
     """
     查询字典数据
@@ -370,7 +369,7 @@ async def batch_set_available_dict_data_controller(
 async def export_data_list_controller(
     search: DictDataQueryParam = Depends(),
     page: PaginationQueryParam = Depends(),
-    auth: AuthSchema = Depends(AuthPermission(["system:dict_data:export"]))
+    auth: AuthSchema = Depends(AuthPermission(["system:dict_data:export"], read_only=True))
 ) -> StreamingResponse:
     """
     导出字典数据
@@ -421,10 +420,8 @@ async def get_init_dict_data_controller(
     )
     logger.info(f"获取初始化字典数据成功：{dict_data_query_result}")
 
-    # 确保数据是字符串类型再进行 JSON 解析
-    if isinstance(dict_data_query_result, bytes):
-        dict_data_query_result = dict_data_query_result.decode('utf-8')
-    elif not isinstance(dict_data_query_result, str):
+    # 缓存中已是 JSON 字符串，原样嵌入响应，无需解析后再序列化
+    if not isinstance(dict_data_query_result, (bytes, str)):
         dict_data_query_result = str(dict_data_query_result)
         
-    return SuccessResponse(data=json.loads(dict_data_query_result), msg="获取初始化字典数据成功")
+    return SuccessResponse(data=RawJSON(dict_data_query_result), msg="获取初始化字典数据成功")
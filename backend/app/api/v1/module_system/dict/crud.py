@@ -2,6 +2,8 @@
 
 from typing import Dict, List, Optional, Sequence, Union, Any
 
+from sqlalchemy import select
+
 from app.core.base_crud import CRUDBase
 from app.api.v1.module_system.dict.model import DictDataModel, DictTypeModel
 from app.api.v1.module_system.dict.schema import DictDataCreateSchema, DictDataUpdateSchema, DictTypeCreateSchema, DictTypeUpdateSchema
@@ -124,6 +126,21 @@ class DictDataCRUD(CRUDBase[DictDataModel, DictDataCreateSchema, DictDataUpdateS
         - Optional[DictDataModel]: 数据字典数据模型,如果不存在则为None
         """
         return await self.get(id=id, preload=preload)
+
+    async def exists_by_dict_types_crud(self, dict_types: List[str]) -> bool:
+        """
+        判断字典类型下是否存在字典数据
+        
+        参数:
+        - dict_types (List[str]): 字典类型列表
+        
+        返回:
+        - bool: 任一字典类型下存在字典数据时返回True
+        """
+        if not dict_types:
+            return False
+        sql = select(DictDataModel.id).where(DictDataModel.dict_type.in_(dict_types)).limit(1)
+        return (await self.db.execute(sql)).first() is not None
     
     async def get_obj_list_crud(self, search: Optional[Dict] = None, order_by: Optional[List[Dict[str, str]]] = None, preload: Optional[List[Union[str, Any]]] = None) -> Sequence[DictDataModel]:
         """
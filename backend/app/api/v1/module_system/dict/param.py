@@ -21,7 +21,7 @@ class DictTypeQueryParam:
         super().__init__()
         
         # 模糊查询字段
-        self.dict_name = ("like", f"%{dict_name}%") if dict_name else None
+        self.dict_name = ("search", dict_name) if dict_name else None
         
         # 精确查询字段
         self.creator_id = creator
@@ -47,7 +47,7 @@ class DictDataQueryParam:
     ) -> None:
         
         # 模糊查询字段
-        self.dict_label = ("like", f"%{dict_label}%") if dict_label else None
+        self.dict_label = ("search", dict_label) if dict_label else None
         
         # 精确查询字段
         self.creator_id = creator
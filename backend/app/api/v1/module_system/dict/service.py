@@ -167,23 +167,22 @@ class DictTypeService:
         """
         if len(ids) < 1:
             raise CustomException(msg='删除失败，删除对象不能为空')
-        for id in ids:
-            exist_obj = await DictTypeCRUD(auth).get_obj_by_id_crud(id=id)
-            if not exist_obj:
-                raise CustomException(msg='删除失败，该数据字典类型不存在')
-            # 检查是否有字典数据
-            exist_obj_type_list = await DictDataCRUD(auth).list(search={'dict_type': id})
-            if len(exist_obj_type_list) > 0:
-                # 如果有字典数据，不能删除
-                raise CustomException(msg='删除失败，该数据字典类型下存在字典数据')
-            # 删除Redis缓存
-            redis_key = f"{RedisInitKeyConfig.SYSTEM_DICT.key}:{exist_obj.dict_type}"
-            try:
-                await RedisCURD(redis).delete(redis_key)
-                logger.info(f"删除字典类型成功: {id}")
-            except Exception as e:
-                logger.error(f"删除字典类型失败: {e}")
-                raise CustomException(msg=f"删除字典类型失败")
+        exist_objs = await DictTypeCRUD(auth).get_many(ids=ids, columns=['dict_type'])
+        if len(exist_objs) < len(set(ids)):
+            raise CustomException(msg='删除失败，该数据字典类型不存在')
+        dict_types = [obj.dict_type for obj in exist_objs]
+        # 检查是否有字典数据
+        if await DictDataCRUD(auth).exists_by_dict_types_crud(dict_types=dict_types):
+            # 如果有字典数据，不能删除
+            raise CustomException(msg='删除失败，该数据字典类型下存在字典数据')
+        # 删除Redis缓存
+        redis_keys = [f"{RedisInitKeyConfig.SYSTEM_DICT.key}:{dict_type}" for dict_type in dict_types]
+        try:
+            await RedisCURD(redis).delete(*redis_keys)
+            logger.info(f"删除字典类型成功: {ids}")
+        except Exception as e:
+            logger.error(f"删除字典类型失败: {e}")
+            raise CustomException(msg=f"删除字典类型失败")
         await DictTypeCRUD(auth).delete_obj_crud(ids=ids)
     
     @classmethod
@@ -435,23 +434,21 @@ class DictDataService:
         if len(ids) < 1:
             raise CustomException(msg='删除失败，删除对象不能为空')
         
-        for id in ids:
-
-            exist_obj = await DictDataCRUD(auth).get_obj_by_id_crud(id=id)
-            if not exist_obj:
-                raise CustomException(msg=f'{id} 删除失败，该字典数据不存在')
-            # 新增：系统默认字典数据不允许删除（通过 is_default 判断）
-            if exist_obj.is_default:
-                raise CustomException(msg='删除失败，系统默认字典数据不允许删除')
-            # 删除Redis缓存
-            redis_key = f"{RedisInitKeyConfig.SYSTEM_DICT.key}:{exist_obj.dict_type}"
-            try:
-                # 删除Redis缓存
-                await RedisCURD(redis).delete(redis_key)
-                logger.info(f"删除字典数据成功: {id}")
-            except Exception as e:
-                logger.error(f"删除字典数据失败: {e}")
-                raise CustomException(msg=f"删除字典数据失败 {e}")
+        exist_objs = await DictDataCRUD(auth).get_many(ids=ids, columns=['dict_type', 'is_default'])
+        missing = set(ids) - {obj.id for obj in exist_objs}
+        if missing:
+            raise CustomException(msg=f'{min(missing)} 删除失败，该字典数据不存在')
+        # 系统默认字典数据不允许删除（通过 is_default 判断）
+        if any(obj.is_default for obj in exist_objs):
+            raise CustomException(msg='删除失败，系统默认字典数据不允许删除')
+        # 删除Redis缓存
+        redis_keys = [f"{RedisInitKeyConfig.SYSTEM_DICT.key}:{dict_type}" for dict_type in {obj.dict_type for obj in exist_objs}]
+        try:
+            await RedisCURD(redis).delete(*redis_keys)
+            logger.info(f"删除字典数据成功: {ids}")
+        except Exception as e:
+            logger.error(f"删除字典数据失败: {e}")
+            raise CustomException(msg=f"删除字典数据失败 {e}")
         await DictDataCRUD(auth).delete_obj_crud(ids=ids)
 
     @classmethod
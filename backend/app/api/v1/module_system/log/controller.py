@@ -1,9 +1,9 @@
 # -*- coding: utf-8 -*-
 
+from typing import Optional
 from fastapi import APIRouter, Body, Depends, Path, Query
 from fastapi.responses import JSONResponse, StreamingResponse
 
-from app.common.request import PaginationService
 from app.common.response import SuccessResponse, StreamResponse
 from app.utils.common_util import bytes2file_response
 from app.core.router_class import OperationLogRoute
@@ -22,7 +22,8 @@ LogRouter = APIRouter(route_class=OperationLogRoute, prefix="/log", tags=["日
 async def get_obj_list_controller(
     page: PaginationQueryParam = Depends(),
     search: OperationLogQueryParam = Depends(),
-    auth: AuthSchema = Depends(AuthPermission(["system:log:query"]))
+    last_id: Optional[int] = Query(None, description="上一页最后一条日志ID(MongoDB 存储时按范围分页)"),
+    auth: AuthSchema = Depends(AuthPermission(["system:log:query"], read_only=True))
 ) -> JSONResponse:
     """ 
     查询日志 
@@ -30,6 +31,7 @@ async def get_obj_list_controller(
     参数:
     - page (PaginationQueryParam): 分页查询参数模型
     - search (OperationLogQueryParam): 日志查询参数模型
+    - last_id (Optional[int]): 上一页最后一条日志ID
     - auth (AuthSchema): 认证信息模型
     
     返回:
@@ -38,8 +40,7 @@ async def get_obj_list_controller(
     order_by = [{"created_at": "desc"}]
     if page.order_by:
         order_by = page.order_by
-    result_dict_list = await OperationLogService.get_log_list_service(search=search, auth=auth, order_by=order_by)
-    result_dict = await PaginationService.paginate(data_list= result_dict_list, page_no= page.page_no, page_size = page.page_size)
+    result_dict = await OperationLogService.get_log_page_service(auth=auth, page_no=page.page_no, page_size=page.page_size, search=search, order_by=order_by, last_id=last_id)
     logger.info(f"查询日志成功")
     return SuccessResponse(data=result_dict, msg="查询日志成功")
 
@@ -87,7 +88,7 @@ async def delete_obj_log_controller(
 @LogRouter.post("/export", summary="导出日志", description="导出日志")
 async def export_obj_list_controller(
     search: OperationLogQueryParam = Depends(),
-    auth: AuthSchema = Depends(AuthPermission(["system:log:export"]))
+    auth: AuthSchema = Depends(AuthPermission(["system:log:export"], read_only=True))
 ) -> StreamingResponse:
     """ 
     导出日志 
@@ -1,10 +1,18 @@
 # -*- coding: utf-8 -*-
 
-from typing import Dict, List, Optional, Sequence, Union, Any
+from typing import Dict, List, Optional, Sequence, Tuple, Union, Any
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, DESCENDING, IndexModel, ReturnDocument
+from pymongo.errors import BulkWriteError, OperationFailure
+from sqlalchemy import delete, select
 
+from app.config.setting import settings
 from app.core.base_crud import CRUDBase
+from app.core.exceptions import CustomException
+from app.core.logger import logger
+from app.core.mongo_crud import MongoCURD
 from ..auth.schema import AuthSchema
-from .model import OperationLogModel
+from .model import OperationLogModel, OperationLogBodyModel
 from .schema import OperationLogCreateSchema
 
 
@@ -22,7 +30,7 @@ class OperationLogCRUD(CRUDBase[OperationLogModel, OperationLogCreateSchema, Ope
 
     async def create_crud(self, data: OperationLogCreateSchema) -> Optional[OperationLogModel]:
         """
-        创建操作日志记录。
+        创建操作日志记录，请求体与响应体写入 system_log_body。
         
         参数:
         - data (OperationLogCreateSchema): 操作日志创建模型。
@@ -30,7 +38,48 @@ class OperationLogCRUD(CRUDBase[OperationLogModel, OperationLogCreateSchema, Ope
         返回:
         - OperationLogModel | None: 创建后的日志记录。
         """
-        return await self.create(data=data)
+        log = await self.create(data=data.model_dump(exclude={'request_payload', 'response_json'}))
+        if data.request_payload or data.response_json:
+            self.auth.db.add(OperationLogBodyModel(
+                log_id=log.id,
+                request_payload=data.request_payload,
+                response_json=data.response_json
+            ))
+            await self.auth.db.flush()
+        return log
+
+    async def get_body_crud(self, log: OperationLogModel) -> Tuple[Optional[str], Optional[str]]:
+        """
+        获取日志的请求体与响应体，未拆分的历史数据从 system_log 读取。
+        
+        参数:
+        - log (OperationLogModel): 已通过权限校验的日志记录。
+        
+        返回:
+        - Tuple[Optional[str], Optional[str]]: (请求体, 响应体)。
+        """
+        body = await self.auth.db.get(OperationLogBodyModel, log.id)
+        if body:
+            return body.request_payload, body.response_json
+        row = (await self.auth.db.execute(
+            select(OperationLogModel.request_payload, OperationLogModel.response_json).where(OperationLogModel.id == log.id)
+        )).first()
+        return (row.request_payload, row.response_json) if row else (None, None)
+
+    async def delete_crud(self, ids: List[int]) -> None:
+        """
+        删除操作日志及其请求体与响应体。
+        
+        参数:
+        - ids (List[int]): 操作日志ID列表。
+        """
+        await self.delete(ids=ids)
+        # 主表按权限删除后，清理已无主记录的请求体/响应体(SQLite 未开启外键时级联不生效)
+        await self.auth.db.execute(
+            delete(OperationLogBodyModel)
+            .where(OperationLogBodyModel.log_id.in_(ids))
+            .where(~OperationLogBodyModel.log_id.in_(select(OperationLogModel.id).where(OperationLogModel.id.in_(ids))))
+        )
 
     async def get_by_id_crud(self, id: int, preload: Optional[List[Union[str, Any]]] = None) -> Optional[OperationLogModel]:
         """
@@ -57,4 +106,132 @@ class OperationLogCRUD(CRUDBase[OperationLogModel, OperationLogCreateSchema, Ope
         返回:
         - Sequence[OperationLogModel]: 操作日志列表。
         """
-        return await self.list(search=search, order_by=order_by, preload=preload)
\ No newline at end of file
+        return await self.list(search=search, order_by=order_by, preload=preload)
+
+class OperationLogMongoCRUD(MongoCURD):
+    """
+    操作日志 MongoDB 数据层。
+
+    文档沿用 system_log 的字段与自增整数 id(计数器集合按批预留)，接口与数据库后端一致；
+    created_at 上的 TTL 索引按 OPERATION_LOG_RETENTION_DAYS 自动过期。
+    """
+
+    COUNTER_COLLECTION = 'counters'
+    DUPLICATE_KEY_ERROR = 11000
+    # 列表不返回请求体与响应体
+    LIST_PROJECTION = {'_id': 0, 'request_payload': 0, 'response_json': 0}
+    INDEXES = [
+        IndexModel([('id', DESCENDING)], name='ix_id', unique=True),
+        IndexModel([('type', ASCENDING), ('created_at', DESCENDING)], name='ix_type_created_at'),
+        IndexModel([('request_ip', ASCENDING), ('created_at', DESCENDING)], name='ix_request_ip_created_at'),
+        IndexModel([('response_code', ASCENDING), ('created_at', DESCENDING)], name='ix_response_code_created_at'),
+        IndexModel([('creator_id', ASCENDING), ('created_at', DESCENDING)], name='ix_creator_id_created_at'),
+        IndexModel([('request_path', ASCENDING)], name='ix_request_path'),
+    ]
+
+    def __init__(self, db: AsyncIOMotorDatabase) -> None:
+        """
+        初始化操作日志 MongoDB 数据层。
+        """
+        super().__init__(db=db, collection=settings.MONGO_LOG_COLLECTION)
+
+    async def ensure_indexes_crud(self) -> None:
+        """
+        创建普通索引与 TTL 索引，保留天数变化时通过 collMod 更新 TTL。
+        """
+        await self.collection.create_indexes(self.INDEXES)
+        if settings.OPERATION_LOG_RETENTION_DAYS <= 0:
+            return
+        ttl = settings.OPERATION_LOG_RETENTION_DAYS * 86400
+        try:
+            await self.collection.create_index([('created_at', ASCENDING)], name='ttl_created_at', expireAfterSeconds=ttl)
+        except OperationFailure:
+            await self.db.command('collMod', self.collection.name, index={'name': 'ttl_created_at', 'expireAfterSeconds': ttl})
+
+    async def create_many_crud(self, documents: List[Dict]) -> int:
+        """
+        为一批日志预留自增 id 后无序批量写入。
+
+        写入失败的批次会由 MongoSink 原样重试：已带 id 的文档不再重新预留，
+        上次已写入的文档在重试时触发 _id/id 唯一索引冲突，计为写入成功。
+        
+        参数:
+        - documents (List[Dict]): 日志文档列表。
+        
+        返回:
+        - int: 写入条数(含重试时已存在的文档)。
+
+        异常:
+        - CustomException: 写入失败时抛出。
+        """
+        if not documents:
+            return 0
+        pending = [document for document in documents if 'id' not in document]
+        if pending:
+            counter = await self.db[self.COUNTER_COLLECTION].find_one_and_update(
+                {'_id': self.collection.name},
+                {'$inc': {'seq': len(pending)}},
+                upsert=True,
+                return_document=ReturnDocument.AFTER
+            )
+            first_id = counter['seq'] - len(pending) + 1
+            for offset, document in enumerate(pending):
+                document['id'] = first_id + offset
+        try:
+            result = await self.collection.insert_many(documents, ordered=False)
+            return len(result.inserted_ids)
+        except BulkWriteError as e:
+            errors = e.details.get('writeErrors', [])
+            duplicated = [
+                error for error in errors
+                if error.get('code') == self.DUPLICATE_KEY_ERROR and set(error.get('keyPattern', {})) & {'_id', 'id'}
+            ]
+            if len(duplicated) < len(errors):
+                logger.warning(f"操作日志批量写入部分失败: {[error for error in errors if error not in duplicated][:1]}")
+            return e.details.get('nInserted', 0) + len(duplicated)
+        except Exception as e:
+            raise CustomException(msg=f"批量写入操作日志失败: {str(e)}")
+
+    async def get_by_id_crud(self, id: int) -> Optional[Dict]:
+        """
+        根据ID获取操作日志详情(包含请求体与响应体)。
+        
+        参数:
+        - id (int): 操作日志ID。
+        
+        返回:
+        - Dict | None: 操作日志文档。
+        """
+        return await self.collection.find_one({'id': id}, {'_id': 0})
+
+    async def get_list_crud(self, search: Optional[Dict] = None, page_size: Optional[int] = None, last_id: Optional[int] = None, page_no: Optional[int] = None) -> List[Dict]:
+        """
+        按 id 倒序(即创建时间倒序)查询操作日志，传入 last_id 时按范围分页。
+        
+        参数:
+        - search (Dict | None): 搜索条件字典。
+        - page_size (int | None): 每页数量，为空返回全部。
+        - last_id (int | None): 上一页最后一条记录的 id。
+        - page_no (int | None): 页码，未传 last_id 时使用。
+        
+        返回:
+        - List[Dict]: 操作日志文档列表(不含请求体与响应体)。
+        """
+        return await self.list(
+            page_no=page_no,
+            page_size=page_size,
+            order_by=[{'field': 'id', 'direction': DESCENDING}],
+            projection=self.LIST_PROJECTION,
+            range_field='id',
+            after=last_id,
+            **(search or {})
+        )
+
+    async def delete_crud(self, ids: List[int]) -> None:
+        """
+        删除操作日志。
+        
+        参数:
+        - ids (List[int]): 操作日志ID列表。
+        """
+        await self.collection.delete_many({'id': {'$in': ids}})
@@ -1,28 +1,51 @@
 # -*- coding: utf-8 -*-
 
 from typing import Optional
-from sqlalchemy import String, Integer, Text
+from sqlalchemy import ForeignKey, Index, String, Integer, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.core.base_model import CreatorMixin
+from app.core.base_model import CreatorMixin, MappedBase
 
 
 class OperationLogModel(CreatorMixin):
-    """ 
+    """
     系统日志
+
+    索引与 OperationLogQueryParam 的过滤条件对应，均以 created_at 结尾以支持按时间倒序分页；
+    请求体与响应体写入 system_log_body，仅在详情中读取。
     """
     __tablename__ = "system_log"
-    __table_args__ = ({'comment': '系统日志表'})
+    __table_args__ = (
+        Index('ix_system_log_created_at', 'created_at'),
+        Index('ix_system_log_type_created_at', 'type', 'created_at'),
+        Index('ix_system_log_request_ip_created_at', 'request_ip', 'created_at'),
+        Index('ix_system_log_response_code_created_at', 'response_code', 'created_at'),
+        Index('ix_system_log_request_path', 'request_path'),
+        {'comment': '系统日志表'}
+    )
     __loader_options__ = ["creator"]
 
     type: Mapped[int] = mapped_column(Integer, comment="日志类型(1登录日志 2操作日志)")
     request_path: Mapped[str] = mapped_column(String(255), comment="请求路径")
     request_method: Mapped[str] = mapped_column(String(10), comment="请求方式")
-    request_payload: Mapped[Optional[str]] = mapped_column(Text, comment="请求体")
+    # 历史数据的请求体/响应体，新记录写入 system_log_body；延迟加载，列表查询不读取
+    request_payload: Mapped[Optional[str]] = mapped_column(Text, deferred=True, comment="请求体(历史数据)")
     request_ip: Mapped[Optional[str]] = mapped_column(String(50), comment="请求IP地址")
     login_location: Mapped[Optional[str]] = mapped_column(String(255), comment="登录位置")
     request_os: Mapped[Optional[str]] = mapped_column(String(64), nullable=True, comment="操作系统")
     request_browser: Mapped[Optional[str]] = mapped_column(String(64), nullable=True, comment="浏览器")
     response_code: Mapped[int] = mapped_column(Integer, comment="响应状态码")
-    response_json: Mapped[Optional[str]] = mapped_column(Text, nullable=True, comment="响应体")
+    response_json: Mapped[Optional[str]] = mapped_column(Text, nullable=True, deferred=True, comment="响应体(历史数据)")
     process_time: Mapped[Optional[str]] = mapped_column(String(20), nullable=True, comment="处理时间")
+
+
+class OperationLogBodyModel(MappedBase):
+    """
+    系统日志请求体/响应体(与 system_log 一对一)
+    """
+    __tablename__ = "system_log_body"
+    __table_args__ = ({'comment': '系统日志请求体与响应体表'})
+
+    log_id: Mapped[int] = mapped_column(ForeignKey('system_log.id', ondelete='CASCADE'), primary_key=True, comment="日志ID")
+    request_payload: Mapped[Optional[str]] = mapped_column(Text, nullable=True, comment="请求体")
+    response_json: Mapped[Optional[str]] = mapped_column(Text, nullable=True, comment="响应体")
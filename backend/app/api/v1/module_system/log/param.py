@@ -20,8 +20,8 @@ class OperationLogQueryParam:
         end_time: Optional[DateTimeStr] = Query(None, description="结束时间", example="2025-12-31 23:59:59"),
     ) -> None:
         
-        # 模糊查询字段
-        self.request_path = ("like", f"%{request_path}%") if request_path else None
+        # 前缀查询字段(SQLite 编译为区间查询以使用 request_path 索引)
+        self.request_path = ("startswith", request_path) if request_path else None
         
         # 精确查询字段
         self.creator_id = creator
@@ -7,18 +7,16 @@ from app.core.base_schema import BaseSchema
 import re
 
 
-class OperationLogCreateSchema(BaseModel):
-    """日志创建模型"""
+class OperationLogBaseSchema(BaseModel):
+    """日志基础模型(不含请求体与响应体)"""
     type: Optional[int] = Field(default=None, description="日志类型(1登录日志 2操作日志)")
     request_path: Optional[str] = Field(default=None, description="请求路径")
     request_method: Optional[str] = Field(default=None, description="请求方法")
-    request_payload: Optional[str] = Field(default=None, description="请求负载")
     request_ip: Optional[str] = Field(default=None, description="请求 IP 地址")
     login_location: Optional[str] = Field(default=None, description="登录位置")
     request_os: Optional[str] = Field(default=None, description="请求操作系统")
     request_browser: Optional[str] = Field(default=None, description="请求浏览器")
     response_code: Optional[int] = Field(default=None, description="响应状态码")
-    response_json: Optional[str] = Field(default=None, description="响应 JSON 数据")
     process_time: Optional[str] = Field(default=None, description="处理时间")
     description: Optional[str] = Field(default=None, max_length=255, description="描述")
     creator_id: Optional[int] = Field(default=None, description="创建人ID")
@@ -73,6 +71,12 @@ class OperationLogCreateSchema(BaseModel):
         return value
 
 
-class OperationLogOutSchema(OperationLogCreateSchema, BaseSchema):
-    """日志响应模型"""
+class OperationLogCreateSchema(OperationLogBaseSchema):
+    """日志创建模型"""
+    request_payload: Optional[str] = Field(default=None, description="请求负载")
+    response_json: Optional[str] = Field(default=None, description="响应 JSON 数据")
+
+
+class OperationLogOutSchema(OperationLogBaseSchema, BaseSchema):
+    """日志列表响应模型(请求体与响应体仅在详情中返回)"""
     model_config = ConfigDict(from_attributes=True)
@@ -1,12 +1,21 @@
 # -*- coding: utf-8 -*-
 
+from datetime import datetime
 from typing import Any, Dict, List, Optional
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from sqlalchemy import select
 
+from app.common.request import PaginationService
+from app.config.setting import settings
 from app.core.exceptions import CustomException
+from app.core.logger import logger
+from app.core.mongo_crud import MongoSink
+from app.core.base_schema import UserInfoSchema
 from app.utils.excel_util import ExcelUtil
 from ..auth.schema import AuthSchema
+from ..user.model import UserModel
 from .param import OperationLogQueryParam
-from .crud import OperationLogCRUD
+from .crud import OperationLogCRUD, OperationLogMongoCRUD
 from .schema import (
     OperationLogCreateSchema,
     OperationLogOutSchema
@@ -16,8 +25,94 @@ from .schema import (
 class OperationLogService:
     """
     日志模块服务层
+
+    OPERATION_LOG_BACKEND 为 mongodb 时日志经 MongoSink 批量写入 MongoDB，查询、详情、删除与导出均读写 MongoDB。
     """
 
+    _mongo: Optional[AsyncIOMotorDatabase] = None
+    _sink: Optional[MongoSink] = None
+
+    @classmethod
+    def use_mongo(cls) -> bool:
+        """是否使用 MongoDB 存储操作日志"""
+        return settings.OPERATION_LOG_BACKEND == 'mongodb'
+
+    @classmethod
+    async def start_sink_service(cls, mongo: Optional[AsyncIOMotorDatabase]) -> None:
+        """
+        启动 MongoDB 日志写入缓冲，并创建索引
+        
+        参数:
+        - mongo (AsyncIOMotorDatabase | None): MongoDB 数据库连接
+        
+        异常:
+        - CustomException: 未开启 MongoDB 时抛出异常
+        """
+        if not cls.use_mongo() or cls._sink is not None:
+            return
+        if mongo is None:
+            raise CustomException(msg="操作日志存储后端为 mongodb，请先开启 MONGO_DB_ENABLE")
+        crud = OperationLogMongoCRUD(mongo)
+        await crud.ensure_indexes_crud()
+        cls._mongo = mongo
+        cls._sink = MongoSink(
+            name="操作日志",
+            writer=crud.create_many_crud,
+            batch_size=settings.MONGO_LOG_BATCH_SIZE,
+            flush_interval=settings.MONGO_LOG_FLUSH_INTERVAL,
+            max_buffer=settings.MONGO_LOG_BUFFER_SIZE,
+            max_retries=settings.MONGO_LOG_MAX_RETRIES,
+            retry_backoff=settings.MONGO_LOG_RETRY_BACKOFF
+        )
+        cls._sink.start()
+
+    @classmethod
+    async def stop_sink_service(cls) -> None:
+        """
+        停止 MongoDB 日志写入缓冲并写入剩余日志
+        """
+        if cls._sink is None:
+            return
+        await cls._sink.stop()
+        cls._sink = None
+
+    @classmethod
+    def buffer_log_service(cls, data: OperationLogCreateSchema) -> None:
+        """
+        将日志放入 MongoDB 写入缓冲(不等待写入)
+        
+        参数:
+        - data (OperationLogCreateSchema): 日志创建模型
+        """
+        if cls._sink is None:
+            logger.warning("MongoDB 日志写入缓冲未启动，丢弃日志")
+            return
+        now = datetime.now()
+        cls._sink.put({**data.model_dump(), 'created_at': now, 'updated_at': now})
+
+    @classmethod
+    async def _attach_creators(cls, auth: AuthSchema, logs: List[Dict]) -> List[Dict]:
+        """
+        为 MongoDB 日志批量补充创建人信息(一次查询)
+        
+        参数:
+        - auth (AuthSchema): 认证信息模型
+        - logs (List[Dict]): 日志文档列表
+        
+        返回:
+        - List[Dict]: 日志文档列表
+        """
+        creator_ids = {log['creator_id'] for log in logs if log.get('creator_id')}
+        creators = {}
+        if creator_ids:
+            rows = await auth.db.execute(
+                select(UserModel.id, UserModel.name, UserModel.username).where(UserModel.id.in_(creator_ids))
+            )
+            creators = {row.id: UserInfoSchema.model_validate(row).model_dump() for row in rows}
+        for log in logs:
+            log['creator'] = creators.get(log.get('creator_id'))
+        return logs
+
     @classmethod
     async def get_log_detail_service(cls, auth: AuthSchema, id: int) -> Dict:
         """
@@ -30,8 +125,18 @@ class OperationLogService:
         返回:
         - Dict: 日志详情字典
         """
+        if cls.use_mongo():
+            log = await OperationLogMongoCRUD(cls._mongo).get_by_id_crud(id=id)
+            if not log:
+                raise CustomException(msg='该日志不存在')
+            return (await cls._attach_creators(auth, [log]))[0]
+
         log = await OperationLogCRUD(auth).get_by_id_crud(id=id)
+        if not log:
+            raise CustomException(msg='该日志不存在')
+        request_payload, response_json = await OperationLogCRUD(auth).get_body_crud(log=log)
         log_dict = OperationLogOutSchema.model_validate(log).model_dump()
+        log_dict.update(request_payload=request_payload, response_json=response_json)
         return log_dict
 
     @classmethod
@@ -46,11 +151,61 @@ class OperationLogService:
         
         返回:
         - List[Dict]: 日志详情字典列表
-        """            
+        """
+        if cls.use_mongo():
+            log_list = await OperationLogMongoCRUD(cls._mongo).get_list_crud(search=search.__dict__ if search else None)
+            return await cls._attach_creators(auth, log_list)
+
         log_list = await OperationLogCRUD(auth).get_list_crud(search=search.__dict__, order_by=order_by)
         log_dict_list = [OperationLogOutSchema.model_validate(log).model_dump() for log in log_list]
         return log_dict_list
 
+    @classmethod
+    async def get_log_page_service(cls, auth: AuthSchema, page_no: Optional[int] = None, page_size: Optional[int] = None, search: Optional[OperationLogQueryParam] = None, order_by: Optional[List[Dict[str, str]]] = None, last_id: Optional[int] = None) -> Dict:
+        """
+        分页获取日志列表，当前页直接序列化为 JSON 片段，不生成中间字典
+        
+        参数:
+        - auth (AuthSchema): 认证信息模型
+        - page_no (int | None): 当前页码
+        - page_size (int | None): 每页数量
+        - search (OperationLogQueryParam | None): 查询参数对象。
+        - order_by (List[Dict[str, str]] | None): 排序参数列表。
+        - last_id (int | None): 上一页最后一条日志ID(MongoDB 后端按范围分页，固定按创建时间倒序)。
+        
+        返回:
+        - Dict: 分页结果字典
+        """
+        if cls.use_mongo():
+            crud = OperationLogMongoCRUD(cls._mongo)
+            search_dict = search.__dict__ if search else {}
+            # 无过滤条件时 count 读取集合元数据，为估算值
+            total_is_estimate = not crud.filter_condition(**search_dict)
+            total = await crud.count(**search_dict)
+            items = await crud.get_list_crud(search=search_dict, page_size=page_size, last_id=last_id, page_no=page_no)
+            await cls._attach_creators(auth, items)
+            return {
+                "items": items,
+                "total": total,
+                "total_is_estimate": total_is_estimate,
+                "page_no": page_no,
+                "page_size": page_size,
+                "has_next": len(items) == page_size if total_is_estimate else bool(page_no and page_size and page_no * page_size < total),
+                "last_id": items[-1]['id'] if items else None
+            }
+
+        if page_no and page_size:
+            # 数据库分页，总数由 CountStrategy 估算或缓存
+            return await OperationLogCRUD(auth).page(
+                offset=(page_no - 1) * page_size,
+                limit=page_size,
+                order_by=order_by or [{'created_at': 'desc'}],
+                search=search.__dict__ if search else {},
+                out_schema=OperationLogOutSchema
+            )
+        obj_list = await OperationLogCRUD(auth).get_list_crud(search=search.__dict__ if search else None, order_by=order_by)
+        return await PaginationService.paginate(data_list=obj_list, page_no=page_no, page_size=page_size, schema=OperationLogOutSchema)
+
     @classmethod
     async def create_log_service(cls, auth: AuthSchema, data: OperationLogCreateSchema) -> Dict:
         """
@@ -63,7 +218,7 @@ class OperationLogService:
         返回:
         - Dict: 日志详情字典
         """
-        new_log = await OperationLogCRUD(auth).create(data=data)
+        new_log = await OperationLogCRUD(auth).create_crud(data=data)
         new_log_dict = OperationLogOutSchema.model_validate(new_log).model_dump()
         return new_log_dict
     
@@ -81,7 +236,10 @@ class OperationLogService:
         """
         if len(ids) < 1:
             raise CustomException(msg='删除失败，删除对象不能为空')
-        await OperationLogCRUD(auth).delete(ids=ids)
+        if cls.use_mongo():
+            await OperationLogMongoCRUD(cls._mongo).delete_crud(ids=ids)
+            return
+        await OperationLogCRUD(auth).delete_crud(ids=ids)
 
     @classmethod
     async def export_log_list_service(cls, operation_log_list: List[Dict[str, Any]]) -> bytes:
@@ -100,12 +258,10 @@ class OperationLogService:
             'type': '日志类型',
             'request_path': '请求URL',
             'request_method': '请求方式',
-            'request_payload': '请求参数',
             'request_ip': '操作地址',
             'login_location': '登录位置',
             'request_os': '操作系统',
             'request_browser': '浏览器',
-            'response_json': '返回参数',
             'response_code': '相应状态',
             'process_time': '处理时间',
             'description': '备注',
@@ -22,7 +22,7 @@ MenuRouter = APIRouter(route_class=OperationLogRoute, prefix="/menu", tags=["菜
 @MenuRouter.get("/tree", summary="查询菜单树", description="查询菜单树")
 async def get_menu_tree_controller(
     search: MenuQueryParam = Depends(),
-    auth: AuthSchema = Depends(AuthPermission(["system:menu:query"]))
+    auth: AuthSchema = Depends(AuthPermission(["system:menu:query"], read_only=True))
 ) -> JSONResponse:
     """
     查询菜单树。
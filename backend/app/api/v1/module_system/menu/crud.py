@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 from typing import Dict, List, Optional, Sequence, Union, Any
+from sqlalchemy.engine import Row
 
 from app.core.base_crud import CRUDBase
 from ..auth.schema import AuthSchema
@@ -58,7 +59,16 @@ class MenuCRUD(CRUDBase[MenuModel, MenuCreateSchema, MenuUpdateSchema]):
         返回:
         - Sequence[MenuModel]: 菜单树形列表。
         """
-        return await self.tree_list(search=search, order_by=order_by, children_attr='children', preload=preload)
+        return await self.tree_list(search=search, order_by=order_by, preload=preload)
+
+    async def get_tree_nodes_crud(self) -> Sequence[Row]:
+        """
+        获取菜单树节点关系（仅 id 与 parent_id）。
+        
+        返回:
+        - Sequence[Row]: 菜单节点关系列表。
+        """
+        return await self.tree_nodes()
 
     async def set_available_crud(self, ids: List[int], status: bool) -> None:
         """
@@ -60,11 +60,11 @@ class MenuService:
         返回:
         - List[Dict]: 菜单树形列表对象。
         """
-        # 使用树形结构查询，预加载children关系
+        # 单次查询获取扁平列表
         menu_list = await MenuCRUD(auth).get_tree_list_crud(search=search.__dict__, order_by=order_by)
         # 转换为字典列表
         menu_dict_list = [MenuOutSchema.model_validate(menu).model_dump() for menu in menu_list]
-        # 使用traversal_to_tree构建树形结构
+        # 使用traversal_to_tree按id索引构建树形结构
         return traversal_to_tree(menu_dict_list)
 
     @classmethod
@@ -133,16 +133,13 @@ class MenuService:
         """
         if len(ids) < 1:
             raise CustomException(msg='删除失败，删除对象不能为空')
-        for id in ids:
-            menu = await MenuCRUD(auth).get_by_id_crud(id=id)
-            if not menu:
-                raise CustomException(msg='删除失败，该菜单不存在')
+        if len(await MenuCRUD(auth).get_many(ids=ids)) < len(set(ids)):
+            raise CustomException(msg='删除失败，该菜单不存在')
         # 校验是否存在子级菜单，存在则禁止删除
-        menu_list = await MenuCRUD(auth).get_list_crud()
-        id_map = get_child_id_map(model_list=menu_list)
+        menu_nodes = await MenuCRUD(auth).get_tree_nodes_crud()
+        id_map = get_child_id_map(model_list=menu_nodes)
         for id in ids:
-            descendants = get_child_recursion(id=id, id_map=id_map)
-            if len(descendants) > 1:
+            if id_map.get(id):
                 raise CustomException(msg='删除失败，存在子级菜单，请先删除子级菜单')
         await MenuCRUD(auth).delete(ids=ids)
 
@@ -158,18 +155,18 @@ class MenuService:
         返回:
         - None
         """
-        menu_list = await MenuCRUD(auth).get_list_crud()
+        menu_nodes = await MenuCRUD(auth).get_tree_nodes_crud()
         total_ids = []
         
         if data.status:
             # 激活，则需要把所有父级菜单都激活
-            id_map = get_parent_id_map(model_list=menu_list)
+            id_map = get_parent_id_map(model_list=menu_nodes)
             for menu_id in data.ids:
                 enable_ids = get_parent_recursion(id=menu_id, id_map=id_map)
                 total_ids.extend(enable_ids)
         else:
             # 禁止，则需要把所有子级菜单都禁止
-            id_map = get_child_id_map(model_list=menu_list)
+            id_map = get_child_id_map(model_list=menu_nodes)
             for menu_id in data.ids:
                 disable_ids = get_child_recursion(id=menu_id, id_map=id_map)
                 total_ids.extend(disable_ids)
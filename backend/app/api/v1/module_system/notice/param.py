@@ -20,7 +20,7 @@ class NoticeQueryParam:
     ) -> None:
         
         # 模糊查询字段
-        self.notice_title = ("like", notice_title)
+        self.notice_title = ("search", notice_title)
 
         # 精确查询字段
         self.creator_id = creator
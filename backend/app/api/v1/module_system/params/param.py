@@ -18,8 +18,8 @@ class ParamsQueryParam:
     ) -> None:
 
         # 模糊查询字段
-        self.config_name = ("like", config_name)
-        self.config_key = ("like", config_key)
+        self.config_name = ("search", config_name)
+        self.config_key = ("search", config_key)
 
         # 精确查询字段
         self.config_type = config_type
@@ -187,10 +187,10 @@ class ParamsService:
         """
         if len(ids) < 1:
             raise CustomException(msg='删除失败，删除对象不能为空')
-        for id in ids:
-            exist_obj = await ParamsCRUD(auth).get_obj_by_id_crud(id=id)
-            if not exist_obj:
-                raise CustomException(msg='删除失败，该数据字典类型不存在')
+        exist_objs = await ParamsCRUD(auth).get_many(ids=ids, columns=['config_type', 'config_name', 'config_key'])
+        if len(exist_objs) < len(set(ids)):
+            raise CustomException(msg='删除失败，该数据字典类型不存在')
+        for exist_obj in exist_objs:
             # 检查是否是否初始化类型
             if exist_obj.config_type:
                 # 如果有字典数据，不能删除
@@ -198,18 +198,14 @@ class ParamsService:
         
         await ParamsCRUD(auth).delete_obj_crud(ids=ids)
         
-        # 同步删除Redis缓存
-        for id in ids:
-            exist_obj = await ParamsCRUD(auth).get_obj_by_id_crud(id=id)
-            if not exist_obj:
-                continue
-            redis_key = f"{RedisInitKeyConfig.SYSTEM_CONFIG.key}:{exist_obj.config_key}"
-            try:
-                await RedisCURD(redis).delete(redis_key)
-                logger.info(f"删除系统配置成功: {id}")
-            except Exception as e:
-                logger.error(f"删除系统配置失败: {e}")
-                raise CustomException(msg="删除字典类型失败")
+        # 同步删除Redis缓存(缓存键在删除前取得)
+        redis_keys = [f"{RedisInitKeyConfig.SYSTEM_CONFIG.key}:{obj.config_key}" for obj in exist_objs]
+        try:
+            await RedisCURD(redis).delete(*redis_keys)
+            logger.info(f"删除系统配置成功: {ids}")
+        except Exception as e:
+            logger.error(f"删除系统配置失败: {e}")
+            raise CustomException(msg="删除字典类型失败")
     
     @classmethod
     async def export_obj_service(cls, data_list: List[Dict[str, Any]]) -> bytes:
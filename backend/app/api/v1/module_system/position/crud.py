@@ -71,9 +71,6 @@ class PositionCRUD(CRUDBase[PositionModel, PositionCreateSchema, PositionUpdateS
         返回:
         - List[str]: 岗位名称列表。
         """
-        position_names = []
-        for id in ids:
-            obj = await self.get(id=id)
-            if obj:
-                position_names.append(obj.name)
-        return position_names
\ No newline at end of file
+        rows = await self.get_many(ids=ids, columns=['name'])
+        names = {row.id: row.name for row in rows}
+        return [names[id] for id in ids if id in names]
\ No newline at end of file
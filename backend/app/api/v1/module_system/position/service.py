@@ -103,10 +103,8 @@ class PositionService:
         """
         if len(ids) < 1:
             raise CustomException(msg='删除失败，删除对象不能为空')
-        for id in ids:
-            position = await PositionCRUD(auth).get_by_id_crud(id=id)
-            if not position:
-                raise CustomException(msg='删除失败，该岗位不存在')
+        if len(await PositionCRUD(auth).get_many(ids=ids)) < len(set(ids)):
+            raise CustomException(msg='删除失败，该岗位不存在')
         await PositionCRUD(auth).delete(ids=ids)
 
     @classmethod
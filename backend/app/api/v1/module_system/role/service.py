@@ -104,10 +104,8 @@ class RoleService:
         """
         if len(ids) < 1:
             raise CustomException(msg='删除失败，删除对象不能为空')
-        for id in ids:
-            role = await RoleCRUD(auth).get_by_id_crud(id=id)
-            if not role:
-                raise CustomException(msg='删除失败，该角色不存在')
+        if len(await RoleCRUD(auth).get_many(ids=ids)) < len(set(ids)):
+            raise CustomException(msg='删除失败，该角色不存在')
         await RoleCRUD(auth).delete(ids=ids)
 
     @classmethod
@@ -6,7 +6,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 import urllib.parse
 
 from app.common.response import StreamResponse, SuccessResponse
-from app.common.request import PaginationService
 from app.utils.common_util import bytes2file_response
 from app.core.router_class import OperationLogRoute
 from app.core.dependencies import db_getter, get_current_user, AuthPermission
@@ -185,8 +184,7 @@ async def get_obj_list_controller(
     返回:
     - JSONResponse: 分页查询结果JSON响应
     """
-    result_dict_list = await UserService.get_user_list_service(search=search, auth=auth, order_by=page.order_by)
-    result_dict = await PaginationService.paginate(data_list= result_dict_list, page_no= page.page_no, page_size = page.page_size)
+    result_dict = await UserService.get_user_page_service(auth=auth, page_no=page.page_no, page_size=page.page_size, search=search, order_by=page.order_by)
     logger.info(f"查询用户成功")
     return SuccessResponse(data=result_dict, msg="查询用户成功")
 
@@ -69,6 +69,7 @@ class UserModel(MappedBase):
     __tablename__ = "system_users"
     __table_args__ = ({'comment': '用户表'})
     __loader_options__ = ["dept", "roles", "positions", "creator"]
+    __search_columns__ = ("username", "name", "mobile", "email")
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True, comment='主键ID')
     
@@ -22,10 +22,10 @@ class UserQueryParam:
     ) -> None:
         
         # 模糊查询字段
-        self.username = ("like", username)
-        self.name = ("like", name)
-        self.mobile = ("like", mobile)
-        self.email = ("like", email)
+        self.username = ("search", username)
+        self.name = ("search", name)
+        self.mobile = ("search", mobile)
+        self.email = ("search", email)
 
         # 精确查询字段
         self.dept_id = dept_id
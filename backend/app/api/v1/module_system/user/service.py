@@ -5,6 +5,7 @@ from typing import Any, Dict, List, Optional
 from fastapi import UploadFile
 import pandas as pd
 
+from app.common.request import PaginationService
 from app.core.exceptions import CustomException
 from app.utils.hash_bcrpy_util import PwdUtil
 from app.core.base_schema import BatchSetAvailable, UploadResponseSchema
@@ -82,6 +83,24 @@ class UserService:
 
         return user_dict_list
 
+    @classmethod
+    async def get_user_page_service(cls, auth: AuthSchema, page_no: Optional[int] = None, page_size: Optional[int] = None, search: Optional[UserQueryParam] = None, order_by: Optional[List[Dict[str, str]]] = None) -> Dict:
+        """
+        分页获取用户列表，当前页直接序列化为 JSON 片段，不生成中间字典
+        
+        参数:
+        - auth (AuthSchema): 认证信息模型
+        - page_no (int | None): 当前页码
+        - page_size (int | None): 每页数量
+        - search (UserQueryParam | None): 查询参数对象。
+        - order_by (List[Dict[str, str]] | None): 排序参数列表。
+        
+        返回:
+        - Dict: 分页结果字典
+        """
+        obj_list = await UserCRUD(auth).get_list_crud(search=search.__dict__ if search else None, order_by=order_by)
+        return await PaginationService.paginate(data_list=obj_list, page_no=page_no, page_size=page_size, schema=UserOutSchema)
+
     @classmethod
     async def create_user_service(cls, data: UserCreateSchema, auth: AuthSchema) -> Dict:
         """
@@ -221,15 +240,15 @@ class UserService:
         """
         if len(ids) < 1:
             raise CustomException(msg='删除失败，删除对象不能为空')
-        for id in ids:
-            user = await UserCRUD(auth).get_by_id_crud(id=id)
-            if not user:
-                raise CustomException(msg="用户不存在")
+        users = await UserCRUD(auth).get_many(ids=ids, columns=['is_superuser', 'status'])
+        if len(users) < len(set(ids)):
+            raise CustomException(msg="用户不存在")
+        for user in users:
             if user.is_superuser:
                 raise CustomException(msg="超级管理员不能删除")
             if user.status:
                 raise CustomException(msg="用户已启用,不能删除")
-            if auth.user and auth.user.id == id:
+            if auth.user and auth.user.id == user.id:
                 raise CustomException(msg="不能删除当前登陆用户")
         # 删除用户角色关联数据
         await UserCRUD(auth).set_user_roles_crud(user_ids=ids, role_ids=[])
@@ -263,7 +282,7 @@ class UserService:
 
         # 获取菜单权限
         if auth.user and auth.user.is_superuser:
-            # 使用树形结构查询，预加载children关系
+            # 单次查询获取扁平列表，再按id索引构建树形结构
             menu_all = await MenuCRUD(auth).get_tree_list_crud(search={'type': ('in', [1, 2, 4]), 'status': True}, order_by=[{"order": "asc"}])
             menus = [MenuOutSchema.model_validate(menu).model_dump() for menu in menu_all]
             
@@ -276,7 +295,7 @@ class UserService:
                 if menu.status and menu.type in [1, 2, 4]
             }
             
-            # 使用树形结构查询，预加载children关系
+            # 单次查询获取扁平列表，再按id索引构建树形结构
             menus = [
                 MenuOutSchema.model_validate(menu).model_dump() 
                 for menu in await MenuCRUD(auth).get_tree_list_crud(search={'id': ('in', list(menu_ids))}, order_by=[{"order": "asc"}])
@@ -329,12 +348,12 @@ class UserService:
         返回:
         - None
         """
-        for id in data.ids:
-            user = await UserCRUD(auth).get_by_id_crud(id=id)
-            if not user:
-                raise CustomException(msg=f"用户ID {id} 不存在")
-            if user.is_superuser:
-                raise CustomException(msg="超级管理员状态不能修改")
+        users = await UserCRUD(auth).get_many(ids=data.ids, columns=['is_superuser'])
+        missing = set(data.ids) - {user.id for user in users}
+        if missing:
+            raise CustomException(msg=f"用户ID {min(missing)} 不存在")
+        if any(user.is_superuser for user in users):
+            raise CustomException(msg="超级管理员状态不能修改")
         await UserCRUD(auth).set_available_crud(ids=data.ids, status=data.status)
 
     @classmethod
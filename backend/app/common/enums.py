@@ -41,11 +41,18 @@ class BusinessType(Enum):
 class RedisInitKeyConfig(Enum):
     """系统内置Redis键名枚举"""
 
-    ACCESS_TOKEN = {'key': 'access_token', 'remark': '登录令牌信息'}
-    REFRESH_TOKEN = {'key': 'refresh_token', 'remark': '刷新令牌信息'}
+    SESSION = {'key': 'session', 'remark': '登录会话(令牌编号与会话信息)'}
+    ONLINE_INDEX = {'key': 'online_index', 'remark': '在线会话索引'}
     CAPTCHA_CODES = {'key': 'captcha_codes', 'remark': '图片验证码'}
     SYSTEM_CONFIG = {'key': 'system_config', 'remark': '系统配置'}
     SYSTEM_DICT = {'key':'system_dict','remark': '数据字典'}
+    UPLOAD_CHUNK = {'key': 'upload_chunk', 'remark': '分片上传任务'}
+    UPLOAD_HASH = {'key': 'upload_hash', 'remark': '文件哈希去重索引'}
+    FS_TASK = {'key': 'fs_task', 'remark': '后台文件任务进度'}
+    SCHEDULER_LEADER = {'key': 'scheduler_leader', 'remark': '定时任务主节点租约'}
+    SCHEDULER_FIRE = {'key': 'scheduler_fire', 'remark': '定时任务触发窗口认领'}
+    SCHEDULER_COMMAND = {'key': 'scheduler_command', 'remark': '定时任务命令通道'}
+    SCHEDULER_METRICS = {'key': 'scheduler_metrics', 'remark': '定时任务主节点运行指标'}
     
     @property
     def key(self) -> str:
@@ -1,11 +1,12 @@
 # -*- coding: utf-8 -*-
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Type
 from pydantic import ConfigDict, Field, BaseModel
 from pydantic.alias_generators import to_camel
 
 from app.common.constant import RET
 from app.core.exceptions import CustomException
+from app.core.serialize import Serialize
 
 
 class PageResultSchema(BaseModel):
@@ -15,6 +16,7 @@ class PageResultSchema(BaseModel):
     page_no: Optional[int] = Field(default=None, ge=1, description="页码，默认为1")
     page_size: Optional[int] = Field(default=None, ge=1, description="页面大小，默认为10") 
     total: int = Field(default=0, ge=0, description="总记录数")
+    total_is_estimate: bool = Field(default=False, description="总记录数是否为估算值")
     has_next: Optional[bool] = Field(default=False, description="是否有下一页")
     items: Optional[List[Any]] = Field(default_factory=list, description="分页后的数据列表")
 
@@ -23,7 +25,7 @@ class PaginationService:
     """分页服务类"""
 
     @staticmethod
-    async def paginate(data_list: List[Any], page_no: Optional[int] = None, page_size: Optional[int] = None) -> Dict[str, Any]:
+    async def paginate(data_list: List[Any], page_no: Optional[int] = None, page_size: Optional[int] = None, schema: Optional[Type[BaseModel]] = None) -> Dict[str, Any]:
         """
         分页数据处理。
         输入数据列表和分页信息，返回分页或非分页数据列表结果。
@@ -33,6 +35,7 @@ class PaginationService:
         - data_list (List[Any]): 原始数据列表。
         - page_no (int | None): 当前页码，默认 None。
         - page_size (int | None): 每页数据量，默认 None。
+        - schema (Type[BaseModel] | None): 传入时 data_list 为 ORM 对象列表，当前页按该 Schema 直接序列化为 JSON 片段。
 
         返回:
         - Dict[str, Any]: 分页或非分页数据对象。
@@ -45,8 +48,9 @@ class PaginationService:
         # 如果page_no和page_size都为None,返回全部数据
         if page_no is None or page_size is None:
             return {
-                "items": data_list,
+                "items": Serialize.models_to_json(data_list, schema) if schema else data_list,
                 "total": total,
+                "total_is_estimate": False,
                 "page_no": None,
                 "page_size": None,
                 "has_next": False
@@ -67,8 +71,9 @@ class PaginationService:
         has_next = end < total
 
         return {
-            "items": paginated_data,
+            "items": Serialize.models_to_json(paginated_data, schema) if schema else paginated_data,
             "total": total,
+            "total_is_estimate": False,
             "page_no": page_no,
             "page_size": page_size,
             "has_next": has_next
@@ -1,12 +1,26 @@
 # -*- coding: utf-8 -*-
 
-from typing import Any, Mapping, Optional
+import os
+import stat
+from collections import OrderedDict
+from datetime import date, datetime, time
+from decimal import Decimal
+from email.utils import formatdate, parsedate_to_datetime
+from secrets import token_hex
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+from urllib.parse import quote
+
+import anyio
+import orjson
 from fastapi import status
-from fastapi.responses import JSONResponse, StreamingResponse, FileResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse, FileResponse, Response
 from starlette.background import BackgroundTask
+from starlette.datastructures import Headers
+from starlette.types import Receive, Scope, Send
 from pydantic import Field, BaseModel
 
 from app.common.constant import RET
+from app.config.setting import settings
 
 class ResponseSchema(BaseModel):
     """响应模型"""
@@ -16,7 +30,84 @@ class ResponseSchema(BaseModel):
     status_code: int = Field(default=status.HTTP_200_OK, description="HTTP状态码")
     success: bool = Field(default=True, description='操作是否成功')
 
-class SuccessResponse(JSONResponse):
+
+class RawJSON(bytes):
+    """
+    已序列化的 JSON 片段
+
+    作为响应数据(或其中字典的值、列表的元素)传入时原样嵌入，不再解析与重新序列化，
+    适用于缓存中的字典、树形数据以及 Serialize.models_to_json 的结果。
+    """
+
+    def __new__(cls, value: Union[bytes, str]) -> "RawJSON":
+        if isinstance(value, str):
+            value = value.encode('utf-8')
+        return super().__new__(cls, value)
+
+
+def _json_default(obj: Any) -> Any:
+    """orjson 无法直接处理的类型，日期时间与 DateTimeStr 保持一致的格式"""
+    if isinstance(obj, datetime):
+        return obj.strftime('%Y-%m-%d %H:%M:%S')
+    if isinstance(obj, (date, time)):
+        return obj.isoformat()
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode='json')
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, RawJSON):
+        # 只有字典与列表中的 RawJSON 会原样拼接，其他容器中的片段不能按普通字节串编码为字符串
+        raise TypeError("RawJSON is only supported as the content or inside dict/list/tuple values")
+    if isinstance(obj, bytes):
+        return obj.decode('utf-8')
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _has_raw(content: Any) -> bool:
+    """字典的值或列表/元组的元素中(含嵌套)是否存在 RawJSON"""
+    if isinstance(content, RawJSON):
+        return True
+    if isinstance(content, dict):
+        return any(_has_raw(value) for value in content.values())
+    if isinstance(content, (list, tuple)):
+        return any(_has_raw(item) for item in content)
+    return False
+
+
+def json_dumps(content: Any) -> bytes:
+    """
+    序列化为 JSON 字节串，RawJSON 片段原样拼接。
+
+    参数:
+    - content (Any): 待序列化内容。
+
+    返回:
+    - bytes: JSON 字节串。
+    """
+    if isinstance(content, RawJSON):
+        return bytes(content)
+    if isinstance(content, dict) and _has_raw(content):
+        parts = [orjson.dumps(str(key)) + b':' + json_dumps(value) for key, value in content.items()]
+        return b'{' + b','.join(parts) + b'}'
+    if isinstance(content, (list, tuple)) and _has_raw(content):
+        return b'[' + b','.join(json_dumps(item) for item in content) + b']'
+    return orjson.dumps(
+        content,
+        default=_json_default,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+
+
+class FastJSONResponse(ORJSONResponse):
+    """基于 orjson 的 JSON 响应，支持嵌入 RawJSON 预序列化片段"""
+
+    def render(self, content: Any) -> bytes:
+        return json_dumps(content)
+
+
+class SuccessResponse(FastJSONResponse):
     """成功响应类"""
 
     def __init__(
@@ -31,7 +122,7 @@ class SuccessResponse(JSONResponse):
         初始化成功响应类
         
         参数:
-        - data (Any | None): 响应数据。
+        - data (Any | None): 响应数据，可为 RawJSON 预序列化片段。
         - msg (str): 响应消息。
         - code (int): 业务状态码。
         - status_code (int): HTTP 状态码。
@@ -40,17 +131,18 @@ class SuccessResponse(JSONResponse):
         返回:
         - None
         """
-        content = ResponseSchema(
-            code=code,
-            msg=msg,
-            data=data,
-            status_code=status_code,
-            success=success
-        ).model_dump()
+        # 字段与 ResponseSchema 一致，直接构造避免逐次模型校验
+        content = {
+            "code": code,
+            "msg": msg,
+            "data": data,
+            "status_code": status_code,
+            "success": success
+        }
         super().__init__(content=content, status_code=status_code)
 
 
-class ErrorResponse(JSONResponse):
+class ErrorResponse(FastJSONResponse):
     """错误响应类"""
 
     def __init__(
@@ -74,13 +166,13 @@ class ErrorResponse(JSONResponse):
         返回:
         - None
         """
-        content = ResponseSchema(
-            code=code,
-            msg=msg,
-            data=data,
-            status_code=status_code,
-            success=success
-        ).model_dump()
+        content = {
+            "code": code,
+            "msg": msg,
+            "data": data,
+            "status_code": status_code,
+            "success": success
+        }
         super().__init__(content=content, status_code=status_code)
 
 
@@ -120,7 +212,19 @@ class StreamResponse(StreamingResponse):
 class UploadFileResponse(FileResponse):
     """
     文件响应
+
+    在 Starlette FileResponse 的基础上:
+    - 使用基于 inode + mtime + size 的强 ETag(按 inode 缓存)，支持 If-None-Match / If-Modified-Since 条件请求(304)
+    - 支持 Range / If-Range，单区间返回 206，多区间返回 multipart/byteranges
+    - ASGI 服务器支持 http.response.zerocopysend / http.response.pathsend 扩展时使用零拷贝发送，否则按大块读取
+    - 开启 DOWNLOAD_ACCEL_ENABLE 时，静态目录内的文件通过 X-Accel-Redirect 交由 nginx sendfile 下发
+
+    Range 解析沿用 Starlette 0.40 FileResponse.__call__，并覆盖其私有方法 _should_use_range、_handle_simple、
+    _handle_single_range、_handle_multiple_ranges，因此 requirements.txt 固定了 starlette 版本，升级时需核对这些方法。
     """
+    chunk_size = settings.DOWNLOAD_CHUNK_SIZE
+    _etag_cache: "OrderedDict[Tuple[int, int], Tuple[int, int, str, str]]" = OrderedDict()
+
     def __init__(
             self,
             file_path: str,
@@ -128,7 +232,8 @@ class UploadFileResponse(FileResponse):
             media_type: str = "application/octet-stream",
             headers: Optional[Mapping[str, str]] = None,
             background: Optional[BackgroundTask] = None,
-            status_code: int = 200
+            status_code: int = 200,
+            stat_result: Optional[os.stat_result] = None
     ):
         """
         初始化文件响应类
@@ -140,10 +245,12 @@ class UploadFileResponse(FileResponse):
         - headers (Mapping[str, str] | None): 响应头。
         - background (BackgroundTask | None): 后台任务。
         - status_code (int): HTTP 状态码。
+        - stat_result (os.stat_result | None): 已获取的文件状态，避免重复 stat。
         
         返回:
         - None
         """
+        self._extensions: Dict[str, Any] = {}
         super().__init__(
             path=file_path,
             status_code=status_code,
@@ -151,7 +258,194 @@ class UploadFileResponse(FileResponse):
             media_type=media_type,
             background=background,
             filename=filename,
-            stat_result=None,
-            method=None,
+            stat_result=stat_result,
             content_disposition_type="attachment"
         )
+
+    @classmethod
+    def get_validators(cls, stat_result: os.stat_result) -> Tuple[str, str]:
+        """
+        获取文件的强 ETag 与 Last-Modified，按 (st_dev, st_ino) 缓存，mtime 或大小变化时失效。
+        
+        参数:
+        - stat_result (os.stat_result): 文件状态。
+        
+        返回:
+        - Tuple[str, str]: (ETag, Last-Modified)。
+        """
+        key = (stat_result.st_dev, stat_result.st_ino)
+        cached = cls._etag_cache.get(key)
+        if cached and cached[0] == stat_result.st_mtime_ns and cached[1] == stat_result.st_size:
+            cls._etag_cache.move_to_end(key)
+            return cached[2], cached[3]
+        etag = f'"{stat_result.st_ino:x}-{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+        last_modified = formatdate(stat_result.st_mtime, usegmt=True)
+        cls._etag_cache[key] = (stat_result.st_mtime_ns, stat_result.st_size, etag, last_modified)
+        if len(cls._etag_cache) > settings.DOWNLOAD_ETAG_CACHE_SIZE:
+            cls._etag_cache.popitem(last=False)
+        return etag, last_modified
+
+    def set_stat_headers(self, stat_result: os.stat_result) -> None:
+        etag, last_modified = self.get_validators(stat_result)
+        self.headers.setdefault("content-length", str(stat_result.st_size))
+        self.headers.setdefault("last-modified", last_modified)
+        self.headers.setdefault("etag", etag)
+
+    @classmethod
+    def _should_use_range(cls, http_if_range: str, stat_result: os.stat_result) -> bool:
+        # If-Range 只接受强校验器: 完全一致的 ETag 或 Last-Modified
+        etag, last_modified = cls.get_validators(stat_result)
+        return http_if_range in (etag, last_modified)
+
+    @classmethod
+    def _is_not_modified(cls, request_headers: Headers, stat_result: os.stat_result) -> bool:
+        """
+        判断条件请求是否命中缓存(If-None-Match 优先于 If-Modified-Since)。
+        
+        参数:
+        - request_headers (Headers): 请求头。
+        - stat_result (os.stat_result): 文件状态。
+        
+        返回:
+        - bool: 是否返回 304。
+        """
+        etag, _ = cls.get_validators(stat_result)
+        if_none_match = request_headers.get("if-none-match")
+        if if_none_match is not None:
+            # If-None-Match 使用弱比较
+            tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+            return "*" in tags or etag in tags
+        if_modified_since = request_headers.get("if-modified-since")
+        if if_modified_since:
+            try:
+                since = parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+            return int(stat_result.st_mtime) <= since
+        return False
+
+    def _accel_path(self) -> Optional[str]:
+        """获取 nginx X-Accel-Redirect 内部路径，文件不在静态目录内时返回 None。"""
+        if not settings.DOWNLOAD_ACCEL_ENABLE:
+            return None
+        static_root = os.path.realpath(settings.STATIC_ROOT)
+        real_path = os.path.realpath(self.path)
+        if os.path.commonpath([static_root, real_path]) != static_root:
+            return None
+        relative_path = os.path.relpath(real_path, static_root).replace(os.sep, "/")
+        return f"{settings.DOWNLOAD_ACCEL_PREFIX.rstrip('/')}/{quote(relative_path)}"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if self.stat_result is None:
+            try:
+                self.stat_result = await anyio.to_thread.run_sync(os.stat, self.path)
+            except FileNotFoundError:
+                raise RuntimeError(f"File at path {self.path} does not exist.")
+            if not stat.S_ISREG(self.stat_result.st_mode):
+                raise RuntimeError(f"File at path {self.path} is not a file.")
+            self.set_stat_headers(self.stat_result)
+
+        method = scope["method"].upper()
+        request_headers = Headers(scope=scope)
+        if method in ("GET", "HEAD") and self._is_not_modified(request_headers, self.stat_result):
+            headers = {k: self.headers[k] for k in ("etag", "last-modified") if k in self.headers}
+            await Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)(scope, receive, send)
+            if self.background is not None:
+                await self.background()
+            return
+
+        accel_path = self._accel_path()
+        if accel_path is not None:
+            # 交由 nginx 处理 Range 与发送，后端只返回响应头
+            del self.headers["content-length"]
+            self.headers["x-accel-redirect"] = accel_path
+            await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            if self.background is not None:
+                await self.background()
+            return
+
+        self._extensions = scope.get("extensions") or {}
+        await super().__call__(scope, receive, send)
+
+    async def _send_range(self, send: Send, file: Any, start: int, end: int, more_body: bool) -> None:
+        """
+        发送文件的 [start, end) 区间，优先使用零拷贝扩展。
+        
+        参数:
+        - send (Send): ASGI send。
+        - file (Any): 已打开的二进制文件对象(anyio 包装)。
+        - start (int): 起始偏移。
+        - end (int): 结束偏移(不含)。
+        - more_body (bool): 本区间之后是否还有响应体。
+        """
+        if "http.response.zerocopysend" in self._extensions:
+            await send({
+                "type": "http.response.zerocopysend",
+                "file": file.wrapped,
+                "offset": start,
+                "count": end - start,
+                "more_body": more_body,
+            })
+            return
+        await file.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            chunk = await file.read(min(self.chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        if not more_body:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    async def _handle_simple(self, send: Send, send_header_only: bool) -> None:
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        if send_header_only:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+        elif "http.response.pathsend" in self._extensions and "http.response.zerocopysend" not in self._extensions:
+            await send({"type": "http.response.pathsend", "path": str(self.path)})
+        else:
+            async with await anyio.open_file(self.path, mode="rb") as file:
+                await self._send_range(send, file, 0, self.stat_result.st_size, more_body=False)
+
+    async def _handle_single_range(
+        self, send: Send, start: int, end: int, file_size: int, send_header_only: bool
+    ) -> None:
+        self.headers["content-range"] = f"bytes {start}-{end - 1}/{file_size}"
+        self.headers["content-length"] = str(end - start)
+        await send({"type": "http.response.start", "status": status.HTTP_206_PARTIAL_CONTENT, "headers": self.raw_headers})
+        if send_header_only:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+        else:
+            async with await anyio.open_file(self.path, mode="rb") as file:
+                await self._send_range(send, file, start, end, more_body=False)
+
+    async def _handle_multiple_ranges(
+        self, send: Send, ranges: List[Tuple[int, int]], file_size: int, send_header_only: bool
+    ) -> None:
+        boundary = token_hex(13)
+        content_type = self.headers["content-type"]
+        part_headers = [
+            (
+                f"--{boundary}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Range: bytes {start}-{end - 1}/{file_size}\r\n"
+                "\r\n"
+            ).encode("latin-1")
+            for start, end in ranges
+        ]
+        closing = f"--{boundary}--\r\n".encode("latin-1")
+        content_length = sum(len(h) + (end - start) + 2 for h, (start, end) in zip(part_headers, ranges)) + len(closing)
+        self.headers["content-type"] = f"multipart/byteranges; boundary={boundary}"
+        self.headers["content-length"] = str(content_length)
+        await send({"type": "http.response.start", "status": status.HTTP_206_PARTIAL_CONTENT, "headers": self.raw_headers})
+        if send_header_only:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+        async with await anyio.open_file(self.path, mode="rb") as file:
+            for part_header, (start, end) in zip(part_headers, ranges):
+                await send({"type": "http.response.body", "body": part_header, "more_body": True})
+                await self._send_range(send, file, start, end, more_body=True)
+                await send({"type": "http.response.body", "body": b"\r\n", "more_body": True})
+            await send({"type": "http.response.body", "body": closing, "more_body": False})
@@ -1,27 +1,40 @@
 # -*- coding: utf-8 -*-
 
+import sys
 import json
+import time
+import asyncio
 import importlib
+import threading
+import concurrent.futures
+from bisect import bisect_left
 from datetime import datetime
+from zoneinfo import ZoneInfo
+from traceback import format_tb
 from sqlalchemy.orm.session import Session
-from typing import Union, List, Any, Optional
+from typing import Awaitable, Callable, Dict, Set, Union, List, Any, Optional, Tuple
 from asyncio import iscoroutinefunction
 from apscheduler.job import Job
-from apscheduler.events import JobExecutionEvent, EVENT_ALL, JobEvent
+from apscheduler.events import (
+    JobExecutionEvent, JobSubmissionEvent, EVENT_ALL, EVENT_JOB_EXECUTED, EVENT_JOB_ERROR, EVENT_JOB_SUBMITTED,
+    EVENT_JOB_MISSED, EVENT_JOB_MAX_INSTANCES, JobEvent
+)
 from apscheduler.executors.asyncio import AsyncIOExecutor
+from apscheduler.executors.base import MaxInstancesReachedError, run_job, run_coroutine_job
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.executors.pool import ProcessPoolExecutor
+from apscheduler.executors.pool import ProcessPoolExecutor, ThreadPoolExecutor as JobThreadPoolExecutor
 from apscheduler.jobstores.memory import MemoryJobStore
 from apscheduler.jobstores.redis import RedisJobStore
 from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore 
-from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.base import BaseTrigger
 from apscheduler.triggers.date import DateTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 from app.api.v1.module_application.job.model import JobModel
 from app.config.setting import settings
-from app.core.database import SessionLocal, AsyncSessionLocal, engine
+from app.core.database import AsyncSessionLocal, get_engine, sync_session_connect
 from app.core.exceptions import CustomException
 from app.core.logger import logger
 from app.utils.cron_util import CronUtil
@@ -29,7 +42,6 @@ from app.utils.cron_util import CronUtil
 
 job_stores = {
     'default': MemoryJobStore(),
-    'sqlalchemy': SQLAlchemyJobStore(url=settings.DB_URI, engine=engine), 
     'redis': RedisJobStore(
         host=settings.REDIS_HOST,
         port=int(settings.REDIS_PORT),
@@ -38,10 +50,246 @@ job_stores = {
         db=int(settings.REDIS_DB_NAME),
     ),
 }
+# 数据库任务存储名称，首次使用时注册(见 SchedulerUtil._ensure_jobstore)
+JOBSTORE_SQLALCHEMY = 'sqlalchemy'
+# 执行器名称：协程任务直接运行在事件循环中，同步阻塞任务使用线程池，CPU密集任务使用进程池
+EXECUTOR_ASYNC = 'async'
+EXECUTOR_IO_THREAD = 'io-thread'
+EXECUTOR_CPU_PROCESS = 'cpu-process'
+JOB_EXECUTORS = (EXECUTOR_ASYNC, EXECUTOR_IO_THREAD, EXECUTOR_CPU_PROCESS)
+# 历史执行器名称兼容(default 按任务函数类型解析为 async 或 io-thread)
+LEGACY_EXECUTORS = {'processpool': EXECUTOR_CPU_PROCESS}
+
+
+class JobTimeoutError(Exception):
+    """任务执行超时"""
+
+
+class _JobRun:
+    """
+    单次提交的执行状态。正常结束与超时以先到者为准，结束回调只生效一次。
+    """
+
+    def __init__(self, executor: 'ManagedExecutorMixin', job: Job, run_times: List[datetime]) -> None:
+        self.executor = executor
+        self.job = job
+        self.run_times = run_times
+        self.started = time.monotonic()
+        self.timer: Any = None
+        self._done = False
+        self._lock = threading.Lock()
+
+    def finish(self, events: Optional[List[JobExecutionEvent]] = None, exc: Optional[BaseException] = None, tb: Any = None) -> bool:
+        with self._lock:
+            if self._done:
+                return False
+            self._done = True
+        if self.timer is not None:
+            self.timer.cancel()
+        if exc is not None:
+            # 执行器层面的失败(超时/进程池崩溃)同样生成任务错误事件，保证日志与统计完整
+            formatted_tb = ''.join(format_tb(tb)) if tb else None
+            events = [
+                JobExecutionEvent(EVENT_JOB_ERROR, self.job.id, self.job._jobstore_alias, run_time, exception=exc, traceback=formatted_tb)
+                for run_time in self.run_times
+            ]
+        events = events or []
+        failed = any(event.code == EVENT_JOB_ERROR for event in events)
+        self.executor._record((time.monotonic() - self.started) * 1000, failed, isinstance(exc, JobTimeoutError))
+        self.executor._run_job_success(self.job.id, events)
+        return True
+
+
+class ManagedExecutorMixin:
+    """
+    执行器混入：
+    - 提交前按 (任务ID, 计划执行时间) 认领触发窗口，保证同一窗口在集群内只执行一次，认领函数由调度协调器注入 SchedulerUtil.fire_guard
+    - 统计执行中/排队数量、完成/失败/超时次数与耗时
+    - 任务配置了超时时间时，超时即以 JobTimeoutError 结束本次执行，并由各执行器尽力取消
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.max_workers: Optional[int] = kwargs.get('max_workers')
+        self._metrics_lock = threading.Lock()
+        self._inflight = 0
+        self._completed = 0
+        self._failed = 0
+        self._timeouts = 0
+        self._duration_total = 0.0
+        self._duration_max = 0.0
+        self._claim_tasks: Set[asyncio.Task] = set()
+
+    def submit_job(self, job: Job, run_times: List[datetime]) -> None:
+        guard = SchedulerUtil.fire_guard
+        if guard is None:
+            super().submit_job(job, run_times)
+            return
+        # 认领需访问 Redis，放到事件循环的任务中异步完成后再提交，调度回调本身不等待网络
+        task = asyncio.get_running_loop().create_task(self._claim_and_submit(guard, job, run_times))
+        self._claim_tasks.add(task)
+        task.add_done_callback(self._claim_tasks.discard)
+
+    async def _claim_and_submit(self, guard: Callable[[str, datetime], Awaitable[bool]], job: Job, run_times: List[datetime]) -> None:
+        claimed = [run_time for run_time in run_times if await guard(job.id, run_time)]
+        skipped = [run_time for run_time in run_times if run_time not in claimed]
+        if skipped:
+            SchedulerUtil.discard_run_started(job.id, skipped)
+            logger.warning(f"任务 {job.id} 的触发窗口已被其他节点执行，跳过")
+        if not claimed:
+            return
+        # 调度器已在提交回调返回后处理完本轮，提交异常需在这里按调度器的方式处理
+        try:
+            super().submit_job(job, claimed)
+        except MaxInstancesReachedError:
+            logger.warning(f"任务 {job.id} 已达到最大运行实例数({job.max_instances})，跳过本次执行")
+            SchedulerUtil.discard_run_started(job.id, claimed)
+            self._scheduler._dispatch_event(JobSubmissionEvent(EVENT_JOB_MAX_INSTANCES, job.id, job._jobstore_alias, claimed))
+        except Exception as e:
+            SchedulerUtil.discard_run_started(job.id, claimed)
+            logger.error(f"任务 {job.id} 提交到执行器失败: {str(e)}")
+
+    def _track(self, job: Job, run_times: List[datetime]) -> _JobRun:
+        with self._metrics_lock:
+            self._inflight += 1
+        return _JobRun(self, job, run_times)
+
+    def _record(self, duration: float, failed: bool, timed_out: bool) -> None:
+        with self._metrics_lock:
+            self._inflight -= 1
+            if timed_out:
+                self._timeouts += 1
+            elif failed:
+                self._failed += 1
+            else:
+                self._completed += 1
+            self._duration_total += duration
+            self._duration_max = max(self._duration_max, duration)
+
+    def _arm_timeout(self, run: _JobRun, cancel: Callable[[], Any]) -> None:
+        """任务配置了超时时间时启动计时，超时先结束本次执行再取消。"""
+        timeout = SchedulerUtil.get_job_timeout(run.job.id)
+        if not timeout:
+            return
+
+        def expire() -> None:
+            if run.finish(exc=JobTimeoutError(f"任务 {run.job.id} 执行超过 {timeout} 秒，已取消")):
+                logger.warning(f"任务 {run.job.id} 执行超时({timeout}秒)，已取消")
+                cancel()
+
+        run.timer = self._call_later(timeout, expire)
+
+    def _call_later(self, delay: float, callback: Callable[[], None]) -> Any:
+        timer = threading.Timer(delay, callback)
+        timer.daemon = True
+        timer.start()
+        return timer
+
+    @staticmethod
+    def _future_callback(run: _JobRun) -> Callable[[Any], None]:
+        def callback(f: Any) -> None:
+            if f.cancelled():
+                return
+            exc = f.exception()
+            if exc is not None:
+                run.finish(exc=exc, tb=exc.__traceback__)
+            else:
+                run.finish(events=f.result())
+        return callback
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        获取执行器运行指标。
+
+        返回:
+        - Dict[str, Any]: 执行中、排队、完成/失败/超时次数与平均/最大耗时(毫秒)。
+        """
+        with self._metrics_lock:
+            finished = self._completed + self._failed + self._timeouts
+            running = min(self._inflight, self.max_workers) if self.max_workers else self._inflight
+            return {
+                'max_workers': self.max_workers,
+                'running': running,
+                'queued': self._inflight - running,
+                'completed': self._completed,
+                'failed': self._failed,
+                'timeouts': self._timeouts,
+                'avg_duration': round(self._duration_total / finished, 3) if finished else None,
+                'max_duration': round(self._duration_max, 3) if finished else None,
+            }
+
+
+class ManagedAsyncIOExecutor(ManagedExecutorMixin, AsyncIOExecutor):
+    """协程执行器：协程任务直接运行在事件循环中，超时取消协程"""
+
+    def _do_submit_job(self, job: Job, run_times: List[datetime]) -> None:
+        task = self._eventloop.create_task(run_coroutine_job(job, job._jobstore_alias, run_times, self._logger.name))
+        run = self._track(job, run_times)
+
+        def callback(f: asyncio.Task) -> None:
+            self._pending_futures.discard(f)
+            if f.cancelled():
+                run.finish(exc=asyncio.CancelledError())
+            elif f.exception() is not None:
+                run.finish(exc=f.exception(), tb=f.exception().__traceback__)
+            else:
+                run.finish(events=f.result())
+
+        task.add_done_callback(callback)
+        self._pending_futures.add(task)
+        self._arm_timeout(run, task.cancel)
+
+    def _call_later(self, delay: float, callback: Callable[[], None]) -> Any:
+        return self._eventloop.call_later(delay, callback)
+
+
+class ManagedThreadPoolExecutor(ManagedExecutorMixin, JobThreadPoolExecutor):
+    """
+    线程池执行器：同步/阻塞IO任务，与请求处理使用的事件循环默认线程池隔离。
+    线程无法被强制中断，超时后本次执行记为失败并释放实例数，未开始的执行直接取消。
+    """
+
+    def _do_submit_job(self, job: Job, run_times: List[datetime]) -> None:
+        f = self._pool.submit(run_job, job, job._jobstore_alias, run_times, self._logger.name)
+        run = self._track(job, run_times)
+        f.add_done_callback(self._future_callback(run))
+        self._arm_timeout(run, f.cancel)
+
+
+class ManagedProcessPoolExecutor(ManagedExecutorMixin, ProcessPoolExecutor):
+    """
+    进程池执行器：CPU密集任务在独立进程中运行，不占用事件循环与 GIL。
+    超时后终止当时进程池内的工作进程(同时在执行的其他任务记为失败)，下次提交时重建进程池。
+    """
+
+    def _do_submit_job(self, job: Job, run_times: List[datetime]) -> None:
+        try:
+            self._submit(job, run_times)
+        except BrokenProcessPool:
+            logger.warning("任务进程池已损坏，重建进程池")
+            self._pool = self._pool.__class__(self._pool._max_workers, **self.pool_kwargs)
+            self._submit(job, run_times)
+
+    def _submit(self, job: Job, run_times: List[datetime]) -> None:
+        pool = self._pool
+        f = pool.submit(run_job, job, job._jobstore_alias, run_times, self._logger.name)
+        run = self._track(job, run_times)
+        f.add_done_callback(self._future_callback(run))
+        self._arm_timeout(run, lambda: f.cancel() or self._terminate(pool))
+
+    @staticmethod
+    def _terminate(pool: concurrent.futures.ProcessPoolExecutor) -> None:
+        for process in list((pool._processes or {}).values()):
+            process.terminate()
+
+
 # 配置执行器
 executors = {
-    'default': AsyncIOExecutor(), 
-    'processpool': ProcessPoolExecutor(max_workers=1)  # 减少进程数量以减少资源消耗
+    # APScheduler 要求存在 default 执行器，仅作兜底，任务加载时会解析为具名执行器
+    'default': ManagedAsyncIOExecutor(),
+    EXECUTOR_ASYNC: ManagedAsyncIOExecutor(),
+    EXECUTOR_IO_THREAD: ManagedThreadPoolExecutor(max_workers=settings.SCHEDULER_IO_THREAD_WORKERS),
+    EXECUTOR_CPU_PROCESS: ManagedProcessPoolExecutor(max_workers=settings.SCHEDULER_CPU_PROCESS_WORKERS),
 }
 # 配置默认参数
 job_defaults = {
@@ -57,11 +305,30 @@ scheduler.configure(
     timezone='Asia/Shanghai'
 )
 
+# 任务耗时直方图分桶上界(毫秒)，最后一个桶计数超过最大上界的执行
+JOB_DURATION_BUCKETS: List[float] = [
+    1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000,
+    10000, 30000, 60000, 300000, 600000, 1800000, 3600000
+]
+
+
 class SchedulerUtil:
     """
     定时任务相关方法
     """
 
+    # 单线程串行写入日志与统计，保证统计的增量更新不会相互覆盖
+    _log_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="job-log")
+    # 任务提交时间 (job_id, 计划执行时间) -> monotonic，用于计算执行耗时
+    _run_started: Dict[Tuple[str, datetime], float] = {}
+    # 触发窗口认领函数 (job_id, 计划执行时间) -> 是否由本进程执行，由 SchedulerLeader 注入
+    fire_guard: Optional[Callable[[str, datetime], Awaitable[bool]]] = None
+    # 任务超时时间(秒) job_id -> timeout，任务加载时登记
+    _job_timeouts: Dict[str, int] = {}
+    # 任务运行指标 job_id -> {missed: 错过触发次数, max_instances: 因实例数已满跳过次数, timeouts: 超时次数}
+    _job_metrics: Dict[str, Dict[str, int]] = {}
+    _metrics_lock = threading.Lock()
+
     @classmethod
     def scheduler_event_listener(cls, event: JobEvent | JobExecutionEvent) -> None:
         """
@@ -84,6 +351,21 @@ class SchedulerUtil:
         if isinstance(event, JobExecutionEvent) and event.exception:
             exception_info = str(event.exception)
             status = False
+        if isinstance(event, JobSubmissionEvent) and event.code == EVENT_JOB_SUBMITTED:
+            for run_time in event.scheduled_run_times:
+                cls._run_started[(event.job_id, run_time)] = time.monotonic()
+        run_result = None
+        if isinstance(event, JobExecutionEvent) and event.code in (EVENT_JOB_EXECUTED, EVENT_JOB_ERROR, EVENT_JOB_MISSED):
+            started = cls._run_started.pop((event.job_id, event.scheduled_run_time), None)
+            if event.code != EVENT_JOB_MISSED:
+                duration = (time.monotonic() - started) * 1000 if started is not None else None
+                run_result = (status, duration)
+        if event.code == EVENT_JOB_MISSED:
+            cls._count_job_metric(event.job_id, 'missed')
+        elif event.code == EVENT_JOB_MAX_INSTANCES:
+            cls._count_job_metric(event.job_id, 'max_instances')
+        elif event.code == EVENT_JOB_ERROR and isinstance(event.exception, JobTimeoutError):
+            cls._count_job_metric(event.job_id, 'timeouts')
         if hasattr(event, 'job_id'):
             job_id = event.job_id
             query_job = cls.get_job(job_id=job_id)
@@ -123,24 +405,87 @@ class SchedulerUtil:
                 )
                 
                 # 使用线程池执行操作以避免阻塞调度器和数据库锁定问题
-                executor = ThreadPoolExecutor(max_workers=1)
-                executor.submit(cls._save_job_log_async_wrapper, job_log)
-                executor.shutdown(wait=False)
+                cls._log_executor.submit(cls._save_job_log_async_wrapper, job_log, run_result)
 
     @classmethod
-    def _save_job_log_async_wrapper(cls, job_log):
+    def _count_job_metric(cls, job_id: str, name: str) -> None:
+        with cls._metrics_lock:
+            metrics = cls._job_metrics.setdefault(job_id, {'missed': 0, 'max_instances': 0, 'timeouts': 0})
+            metrics[name] += 1
+
+    @classmethod
+    def discard_run_started(cls, job_id: str, run_times: List[datetime]) -> None:
+        """
+        清除未实际执行的触发记录(认领失败或提交失败时调用)。
+    
+        参数:
+        - job_id (str): 任务ID。
+        - run_times (List[datetime]): 计划执行时间列表。
+    
+        返回:
+        - None
+        """
+        for run_time in run_times:
+            cls._run_started.pop((job_id, run_time), None)
+
+    @classmethod
+    def get_job_timeout(cls, job_id: str) -> Optional[int]:
+        """
+        获取任务超时时间。
+    
+        参数:
+        - job_id (str): 任务ID。
+    
+        返回:
+        - Optional[int]: 超时时间(秒)，未配置时为 None。
+        """
+        return cls._job_timeouts.get(job_id)
+
+    @classmethod
+    def get_metrics(cls) -> Dict[str, Any]:
+        """
+        获取本进程调度器的运行指标(各执行器排队/执行中数量与耗时，各任务错过触发/超时次数)。
+    
+        返回:
+        - Dict[str, Any]: executors 与 jobs 两部分指标。
+        """
+        executor_metrics = {
+            alias: executor.get_metrics()
+            for alias, executor in scheduler._executors.items()
+            if alias in JOB_EXECUTORS
+        }
+        running: Dict[str, int] = {}
+        for executor in scheduler._executors.values():
+            for job_id, count in dict(executor._instances).items():
+                running[job_id] = running.get(job_id, 0) + count
+        with cls._metrics_lock:
+            job_ids = set(cls._job_metrics) | set(running)
+            job_metrics = {
+                job_id: {
+                    'running': running.get(job_id, 0),
+                    **cls._job_metrics.get(job_id, {'missed': 0, 'max_instances': 0, 'timeouts': 0}),
+                }
+                for job_id in job_ids
+            }
+        return {'executors': executor_metrics, 'jobs': job_metrics}
+
+    @classmethod
+    def _save_job_log_async_wrapper(cls, job_log, run_result: Optional[Tuple[bool, Optional[float]]] = None):
         """
         异步保存任务日志的包装器函数，在独立线程中运行
         
         参数:
         - job_log (JobLogModel): 任务日志对象
+        - run_result (Optional[Tuple[bool, Optional[float]]]): 执行结束事件的 (是否成功, 耗时毫秒)，用于更新执行统计
         
         返回:
         - None
         """
-        with SessionLocal() as session:
+        with sync_session_connect() as session:
             try:
                 session.add(job_log)
+                if run_result is not None:
+                    cls._update_job_stats(session, int(job_log.job_id), job_log.create_time, *run_result)
                 session.commit()
             except Exception as e:
                 session.rollback()
@@ -148,40 +493,159 @@ class SchedulerUtil:
             finally:
                 session.close()
 
+    @staticmethod
+    def _histogram_quantile(histogram: List[int], quantile: float) -> Optional[float]:
+        """
+        根据分桶直方图估算分位数(桶内线性插值)。
+        
+        参数:
+        - histogram (List[int]): 各桶计数。
+        - quantile (float): 分位(0~1)。
+        
+        返回:
+        - Optional[float]: 分位数(毫秒)，无数据时为 None。
+        """
+        total = sum(histogram)
+        if not total:
+            return None
+        rank = quantile * total
+        cumulative = 0
+        for index, count in enumerate(histogram):
+            if count and cumulative + count >= rank:
+                if index >= len(JOB_DURATION_BUCKETS):
+                    return float(JOB_DURATION_BUCKETS[-1])
+                lower = JOB_DURATION_BUCKETS[index - 1] if index else 0
+                upper = JOB_DURATION_BUCKETS[index]
+                return round(lower + (upper - lower) * (rank - cumulative) / count, 3)
+            cumulative += count
+        return float(JOB_DURATION_BUCKETS[-1])
+
+    @classmethod
+    def _update_job_stats(cls, session: Session, job_id: int, run_time: datetime, status: bool, duration: Optional[float]) -> None:
+        """
+        增量更新任务执行统计(最近执行、成功/失败次数、耗时分位数)。
+        
+        参数:
+        - session (Session): 同步数据库会话。
+        - job_id (int): 任务ID。
+        - run_time (datetime): 执行时间。
+        - status (bool): 是否成功。
+        - duration (Optional[float]): 耗时(毫秒)。
+        
+        返回:
+        - None
+        """
+        from app.api.v1.module_application.job.model import JobStatsModel
+
+        stats = session.get(JobStatsModel, job_id)
+        if stats is None:
+            stats = JobStatsModel(job_id=job_id, success_count=0, failure_count=0)
+            session.add(stats)
+        stats.last_run_time = run_time
+        stats.last_status = status
+        if status:
+            stats.success_count += 1
+        else:
+            stats.failure_count += 1
+        if duration is not None:
+            histogram = json.loads(stats.duration_histogram) if stats.duration_histogram else [0] * (len(JOB_DURATION_BUCKETS) + 1)
+            histogram[bisect_left(JOB_DURATION_BUCKETS, duration)] += 1
+            stats.duration_histogram = json.dumps(histogram)
+            stats.last_duration = round(duration, 3)
+            stats.p50_duration = cls._histogram_quantile(histogram, 0.5)
+            stats.p95_duration = cls._histogram_quantile(histogram, 0.95)
+
     @classmethod
-    async def init_system_scheduler(cls):
+    async def init_system_scheduler(cls, paused: bool = False):
         """
         应用启动时初始化定时任务。
     
+        参数:
+        - paused (bool): 是否以暂停状态启动(非主节点不触发任务，成为主节点后再加载任务并恢复)。
+    
         返回:
         - None
         """
+        logger.info('🔎 开始启动定时任务...')
+        scheduler.start(paused=paused)
+        scheduler.add_listener(cls.scheduler_event_listener, EVENT_ALL)
+        if not paused:
+            await cls.load_jobs()
+        logger.info('✅️ 系统初始定时任务加载成功')
+
+    @classmethod
+    async def load_jobs(cls) -> int:
+        """
+        从数据库加载全部任务到调度器(已存在时替换)，禁用的任务加载后暂停。
+    
+        返回:
+        - int: 加载的任务数。
+        """
         # 延迟导入避免循环导入
         from app.api.v1.module_application.job.crud import JobCRUD
         from app.api.v1.module_system.auth.schema import AuthSchema
-        logger.info('🔎 开始启动定时任务...')
-        scheduler.start()
         async with AsyncSessionLocal() as session:
             async with session.begin():
                 auth = AuthSchema(db=session)
-                job_list = await JobCRUD(auth).get_obj_list_crud()
+                job_list = await JobCRUD(auth).get_obj_list_crud(preload=[])
                 for item in job_list:
-                    cls.remove_job(job_id=item.id)  # 删除旧任务
-                    cls.add_job(item)
-        scheduler.add_listener(cls.scheduler_event_listener, EVENT_ALL)
-        logger.info('✅️ 系统初始定时任务加载成功')
+                    try:
+                        cls.add_job(item)
+                        if not item.status:
+                            scheduler.pause_job(job_id=str(item.id))
+                    except Exception as e:
+                        logger.error(f'加载定时任务 {item.name} 失败: {str(e)}')
+        return len(job_list)
+
+    @classmethod
+    async def reload_job(cls, job_id: Union[str, int]) -> None:
+        """
+        从数据库重新加载单个任务(任务不存在时从调度器移除)。
+    
+        参数:
+        - job_id (str | int): 任务ID。
+    
+        返回:
+        - None
+        """
+        from app.api.v1.module_application.job.crud import JobCRUD
+        from app.api.v1.module_system.auth.schema import AuthSchema
+        async with AsyncSessionLocal() as session:
+            async with session.begin():
+                obj = await JobCRUD(AuthSchema(db=session)).get_obj_by_id_crud(id=int(job_id), preload=[])
+                if not obj:
+                    cls.remove_job(job_id=job_id)
+                    return
+                cls.add_job(obj)
+                if not obj.status:
+                    scheduler.pause_job(job_id=str(obj.id))
 
     @classmethod
-    async def close_system_scheduler(cls):
+    def clear_local_jobs(cls) -> None:
+        """
+        失去主节点身份时清理本进程内存中的任务(共享的持久化存储由新主节点负责)。
+    
+        返回:
+        - None
+        """
+        scheduler.remove_all_jobs(jobstore='default')
+        cls._job_timeouts.clear()
+
+    @classmethod
+    async def close_system_scheduler(cls, remove_jobs: bool = True):
         """
         关闭系统定时任务。
     
+        参数:
+        - remove_jobs (bool): 是否移除所有任务(仅主节点移除，避免非主节点清空共享存储)。
+    
         返回:
         - None
         """
         try:
             # 移除所有任务
-            scheduler.remove_all_jobs()
+            if remove_jobs:
+                scheduler.remove_all_jobs()
             # 等待所有任务完成后再关闭
             scheduler.shutdown(wait=True)
             logger.info('✅️ 关闭定时任务成功')
@@ -212,15 +676,19 @@ class SchedulerUtil:
         return scheduler.get_jobs()
 
     @classmethod
-    def add_job(cls, job_info: JobModel) -> Job:
+    def build_job_kwargs(cls, job_info: JobModel) -> Dict[str, Any]:
         """
-        根据任务配置创建并添加调度任务。
+        解析任务配置(调用目标、触发器、执行器)，生成 scheduler.add_job 参数。
+        不修改调度器，可在非主节点上用于校验任务配置。
     
         参数:
         - job_info (JobModel): 任务对象信息（包含触发器、函数、参数等）。
     
         返回:
-        - Job: 新增的任务对象。
+        - Dict[str, Any]: scheduler.add_job 参数。
+    
+        异常:
+        - ValueError | CustomException: 任务配置不合法时抛出。
         """
         # 动态导入模块
         # 1. 解析调用目标
@@ -234,64 +702,14 @@ class SchedulerUtil:
             if job_info.jobstore is None:
                 job_info.jobstore = 'default'
             # 2. 确定执行器
-            job_executor = job_info.executor
-            if job_executor is None:
-                job_executor = 'default'
+            job_executor = cls.resolve_executor(job_info.executor, job_func)
             if job_info.trigger_args is None:
                     raise ValueError("interval 触发器缺少参数")
             
-            if iscoroutinefunction(job_func):
-                job_executor = 'default'
-            if job_info.trigger == 'date':
-                trigger = DateTrigger(run_date=job_info.trigger_args)
-            elif job_info.trigger == 'interval':
-                # 将传入的 interval 表达式拆分为不同的字段
-                fields = job_info.trigger_args.strip().split()
-                if len(fields) != 5:
-                    raise ValueError("无效的 interval 表达式")
-                second, minute, hour, day, week = tuple([int(field) if field != '*' else 0 for field in fields])
-                # 秒、分、时、天、周（* * * * 1）
-                trigger = IntervalTrigger(
-                    weeks=week,
-                    days=day,
-                    hours=hour,
-                    minutes=minute,
-                    seconds=second,
-                    start_date=job_info.start_date,
-                    end_date=job_info.end_date,
-                    timezone='Asia/Shanghai',
-                    jitter=None
-                )
-            elif job_info.trigger == 'cron':
-                # 秒、分、时、天、月、星期几、年 ()
-                fields = job_info.trigger_args.strip().split()
-                if len(fields) not in (6, 7):
-                    raise ValueError("无效的 Cron 表达式")
-                if not CronUtil.validate_cron_expression(job_info.trigger_args):
-                    raise ValueError(f'定时任务{job_info.name}, Cron表达式不正确')
-
-                parsed_fields = [None if field in ('*', '?') else field for field in fields]
-                if len(fields) == 6:
-                    parsed_fields.append(None)
-
-                second, minute, hour, day, month, day_of_week, year = tuple(parsed_fields)
-                trigger = CronTrigger(
-                    second=second,
-                    minute=minute,
-                    hour=hour,
-                    day=day,
-                    month=month,
-                    day_of_week=day_of_week,
-                    year=year,
-                    start_date=job_info.start_date,
-                    end_date=job_info.end_date,
-                    timezone='Asia/Shanghai'
-                )
-            else:
-                raise ValueError("无效的 trigger 触发器")
+            trigger = cls.build_trigger(job_info.trigger, job_info.trigger_args, job_info.start_date, job_info.end_date)
 
-            # 3. 添加任务
-            job = scheduler.add_job(
+            # 3. 任务参数
+            return dict(
                 func=job_func,  # 直接使用函数对象
                 trigger=trigger,
                 args=str(job_info.args).split(',') if job_info.args else None,
@@ -303,7 +721,6 @@ class SchedulerUtil:
                 jobstore=job_info.jobstore,
                 executor=job_executor,
             )
-            return job
         except ModuleNotFoundError:
             raise ValueError(f"未找到该模块：{module_path}")
         except AttributeError:
@@ -311,6 +728,132 @@ class SchedulerUtil:
         except Exception as e:
             raise CustomException(msg=f"添加任务失败: {str(e)}")
 
+    @classmethod
+    def build_trigger(cls, trigger: str, trigger_args: str, start_date: Optional[str] = None, end_date: Optional[str] = None) -> BaseTrigger:
+        """
+        根据触发器类型与参数构造调度触发器(cron 表达式编译结果按表达式缓存)。
+    
+        参数:
+        - trigger (str): 触发器类型 date/interval/cron。
+        - trigger_args (str): 触发器参数(执行时间、interval 表达式或 Cron 表达式)。
+        - start_date (Optional[str]): 开始时间。
+        - end_date (Optional[str]): 结束时间。
+    
+        返回:
+        - BaseTrigger: 调度触发器。
+    
+        异常:
+        - ValueError: 触发器类型或参数不合法时抛出。
+        """
+        if trigger == 'date':
+            return DateTrigger(run_date=trigger_args, timezone='Asia/Shanghai')
+        if trigger == 'interval':
+            # 秒、分、时、天、周（* * * * 1）
+            return IntervalTrigger(
+                **CronUtil.parse_interval(trigger_args.strip()),
+                start_date=start_date,
+                end_date=end_date,
+                timezone='Asia/Shanghai',
+                jitter=None
+            )
+        if trigger == 'cron':
+            # 秒、分、时、日、月、星期、[年]
+            try:
+                return CronUtil.build_trigger(trigger_args, start_date=start_date, end_date=end_date)
+            except ValueError as e:
+                raise ValueError(f"Cron表达式不正确: {str(e)}")
+        raise ValueError("无效的 trigger 触发器")
+
+    @classmethod
+    def preview_fire_times(cls, trigger: str, trigger_args: str, start_date: Optional[str] = None, end_date: Optional[str] = None, count: int = 5) -> List[datetime]:
+        """
+        预览触发器的后 N 次触发时间(与调度时使用同一触发器计算)。
+    
+        参数:
+        - trigger (str): 触发器类型 date/interval/cron。
+        - trigger_args (str): 触发器参数。
+        - start_date (Optional[str]): 开始时间。
+        - end_date (Optional[str]): 结束时间。
+        - count (int): 预览次数。
+    
+        返回:
+        - List[datetime]: 触发时间列表。
+        """
+        job_trigger = cls.build_trigger(trigger, trigger_args, start_date, end_date)
+        now = datetime.now(ZoneInfo('Asia/Shanghai'))
+        fire_times: List[datetime] = []
+        fire_time = job_trigger.get_next_fire_time(None, now)
+        while fire_time is not None and len(fire_times) < count:
+            fire_times.append(fire_time)
+            fire_time = job_trigger.get_next_fire_time(fire_time, fire_time)
+        return fire_times
+
+    @classmethod
+    def resolve_executor(cls, executor: Optional[str], job_func: Callable) -> str:
+        """
+        解析并校验任务执行器：协程任务只能使用 async，同步任务只能使用 io-thread 或 cpu-process。
+    
+        参数:
+        - executor (Optional[str]): 任务配置的执行器名称(兼容历史名称 default/processpool)。
+        - job_func (Callable): 任务函数。
+    
+        返回:
+        - str: 执行器名称。
+    
+        异常:
+        - ValueError: 执行器不存在或与任务函数类型不匹配时抛出。
+        """
+        is_coroutine = iscoroutinefunction(job_func)
+        name = LEGACY_EXECUTORS.get(executor or 'default', executor or 'default')
+        if name == 'default':
+            name = EXECUTOR_ASYNC if is_coroutine else EXECUTOR_IO_THREAD
+        if name not in JOB_EXECUTORS:
+            raise ValueError(f"无效的执行器：{executor}，可选 {'/'.join(JOB_EXECUTORS)}")
+        if is_coroutine and name != EXECUTOR_ASYNC:
+            raise ValueError("协程任务只能使用 async 执行器")
+        if not is_coroutine and name == EXECUTOR_ASYNC:
+            raise ValueError("同步任务不能使用 async 执行器，请选择 io-thread 或 cpu-process")
+        if name == EXECUTOR_CPU_PROCESS and job_func.__qualname__ != job_func.__name__:
+            raise ValueError("cpu-process 执行器要求任务函数为模块级函数")
+        return name
+
+    @classmethod
+    def _ensure_jobstore(cls, alias: str) -> None:
+        """
+        按需注册数据库任务存储，同步数据库引擎在首个使用该存储的任务加入时才创建。
+    
+        参数:
+        - alias (str): 任务存储名称。
+    
+        返回:
+        - None
+        """
+        if alias == JOBSTORE_SQLALCHEMY and alias not in scheduler._jobstores:
+            scheduler.add_jobstore(SQLAlchemyJobStore(engine=get_engine()), alias=alias)
+
+    @classmethod
+    def add_job(cls, job_info: JobModel) -> Job:
+        """
+        根据任务配置创建并添加调度任务(已存在时替换)。
+    
+        参数:
+        - job_info (JobModel): 任务对象信息（包含触发器、函数、参数等）。
+    
+        返回:
+        - Job: 新增的任务对象。
+        """
+        job_kwargs = cls.build_job_kwargs(job_info)
+        try:
+            cls._ensure_jobstore(job_kwargs['jobstore'])
+            job = scheduler.add_job(**job_kwargs, replace_existing=True)
+        except Exception as e:
+            raise CustomException(msg=f"添加任务失败: {str(e)}")
+        if getattr(job_info, 'timeout', None):
+            cls._job_timeouts[job.id] = job_info.timeout
+        else:
+            cls._job_timeouts.pop(job.id, None)
+        return job
+
     @classmethod
     def remove_job(cls, job_id: Union[str, int]) -> None:
         """
@@ -325,6 +868,7 @@ class SchedulerUtil:
         query_job = cls.get_job(job_id=str(job_id))
         if query_job:
             scheduler.remove_job(job_id=str(job_id))
+        cls._job_timeouts.pop(str(job_id), None)
 
     @classmethod
     def clear_jobs(cls):
@@ -335,6 +879,7 @@ class SchedulerUtil:
         - None
         """
         scheduler.remove_all_jobs()
+        cls._job_timeouts.clear()
 
     @classmethod
     def modify_job(cls, job_id: Union[str, int]) -> Job:
@@ -3,19 +3,22 @@
 from pydantic import BaseModel
 from typing import TypeVar, Sequence, Generic, Dict, Any, List, Optional, Type, Union
 from sqlalchemy.sql.elements import ColumnElement
-from sqlalchemy.orm import selectinload
-from sqlalchemy.engine import Result
-from sqlalchemy import asc, func, select, delete, Select, desc, update, or_, and_
+from sqlalchemy.orm import lazyload, selectinload
+from sqlalchemy.engine import Result, Row
+from sqlalchemy import asc, func, select, insert, delete, Select, desc, update, or_, and_
 from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.types import Date
 
 from app.core.base_model import MappedBase
 from app.api.v1.module_system.auth.schema import AuthSchema
 from app.api.v1.module_system.dept.model import DeptModel
 from app.api.v1.module_system.user.model import UserModel
 from app.utils.common_util import get_child_id_map, get_child_recursion
+from app.utils.time_util import TimeUtil
 from app.core.exceptions import CustomException
-from app.common.request import PageResultSchema
 from app.core.serialize import Serialize
+from app.core.text_search import TextSearch
+from app.core.count_strategy import CountStrategy
 
 ModelType = TypeVar("ModelType", bound=MappedBase)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
@@ -71,6 +74,29 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         except Exception as e:
             raise CustomException(msg=f"获取查询失败: {str(e)}")
 
+    async def get_many(self, ids: Sequence[int], columns: Optional[List[str]] = None) -> Sequence[Row]:
+        """
+        按ID批量获取指定字段，一次查询完成存在性校验，不加载关联关系
+        
+        参数:
+        - ids (Sequence[int]): ID列表
+        - columns (Optional[List[str]]): 需要的字段名，id 始终返回
+            
+        返回:
+        - Sequence[Row]: 存在且有数据权限的记录行，可按 row.id、row.<字段名> 访问
+            
+        异常:
+        - CustomException: 查询失败时抛出异常
+        """
+        try:
+            names = ['id'] + [name for name in (columns or []) if name != 'id']
+            sql = select(*[getattr(self.model, name) for name in names]).where(getattr(self.model, 'id').in_(list(ids)))
+            sql = await self.__filter_permissions(sql)
+            result: Result = await self.db.execute(sql)
+            return result.all()
+        except Exception as e:
+            raise CustomException(msg=f"批量查询失败: {str(e)}")
+
     async def list(self, search: Optional[Dict] = None, order_by: Optional[List[Dict[str, str]]] = None, preload: Optional[List[Union[str, Any]]] = None) -> Sequence[ModelType]:
         """
         根据条件获取对象列表
@@ -99,18 +125,20 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         except Exception as e:
             raise CustomException(msg=f"列表查询失败: {str(e)}")
 
-    async def tree_list(self, search: Optional[Dict] = None, order_by: Optional[List[Dict[str, str]]] = None, children_attr: str = 'children', preload: Optional[List[Union[str, Any]]] = None) -> Sequence[ModelType]:
+    async def tree_list(self, search: Optional[Dict] = None, order_by: Optional[List[Dict[str, str]]] = None, preload: Optional[List[Union[str, Any]]] = None) -> Sequence[ModelType]:
         """
-        获取树形结构数据列表
+        获取树形结构的扁平数据列表（单次查询，不递归加载子节点关系）
+
+        结果需配合 traversal_to_tree 在内存中按 id 索引组装为树。
+        模型上 lazy="selectin" 的关系(如部门的 users/roles)不会随树查询级联加载。
         
         参数:
         - search (Optional[Dict]): 查询条件
         - order_by (Optional[List[Dict[str, str]]]): 排序字段
-        - children_attr (str): 子节点属性名
-        - preload (Optional[List[Union[str, Any]]]): 额外预加载关系，若为None则默认包含children_attr
+        - preload (Optional[List[Union[str, Any]]]): 预加载关系，未提供时仅加载创建人(不含其关联关系)
             
         返回:
-        - Sequence[ModelType]: 树形结构数据列表
+        - Sequence[ModelType]: 扁平数据列表
             
         异常:
         - CustomException: 查询失败时抛出异常
@@ -118,19 +146,11 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         try:
             conditions = await self.__build_conditions(**search) if search else []
             order = order_by or [{'id': 'asc'}]
-            sql = select(self.model).where(*conditions).order_by(*self.__order_by(order))
-            
-            # 处理预加载选项
-            final_preload = preload
-            # 如果没有提供preload且children_attr存在，则添加到预加载选项中
-            if preload is None and children_attr and hasattr(self.model, children_attr):
-                # 获取模型默认预加载选项
-                model_defaults = getattr(self.model, "__loader_options__", [])
-                # 将children_attr添加到默认预加载选项中
-                final_preload = list(model_defaults) + [children_attr]
-            
-            # 应用预加载选项
-            for opt in self.__loader_options(final_preload):
+            sql = select(self.model).where(*conditions).order_by(*self.__order_by(order)).options(lazyload('*'))
+            if preload is None:
+                # 输出模型只需要创建人的基础信息，创建人自身的关系同样不加载
+                preload = [selectinload(self.model.creator).lazyload('*')] if hasattr(self.model, 'creator') else []
+            for opt in self.__loader_options(preload):
                 sql = sql.options(opt)
             
             sql = await self.__filter_permissions(sql)
@@ -138,10 +158,39 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             return result.scalars().all()
         except Exception as e:
             raise CustomException(msg=f"树形列表查询失败: {str(e)}")
+
+    async def tree_nodes(self, parent_attr: str = 'parent_id') -> Sequence[Row]:
+        """
+        获取树形结构的节点关系（仅查询 id 与父级 id 两列）
+
+        用于计算祖先/后代 ID，避免加载完整对象及其关联关系。
+
+        参数:
+        - parent_attr (str): 父级 ID 字段名
+
+        返回:
+        - Sequence[Row]: 包含 id、parent_id 属性的行列表
+
+        异常:
+        - CustomException: 查询失败时抛出异常
+        """
+        try:
+            sql = select(
+                getattr(self.model, 'id').label('id'),
+                getattr(self.model, parent_attr).label('parent_id')
+            )
+            sql = await self.__filter_permissions(sql)
+            result: Result = await self.db.execute(sql)
+            return result.all()
+        except Exception as e:
+            raise CustomException(msg=f"树形节点查询失败: {str(e)}")
     
     async def page(self, offset: int, limit: int, order_by: List[Dict[str, str]], search: Dict, out_schema: Type[OutSchemaType], preload: Optional[List[Union[str, Any]]] = None) -> Dict:
         """
         获取分页数据
+
+        总数由 CountStrategy 统计：无过滤且无数据权限限制的大表使用统计信息估算，
+        其余情况精确统计并短时缓存，估算时返回 total_is_estimate=True。
         
         参数:
         - offset (int): 偏移量
@@ -159,43 +208,50 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         try:
             conditions = await self.__build_conditions(**search) if search else []
+            perm = await self.__permission_condition()
             order = order_by or [{'id': 'asc'}]
             sql = select(self.model).where(*conditions).order_by(*self.__order_by(order))
             # 应用预加载选项
             for opt in self.__loader_options(preload):
                 sql = sql.options(opt)
-            sql = await self.__filter_permissions(sql)
+            if perm is not None:
+                sql = sql.where(perm)
 
             # 获取总数
-            count_sql = select(func.count()).select_from(self.model)
-            if conditions:
-                count_sql = count_sql.where(*conditions)
-            count_sql = await self.__filter_permissions(count_sql)
-            
-            total_result = await self.db.execute(count_sql)
-            total = total_result.scalar() or 0
+            count_sql = select(func.count()).select_from(self.model).where(*conditions)
+            if perm is not None:
+                count_sql = count_sql.where(perm)
+            total, total_is_estimate = await CountStrategy.count(
+                db=self.db,
+                table_name=self.model.__tablename__,
+                count_sql=count_sql,
+                filtered=bool(conditions) or perm is not None
+            )
 
             result: Result = await self.db.execute(sql.offset(offset).limit(limit))
             objs = result.scalars().all()
 
-            data = PageResultSchema(
-                items=[out_schema.model_validate(obj).model_dump() for obj in objs],
-                total=total,
-                page_no=offset // limit + 1 if limit else 1,
-                page_size=limit,
-                has_next=offset + limit < total,
-            ).model_dump()
-
-            return data
+            return {
+                "items": Serialize.models_to_json(objs, out_schema),
+                "total": total,
+                "total_is_estimate": total_is_estimate,
+                "page_no": offset // limit + 1 if limit else 1,
+                "page_size": limit,
+                "has_next": offset + limit < total if not total_is_estimate else len(objs) == limit,
+            }
         except Exception as e:
             raise CustomException(msg=f"分页查询失败: {str(e)}")
     
-    async def create(self, data: Union[CreateSchemaType, Dict]) -> ModelType:
+    async def create(self, data: Union[CreateSchemaType, Dict], preload: Optional[List[Union[str, Any]]] = None) -> ModelType:
         """
         创建新对象
         
+        数据库支持 INSERT ... RETURNING 时一条语句写入并取回整行，关联关系按预加载选项加载；
+        否则回退为 flush 后 refresh。
+        
         参数:
         - data (Union[CreateSchemaType, Dict]): 对象属性
+        - preload (Optional[List[Union[str, Any]]]): 预加载关系，未提供时按模型关系的加载策略加载
             
         返回:
         - ModelType: 新创建的对象实例
@@ -205,12 +261,20 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         try:
             obj_dict = data if isinstance(data, dict) else data.model_dump()
-            obj = self.model(**obj_dict)
             
             # 设置创建人ID（存在该字段时）
-            if hasattr(obj, "creator_id") and self.current_user:
-                setattr(obj, "creator_id", self.current_user.id)
+            if hasattr(self.model, "creator_id") and self.current_user:
+                obj_dict = {**obj_dict, "creator_id": self.current_user.id}
             
+            values = self.__column_values(obj_dict, for_insert=True)
+            if values is not None and self.db.get_bind().dialect.insert_returning:
+                sql = insert(self.model).values(**values).returning(self.model).options(*self.__returning_options(preload))
+                result: Result = await self.db.execute(sql)
+                obj = result.scalars().one()
+                await self.__load_relationships(obj)
+                return obj
+            
+            obj = self.model(**obj_dict)
             self.db.add(obj)
             await self.db.flush()
             await self.db.refresh(obj)
@@ -218,13 +282,17 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         except Exception as e:
             raise CustomException(msg=f"创建失败: {str(e)}")
 
-    async def update(self, id: int, data: Union[UpdateSchemaType, Dict]) -> ModelType:
+    async def update(self, id: int, data: Union[UpdateSchemaType, Dict], preload: Optional[List[Union[str, Any]]] = None) -> ModelType:
         """
         更新对象
         
+        数据库支持 UPDATE ... RETURNING 时一条语句更新并取回整行(带数据权限条件)，
+        不再先查询再 refresh；否则回退为查询后逐属性赋值，仅 refresh 被服务端改写的字段。
+        
         参数:
         - id (int): 对象ID
         - data (Union[UpdateSchemaType, Dict]): 更新的属性及值
+        - preload (Optional[List[Union[str, Any]]]): 预加载关系，未提供时按模型关系的加载策略加载
             
         返回:
         - ModelType: 更新后的对象实例
@@ -234,20 +302,105 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         try:
             obj_dict = data if isinstance(data, dict) else data.model_dump(exclude_unset=True, exclude={"id"})
-            obj = await self.get(id=id)
+            obj_dict = {key: value for key, value in obj_dict.items() if hasattr(self.model, key)}
+            
+            values = self.__column_values(obj_dict)
+            if values and self.db.get_bind().dialect.update_returning:
+                sql = update(self.model).where(getattr(self.model, 'id') == id).values(**values).returning(self.model)
+                perm = await self.__permission_condition()
+                if perm is not None:
+                    sql = sql.where(perm)
+                result: Result = await self.db.execute(sql.options(*self.__returning_options(preload)))
+                obj = result.scalars().first()
+                if not obj:
+                    raise CustomException(msg="更新对象不存在")
+                await self.__load_relationships(obj)
+                return obj
+            
+            obj = await self.get(id=id, preload=preload)
             if not obj:
                 raise CustomException(msg="更新对象不存在")
             
             for key, value in obj_dict.items():
-                if hasattr(obj, key):
-                    setattr(obj, key, value)
+                setattr(obj, key, value)
                     
             await self.db.flush()
-            await self.db.refresh(obj)
+            # 仅服务端生成的字段会在 flush 后过期
+            expired = sa_inspect(obj).expired_attributes
+            if expired:
+                await self.db.refresh(obj, attribute_names=list(expired))
             return obj
         except Exception as e:
             raise CustomException(msg=f"更新失败: {str(e)}")
 
+    async def bulk_create(self, data: Sequence[Union[CreateSchemaType, Dict]]) -> int:
+        """
+        批量创建对象
+        
+        以 executemany 方式写入，SQLite/PostgreSQL 等由 SQLAlchemy insertmanyvalues 合并为多行 VALUES 分批提交；
+        不返回对象实例，也不触发 ORM 事件。
+        
+        参数:
+        - data (Sequence[Union[CreateSchemaType, Dict]]): 对象属性列表
+            
+        返回:
+        - int: 写入条数
+            
+        异常:
+        - CustomException: 创建失败时抛出异常
+        """
+        try:
+            rows = []
+            for item in data:
+                obj_dict = item if isinstance(item, dict) else item.model_dump()
+                if hasattr(self.model, "creator_id") and self.current_user:
+                    obj_dict = {**obj_dict, "creator_id": self.current_user.id}
+                values = self.__column_values(obj_dict, for_insert=True)
+                if values is None:
+                    raise CustomException(msg=f"存在非字段属性: {', '.join(obj_dict)}")
+                rows.append(values)
+            if not rows:
+                return 0
+            await self.db.execute(insert(self.model), rows)
+            return len(rows)
+        except Exception as e:
+            raise CustomException(msg=f"批量创建失败: {str(e)}")
+
+    async def bulk_update(self, data: Sequence[Dict]) -> int:
+        """
+        按主键批量更新对象，每项的更新字段可不同，非字段属性被忽略
+        
+        以 executemany 方式执行 UPDATE ... WHERE id = ?，会话中已加载的对象同步更新；
+        有数据权限限制时先一次查询过滤出有权限的记录，无权限的项被忽略。
+        
+        参数:
+        - data (Sequence[Dict]): 更新数据列表，每项须包含 id
+            
+        返回:
+        - int: 更新条数
+            
+        异常:
+        - CustomException: 更新失败时抛出异常
+        """
+        try:
+            columns = sa_inspect(self.model).column_attrs
+            rows = []
+            for item in data:
+                if item.get('id') is None:
+                    raise CustomException(msg="批量更新数据缺少id")
+                values = {key: value for key, value in item.items() if key in columns}
+                if len(values) > 1:
+                    rows.append(values)
+            if rows and await self.__permission_condition() is not None:
+                allowed = {row.id for row in await self.get_many(ids=[row['id'] for row in rows])}
+                rows = [row for row in rows if row['id'] in allowed]
+            if not rows:
+                return 0
+            await self.db.execute(update(self.model), rows)
+            return len(rows)
+        except Exception as e:
+            raise CustomException(msg=f"批量更新失败: {str(e)}")
+
     async def delete(self, ids: List[int]) -> None:
         """
         删除对象
@@ -317,6 +470,44 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         except Exception as e:
             raise CustomException(msg=f"批量更新失败: {str(e)}")
 
+    def __column_values(self, obj_dict: Dict[str, Any], for_insert: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        校验属性均为字段并转换为 INSERT/UPDATE 语句的取值，存在关系等非字段属性时返回None。
+        
+        与 ORM 工作单元保持一致：插入时有默认值的字段取值为None则不写入，由默认值生成。
+        """
+        columns = sa_inspect(self.model).column_attrs
+        values = {}
+        for key, value in obj_dict.items():
+            attr = columns.get(key)
+            if attr is None:
+                return None
+            column = attr.columns[0]
+            if for_insert and value is None and (column.primary_key or column.default is not None or column.server_default is not None):
+                continue
+            values[key] = value
+        return values
+
+    def __returning_options(self, preload: Optional[List[Union[str, Any]]] = None) -> List[Any]:
+        """
+        INSERT/UPDATE ... RETURNING 的加载选项：仅按 preload 显式加载，其余关系延后由 __load_relationships 处理。
+
+        RETURNING 取回的行会覆盖会话中的同一对象，按模型策略 selectin 会重新查询已在会话中的关联对象。
+        """
+        if preload is None:
+            return [lazyload('*')]
+        return [lazyload('*'), *self.__loader_options(preload)]
+
+    async def __load_relationships(self, obj: ModelType) -> None:
+        """
+        加载对象尚未加载的预加载策略关系(与 refresh 后可访问的关系一致)。
+        多对一关系优先从会话标识映射中获取，不产生查询。
+        """
+        state = sa_inspect(obj)
+        for rel in state.mapper.relationships:
+            if rel.lazy in ('selectin', 'joined', 'subquery', 'immediate') and rel.key in state.unloaded:
+                await getattr(obj.awaitable_attrs, rel.key)
+
     async def __filter_permissions(self, sql: Select) -> Select:
         """
         过滤数据权限（仅用于Select）。
@@ -369,9 +560,9 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         # 如果有自定义数据权限且部门ID存在，优先处理
         if 5 in data_scopes and dept_ids:
             # 自定义数据权限
-            creator_rel = getattr(self.model, "creator", None)
-            if hasattr(UserModel, 'dept_id') and creator_rel is not None:
-                return creator_rel.has(getattr(UserModel, 'dept_id').in_(list(dept_ids)))
+            condition = self.__dept_scope_condition(dept_ids)
+            if condition is not None:
+                return condition
             else:
                 creator_id_attr = getattr(self.model, "creator_id", None)
                 if creator_id_attr is not None:
@@ -394,10 +585,9 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             
         if 3 in data_scopes and dept_id_val is not None:
             # 本部门及以下数据（查询所有部门并递归）
-            dept_sql = select(DeptModel)
+            dept_sql = select(DeptModel.id, DeptModel.parent_id)
             dept_result = await self.db.execute(dept_sql)
-            dept_objs = dept_result.scalars().all()
-            id_map = get_child_id_map(dept_objs)
+            id_map = get_child_id_map(dept_result.all())
             dept_child_ids = get_child_recursion(id=dept_id_val, id_map=id_map)
             dept_ids.add(dept_id_val)  # 包含本部门
             for child_id in dept_child_ids:
@@ -405,10 +595,10 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
         # 处理2、3汇总的数据权限
         if (2 in data_scopes or 3 in data_scopes) and dept_ids:
-            # 使用关系creator进行筛选（若存在），否则回退到仅本人数据
-            creator_rel = getattr(self.model, "creator", None)
-            if hasattr(UserModel, 'dept_id') and creator_rel is not None and dept_ids:
-                return creator_rel.has(getattr(UserModel, 'dept_id').in_(list(dept_ids)))
+            # 按创建人所属部门筛选，否则回退到仅本人数据
+            condition = self.__dept_scope_condition(dept_ids)
+            if condition is not None:
+                return condition
             else:
                 creator_id_attr = getattr(self.model, "creator_id", None)
                 if creator_id_attr is not None:
@@ -421,6 +611,24 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             return creator_id_attr == self.current_user.id
         return None
 
+    def __dept_scope_condition(self, dept_ids: set) -> Optional[ColumnElement]:
+        """
+        构造部门数据权限表达式：creator_id IN (SELECT id FROM system_users WHERE dept_id IN (...))。
+
+        非相关子查询只执行一次，主表按 creator_id 索引查找；
+        相比 creator.has() 生成的相关 EXISTS 不再对每一行回查用户表。
+
+        参数:
+        - dept_ids (set): 允许的部门ID集合。
+
+        返回:
+        - Optional[ColumnElement]: 模型没有 creator_id 字段时返回 None。
+        """
+        creator_id_attr = getattr(self.model, "creator_id", None)
+        if creator_id_attr is None or not dept_ids:
+            return None
+        return creator_id_attr.in_(select(UserModel.id).where(UserModel.dept_id.in_(sorted(dept_ids))))
+
     async def __build_conditions(self, **kwargs) -> List[ColumnElement]:
         """
         构建查询条件
@@ -446,12 +654,27 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                     conditions.append(attr.is_(None))
                 elif seq == "not None":
                     conditions.append(attr.isnot(None))
-                elif seq == "date" and val:
-                    conditions.append(func.date_format(attr, "%Y-%m-%d") == val)
-                elif seq == "month" and val:
-                    conditions.append(func.date_format(attr, "%Y-%m") == val)
+                elif seq in ("date", "month") and val:
+                    # 编译为左闭右开区间而非对列调用日期函数，可使用列上的索引且与数据库方言无关
+                    try:
+                        start, end = TimeUtil.period_range(val, "day" if seq == "date" else "month")
+                    except ValueError:
+                        raise CustomException(msg=f"查询参数 {key} 格式错误: {val}")
+                    if isinstance(attr.type, Date):
+                        start, end = start.date(), end.date()
+                    conditions.append(and_(attr >= start, attr < end))
                 elif seq == "like" and val:
                     conditions.append(attr.like(f"%{val}%"))
+                elif seq == "search" and val:
+                    # 按方言走全文检索索引，模型未声明 __search_columns__ 时等同 like
+                    conditions.append(TextSearch.condition(self.model, key, val, self.db.get_bind().dialect.name))
+                elif seq == "startswith" and val:
+                    if self.db.get_bind().dialect.name == "sqlite":
+                        # SQLite 的 LIKE 不区分大小写且带 ESCAPE 时不走索引；默认 BINARY 排序规则下编译为左闭右开区间，可使用列上的索引
+                        conditions.append(and_(attr >= val, attr < val + "\U0010FFFF"))
+                    else:
+                        # MySQL 的前缀 LIKE 可走索引；PostgreSQL 在非 C 排序规则下需为该列建立 text_pattern_ops 索引
+                        conditions.append(attr.startswith(val, autoescape=True))
                 elif seq == "in" and val:
                     conditions.append(attr.in_(val))
                 elif seq == "between" and isinstance(val, (list, tuple)) and len(val) == 2:
@@ -10,6 +10,8 @@ from sqlalchemy import ForeignKey, Integer, DateTime, Text
 from sqlalchemy.ext.asyncio import AsyncAttrs
 from sqlalchemy.orm import relationship, DeclarativeBase, Mapped, declared_attr, mapped_column
 
+from app.core.text_search import TextSearch
+
 
 class MappedBase(AsyncAttrs, DeclarativeBase):
     """
@@ -22,10 +24,17 @@ class MappedBase(AsyncAttrs, DeclarativeBase):
     `mapped_column() <https://docs.sqlalchemy.org/en/20/orm/mapping_api.html#sqlalchemy.orm.mapped_column>`__
 
     兼容 SQLite、MySQL 和 PostgreSQL
+
+    子类声明 __search_columns__ 后自动注册全文检索索引(见 TextSearch)
     """
 
     __abstract__ = True
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if getattr(cls, '__search_columns__', None) and '__table__' in cls.__dict__:
+            TextSearch.register(cls)
+
 
 class ModelMixin(MappedBase):
     """
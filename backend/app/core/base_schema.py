@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 
-from typing import List, Optional
+from typing import Any, List, Optional
 from pydantic import BaseModel, ConfigDict, Field
 
 from app.core.validator import DateTimeStr
@@ -53,3 +53,4 @@ class DownloadFileSchema(BaseModel):
     """下载文件模型"""
     file_path: str = Field(..., description='新文件映射路径')
     file_name: str = Field(..., description='新文件名称')
+    stat_result: Optional[Any] = Field(default=None, exclude=True, description='文件状态(os.stat_result)')
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import Select, event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.config.setting import settings
+
+
+class CountStrategy:
+    """
+    分页总数统计策略
+
+    - 无过滤条件且无数据权限限制：PostgreSQL/MySQL 读取统计信息(pg_class.reltuples / information_schema.TABLES.TABLE_ROWS)，
+      估算行数不小于 COUNT_EXACT_THRESHOLD 时直接返回估算值，否则精确统计
+    - 其余情况：精确 COUNT，结果按 (表名, 统计语句与参数摘要) 缓存 COUNT_CACHE_TTL 秒；
+      过滤条件与数据权限谓词都编译进统计语句，摘要即区分了不同筛选与不同数据范围
+
+    缓存按表维护版本号：本进程内经 ORM 对该表的增删改(flush 或 update/delete 语句)先记入会话，
+    事务提交后才递增版本号使其失效，回滚则丢弃；写入事务提交前本会话对该表的统计不读写缓存。
+    多进程部署时其他进程的写入最多延迟 COUNT_CACHE_TTL 秒可见。
+    """
+
+    # 会话 info 中记录本事务已写入表名的键
+    _DIRTY_KEY = 'count_dirty_tables'
+
+    # (表名, 摘要) -> (过期时间戳, 表版本, 总数)
+    _entries: "OrderedDict[Tuple[str, str], Tuple[float, int, int]]" = OrderedDict()
+    _versions: Dict[str, int] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def invalidate(cls, table_name: str) -> None:
+        """
+        使表的缓存总数失效
+
+        参数:
+        - table_name (str): 表名。
+        """
+        with cls._lock:
+            cls._versions[table_name] = cls._versions.get(table_name, 0) + 1
+
+    @classmethod
+    def clear(cls) -> None:
+        """清空缓存"""
+        with cls._lock:
+            cls._entries.clear()
+
+    @classmethod
+    def mark_dirty(cls, session: Session, table_name: str) -> None:
+        """
+        记录会话当前事务写入的表，提交后再使其缓存总数失效
+
+        参数:
+        - session (Session): 同步会话。
+        - table_name (str): 表名。
+        """
+        session.info.setdefault(cls._DIRTY_KEY, set()).add(table_name)
+
+    @classmethod
+    def _version(cls, table_name: str) -> int:
+        with cls._lock:
+            return cls._versions.get(table_name, 0)
+
+    @classmethod
+    def _get(cls, key: Tuple[str, str]) -> Optional[int]:
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is None:
+                return None
+            expire_at, version, total = entry
+            if expire_at <= time.monotonic() or version != cls._versions.get(key[0], 0):
+                del cls._entries[key]
+                return None
+            cls._entries.move_to_end(key)
+            return total
+
+    @classmethod
+    def _put(cls, key: Tuple[str, str], total: int, version: int) -> None:
+        if settings.COUNT_CACHE_TTL <= 0:
+            return
+        with cls._lock:
+            # 使用统计前读取的版本号：统计期间有写入提交时该条目随即失效
+            cls._entries[key] = (time.monotonic() + settings.COUNT_CACHE_TTL, version, total)
+            cls._entries.move_to_end(key)
+            while len(cls._entries) > settings.COUNT_CACHE_SIZE:
+                cls._entries.popitem(last=False)
+
+    @classmethod
+    async def estimate(cls, db: AsyncSession, table_name: str) -> Optional[int]:
+        """
+        从数据库统计信息读取表的估算行数
+
+        参数:
+        - db (AsyncSession): 数据库会话。
+        - table_name (str): 表名。
+
+        返回:
+        - Optional[int]: 估算行数，方言不支持或表尚未收集统计信息时返回 None。
+        """
+        dialect = db.get_bind().dialect.name
+        if dialect == 'postgresql':
+            sql = text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table_name)")
+        elif dialect == 'mysql':
+            sql = text("SELECT TABLE_ROWS FROM information_schema.TABLES WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table_name")
+        else:
+            return None
+        value = (await db.execute(sql, {'table_name': table_name})).scalar()
+        # PostgreSQL 未 ANALYZE 的表 reltuples 为 -1
+        return int(value) if value is not None and value >= 0 else None
+
+    @classmethod
+    async def count(cls, db: AsyncSession, table_name: str, count_sql: Select, filtered: bool) -> Tuple[int, bool]:
+        """
+        统计分页总数
+
+        参数:
+        - db (AsyncSession): 数据库会话。
+        - table_name (str): 主表名。
+        - count_sql (Select): 已包含过滤条件与数据权限的统计语句。
+        - filtered (bool): 是否带有过滤条件或数据权限限制。
+
+        返回:
+        - Tuple[int, bool]: (总数, 是否为估算值)。
+        """
+        if not filtered:
+            estimated = await cls.estimate(db, table_name)
+            if estimated is not None and estimated >= settings.COUNT_EXACT_THRESHOLD:
+                return estimated, True
+
+        compiled = count_sql.compile(dialect=db.get_bind().dialect)
+        digest = hashlib.sha1(
+            (str(compiled) + repr(sorted(compiled.params.items(), key=lambda item: item[0]))).encode()
+        ).hexdigest()
+        key = (table_name, digest)
+        if table_name in db.info.get(cls._DIRTY_KEY, ()):
+            # 本事务已写入该表且未提交，统计结果含未提交数据，不读写缓存
+            return (await db.execute(count_sql)).scalar() or 0, False
+        total = cls._get(key)
+        if total is None:
+            version = cls._version(table_name)
+            total = (await db.execute(count_sql)).scalar() or 0
+            cls._put(key, total, version)
+        return total, False
+
+
+@event.listens_for(Session, 'after_flush')
+def _mark_after_flush(session: Session, flush_context) -> None:
+    """工作单元写入后记录涉及的表"""
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        table = getattr(obj, '__table__', None)
+        if table is not None:
+            CountStrategy.mark_dirty(session, table.name)
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _mark_on_statement(orm_execute_state: ORMExecuteState) -> None:
+    """insert/update/delete 语句执行前记录目标表"""
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        table = getattr(orm_execute_state.statement, 'table', None)
+        if table is not None and getattr(table, 'name', None):
+            CountStrategy.mark_dirty(orm_execute_state.session, table.name)
+
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_after_commit(session: Session) -> None:
+    """事务提交后使本事务写入表的缓存总数失效"""
+    for table_name in session.info.pop(CountStrategy._DIRTY_KEY, ()):
+        CountStrategy.invalidate(table_name)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_after_rollback(session: Session) -> None:
+    """事务回滚后丢弃写入记录"""
+    session.info.pop(CountStrategy._DIRTY_KEY, None)
@@ -1,11 +1,18 @@
 # -*- coding: utf-8 -*-
 
+import itertools
+import threading
+import time
+from typing import Any, Dict, List, Optional
 from redis.asyncio import Redis
 from redis import exceptions
 from motor.motor_asyncio import AsyncIOMotorClient
 from fastapi import FastAPI
-from sqlalchemy import create_engine, Engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event, Engine, Select
+from sqlalchemy import exc as sa_exc
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.orm import ORMExecuteState, Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
     async_sessionmaker,
@@ -18,29 +25,234 @@ from app.config.setting import settings
 from app.core.exceptions import CustomException
 
 
-# 同步数据库引擎
-engine: Engine = create_engine(
-    url=settings.DB_URI,
-    echo=settings.DATABASE_ECHO,
-    pool_pre_ping=settings.POOL_PRE_PING,
-    pool_recycle=settings.POOL_RECYCLE,
-)
+class PoolStatsMixin:
+    """
+    连接池借出统计：记录自连接池创建(或重建)以来的借出次数、借出等待耗时与超时次数。
+
+    借出耗时包含池内无空闲连接时新建连接的时间，持续偏高说明连接池过小或连接泄漏。
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except sa_exc.TimeoutError:
+            with self._stats_lock:
+                self.timeouts += 1
+            raise
+        finally:
+            wait = time.perf_counter() - start
+            with self._stats_lock:
+                self.checkouts += 1
+                self.wait_total += wait
+                self.wait_max = max(self.wait_max, wait)
+
+
+class StatsQueuePool(PoolStatsMixin, QueuePool):
+    """带借出统计的同步连接池"""
+
+
+class StatsAsyncQueuePool(PoolStatsMixin, AsyncAdaptedQueuePool):
+    """带借出统计的异步连接池"""
+
+
+def _set_sqlite_pragma(dbapi_connection, connection_record) -> None:
+    """SQLite 每个新连接启用 WAL 与锁等待超时，读写可并发，写锁冲突时等待而非直接报错"""
+    cursor = dbapi_connection.cursor()
+    if settings.SQLITE_WAL:
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT)}")
+    cursor.close()
+
+
+def engine_options(sync: bool = False) -> Dict[str, Any]:
+    """
+    按数据库类型生成引擎参数。
+
+    同步引擎(定时任务存储与任务日志)从 POOL_SIZE 中划出 SYNC_POOL_SIZE 个连接且不溢出，
+    异步引擎使用其余连接，单进程连接数上限为 POOL_SIZE + MAX_OVERFLOW。
+    SQLite 写入串行，连接池同样限制并发连接数，并由 busy_timeout 排队等待写锁。
+
+    参数:
+    - sync (bool): 是否为同步引擎。
+
+    返回:
+    - Dict[str, Any]: create_engine/create_async_engine 参数。
+    """
+    sync_size = max(min(settings.SYNC_POOL_SIZE, settings.POOL_SIZE - 1), 1)
+    options: Dict[str, Any] = dict(
+        echo=settings.DATABASE_ECHO,
+        echo_pool=settings.ECHO_POOL,
+        pool_pre_ping=settings.POOL_PRE_PING,
+        pool_recycle=settings.POOL_RECYCLE,
+        pool_timeout=settings.POOL_TIMEOUT,
+        poolclass=StatsQueuePool if sync else StatsAsyncQueuePool,
+        pool_size=sync_size if sync else max(settings.POOL_SIZE - sync_size, 1),
+        max_overflow=0 if sync else settings.MAX_OVERFLOW,
+    )
+    if settings.DATABASE_TYPE == 'mysql':
+        # 服务端 wait_timeout 关闭的空闲连接由 pool_recycle/pool_pre_ping 处理，LIFO 让空闲连接自然回收
+        options['pool_use_lifo'] = True
+    return options
+
+
+def _create_engine(sync: bool = False) -> Engine:
+    """创建同步引擎，SQLite 注册连接参数设置"""
+    sync_engine = create_engine(url=settings.DB_URI, **engine_options(sync=sync))
+    if settings.DATABASE_TYPE == 'sqlite':
+        event.listen(sync_engine, 'connect', _set_sqlite_pragma)
+    return sync_engine
 
-# 同步数据库会话工厂
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 # 异步数据库引擎
-async_engine: AsyncEngine = create_async_engine(
-    url=settings.ASYNC_DB_URI,
-    echo=settings.DATABASE_ECHO,
-    echo_pool=settings.ECHO_POOL,
-    pool_pre_ping=settings.POOL_PRE_PING,
-    future=settings.FUTURE,
-    pool_recycle=settings.POOL_RECYCLE,
-    # pool_size=settings.POOL_SIZE,  # sqlite 不支持
-    # max_overflow=settings.MAX_OVERFLOW,  # sqlite 不支持
-    # pool_timeout=settings.POOL_TIMEOUT,  # sqlite 不支持
-)
+async_engine: AsyncEngine = create_async_engine(url=settings.ASYNC_DB_URI, future=settings.FUTURE, **engine_options())
+if settings.DATABASE_TYPE == 'sqlite':
+    event.listen(async_engine.sync_engine, 'connect', _set_sqlite_pragma)
+
+
+# 会话 info 键：只读标记 / 已发生写入 / 本会话使用的副本
+READ_ONLY = 'read_only'
+_WROTE = '_wrote'
+_REPLICA = '_replica'
+
+
+class ReplicaRouter:
+    """
+    只读副本选择：轮询可用副本，连接失败的副本在 REPLICA_RETRY_INTERVAL 秒内不再选择。
+    """
+
+    engines: List[AsyncEngine] = []
+    _down_until: Dict[Engine, float] = {}
+    _counter = itertools.count()
+
+    @classmethod
+    def register(cls, url: str) -> AsyncEngine:
+        """
+        创建并登记只读副本引擎(连接池参数与主库异步引擎一致)
+        
+        参数:
+        - url (str): 副本异步连接地址。
+        
+        返回:
+        - AsyncEngine: 副本异步引擎。
+        """
+        replica = create_async_engine(url=url, future=settings.FUTURE, **engine_options())
+        if replica.dialect.name == 'sqlite':
+            event.listen(replica.sync_engine, 'connect', _set_sqlite_pragma)
+        event.listen(replica.sync_engine, 'handle_error', cls._on_error)
+        cls.engines.append(replica)
+        return replica
+
+    @classmethod
+    def choose(cls) -> Optional[Engine]:
+        """
+        选择一个可用副本
+        
+        返回:
+        - Optional[Engine]: 副本同步引擎(会话路由使用)，均不可用时返回 None。
+        """
+        now = time.monotonic()
+        healthy = [item.sync_engine for item in cls.engines if cls._down_until.get(item.sync_engine, 0) <= now]
+        if not healthy:
+            return None
+        return healthy[next(cls._counter) % len(healthy)]
+
+    @classmethod
+    def mark_down(cls, engine: Engine, error: BaseException) -> None:
+        """
+        标记副本不可用
+        
+        参数:
+        - engine (Engine): 副本同步引擎。
+        - error (BaseException): 连接异常。
+        """
+        cls._down_until[engine] = time.monotonic() + settings.REPLICA_RETRY_INTERVAL
+        logger.warning(f"只读副本 {engine.url.render_as_string(hide_password=True)} 不可用，{settings.REPLICA_RETRY_INTERVAL} 秒内改走主库: {error}")
+
+    @classmethod
+    def is_replica(cls, engine: Any) -> bool:
+        """判断是否为副本引擎"""
+        return any(engine is item.sync_engine for item in cls.engines)
+
+    @staticmethod
+    def _on_error(context: ExceptionContext) -> None:
+        """副本连接断开时标记不可用，后续请求改走主库"""
+        if context.is_disconnect and context.engine is not None:
+            ReplicaRouter.mark_down(context.engine, context.original_exception)
+
+
+for _replica_url in settings.DATABASE_REPLICAS:
+    ReplicaRouter.register(_replica_url)
+
+
+class RoutingSession(Session):
+    """
+    读写分离会话
+
+    会话标记为只读(use_replica)后，查询语句路由到只读副本(同一会话固定同一副本)；
+    写语句、flush、加锁查询以及会话内发生过写入之后的查询均走主库，保证读到本会话的写入。
+    副本连接失败时自动改走主库。未配置 DATABASE_REPLICAS 时与普通会话一致。
+    """
+
+    def get_bind(self, mapper=None, *, clause=None, **kw):
+        if (
+            self.info.get(READ_ONLY)
+            and not self.info.get(_WROTE)
+            and not self._flushing
+            and isinstance(clause, Select)
+            and clause._for_update_arg is None
+        ):
+            replica = self.info.get(_REPLICA)
+            if replica is None:
+                replica = ReplicaRouter.choose()
+            if replica is not None:
+                self.info[_REPLICA] = replica
+                return replica
+        return super().get_bind(mapper, clause=clause, **kw)
+
+    def _connection_for_bind(self, engine, execution_options=None, **kw):
+        if self.bind is not None and engine is not self.bind and ReplicaRouter.is_replica(engine):
+            try:
+                return super()._connection_for_bind(engine, execution_options, **kw)
+            except (sa_exc.DBAPIError, OSError) as e:
+                ReplicaRouter.mark_down(engine, e)
+                self.info.pop(_REPLICA, None)
+                return super()._connection_for_bind(self.bind, execution_options, **kw)
+        return super()._connection_for_bind(engine, execution_options, **kw)
+
+
+@event.listens_for(RoutingSession, 'do_orm_execute')
+def _mark_write_statement(orm_execute_state: ORMExecuteState) -> None:
+    """非查询语句执行后本会话改走主库"""
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info[_WROTE] = True
+
+
+@event.listens_for(RoutingSession, 'after_flush')
+def _mark_flush(session: Session, flush_context) -> None:
+    """flush 后本会话改走主库"""
+    session.info[_WROTE] = True
+
+
+def use_replica(session: AsyncSession) -> None:
+    """
+    将会话标记为只读，其后的查询可路由到只读副本
+    
+    参数:
+    - session (AsyncSession): 异步数据库会话。
+    """
+    if ReplicaRouter.engines:
+        session.info[READ_ONLY] = True
+
 
 # 异步数据库会话工厂
 AsyncSessionLocal = async_sessionmaker(
@@ -48,9 +260,84 @@ AsyncSessionLocal = async_sessionmaker(
     autocommit=settings.AUTOCOMMIT,
     autoflush=settings.AUTOFETCH,
     expire_on_commit=settings.EXPIRE_ON_COMMIT,
-    class_=AsyncSession
+    class_=AsyncSession,
+    sync_session_class=RoutingSession
 )
 
+# 同步数据库引擎与会话工厂，首次使用时创建
+_engine: Optional[Engine] = None
+_engine_lock = threading.Lock()
+_SessionLocal = sessionmaker(autocommit=False, autoflush=False)
+
+
+def get_engine() -> Engine:
+    """
+    获取同步数据库引擎(首次调用时创建)，用于定时任务存储与任务日志等同步场景。
+    
+    返回:
+    - Engine: 同步数据库引擎。
+    """
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = _create_engine(sync=True)
+                _SessionLocal.configure(bind=_engine)
+    return _engine
+
+
+def sync_session_connect() -> Session:
+    """
+    获取同步数据库会话。
+    
+    返回:
+    - Session: 同步数据库会话。
+    """
+    get_engine()
+    return _SessionLocal()
+
+
+def pool_status() -> List[Dict[str, Any]]:
+    """
+    获取数据库连接池状态(当前进程)，同步引擎未创建时不包含。
+    
+    返回:
+    - List[Dict[str, Any]]: 各引擎的连接池大小、借出/空闲/溢出连接数与借出等待统计。
+    """
+    engines = [('async', async_engine.sync_engine)]
+    engines.extend((f'replica-{index}', item.sync_engine) for index, item in enumerate(ReplicaRouter.engines))
+    if _engine is not None:
+        engines.append(('sync', _engine))
+    result = []
+    for name, item in engines:
+        pool = item.pool
+        checkouts = getattr(pool, 'checkouts', 0)
+        result.append({
+            'name': name,
+            'dialect': item.dialect.name,
+            'pool_class': type(pool).__name__,
+            'size': pool.size() if isinstance(pool, QueuePool) else 0,
+            'max_overflow': getattr(pool, '_max_overflow', 0),
+            'checked_out': pool.checkedout() if isinstance(pool, QueuePool) else 0,
+            'checked_in': pool.checkedin() if isinstance(pool, QueuePool) else 0,
+            'overflow': max(pool.overflow(), 0) if isinstance(pool, QueuePool) else 0,
+            'checkouts': checkouts,
+            'timeouts': getattr(pool, 'timeouts', 0),
+            'wait_avg_ms': round(getattr(pool, 'wait_total', 0.0) * 1000 / checkouts, 3) if checkouts else 0.0,
+            'wait_max_ms': round(getattr(pool, 'wait_max', 0.0) * 1000, 3),
+        })
+    return result
+
+
+async def dispose_engines() -> None:
+    """关闭数据库连接池"""
+    await async_engine.dispose()
+    for replica in ReplicaRouter.engines:
+        await replica.dispose()
+    if _engine is not None:
+        _engine.dispose()
+    logger.info('✅️ 数据库连接池已关闭')
+
 def session_connect() -> AsyncSession:
     """
     获取异步数据库会话连接。
@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 
-import json
 from redis.asyncio.client import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -12,12 +11,11 @@ from fastapi import Depends
 from app.api.v1.module_system.user.schema import UserOutSchema
 from app.api.v1.module_system.user.model import UserModel
 from app.api.v1.module_system.role.model import RoleModel
-from app.common.enums import RedisInitKeyConfig
 from app.core.exceptions import CustomException
-from app.core.database import session_connect
-from app.core.security import OAuth2Schema, decode_access_token
+from app.core.database import session_connect, use_replica
+from app.core.security import OAuth2Schema, decode_session_token
 from app.core.logger import logger
-from app.core.redis_crud import RedisCURD
+from app.core.session_store import SessionStore
 from app.api.v1.module_system.user.crud import UserCRUD
 from app.api.v1.module_system.auth.schema import AuthSchema
 
@@ -32,6 +30,17 @@ async def db_getter() -> AsyncGenerator[AsyncSession, None]:
         async with session.begin():
             yield session
 
+async def read_only_db_getter() -> AsyncGenerator[AsyncSession, None]:
+    """获取只读数据库会话连接(查询优先走只读副本，本会话写入后改走主库)
+    
+    返回:
+    - AsyncSession: 数据库会话连接
+    """
+    async with session_connect() as session:
+        use_replica(session)
+        async with session.begin():
+            yield session
+
 async def redis_getter(request: Request) -> Redis:
     """获取Redis连接
     
@@ -78,21 +87,18 @@ async def get_current_user(
     if token.startswith('Bearer'):
         token = token.split(' ')[1]
 
-    payload = decode_access_token(token)
-    if not payload or not hasattr(payload, 'is_refresh') or payload.is_refresh:
+    # 验签结果按令牌摘要缓存，吊销由下方会话检查保证
+    payload, user_info = decode_session_token(token)
+    if payload.is_refresh:
         raise CustomException(msg="非法凭证", code=10401, status_code=401)
-        
-    online_user_info = payload.sub
-    # 从Redis中获取用户信息
-    user_info = json.loads(online_user_info)  # 确保是字典类型
-    
+
     session_id = user_info.get("session_id")
     if not session_id:
         raise CustomException(msg="认证已失效", code=10401, status_code=401)
 
-    # 检查用户是否在线
-    online_ok = await RedisCURD(redis).exists(key=f'{RedisInitKeyConfig.ACCESS_TOKEN.key}:{session_id}')
-    if not online_ok:
+    # 检查会话是否在线且访问令牌未被轮换
+    access_jti = await SessionStore.get_access_jti(redis=redis, session_id=session_id)
+    if not access_jti or access_jti != payload.jti:
         raise CustomException(msg="认证已失效", code=10401, status_code=401)
 
     # 关闭数据权限过滤，避免当前用户查询被拦截
@@ -132,16 +138,18 @@ async def get_current_user(
 class AuthPermission:
     """权限验证类"""
     
-    def __init__(self, permissions: Optional[list[str]] = None, check_data_scope: bool = True) -> None:
+    def __init__(self, permissions: Optional[list[str]] = None, check_data_scope: bool = True, read_only: bool = False) -> None:
         """
         初始化权限验证
         
         参数:
         - permissions (Optional[list[str]]): 权限标识列表。
         - check_data_scope (bool): 是否启用严格模式校验。
+        - read_only (bool): 是否为只读接口，是则查询优先走只读副本。
         """
         self.permissions = permissions or []
         self.check_data_scope = check_data_scope
+        self.read_only = read_only
 
     async def __call__(self, auth: AuthSchema = Depends(get_current_user)) -> AuthSchema:
         """
@@ -154,6 +162,8 @@ class AuthPermission:
         - AuthSchema: 认证信息对象。
         """
         auth.check_data_scope = self.check_data_scope
+        if self.read_only:
+            use_replica(auth.db)
 
         # 超级管理员直接通过
         if auth.user and auth.user.is_superuser:
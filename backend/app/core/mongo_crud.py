@@ -1,15 +1,20 @@
 # mongo_curd.py
+import re
+import time
+import asyncio
 import datetime
-import json
-from typing import Any, List, Optional, Dict, Union
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, List, Optional, Dict, Union
 from bson import ObjectId
 from bson.errors import InvalidId
-from bson.json_util import dumps
 from fastapi.encoders import jsonable_encoder
 from motor.motor_asyncio import AsyncIOMotorDatabase
-from pymongo.results import InsertOneResult, UpdateResult, DeleteResult
+from pymongo import DESCENDING
+from pymongo.errors import BulkWriteError
+from pymongo.results import InsertOneResult, InsertManyResult, UpdateResult, DeleteResult
 
 from app.core.exceptions import CustomException
+from app.core.logger import logger
 
 class MongoCURD:
     """
@@ -95,6 +100,32 @@ class MongoCURD:
         except Exception as e:
             raise CustomException(msg=f"创建数据失败: {str(e)}")
 
+    async def create_many(self, data: List[Dict], ordered: bool = False) -> int:
+        """
+        批量创建数据，单次往返写入。
+
+        参数:
+        - data (List[Dict]): 文档列表，需已包含时间戳等字段。
+        - ordered (bool): 是否按顺序写入，默认 False(单条失败不影响其余文档)。
+
+        返回:
+        - int: 成功写入的文档数。
+
+        异常:
+        - CustomException: 写入失败时抛出。
+        """
+        if not data:
+            return 0
+        try:
+            result: InsertManyResult = await self.collection.insert_many(data, ordered=ordered)
+            return len(result.inserted_ids)
+        except BulkWriteError as e:
+            # 无序写入时部分文档失败(如重复键)，其余文档已写入
+            logger.warning(f"批量写入部分失败: {e.details.get('writeErrors', [])[:1]}")
+            return e.details.get('nInserted', 0)
+        except Exception as e:
+            raise CustomException(msg=f"批量创建数据失败: {str(e)}")
+
     async def update(self, _id: str, data: Union[Dict, Any], upsert: bool = False) -> UpdateResult:
         """
         更新数据。
@@ -162,38 +193,56 @@ class MongoCURD:
             page_no: Optional[int] = 1,
             page_size: Optional[int] = 10,
             order_by: Optional[List[Dict]] = None,
+            projection: Optional[Dict[str, Any]] = None,
+            range_field: Optional[str] = None,
+            after: Any = None,
             **kwargs
     ) -> List[Dict]:
         """
         查询数据列表。
-        
+
+        驱动返回的文档已是 Python 字典，仅转换 _id，不再经过 JSON 往返；
+        传入 range_field 与 after 时按该字段做范围分页(取 after 之后的一页)，不使用 skip。
+
         参数:
-        - page_no (int | None): 页码，默认 1。
+        - page_no (int | None): 页码，默认 1，范围分页时忽略。
         - page_size (int | None): 每页数量，默认 10。
         - order_by (List[Dict] | None): 排序条件，形如 [{'field': '字段名', 'direction': 1}]。
+        - projection (Dict[str, Any] | None): 返回字段投影。
+        - range_field (str | None): 范围分页字段，需有索引且唯一，如 _id。
+        - after (Any): 上一页最后一条记录的 range_field 值。
         - kwargs (Dict[str, Any]): 查询条件键值对。
-        
+
         返回:
         - List[Dict]: 数据列表。
-        
+
         异常:
         - CustomException: 查询失败时抛出。
         """
         try:
             params = self.filter_condition(**kwargs)
-            cursor = self.collection.find(params)
+            sort_conditions = [(item['field'], item['direction']) for item in order_by] if order_by else []
 
-            # 排序处理
-            if order_by:
-                sort_conditions = [(item['field'], item['direction']) for item in order_by]
-                cursor.sort(sort_conditions)
+            if range_field and after is not None:
+                # 按范围字段排序方向取下一页，默认倒序
+                direction = next((d for f, d in sort_conditions if f == range_field), DESCENDING)
+                params[range_field] = {**params.get(range_field, {}), '$lt' if direction == DESCENDING else '$gt': after}
+                sort_conditions = [(range_field, direction)]
 
-            # 分页处理
-            if page_no and page_size:
-                cursor.skip((page_no - 1) * page_size).limit(page_size)
+            cursor = self.collection.find(params, projection)
+            if sort_conditions:
+                cursor.sort(sort_conditions)
+            if page_size:
+                if page_no and page_no > 1 and after is None:
+                    cursor.skip((page_no - 1) * page_size)
+                cursor.limit(page_size)
 
-            data_list = [json.loads(dumps(row)) async for row in cursor]
-            return [jsonable_encoder(self.schema(**data)) for data in data_list] if self.schema else data_list
+            data_list = []
+            async for row in cursor:
+                if '_id' in row:
+                    row['_id'] = str(row['_id'])
+                data_list.append(row)
+            return [self.schema.model_validate(data).model_dump() for data in data_list] if self.schema else data_list
         except Exception as e:
             raise CustomException(msg=f"查询列表失败: {str(e)}")
 
@@ -212,6 +261,9 @@ class MongoCURD:
         """
         try:
             params = self.filter_condition(**kwargs)
+            if not params:
+                # 无过滤条件时读取集合元数据，不扫描索引
+                return await self.collection.estimated_document_count()
             return await self.collection.count_documents(params)
         except Exception as e:
             raise CustomException(msg=f"统计数据失败: {str(e)}")
@@ -222,7 +274,7 @@ class MongoCURD:
         构建过滤条件。
         
         参数:
-        - kwargs (Dict[str, Any]): 查询参数，支持 ('like'|'between'|'ObjectId'|'in'|'gt'|'gte'|'lt'|'lte') 等操作。
+        - kwargs (Dict[str, Any]): 查询参数，支持 ('like'|'startswith'|'between'|'ObjectId'|'in'|'gt'|'gte'|'lt'|'lte') 等操作。
         
         返回:
         - Dict: 过滤条件字典。
@@ -238,11 +290,17 @@ class MongoCURD:
             if isinstance(v, tuple):
                 if v[0] == "like" and v[1]:
                     params[k] = {'$regex': v[1], '$options': 'i'}  # i表示不区分大小写
+                elif v[0] == "startswith" and v[1]:
+                    # 锚定前缀且区分大小写的正则可使用索引
+                    params[k] = {'$regex': f"^{re.escape(v[1])}"}
                 elif v[0] == "between" and len(v[1]) == 2:
-                    params[k] = {
-                        '$gte': f"{v[1][0]} 00:00:00",
-                        '$lt': f"{v[1][1]} 23:59:59"
-                    }
+                    if isinstance(v[1][0], datetime.datetime):
+                        params[k] = {'$gte': v[1][0], '$lte': v[1][1]}
+                    else:
+                        params[k] = {
+                            '$gte': f"{v[1][0]} 00:00:00",
+                            '$lt': f"{v[1][1]} 23:59:59"
+                        }
                 elif v[0] == "ObjectId" and v[1]:
                     try:
                         params[k] = ObjectId(v[1])
@@ -263,41 +321,148 @@ class MongoCURD:
                 
         return params
 
-# from app.api.v1.module_system.log.schema import OperationLogOutSchema
-
-# class OperationRecordDal(MongoCURD):
-#     """
-#     操作记录数据访问层
-#     """
-
-#     def __init__(self, db: AsyncIOMotorDatabase):
-#         """
-#         初始化操作记录数据访问层。
-
-#         :param db: 数据库连接
-#         """
-#         super().__init__(
-#             db=db,
-#             collection="system_operation_log",
-#             schema=OperationLogOutSchema,
-#         )
-
-# 创建日志到mongodb(已测试成功，可以成功创建):暂时注释，是因为该中间保存日志到mongodb(已调试成功)，而我现在实现的是记录到mysql的log表
-# if not settings.MONGO_DB_ENABLE:
-#     return response
-# document = OperationLogCreateSchema(
-#     request_ip = request.client.host,
-#     request_os = user_agent.os.family,
-#     request_browser = user_agent.browser.family,
-#     request_path = request.url.path,
-#     request_method = request.method,
-#     request_payload = oper_param,
-#     response_code = response.status_code,
-#     response_json = response_data.decode(),
-#     description = route.name,
-#     creator_id = creator_id
-# )
-# from app.core.mongo_curd import OperationRecordDal
-# from app.core.dependencies import mongo_getter
-# operation_record_dal = OperationRecordDal(db = await mongo_getter(request))
-# await operation_record_dal.create(data=document.model_dump())
\ No newline at end of file
+
+class MongoSink:
+    """
+    MongoDB 批量写入缓冲
+
+    put 仅将文档放入内存队列；后台任务在攒满 batch_size 条或距上次写入超过
+    flush_interval 秒时调用 writer 批量写入。写入失败的批次放回队首，按指数退避重试，
+    连续失败 max_retries 次后才丢弃。队列超过 max_buffer 时丢弃新文档，
+    避免数据库不可用时内存无限增长。
+    """
+
+    def __init__(
+            self,
+            name: str,
+            writer: Callable[[List[Dict]], Awaitable[int]],
+            batch_size: int = 500,
+            flush_interval: float = 1.0,
+            max_buffer: int = 10000,
+            max_retries: int = 3,
+            retry_backoff: float = 0.5
+    ) -> None:
+        """
+        初始化写入缓冲。
+
+        参数:
+        - name (str): 名称，用于日志输出。
+        - writer (Callable[[List[Dict]], Awaitable[int]]): 批量写入函数，返回写入条数。
+        - batch_size (int): 单批写入条数。
+        - flush_interval (float): 最长缓冲时间(秒)。
+        - max_buffer (int): 缓冲上限(含待重试的批次)。
+        - max_retries (int): 单批写入失败后的最多重试次数。
+        - retry_backoff (float): 首次重试等待时间(秒)，之后每次翻倍。
+
+        返回:
+        - None
+        """
+        self.name = name
+        self.writer = writer
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self._failures = 0
+        self._retry_at = 0.0
+        self._buffer: Deque[Dict] = deque()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+        self._dropped = 0
+
+    def put(self, document: Dict) -> bool:
+        """
+        放入待写入文档。
+
+        参数:
+        - document (Dict): 文档。
+
+        返回:
+        - bool: 缓冲已满被丢弃时返回 False。
+        """
+        if len(self._buffer) >= self.max_buffer:
+            self._dropped += 1
+            return False
+        self._buffer.append(document)
+        if len(self._buffer) >= self.batch_size:
+            self._wakeup.set()
+        return True
+
+    def _requeue(self, batch: List[Dict]) -> None:
+        """失败批次放回队首，超出缓冲上限的部分丢弃"""
+        room = max(self.max_buffer - len(self._buffer), 0)
+        if room < len(batch):
+            self._dropped += len(batch) - room
+            batch = batch[:room]
+        self._buffer.extendleft(reversed(batch))
+
+    async def flush(self, wait: bool = False) -> int:
+        """
+        写入缓冲区中的全部文档。
+
+        写入失败时批次放回队首并在退避时间后重试，连续失败超过 max_retries 次丢弃该批次；
+        处于退避期间时直接返回。
+
+        参数:
+        - wait (bool): 是否等待退避结束后继续重试(停止时使用)，此时丢弃一批后不再写入剩余文档。
+
+        返回:
+        - int: 写入条数。
+        """
+        written = 0
+        while self._buffer:
+            delay = self._retry_at - time.monotonic()
+            if delay > 0:
+                if not wait:
+                    break
+                await asyncio.sleep(delay)
+            batch = [self._buffer.popleft() for _ in range(min(self.batch_size, len(self._buffer)))]
+            try:
+                written += await self.writer(batch)
+                self._failures = 0
+                self._retry_at = 0.0
+            except Exception as e:
+                self._failures += 1
+                backoff = self.retry_backoff * 2 ** (self._failures - 1)
+                self._retry_at = time.monotonic() + backoff
+                if self._failures <= self.max_retries:
+                    logger.warning(f"{self.name} 批量写入失败，{backoff:.1f} 秒后第 {self._failures} 次重试: {str(e)}")
+                    self._requeue(batch)
+                    continue
+                self._failures = 0
+                if wait:
+                    logger.error(f"{self.name} 批量写入连续失败，丢弃 {len(batch) + len(self._buffer)} 条: {str(e)}")
+                    self._buffer.clear()
+                    break
+                logger.error(f"{self.name} 批量写入连续失败，丢弃 {len(batch)} 条: {str(e)}")
+        if self._dropped:
+            logger.warning(f"{self.name} 缓冲区已满，丢弃 {self._dropped} 条")
+            self._dropped = 0
+        return written
+
+    async def _flush_loop(self) -> None:
+        while not self._closing:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    def start(self) -> None:
+        """启动后台写入任务。"""
+        if self._task is None:
+            self._closing = False
+            self._task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        """停止后台写入任务，等待进行中的写入完成并写入剩余文档。"""
+        if self._task is None:
+            return
+        self._closing = True
+        self._wakeup.set()
+        await self._task
+        self._task = None
+        await self.flush(wait=True)
@@ -121,24 +121,29 @@ class OperationLogRoute(APIRoute):
                 # 如果请求来自api文档，则不记录日志
                 pass
             else:
-                async with session_connect() as session:
-                    async with session.begin():
-                        auth = AuthSchema(db=session)
-                        await OperationLogService.create_log_service(data=OperationLogCreateSchema(
-                            type = log_type,
-                            request_path = request.url.path,
-                            request_method = request.method,
-                            request_payload = payload,
-                            request_ip = request_ip,
-                            login_location=login_location,
-                            request_os = user_agent.os.family,
-                            request_browser = user_agent.browser.family,
-                            response_code = response.status_code,
-                            response_json = response_data.decode() if isinstance(response_data, (bytes, bytearray)) else str(response_data),
-                            process_time = process_time,
-                            description = route.summary,
-                            creator_id = current_user_id
-                        ), auth = auth) 
+                log_data = OperationLogCreateSchema(
+                    type = log_type,
+                    request_path = request.url.path,
+                    request_method = request.method,
+                    request_payload = payload,
+                    request_ip = request_ip,
+                    login_location=login_location,
+                    request_os = user_agent.os.family,
+                    request_browser = user_agent.browser.family,
+                    response_code = response.status_code,
+                    response_json = response_data.decode() if isinstance(response_data, (bytes, bytearray)) else str(response_data),
+                    process_time = process_time,
+                    description = route.summary,
+                    creator_id = current_user_id
+                )
+                if OperationLogService.use_mongo():
+                    # 放入写入缓冲后立即返回，由后台批量写入 MongoDB
+                    OperationLogService.buffer_log_service(data=log_data)
+                else:
+                    async with session_connect() as session:
+                        async with session.begin():
+                            auth = AuthSchema(db=session)
+                            await OperationLogService.create_log_service(data=log_data, auth=auth)
             
             return response
 
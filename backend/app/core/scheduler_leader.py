@@ -0,0 +1,468 @@
+# -*- coding: utf-8 -*-
+
+import json
+import time
+import uuid
+import asyncio
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple, Union
+
+from redis.asyncio.client import Redis
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.common.enums import RedisInitKeyConfig
+from app.config.setting import settings
+from app.core.ap_scheduler import SchedulerUtil, scheduler
+from app.core.logger import logger
+
+
+class LeaderBackend(ABC):
+    """
+    主节点选举后端接口
+
+    - acquire/renew/release: 基于带过期时间的租约实现选主与续约
+    - claim: 认领任务触发窗口(执行器提交任务前在事件循环中异步执行)
+    - publish/listen: 任务变更命令通道，非主节点发布，主节点订阅
+    - save_metrics/load_metrics: 主节点定期发布运行指标，任意进程读取
+    """
+
+    @abstractmethod
+    async def acquire(self, token: str, ttl: int) -> bool:
+        """获取租约，已被其他节点持有时返回 False。"""
+
+    @abstractmethod
+    async def renew(self, token: str, ttl: int) -> bool:
+        """续约，租约已不属于该令牌时返回 False。"""
+
+    @abstractmethod
+    async def release(self, token: str) -> None:
+        """释放仍属于该令牌的租约。"""
+
+    @abstractmethod
+    async def claim(self, key: str, ttl: int) -> bool:
+        """认领触发窗口，已被认领时返回 False。"""
+
+    @abstractmethod
+    async def publish(self, message: str) -> None:
+        """发布任务变更命令。"""
+
+    @abstractmethod
+    def listen(self, subscribed: Optional[asyncio.Event] = None) -> AsyncIterator[str]:
+        """订阅任务变更命令，订阅生效后设置 subscribed。"""
+
+    @abstractmethod
+    async def save_metrics(self, data: str, ttl: int) -> None:
+        """保存运行指标。"""
+
+    @abstractmethod
+    async def load_metrics(self) -> Optional[str]:
+        """读取未过期的运行指标。"""
+
+
+class RedisLeaderBackend(LeaderBackend):
+    """基于 Redis 的选主后端(SET NX PX 租约 + Lua 校验令牌续约/释放 + Pub/Sub 命令通道)"""
+
+    # 仅当租约仍属于当前令牌时续约/释放，避免误操作其他节点的租约
+    _RENEW_SCRIPT = "if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('pexpire', KEYS[1], ARGV[2]) else return 0 end"
+    _RELEASE_SCRIPT = "if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('del', KEYS[1]) else return 0 end"
+
+    def __init__(self, redis: Redis) -> None:
+        self.redis = redis
+        self.lease_key = RedisInitKeyConfig.SCHEDULER_LEADER.key
+        self.channel = RedisInitKeyConfig.SCHEDULER_COMMAND.key
+        self.metrics_key = RedisInitKeyConfig.SCHEDULER_METRICS.key
+
+    async def acquire(self, token: str, ttl: int) -> bool:
+        return bool(await self.redis.set(self.lease_key, token, nx=True, px=ttl * 1000))
+
+    async def renew(self, token: str, ttl: int) -> bool:
+        return bool(await self.redis.eval(self._RENEW_SCRIPT, 1, self.lease_key, token, ttl * 1000))
+
+    async def release(self, token: str) -> None:
+        await self.redis.eval(self._RELEASE_SCRIPT, 1, self.lease_key, token)
+
+    async def claim(self, key: str, ttl: int) -> bool:
+        return bool(await self.redis.set(key, 1, nx=True, ex=ttl))
+
+    async def publish(self, message: str) -> None:
+        await self.redis.publish(self.channel, message)
+
+    async def listen(self, subscribed: Optional[asyncio.Event] = None) -> AsyncIterator[str]:
+        pubsub = self.redis.pubsub()
+        await pubsub.subscribe(self.channel)
+        if subscribed is not None:
+            subscribed.set()
+        try:
+            while True:
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                if message and message.get('type') == 'message':
+                    yield message['data']
+        finally:
+            await pubsub.unsubscribe(self.channel)
+            await pubsub.aclose()
+
+    async def save_metrics(self, data: str, ttl: int) -> None:
+        await self.redis.set(self.metrics_key, data, ex=ttl)
+
+    async def load_metrics(self) -> Optional[str]:
+        return await self.redis.get(self.metrics_key)
+
+
+class LocalLeaderBackend(LeaderBackend):
+    """进程内选主后端(单进程部署或测试使用)，语义与 Redis 后端一致"""
+
+    _leases: Dict[str, Tuple[str, float]] = {}
+    _claims: Dict[str, float] = {}
+    _metrics: Optional[Tuple[str, float]] = None
+    _queues: List[asyncio.Queue] = []
+    _lock = threading.Lock()
+
+    def __init__(self) -> None:
+        self.lease_key = RedisInitKeyConfig.SCHEDULER_LEADER.key
+
+    async def acquire(self, token: str, ttl: int) -> bool:
+        with self._lock:
+            lease = self._leases.get(self.lease_key)
+            if lease and lease[1] > time.monotonic():
+                return False
+            self._leases[self.lease_key] = (token, time.monotonic() + ttl)
+            return True
+
+    async def renew(self, token: str, ttl: int) -> bool:
+        with self._lock:
+            lease = self._leases.get(self.lease_key)
+            if not lease or lease[0] != token or lease[1] <= time.monotonic():
+                return False
+            self._leases[self.lease_key] = (token, time.monotonic() + ttl)
+            return True
+
+    async def release(self, token: str) -> None:
+        with self._lock:
+            lease = self._leases.get(self.lease_key)
+            if lease and lease[0] == token:
+                self._leases.pop(self.lease_key, None)
+
+    async def claim(self, key: str, ttl: int) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            expires = self._claims.get(key)
+            if expires and expires > now:
+                return False
+            self._claims[key] = now + ttl
+            if len(self._claims) > 10000:
+                for expired in [k for k, v in self._claims.items() if v <= now]:
+                    self._claims.pop(expired, None)
+            return True
+
+    async def publish(self, message: str) -> None:
+        for queue in list(self._queues):
+            queue.put_nowait(message)
+
+    async def listen(self, subscribed: Optional[asyncio.Event] = None) -> AsyncIterator[str]:
+        queue: asyncio.Queue = asyncio.Queue()
+        self._queues.append(queue)
+        if subscribed is not None:
+            subscribed.set()
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self._queues.remove(queue)
+
+    async def save_metrics(self, data: str, ttl: int) -> None:
+        LocalLeaderBackend._metrics = (data, time.monotonic() + ttl)
+
+    async def load_metrics(self) -> Optional[str]:
+        metrics = LocalLeaderBackend._metrics
+        if metrics and metrics[1] > time.monotonic():
+            return metrics[0]
+        return None
+
+
+class SchedulerLeader:
+    """
+    定时任务调度协调器
+
+    每个进程都以暂停状态启动调度器，通过租约选出唯一的主节点加载任务并触发执行：
+    - 主节点每 TTL/3 续约一次，续约失败或超过本地租约期限立即暂停调度并清理内存任务
+    - 非主节点每 TTL/3 尝试获取租约，主节点宕机后最迟一个 TTL 内完成切换
+    - 任意进程上的任务增删改通过命令通道转发给主节点(事务提交后发布)
+    - 执行器提交任务前按 (任务ID, 计划执行时间) 认领触发窗口，切换期间同一窗口也不会重复执行
+    - 只有主节点执行任务，运行指标由主节点每 TTL/3 发布一次，任意进程均可读取
+    """
+
+    _backend: Optional[LeaderBackend] = None
+    _token: str = ''
+    _is_leader: bool = False
+    _lease_deadline: float = 0.0
+    _election_task: Optional[asyncio.Task] = None
+    _listen_task: Optional[asyncio.Task] = None
+    _pending: Set[asyncio.Task] = set()
+
+    @classmethod
+    async def start(cls, redis: Optional[Redis] = None) -> None:
+        """
+        启动调度器并参与主节点选举。
+
+        参数:
+        - redis (Optional[Redis]): Redis 连接，选举后端为 redis 时必填。
+
+        返回:
+        - None
+        """
+        if settings.SCHEDULER_LEADER_BACKEND == 'redis' and redis is not None:
+            cls._backend = RedisLeaderBackend(redis)
+        else:
+            cls._backend = LocalLeaderBackend()
+        cls._token = uuid.uuid4().hex
+        SchedulerUtil.fire_guard = cls._claim_fire
+        await SchedulerUtil.init_system_scheduler(paused=True)
+        await cls._elect()
+        cls._election_task = asyncio.create_task(cls._election_loop())
+
+    @classmethod
+    async def stop(cls) -> None:
+        """
+        停止选举并关闭调度器，主节点主动释放租约以便其他节点立即接管。
+
+        返回:
+        - None
+        """
+        for task in (cls._election_task, cls._listen_task):
+            if task:
+                task.cancel()
+        cls._election_task = cls._listen_task = None
+        was_leader = cls._is_leader
+        cls._is_leader = False
+        await SchedulerUtil.close_system_scheduler(remove_jobs=was_leader)
+        if was_leader and cls._backend:
+            try:
+                await cls._backend.release(cls._token)
+            except Exception as e:
+                logger.error(f'释放定时任务主节点租约失败: {str(e)}')
+
+    @classmethod
+    def is_leader(cls) -> bool:
+        """当前进程是否为调度主节点(且租约未过期)。"""
+        return cls._is_leader and time.monotonic() < cls._lease_deadline
+
+    @classmethod
+    def get_status(cls) -> Dict[str, Any]:
+        """
+        获取当前进程的调度协调状态。
+
+        返回:
+        - Dict[str, Any]: 是否主节点、节点令牌、选举后端。
+        """
+        return {
+            'is_leader': cls.is_leader(),
+            'node': cls._token,
+            'backend': settings.SCHEDULER_LEADER_BACKEND,
+        }
+
+    @classmethod
+    async def get_metrics(cls) -> Dict[str, Any]:
+        """
+        获取调度运行指标。主节点直接返回本进程指标，非主节点读取主节点最近一次发布的指标。
+
+        返回:
+        - Dict[str, Any]: leader(主节点令牌)、updated_at(采集时间)、executors 与 jobs 指标；暂无主节点时指标为空。
+        """
+        if cls.is_leader():
+            return cls._collect_metrics()
+        data = None
+        if cls._backend is not None:
+            try:
+                data = await cls._backend.load_metrics()
+            except Exception as e:
+                logger.error(f'读取定时任务运行指标失败: {str(e)}')
+        if not data:
+            return {'leader': None, 'updated_at': None, 'executors': {}, 'jobs': {}}
+        return json.loads(data)
+
+    @classmethod
+    def _collect_metrics(cls) -> Dict[str, Any]:
+        return {
+            'leader': cls._token,
+            'updated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            **SchedulerUtil.get_metrics(),
+        }
+
+    @classmethod
+    async def _publish_metrics(cls) -> None:
+        """主节点发布运行指标，过期时间为一个租约周期，主节点失效后指标随之过期。"""
+        try:
+            await cls._backend.save_metrics(json.dumps(cls._collect_metrics()), settings.SCHEDULER_LEADER_TTL)
+        except Exception as e:
+            logger.error(f'发布定时任务运行指标失败: {str(e)}')
+
+    @classmethod
+    async def dispatch(cls, action: str, job_id: Optional[Union[int, str]] = None, job_info: Any = None, db: Optional[AsyncSession] = None) -> None:
+        """
+        下发任务变更命令。主节点直接应用；非主节点先在本地校验任务配置，再在事务提交后通过命令通道转发给主节点。
+
+        参数:
+        - action (str): add/modify/remove/pause/resume/clear。
+        - job_id (Optional[Union[int, str]]): 任务ID。
+        - job_info (Any): 任务对象(add/modify 时用于主节点直接应用或非主节点校验)。
+        - db (Optional[AsyncSession]): 当前请求的数据库会话，提供时在提交后发布命令。
+
+        返回:
+        - None
+        """
+        if cls.is_leader():
+            await cls._apply(action, job_id, job_info)
+            return
+        if job_info is not None:
+            SchedulerUtil.build_job_kwargs(job_info)
+        message = json.dumps({'action': action, 'job_id': job_id, 'node': cls._token})
+        if db is None:
+            await cls._publish(message)
+            return
+        loop = asyncio.get_running_loop()
+
+        def _after_commit(session: Any) -> None:
+            task = loop.create_task(cls._publish(message))
+            cls._pending.add(task)
+            task.add_done_callback(cls._pending.discard)
+
+        event.listen(db.sync_session, 'after_commit', _after_commit, once=True)
+
+    @classmethod
+    async def _publish(cls, message: str) -> None:
+        try:
+            await cls._backend.publish(message)
+        except Exception as e:
+            logger.error(f'发布定时任务命令失败: {str(e)}')
+
+    @classmethod
+    async def _apply(cls, action: str, job_id: Optional[Union[int, str]] = None, job_info: Any = None) -> None:
+        """在主节点上应用任务变更命令。"""
+        if action in ('add', 'modify'):
+            if job_info is not None:
+                SchedulerUtil.add_job(job_info)
+                if not job_info.status:
+                    SchedulerUtil.pause_job(job_id=job_info.id)
+            else:
+                await SchedulerUtil.reload_job(job_id=job_id)
+        elif action == 'remove':
+            SchedulerUtil.remove_job(job_id=job_id)
+        elif action == 'pause':
+            SchedulerUtil.pause_job(job_id=job_id)
+        elif action == 'resume':
+            SchedulerUtil.resume_job(job_id=job_id)
+        elif action == 'clear':
+            SchedulerUtil.clear_jobs()
+        else:
+            logger.warning(f'未知的定时任务命令: {action}')
+
+    @classmethod
+    async def _claim_fire(cls, job_id: str, run_time: datetime) -> bool:
+        """认领任务触发窗口，只有持有有效租约的主节点才能认领。"""
+        if not cls.is_leader():
+            return False
+        key = f'{RedisInitKeyConfig.SCHEDULER_FIRE.key}:{job_id}:{int(run_time.timestamp())}'
+        try:
+            # 认领超时按失败处理，Redis 变慢时不让认领请求无限堆积
+            return await asyncio.wait_for(cls._backend.claim(key, settings.SCHEDULER_FIRE_GUARD_TTL), timeout=2)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # 无法确认认领结果时宁可跳过本次触发，避免重复执行
+            logger.error(f'认领定时任务触发窗口失败: {str(e)}')
+            return False
+
+    @classmethod
+    async def _elect(cls) -> None:
+        """执行一轮选举：主节点续约，非主节点尝试获取租约。"""
+        ttl = settings.SCHEDULER_LEADER_TTL
+        started = time.monotonic()
+        try:
+            if cls._is_leader:
+                ok = await asyncio.wait_for(cls._backend.renew(cls._token, ttl), timeout=ttl / 3)
+                if ok:
+                    cls._lease_deadline = started + ttl
+                else:
+                    await cls._demote('租约已失效')
+            else:
+                ok = await asyncio.wait_for(cls._backend.acquire(cls._token, ttl), timeout=ttl / 3)
+                if ok:
+                    cls._lease_deadline = started + ttl
+                    await cls._promote()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f'定时任务主节点选举失败: {str(e)}')
+            if cls._is_leader and time.monotonic() >= cls._lease_deadline:
+                await cls._demote('续约超时')
+
+    @classmethod
+    async def _election_loop(cls) -> None:
+        interval = settings.SCHEDULER_LEADER_TTL / 3
+        while True:
+            await asyncio.sleep(interval)
+            await cls._elect()
+            if cls.is_leader():
+                await cls._publish_metrics()
+
+    @classmethod
+    async def _promote(cls) -> None:
+        """
+        获取租约后接管调度：先订阅命令通道再从数据库加载任务，加载期间发布的命令在加载完成后应用，不会丢失。
+
+        加载失败时释放租约并恢复为非主节点，由其他节点(或下一轮选举)接管。
+        """
+        subscribed = asyncio.Event()
+        loaded = asyncio.Event()
+        cls._listen_task = asyncio.create_task(cls._listen_loop(subscribed, loaded))
+        try:
+            await asyncio.wait_for(subscribed.wait(), timeout=settings.SCHEDULER_LEADER_TTL / 3)
+            count = await SchedulerUtil.load_jobs()
+        except BaseException:
+            cls._listen_task.cancel()
+            cls._listen_task = None
+            SchedulerUtil.clear_local_jobs()
+            try:
+                await cls._backend.release(cls._token)
+            except Exception as e:
+                logger.error(f'释放定时任务主节点租约失败: {str(e)}')
+            raise
+        # 恢复调度与标记主节点之间没有 await，触发窗口认领不会落在两者之间
+        scheduler.resume()
+        cls._is_leader = True
+        loaded.set()
+        await cls._publish_metrics()
+        logger.info(f'✅️ 当前进程成为定时任务主节点({cls._token})，加载任务 {count} 个')
+
+    @classmethod
+    async def _demote(cls, reason: str) -> None:
+        cls._is_leader = False
+        scheduler.pause()
+        SchedulerUtil.clear_local_jobs()
+        if cls._listen_task:
+            cls._listen_task.cancel()
+            cls._listen_task = None
+        logger.warning(f'⚠️ 当前进程失去定时任务主节点身份: {reason}')
+
+    @classmethod
+    async def _listen_loop(cls, subscribed: asyncio.Event, loaded: asyncio.Event) -> None:
+        """主节点订阅命令通道并应用其他进程转发的任务变更，任务加载完成前收到的命令等待加载完成后应用。"""
+        while True:
+            try:
+                async for message in cls._backend.listen(subscribed):
+                    await loaded.wait()
+                    command = json.loads(message)
+                    if command.get('node') == cls._token:
+                        continue
+                    try:
+                        await cls._apply(command.get('action', ''), command.get('job_id'))
+                    except Exception as e:
+                        logger.error(f'应用定时任务命令失败 {command}: {str(e)}')
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f'定时任务命令通道异常: {str(e)}')
+                await asyncio.sleep(1)
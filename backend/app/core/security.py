@@ -1,7 +1,14 @@
 # -*- coding: utf-8 -*-
 
+import hashlib
+import json
+import threading
+import time
 import jwt
-from typing import Dict, Optional
+from collections import OrderedDict
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
 from fastapi import Form, Request
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from fastapi.security.utils import get_authorization_scheme_param
@@ -119,6 +126,102 @@ def create_access_token(payload: JWTPayloadSchema) -> str:
     )
 
 
+class TokenPayloadCache:
+    """
+    已验证令牌的本地缓存
+
+    以令牌摘要为键缓存解析后的载荷与会话信息，条目在令牌 exp 时失效，
+    超出容量时按最近最少使用淘汰。缓存只省去验签与解析，吊销仍由调用方的会话检查保证。
+    会话信息以只读映射保存，各请求共享同一对象，调用方无法修改缓存内容。
+    """
+
+    _entries: "OrderedDict[bytes, Tuple[float, JWTPayloadSchema, Mapping[str, Any]]]" = OrderedDict()
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls, digest: bytes) -> Optional[Tuple[JWTPayloadSchema, Mapping[str, Any]]]:
+        """
+        获取未过期的缓存条目
+
+        参数:
+        - digest (bytes): 令牌摘要。
+
+        返回:
+        - Optional[Tuple[JWTPayloadSchema, Mapping[str, Any]]]: 载荷与只读会话信息，不存在或已过期时返回 None。
+        """
+        with cls._lock:
+            entry = cls._entries.get(digest)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                del cls._entries[digest]
+                return None
+            cls._entries.move_to_end(digest)
+            return entry[1], entry[2]
+
+    @classmethod
+    def put(cls, digest: bytes, exp: float, payload: JWTPayloadSchema, session: Mapping[str, Any]) -> None:
+        """
+        写入缓存条目
+
+        参数:
+        - digest (bytes): 令牌摘要。
+        - exp (float): 令牌过期时间戳。
+        - payload (JWTPayloadSchema): 已验证的载荷。
+        - session (Mapping[str, Any]): 解析后的只读会话信息。
+        """
+        if settings.TOKEN_CACHE_SIZE <= 0:
+            return
+        with cls._lock:
+            cls._entries[digest] = (exp, payload, session)
+            cls._entries.move_to_end(digest)
+            while len(cls._entries) > settings.TOKEN_CACHE_SIZE:
+                cls._entries.popitem(last=False)
+
+    @classmethod
+    def clear(cls) -> None:
+        """清空缓存"""
+        with cls._lock:
+            cls._entries.clear()
+
+
+def decode_session_token(token: str) -> Tuple[JWTPayloadSchema, Mapping[str, Any]]:
+    """
+    解析JWT令牌并返回会话信息
+
+    同一令牌在过期前重复解析时直接命中本地缓存；会话信息为只读映射，命中缓存与否返回类型一致。
+
+    参数:
+    - token (str): JWT令牌字符串。
+
+    返回:
+    - Tuple[JWTPayloadSchema, Mapping[str, Any]]: 解析后的JWT有效载荷与 sub 中的只读会话信息。
+
+    异常:
+    - CustomException: 解析失败时抛出,状态码为401。
+    """
+    if not token:
+        raise CustomException(msg="认证不存在,请重新登录", code=10401, status_code=401)
+
+    digest = hashlib.sha256(token.encode()).digest()
+    cached = TokenPayloadCache.get(digest)
+    if cached is not None:
+        return cached
+
+    payload = decode_access_token(token)
+    try:
+        session = json.loads(payload.sub)
+    except ValueError:
+        raise CustomException(msg="无效认证,请重新登录", code=10401, status_code=401)
+    if not isinstance(session, dict):
+        raise CustomException(msg="无效认证,请重新登录", code=10401, status_code=401)
+
+    exp = payload.exp.timestamp() if isinstance(payload.exp, datetime) else float(payload.exp)
+    session = MappingProxyType(session)
+    TokenPayloadCache.put(digest, exp, payload, session)
+    return payload, session
+
+
 def decode_access_token(token: str) -> JWTPayloadSchema:
     """
     解析JWT访问令牌
@@ -1,9 +1,12 @@
 # -*- coding: utf-8 -*-
 
-from pydantic import BaseModel
-from typing import TypeVar, Dict, Any, Type, Generic
+from functools import lru_cache
+from pydantic import BaseModel, TypeAdapter
+from typing import TypeVar, Dict, Any, Type, Generic, List, Sequence
 from sqlalchemy.orm import DeclarativeBase
 
+from app.common.response import RawJSON
+
 ModelType = TypeVar("ModelType", bound=DeclarativeBase)
 SchemaType = TypeVar("SchemaType", bound=BaseModel)
 
@@ -53,3 +56,31 @@ class Serialize(Generic[ModelType, SchemaType]):
         except Exception as e:
             raise ValueError(f"反序列化失败: {str(e)}")
 
+    @classmethod
+    def models_to_json(cls, models: Sequence[Any], schema: Type[SchemaType]) -> RawJSON:
+        """
+        将 SQLAlchemy 模型列表按 Schema 校验并直接序列化为 JSON 数组
+
+        校验与序列化均在 pydantic-core 中一次完成，不生成中间字典，结果可直接作为响应数据。
+        
+        参数:
+        - models (Sequence[Any]): SQLAlchemy 模型实例列表。
+        - schema (Type[SchemaType]): Pydantic Schema 类(需开启 from_attributes)。
+            
+        返回:
+        - RawJSON: JSON 数组片段。
+            
+        异常:
+        - ValueError: 转换过程中可能抛出的异常。
+        """
+        adapter = _list_adapter(schema)
+        try:
+            return RawJSON(adapter.dump_json(adapter.validate_python(list(models), from_attributes=True)))
+        except Exception as e:
+            raise ValueError(f"序列化失败: {str(e)}")
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(schema: Type[BaseModel]) -> TypeAdapter:
+    """按 Schema 缓存列表类型适配器，避免重复构建校验器"""
+    return TypeAdapter(List[schema])
@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+
+import json
+import time
+from typing import Dict, List, Optional, Tuple
+from redis.asyncio.client import Redis
+
+from app.common.enums import RedisInitKeyConfig
+from app.core.redis_crud import RedisCURD
+
+
+class SessionStore:
+    """
+    登录会话存储
+
+    每个会话对应一个 Redis 哈希 session:{session_id}：
+    - access_jti: 当前有效访问令牌编号
+    - refresh_jti: 当前有效刷新令牌编号
+    - info: 会话元数据(OnlineOutSchema 的 JSON)
+
+    哈希过期时间与刷新令牌一致；访问令牌的有效期由 JWT 自身的 exp 约束，
+    服务端只需比对 jti 即可判定令牌是否已被轮换或吊销。
+
+    在线会话索引(online_index:*)与会话哈希在同一次往返内维护：
+    - login: 有序集合，成员为会话编号，分值为登录时间戳，用于倒序分页
+    - expire: 有序集合，分值为过期时间戳，用于清理已过期会话的索引
+    - meta: 哈希，会话编号 -> 会话元数据 JSON
+    - terms: 哈希，会话编号 -> 该会话写入 search 的成员(换行分隔)
+    - search: 字典序有序集合，成员为 "字段:小写值\\0会话编号"，用于前缀过滤
+    """
+
+    ACCESS_JTI = 'access_jti'
+    REFRESH_JTI = 'refresh_jti'
+    INFO = 'info'
+
+    # 支持前缀过滤的会话字段
+    SEARCH_FIELDS = ('name', 'ipaddr', 'login_location')
+    # 大于任何合法 UTF-8 字符，用作字典序区间上界
+    _LEX_MAX = chr(0x10FFFF)
+
+    # 刷新令牌轮换：仅当传入的刷新令牌仍为当前令牌时替换两个 jti 并续期，保证旧刷新令牌只能使用一次
+    _ROTATE_SCRIPT = """
+    if redis.call('hget', KEYS[1], 'refresh_jti') ~= ARGV[1] then
+        return 0
+    end
+    redis.call('hset', KEYS[1], 'access_jti', ARGV[2], 'refresh_jti', ARGV[3])
+    redis.call('expire', KEYS[1], ARGV[4])
+    redis.call('zadd', KEYS[2], 'XX', ARGV[5], ARGV[6])
+    return 1
+    """
+
+    # 删除会话及其索引；ARGV[2] 非空时额外清理过期时间早于该时间戳的会话
+    _REMOVE_SCRIPT = """
+    local sids = {}
+    for i = 3, #ARGV do
+        sids[#sids + 1] = ARGV[i]
+    end
+    if ARGV[2] ~= '' then
+        -- 单次最多清理 1000 个过期会话，避免长时间阻塞 Redis
+        local expired = redis.call('zrangebyscore', KEYS[2], '-inf', ARGV[2], 'LIMIT', 0, 1000)
+        for _, sid in ipairs(expired) do
+            sids[#sids + 1] = sid
+        end
+    end
+    local removed = 0
+    for _, sid in ipairs(sids) do
+        removed = removed + redis.call('del', ARGV[1] .. sid)
+        local terms = redis.call('hget', KEYS[4], sid)
+        if terms then
+            for term in string.gmatch(terms, '[^\\n]+') do
+                redis.call('zrem', KEYS[5], term)
+            end
+        end
+        redis.call('zrem', KEYS[1], sid)
+        redis.call('zrem', KEYS[2], sid)
+        redis.call('hdel', KEYS[3], sid)
+        redis.call('hdel', KEYS[4], sid)
+    end
+    return removed
+    """
+
+    @staticmethod
+    def key(session_id: str) -> str:
+        """
+        获取会话键名
+
+        参数:
+        - session_id (str): 会话编号。
+
+        返回:
+        - str: Redis 键名。
+        """
+        return f'{RedisInitKeyConfig.SESSION.key}:{session_id}'
+
+    @staticmethod
+    def index_key(name: str) -> str:
+        """
+        获取在线会话索引键名
+
+        参数:
+        - name (str): 索引名称(login/expire/meta/terms/search)。
+
+        返回:
+        - str: Redis 键名。
+        """
+        return f'{RedisInitKeyConfig.ONLINE_INDEX.key}:{name}'
+
+    @classmethod
+    def _index_keys(cls) -> List[str]:
+        """按 Lua 脚本约定的顺序返回索引键名"""
+        return [cls.index_key(name) for name in ('login', 'expire', 'meta', 'terms', 'search')]
+
+    @classmethod
+    def _search_term(cls, field: str, value: str, session_id: str = '') -> str:
+        """生成字典序索引成员，会话编号为空时即为前缀查询的下界"""
+        return f'{field}:{value.strip().lower()}' + (f'\0{session_id}' if session_id else '')
+
+    @classmethod
+    async def create(cls, redis: Redis, session_id: str, access_jti: str, refresh_jti: str, info: str, expire: int) -> None:
+        """
+        创建会话并写入在线索引（单次往返的事务管道写入）
+
+        参数:
+        - redis (Redis): Redis 客户端。
+        - session_id (str): 会话编号。
+        - access_jti (str): 访问令牌编号。
+        - refresh_jti (str): 刷新令牌编号。
+        - info (str): 会话元数据 JSON。
+        - expire (int): 过期时间(秒)，与刷新令牌一致。
+        """
+        key = cls.key(session_id)
+        login_key, expire_key, meta_key, terms_key, search_key = cls._index_keys()
+        meta = json.loads(info)
+        terms = [
+            cls._search_term(field, str(meta[field]).replace('\n', ' '), session_id)
+            for field in cls.SEARCH_FIELDS if meta.get(field)
+        ]
+        now = time.time()
+
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            pipe.hset(key, mapping={cls.ACCESS_JTI: access_jti, cls.REFRESH_JTI: refresh_jti, cls.INFO: info})
+            pipe.expire(key, expire)
+            pipe.zadd(login_key, {session_id: now})
+            pipe.zadd(expire_key, {session_id: now + expire})
+            pipe.hset(meta_key, session_id, info)
+            if terms:
+                pipe.hset(terms_key, session_id, '\n'.join(terms))
+                pipe.zadd(search_key, {term: 0 for term in terms})
+            await pipe.execute()
+
+    @classmethod
+    async def rotate(cls, redis: Redis, session_id: str, refresh_jti: str, new_access_jti: str, new_refresh_jti: str, expire: int) -> bool:
+        """
+        原子轮换会话令牌并续期在线索引
+
+        参数:
+        - redis (Redis): Redis 客户端。
+        - session_id (str): 会话编号。
+        - refresh_jti (str): 调用方持有的刷新令牌编号。
+        - new_access_jti (str): 新访问令牌编号。
+        - new_refresh_jti (str): 新刷新令牌编号。
+        - expire (int): 续期时间(秒)。
+
+        返回:
+        - bool: 会话存在且刷新令牌为当前令牌时返回 True。
+        """
+        result = await redis.eval(
+            cls._ROTATE_SCRIPT, 2, cls.key(session_id), cls.index_key('expire'),
+            refresh_jti, new_access_jti, new_refresh_jti, expire, time.time() + expire, session_id
+        )
+        return bool(result)
+
+    @classmethod
+    async def get_access_jti(cls, redis: Redis, session_id: str) -> Optional[str]:
+        """
+        获取会话当前访问令牌编号
+
+        参数:
+        - redis (Redis): Redis 客户端。
+        - session_id (str): 会话编号。
+
+        返回:
+        - Optional[str]: 会话不存在时返回 None。
+        """
+        return await redis.hget(cls.key(session_id), cls.ACCESS_JTI)
+
+    @classmethod
+    async def delete(cls, redis: Redis, session_id: str) -> bool:
+        """
+        删除会话及其在线索引（退出登录/强制下线）
+
+        参数:
+        - redis (Redis): Redis 客户端。
+        - session_id (str): 会话编号。
+
+        返回:
+        - bool: 会话存在并被删除时返回 True。
+        """
+        result = await redis.eval(cls._REMOVE_SCRIPT, 5, *cls._index_keys(), cls.key(''), '', session_id)
+        return bool(result)
+
+    @classmethod
+    async def cleanup(cls, redis: Redis) -> None:
+        """
+        清理已过期会话遗留在在线索引中的条目
+
+        会话哈希由 Redis TTL 自动删除，索引条目按 expire 有序集合的分值批量移除。
+
+        参数:
+        - redis (Redis): Redis 客户端。
+        """
+        await redis.eval(cls._REMOVE_SCRIPT, 5, *cls._index_keys(), cls.key(''), time.time())
+
+    @classmethod
+    async def clear(cls, redis: Redis) -> None:
+        """
+        删除全部会话及在线索引
+
+        参数:
+        - redis (Redis): Redis 客户端。
+        """
+        await RedisCURD(redis).clear(f'{RedisInitKeyConfig.SESSION.key}:*')
+        await redis.delete(*cls._index_keys())
+
+    @classmethod
+    async def page(cls, redis: Redis, offset: int = 0, limit: Optional[int] = None, prefixes: Optional[Dict[str, str]] = None) -> Tuple[int, List[Dict]]:
+        """
+        按登录时间倒序分页查询在线会话
+
+        参数:
+        - redis (Redis): Redis 客户端。
+        - offset (int): 起始偏移。
+        - limit (Optional[int]): 返回条数，为空返回全部。
+        - prefixes (Optional[Dict[str, str]]): 字段前缀过滤，键为 SEARCH_FIELDS 之一，大小写不敏感。
+
+        返回:
+        - Tuple[int, List[Dict]]: 匹配总数与当前页会话元数据列表。
+        """
+        login_key = cls.index_key('login')
+        prefixes = {field: value for field, value in (prefixes or {}).items() if value and value.strip()}
+        await cls.cleanup(redis)
+
+        if not prefixes:
+            stop = -1 if limit is None else offset + limit - 1
+            async with redis.pipeline(transaction=False) as pipe:
+                pipe.zcard(login_key)
+                pipe.zrevrange(login_key, offset, stop)
+                total, session_ids = await pipe.execute()
+        else:
+            search_key = cls.index_key('search')
+            async with redis.pipeline(transaction=False) as pipe:
+                for field, value in prefixes.items():
+                    lower = cls._search_term(field, value)
+                    pipe.zrangebylex(search_key, f'[{lower}', f'[{lower}{cls._LEX_MAX}')
+                results = await pipe.execute()
+
+            # 多个过滤条件取交集
+            matched = None
+            for terms in results:
+                ids = {term.rsplit('\0', 1)[-1] for term in terms}
+                matched = ids if matched is None else matched & ids
+            candidates = list(matched or ())
+            if not candidates:
+                return 0, []
+
+            # 逐个 ZSCORE 而非 ZMSCORE，兼容 Redis 6.2 以下版本
+            async with redis.pipeline(transaction=False) as pipe:
+                for sid in candidates:
+                    pipe.zscore(login_key, sid)
+                scores = await pipe.execute()
+            ranked = sorted(
+                ((sid, score) for sid, score in zip(candidates, scores) if score is not None),
+                key=lambda item: item[1],
+                reverse=True
+            )
+            total = len(ranked)
+            end = None if limit is None else offset + limit
+            session_ids = [sid for sid, _ in ranked[offset:end]]
+
+        if not session_ids:
+            return total, []
+        infos = await redis.hmget(cls.index_key('meta'), session_ids)
+        return total, [json.loads(info) for info in infos if info]
@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+
+import sqlite3
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from sqlalchemy import DDL, Connection, Table, bindparam, column, event, inspect, text
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.sql.elements import ColumnElement
+
+
+class TextSearch:
+    """
+    全文检索索引
+
+    模型通过 __search_columns__ 声明可检索字段后，CRUDBase 的 ("search", 文本) 条件
+    按数据库方言编译为可走索引的查询：
+    - sqlite: FTS5 trigram 外部内容虚拟表 {表名}_ts，由触发器与主表同步
+    - postgresql: pg_trgm GIN 索引 ts_{表名}_{字段}，查询为 ILIKE '%文本%'
+    - mysql: ngram 解析器的 FULLTEXT 索引 ts_{表名}_{字段}，查询为 MATCH ... AGAINST
+
+    检索文本短于索引最小分词长度、字段未声明或方言不支持时回退为 LIKE '%文本%'。
+
+    建表(create_all)时自动创建索引，已有表在启动时由 ensure 补建。
+    项目不附带 Alembic 迁移历史(迁移由各部署通过 main.py revision 自动生成，且生成时忽略检索索引)，
+    因此已有数据库升级的受支持方式是启动时的 ensure(InitializeData 在 create_all 之后调用)，无需额外迁移；
+    自行维护迁移脚本时可在迁移中调用 TextSearch.upgrade(op) / TextSearch.downgrade(op)。
+    """
+
+    PREFIX = 'ts_'
+    SUFFIX = '_ts'
+    # 各方言可走索引的最小检索长度(sqlite trigram 为 3，mysql ngram_token_size 默认 2)
+    MIN_LENGTH = {'sqlite': 3, 'mysql': 2, 'postgresql': 1}
+    # FTS5 trigram 分词器需要 SQLite 3.34+
+    SQLITE_TRIGRAM = sqlite3.sqlite_version_info >= (3, 34, 0)
+
+    # 表名 -> 可检索字段
+    _registry: Dict[str, Tuple[str, ...]] = {}
+
+    @classmethod
+    def register(cls, model: Type[Any]) -> None:
+        """
+        注册模型的可检索字段，并在建表/删表时维护对应方言的索引
+
+        参数:
+        - model (Type[Any]): 声明了 __search_columns__ 的模型类。
+        """
+        table: Table = model.__table__
+        columns = tuple(model.__search_columns__)
+        cls._registry[table.name] = columns
+
+        for dialect in ('sqlite', 'postgresql', 'mysql'):
+            for statement in cls.create_statements(table.name, columns, dialect):
+                event.listen(table, 'after_create', DDL(statement).execute_if(dialect=dialect))
+        for statement in cls.drop_statements(table.name, columns, 'sqlite'):
+            event.listen(table, 'before_drop', DDL(statement).execute_if(dialect='sqlite'))
+
+    @classmethod
+    def fts_table(cls, table_name: str) -> str:
+        """获取 SQLite FTS5 虚拟表名"""
+        return f'{table_name}{cls.SUFFIX}'
+
+    @classmethod
+    def index_name(cls, table_name: str, column: str) -> str:
+        """获取 PostgreSQL/MySQL 检索索引名"""
+        return f'{cls.PREFIX}{table_name}_{column}'
+
+    @classmethod
+    def is_search_object(cls, name: Optional[str], type_: str) -> bool:
+        """
+        判断数据库对象是否为检索索引(供 Alembic autogenerate 忽略)
+
+        参数:
+        - name (Optional[str]): 对象名称。
+        - type_ (str): 对象类型(table/index 等)。
+
+        返回:
+        - bool: 是检索索引或 FTS5 虚拟表/影子表时返回 True。
+        """
+        if not name:
+            return False
+        if type_ == 'index':
+            return name.startswith(cls.PREFIX)
+        if type_ == 'table':
+            # FTS5 影子表: {表名}_ts_data/_idx/_docsize/_config/_content
+            return any(name == cls.fts_table(t) or name.startswith(f'{cls.fts_table(t)}_') for t in cls._registry)
+        return False
+
+    @classmethod
+    def create_statements(cls, table_name: str, columns: Tuple[str, ...], dialect: str) -> List[str]:
+        """
+        生成创建检索索引的 DDL
+
+        参数:
+        - table_name (str): 表名。
+        - columns (Tuple[str, ...]): 可检索字段。
+        - dialect (str): 数据库方言名称。
+
+        返回:
+        - List[str]: DDL 语句列表(逐条执行)。
+        """
+        if dialect == 'sqlite':
+            if not cls.SQLITE_TRIGRAM:
+                return []
+            fts = cls.fts_table(table_name)
+            cols = ', '.join(columns)
+            new_values = ', '.join(f'new.{c}' for c in columns)
+            old_values = ', '.join(f'old.{c}' for c in columns)
+            return [
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({cols}, content='{table_name}', content_rowid='id', tokenize='trigram')",
+                f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table_name} BEGIN "
+                f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_values}); END",
+                f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table_name} BEGIN "
+                f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old_values}); END",
+                f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {cols} ON {table_name} BEGIN "
+                f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old_values}); "
+                f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_values}); END",
+                # 为已有数据建立索引
+                f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+            ]
+        if dialect == 'postgresql':
+            return ["CREATE EXTENSION IF NOT EXISTS pg_trgm"] + [
+                f"CREATE INDEX IF NOT EXISTS {cls.index_name(table_name, c)} ON {table_name} USING gin ({c} gin_trgm_ops)"
+                for c in columns
+            ]
+        if dialect == 'mysql':
+            return [
+                f"CREATE FULLTEXT INDEX {cls.index_name(table_name, c)} ON {table_name} ({c}) WITH PARSER ngram"
+                for c in columns
+            ]
+        return []
+
+    @classmethod
+    def drop_statements(cls, table_name: str, columns: Tuple[str, ...], dialect: str) -> List[str]:
+        """
+        生成删除检索索引的 DDL
+
+        参数:
+        - table_name (str): 表名。
+        - columns (Tuple[str, ...]): 可检索字段。
+        - dialect (str): 数据库方言名称。
+
+        返回:
+        - List[str]: DDL 语句列表(逐条执行)。
+        """
+        if dialect == 'sqlite':
+            fts = cls.fts_table(table_name)
+            return [f"DROP TRIGGER IF EXISTS {fts}_{suffix}" for suffix in ('ai', 'ad', 'au')] + [f"DROP TABLE IF EXISTS {fts}"]
+        if dialect == 'postgresql':
+            return [f"DROP INDEX IF EXISTS {cls.index_name(table_name, c)}" for c in columns]
+        if dialect == 'mysql':
+            return [f"DROP INDEX {cls.index_name(table_name, c)} ON {table_name}" for c in columns]
+        return []
+
+    @classmethod
+    def ensure(cls, connection: Connection) -> None:
+        """
+        为已存在但缺少检索索引的表补建索引
+
+        参数:
+        - connection (Connection): 同步数据库连接。
+        """
+        dialect = connection.dialect.name
+        inspector = inspect(connection)
+        tables = set(inspector.get_table_names())
+        for table_name, columns in cls._registry.items():
+            if table_name not in tables:
+                continue
+            if dialect == 'sqlite':
+                missing = cls.fts_table(table_name) not in tables
+            else:
+                indexes = {index['name'] for index in inspector.get_indexes(table_name)}
+                missing = any(cls.index_name(table_name, c) not in indexes for c in columns)
+            if not missing:
+                continue
+            if dialect == 'mysql':
+                # MySQL 不支持 CREATE INDEX IF NOT EXISTS，仅创建缺失的索引
+                statements = [
+                    statement for c, statement in zip(columns, cls.create_statements(table_name, columns, dialect))
+                    if cls.index_name(table_name, c) not in indexes
+                ]
+            else:
+                statements = cls.create_statements(table_name, columns, dialect)
+            for statement in statements:
+                connection.execute(text(statement))
+
+    @classmethod
+    def upgrade(cls, op: Any) -> None:
+        """
+        在 Alembic 迁移中为已注册模型创建检索索引
+
+        参数:
+        - op (Any): alembic.op。
+        """
+        dialect = op.get_bind().dialect.name
+        for table_name, columns in cls._registry.items():
+            for statement in cls.create_statements(table_name, columns, dialect):
+                op.execute(statement)
+
+    @classmethod
+    def downgrade(cls, op: Any) -> None:
+        """
+        在 Alembic 迁移中删除检索索引
+
+        参数:
+        - op (Any): alembic.op。
+        """
+        dialect = op.get_bind().dialect.name
+        for table_name, columns in cls._registry.items():
+            for statement in cls.drop_statements(table_name, columns, dialect):
+                op.execute(statement)
+
+    @classmethod
+    def condition(cls, model: Type[Any], key: str, value: str, dialect: str) -> ColumnElement:
+        """
+        构建检索条件
+
+        参数:
+        - model (Type[Any]): 模型类。
+        - key (str): 字段名。
+        - value (str): 检索文本。
+        - dialect (str): 当前会话的数据库方言名称。
+
+        返回:
+        - ColumnElement: SQL 条件表达式。
+        """
+        attr = getattr(model, key)
+        value = value.strip()
+        columns = cls._registry.get(model.__tablename__, ())
+        searchable = key in columns and len(value) >= cls.MIN_LENGTH.get(dialect, 0)
+
+        if searchable and dialect == 'sqlite' and cls.SQLITE_TRIGRAM:
+            fts = cls.fts_table(model.__tablename__)
+            # FTS5 列过滤 + 短语查询，双引号按 FTS5 语法转义
+            phrase = value.replace('"', '""')
+            rowids = text(f"SELECT rowid FROM {fts} WHERE {fts} MATCH :{fts}_{key}").bindparams(
+                bindparam(f'{fts}_{key}', f'{key} : "{phrase}"')
+            ).columns(column('rowid'))
+            return model.id.in_(rowids)
+        if searchable and dialect == 'postgresql':
+            return attr.icontains(value, autoescape=True)
+        if searchable and dialect == 'mysql':
+            # 布尔模式短语查询，ngram 分词下等价于子串匹配
+            return match(attr, against=f'"{value.replace(chr(34), " ")}"').in_boolean_mode()
+        return attr.like(f"%{value}%")
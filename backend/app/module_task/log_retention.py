@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+import gzip
+import json
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import delete, select
+
+from app.config.setting import settings
+from app.core.database import sync_session_connect
+from app.core.logger import logger
+from app.api.v1.module_system.log.model import OperationLogModel, OperationLogBodyModel
+
+
+def _month_start(value: datetime) -> datetime:
+    """返回所在月份第一天零点"""
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _next_month(value: datetime) -> datetime:
+    """返回下个月第一天零点"""
+    return _month_start(value.replace(day=28) + timedelta(days=4))
+
+
+def archive_operation_logs(retention_days: Optional[int] = None, archive: Optional[bool] = None, batch_size: int = 1000) -> int:
+    """
+    按月归档并清理超过保留期的操作日志
+
+    以整月为单位处理早于保留期所在月份的数据：按主键分批读取，写入
+    OPERATION_LOG_ARCHIVE_DIR/system_log_{YYYYMM}.jsonl.gz 后按主键删除，
+    每批单独提交，查询与删除均走 created_at/主键索引，不会长时间锁表。
+
+    参数:
+    - retention_days (Optional[int]): 保留天数，默认 OPERATION_LOG_RETENTION_DAYS。
+    - archive (Optional[bool]): 删除前是否归档，默认 OPERATION_LOG_ARCHIVE。
+    - batch_size (int): 每批处理条数。
+
+    返回:
+    - int: 清理的日志条数。
+    """
+    retention_days = settings.OPERATION_LOG_RETENTION_DAYS if retention_days is None else int(retention_days)
+    archive = settings.OPERATION_LOG_ARCHIVE if archive is None else archive
+    if retention_days <= 0:
+        logger.info("操作日志保留天数不大于0，跳过清理")
+        return 0
+
+    cutoff = _month_start(datetime.now() - timedelta(days=retention_days))
+    if archive:
+        settings.OPERATION_LOG_ARCHIVE_DIR.mkdir(parents=True, exist_ok=True)
+
+    total = 0
+    with sync_session_connect() as db:
+        oldest = db.execute(
+            select(OperationLogModel.created_at).order_by(OperationLogModel.created_at).limit(1)
+        ).scalar()
+        if oldest is None or oldest >= cutoff:
+            logger.info(f"无早于 {cutoff:%Y-%m-%d} 的操作日志需要清理")
+            return 0
+
+        month = _month_start(oldest)
+        while month < cutoff:
+            month_end = _next_month(month)
+            archive_file = settings.OPERATION_LOG_ARCHIVE_DIR.joinpath(f"system_log_{month:%Y%m}.jsonl.gz")
+            count = 0
+            last_id = 0
+            while True:
+                rows = db.execute(
+                    select(OperationLogModel.__table__, OperationLogBodyModel.request_payload.label('body_request_payload'),
+                           OperationLogBodyModel.response_json.label('body_response_json'))
+                    .outerjoin(OperationLogBodyModel, OperationLogBodyModel.log_id == OperationLogModel.id)
+                    .where(OperationLogModel.created_at >= month, OperationLogModel.created_at < month_end)
+                    .where(OperationLogModel.id > last_id)
+                    .order_by(OperationLogModel.id)
+                    .limit(batch_size)
+                ).mappings().all()
+                if not rows:
+                    break
+
+                ids = [row['id'] for row in rows]
+                if archive:
+                    with gzip.open(archive_file, 'at', encoding='utf-8') as f:
+                        for row in rows:
+                            record = {key: value for key, value in row.items() if not key.startswith('body_')}
+                            # 新数据的请求体/响应体在 system_log_body，历史数据仍在主表
+                            record['request_payload'] = row['body_request_payload'] or row['request_payload']
+                            record['response_json'] = row['body_response_json'] or row['response_json']
+                            f.write(json.dumps(record, ensure_ascii=False, default=str) + '\n')
+
+                db.execute(delete(OperationLogBodyModel).where(OperationLogBodyModel.log_id.in_(ids)))
+                db.execute(delete(OperationLogModel).where(OperationLogModel.id.in_(ids)))
+                db.commit()
+                count += len(ids)
+                last_id = ids[-1]
+
+            if count:
+                logger.info(f"操作日志 {month:%Y-%m} 清理 {count} 条" + (f"，已归档至 {archive_file}" if archive else ""))
+            total += count
+            month = month_end
+
+    logger.info(f"操作日志清理完成，共 {total} 条，保留 {cutoff:%Y-%m-%d} 之后的数据")
+    return total
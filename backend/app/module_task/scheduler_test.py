@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 import time
+import asyncio
 from datetime import datetime
 
 from app.core.logger import logger
@@ -31,7 +32,7 @@ async def async_job(*args, **kwargs) -> None:
     """
     try:
         print(f"开始执行任务: {args}-{kwargs}")
-        time.sleep(3)
+        await asyncio.sleep(3)
         print(f'{datetime.now()}异步函数执行完成')
     except Exception as e:
         logger.error(f"异步任务执行失败: {e}")
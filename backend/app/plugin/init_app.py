@@ -13,14 +13,21 @@ from fastapi.openapi.docs import (
 
 from app.config.setting import settings
 from app.core.ap_scheduler import SchedulerUtil
+from app.core.database import dispose_engines
+from app.core.scheduler_leader import SchedulerLeader
 from app.core.logger import logger
 from app.utils.common_util import import_module, import_modules_async, worship
 from app.utils.console import run as console_run
+from app.utils.fs_util import FsUtil, FsTaskManager
+from app.utils.file_index_util import FileIndexUtil
+from app.utils.captcha_util import CaptchaPool
+from app.utils.ai_util import AIClient
 from app.core.exceptions import handle_exception
 from app.core.discover import router
 from app.scripts.initialize import InitializeData
 from app.api.v1.module_system.params.service import ParamsService
 from app.api.v1.module_system.dict.service import DictDataService
+from app.api.v1.module_system.log.service import OperationLogService
 
 
 @asynccontextmanager
@@ -44,8 +51,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[Any, Any]:
     logger.info("✅️ 初始化Redis系统配置完成...")
     await DictDataService().init_dict_service(redis=app.state.redis)
     logger.info('✅️ 初始化Redis数据字典完成...')
-    await SchedulerUtil.init_system_scheduler()
+    await SchedulerLeader.start(redis=app.state.redis)
     logger.info('✅️ 初始化定时任务完成...')
+    FsTaskManager.start(redis=app.state.redis)
+    FileIndexUtil.start()
+    CaptchaPool.start()
+    AIClient.start()
+    await OperationLogService.start_sink_service(mongo=getattr(app.state, 'mongo', None))
     scheduler_status = SchedulerUtil.get_job_status()
     scheduler_jobs = len(SchedulerUtil.get_all_jobs())
 
@@ -64,7 +76,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[Any, Any]:
     yield
 
     await import_modules_async(modules=settings.EVENT_LIST, desc="全局事件", app=app, status=False)
-    await SchedulerUtil.close_system_scheduler()
+    await SchedulerLeader.stop()
+    await FileIndexUtil.stop()
+    CaptchaPool.stop()
+    await AIClient.stop()
+    await OperationLogService.stop_sink_service()
+    FsUtil.shutdown()
+    await dispose_engines()
     logger.info(f'⚠️  {settings.TITLE} 服务关闭...')
 
 def register_middlewares(app: FastAPI) -> None:
@@ -10,6 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.logger import logger
 from app.core.database import AsyncSessionLocal, async_engine
 from app.core.base_model import MappedBase
+from app.core.text_search import TextSearch
 from app.config.setting import settings
 from app.api.v1.module_system.user.model import UserModel, UserRolesModel
 from app.api.v1.module_system.role.model import RoleModel
@@ -17,6 +18,7 @@ from app.api.v1.module_system.dept.model import DeptModel
 from app.api.v1.module_system.menu.model import MenuModel
 from app.api.v1.module_system.params.model import ParamsModel
 from app.api.v1.module_system.dict.model import DictTypeModel, DictDataModel
+from app.api.v1.module_application.job.model import JobModel
 
 
 class InitializeData:
@@ -38,8 +40,13 @@ class InitializeData:
             UserRolesModel,
             ParamsModel,
             DictTypeModel,
-            DictDataModel
+            DictDataModel,
+            JobModel
         ]
+        # 按业务键补充缺失数据的表：已有数据的库升级后也会写入新增的内置数据(不覆盖已有记录)
+        self.seed_keys = {
+            JobModel: 'func',
+        }
     
     async def __init_create_table(self) -> None:
         """
@@ -49,6 +56,7 @@ class InitializeData:
             # 使用引擎创建所有表
             async with async_engine.begin() as conn:
                 await conn.run_sync(MappedBase.metadata.create_all)
+                await conn.run_sync(TextSearch.ensure)
             logger.info("✅️ 数据库表结构初始化完成")
         except asyncio.exceptions.TimeoutError:
             logger.error("❌️ 数据库表结构初始化超时")
@@ -66,6 +74,10 @@ class InitializeData:
         """
         for model in self.prepare_init_models:
             table_name = model.__tablename__
+
+            if model in self.seed_keys:
+                await self.__init_missing_data(db, model, self.seed_keys[model])
+                continue
             
             # 检查表中是否已经有数据
             count_result = await db.execute(select(func.count()).select_from(model))
@@ -96,6 +108,35 @@ class InitializeData:
                 logger.error(f"❌️ 初始化 {table_name} 表数据失败: {str(e)}")
                 raise
 
+    async def __init_missing_data(self, db: AsyncSession, model, key: str) -> None:
+        """
+        按业务键写入表中尚不存在的初始化数据(幂等)
+
+        参数:
+        - db (AsyncSession): 异步数据库会话。
+        - model: 对应的 SQLAlchemy 模型类。
+        - key (str): 业务键字段名。
+        """
+        table_name = model.__tablename__
+        data = await self.__get_data(table_name)
+        if not data:
+            logger.warning(f"⚠️  跳过 {table_name} 表，无初始化数据")
+            return
+
+        column = getattr(model, key)
+        result = await db.execute(select(column).where(column.in_([item[key] for item in data])))
+        existing = set(result.scalars().all())
+        missing = [item for item in data if item[key] not in existing]
+        if not missing:
+            return
+        try:
+            db.add_all([model(**item) for item in missing])
+            await db.flush()
+            logger.info(f"✅️ 已向 {table_name} 表补充初始化数据: {', '.join(str(item[key]) for item in missing)}")
+        except Exception as e:
+            logger.error(f"❌️ 初始化 {table_name} 表数据失败: {str(e)}")
+            raise
+
     def __create_objects_with_children(self, data: List[Dict], model_class) -> List:
         """
         通用递归创建对象函数，处理嵌套的 children 数据
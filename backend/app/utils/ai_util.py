@@ -1,35 +1,101 @@
 # -*- coding: utf-8 -*- 
 
-from typing import Any, AsyncGenerator
-from openai import AsyncOpenAI, OpenAI
-from openai.types.chat.chat_completion import ChatCompletion
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, AsyncIterator, Dict, Optional
+from openai import AsyncOpenAI
 import httpx
 
 from app.config.setting import settings
+from app.core.exceptions import CustomException
 from app.core.logger import logger
 
 
 class AIClient:
     """
     AI客户端类，用于与OpenAI API交互。
+
+    应用级共享一个带连接池的 httpx 客户端与 AsyncOpenAI 实例(在 lifespan 中创建与关闭)，
+    请求间复用 TLS 连接；按用户限制同时进行的对话数，并将逐 token 的流式输出合并为较大的帧。
     """
 
-    def __init__(self):
-        self.model = settings.OPENAI_MODEL
-        # 创建一个不带冲突参数的httpx客户端
-        self.http_client = httpx.AsyncClient(
-            timeout=30.0,
-            follow_redirects=True
+    _http_client: Optional[httpx.AsyncClient] = None
+    _client: Optional[AsyncOpenAI] = None
+    _inflight: Dict[str, int] = {}
+
+    @classmethod
+    def start(cls) -> None:
+        """
+        创建共享客户端
+        """
+        if cls._client is not None:
+            return
+        cls._http_client = httpx.AsyncClient(
+            timeout=settings.OPENAI_TIMEOUT,
+            follow_redirects=True,
+            http2=settings.OPENAI_HTTP2,
+            limits=httpx.Limits(
+                max_connections=settings.OPENAI_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.OPENAI_MAX_KEEPALIVE,
+                keepalive_expiry=settings.OPENAI_KEEPALIVE_EXPIRY
+            )
         )
-        
-        # 使用自定义的http客户端
-        self.client = AsyncOpenAI(
+        cls._client = AsyncOpenAI(
             api_key=settings.OPENAI_API_KEY,
             base_url=settings.OPENAI_BASE_URL,
-            http_client=self.http_client
+            http_client=cls._http_client
         )
 
-    def _friendly_error_message(self, e: Exception) -> str:
+    @classmethod
+    async def stop(cls) -> None:
+        """
+        关闭共享客户端连接
+        """
+        if cls._client is not None:
+            await cls._client.close()
+        if cls._http_client is not None:
+            await cls._http_client.aclose()
+        cls._client = None
+        cls._http_client = None
+
+    @classmethod
+    def get_client(cls) -> AsyncOpenAI:
+        """
+        获取共享 AsyncOpenAI 实例，未在 lifespan 中创建时按需创建
+
+        返回:
+        - AsyncOpenAI: 共享客户端。
+        """
+        if cls._client is None:
+            cls.start()
+        return cls._client
+
+    @classmethod
+    @asynccontextmanager
+    async def acquire(cls, user_key: str) -> AsyncIterator[None]:
+        """
+        占用用户对话并发名额，超过上限时直接拒绝
+
+        参数:
+        - user_key (str): 用户标识(用户ID或客户端地址)。
+
+        异常:
+        - CustomException: 用户同时进行的对话数超过 OPENAI_USER_CONCURRENCY 时抛出。
+        """
+        if cls._inflight.get(user_key, 0) >= settings.OPENAI_USER_CONCURRENCY:
+            raise CustomException(msg="当前对话请求过多，请等待上一条回复完成后再试")
+        cls._inflight[user_key] = cls._inflight.get(user_key, 0) + 1
+        try:
+            yield
+        finally:
+            remaining = cls._inflight.get(user_key, 1) - 1
+            if remaining > 0:
+                cls._inflight[user_key] = remaining
+            else:
+                cls._inflight.pop(user_key, None)
+
+    @staticmethod
+    def _friendly_error_message(e: Exception) -> str:
         """将 OpenAI 或网络异常转换为友好的中文提示。"""
         # 尝试获取状态码与错误体
         status_code = getattr(e, "status_code", None)
@@ -73,9 +139,13 @@ class AIClient:
         # 默认兜底
         return f"处理您的请求时出现错误：{msg}"
 
-    async def process(self, query: str)  -> AsyncGenerator[str, None]:
+    @classmethod
+    async def process(cls, query: str) -> AsyncGenerator[str, None]:
         """
-        处理查询并返回流式响应
+        处理查询并返回流式响应，相邻 token 合并输出
+
+        满足 AI_STREAM_FLUSH_CHARS 字符或距上次输出超过 AI_STREAM_FLUSH_INTERVAL 秒时输出一帧，
+        减少 HTTP 分块与 WebSocket 帧数量。
 
         参数:
         - query (str): 用户查询。
@@ -85,10 +155,12 @@ class AIClient:
         """
         system_prompt = """你是一个有用的AI助手，可以帮助用户回答问题和提供帮助。请用中文回答用户的问题。"""
 
+        buffer = []
+        buffered = 0
+        last_flush = time.monotonic()
         try:
-            # 使用 await 调用异步客户端
-            response = await self.client.chat.completions.create(
-                model=self.model,
+            response = await cls.get_client().chat.completions.create(
+                model=settings.OPENAI_MODEL,
                 messages=[
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": query}
@@ -96,21 +168,27 @@ class AIClient:
                 stream=True
             )
             
-            # 流式返回响应
-            async for chunk in response:
-                if chunk.choices and chunk.choices[0].delta.content:
-                    yield chunk.choices[0].delta.content
+            # 客户端断开时生成器以 GeneratorExit 结束，需显式关闭上游流以归还连接池中的连接
+            async with response:
+                async for chunk in response:
+                    if not (chunk.choices and chunk.choices[0].delta.content):
+                        continue
+                    content = chunk.choices[0].delta.content
+                    buffer.append(content)
+                    buffered += len(content)
+                    now = time.monotonic()
+                    if buffered >= settings.AI_STREAM_FLUSH_CHARS or now - last_flush >= settings.AI_STREAM_FLUSH_INTERVAL:
+                        yield ''.join(buffer)
+                        buffer.clear()
+                        buffered = 0
+                        last_flush = now
+
+            if buffer:
+                yield ''.join(buffer)
                     
         except Exception as e:
-            # 记录详细错误，返回友好提示
+            # 记录详细错误，先输出已生成的内容，再返回友好提示
             logger.error(f"AI处理查询失败: {str(e)}")
-            yield self._friendly_error_message(e)
-
-    async def close(self) -> None:
-        """
-        关闭客户端连接
-        """
-        if hasattr(self, 'client'):
-            await self.client.close()
-        if hasattr(self, 'http_client'):
-            await self.http_client.aclose()
\ No newline at end of file
+            if buffer:
+                yield ''.join(buffer)
+            yield cls._friendly_error_message(e)
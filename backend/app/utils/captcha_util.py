@@ -3,17 +3,52 @@
 import base64
 import random
 import string
+import threading
+from collections import deque
 from io import BytesIO
-from typing import Tuple
+from typing import Any, Deque, Dict, Optional, Tuple
 from PIL import Image, ImageDraw, ImageFont
 
 from app.config.setting import settings
+from app.core.logger import logger
 
 
 class CaptchaUtil:
     """
     验证码工具类
     """
+    # 字体对象按线程缓存(FreeType 字体对象不保证跨线程并发安全)
+    _local = threading.local()
+
+    @classmethod
+    def _get_font(cls) -> ImageFont.FreeTypeFont:
+        """
+        获取缓存的验证码字体。
+        
+        返回:
+        - ImageFont.FreeTypeFont: 字体对象。
+        """
+        key = (settings.CAPTCHA_FONT_PATH, settings.CAPTCHA_FONT_SIZE)
+        font = getattr(cls._local, 'font', None)
+        if font is None or getattr(cls._local, 'font_key', None) != key:
+            font = ImageFont.truetype(font=settings.CAPTCHA_FONT_PATH, size=settings.CAPTCHA_FONT_SIZE)
+            cls._local.font, cls._local.font_key = font, key
+        return font
+
+    @staticmethod
+    def _to_base64(image: Image.Image) -> str:
+        """
+        将图片编码为 PNG 并转换为 base64(不做 optimize，体积差异很小但编码快得多)。
+        
+        参数:
+        - image (Image.Image): 图片对象。
+        
+        返回:
+        - str: base64字符串。
+        """
+        buffer = BytesIO()
+        image.save(buffer, format='PNG')
+        return base64.b64encode(buffer.getvalue()).decode()
     @classmethod 
     def generate_captcha(cls) -> Tuple[str, str]:
         """
@@ -33,7 +68,7 @@ class CaptchaUtil:
         draw = ImageDraw.Draw(image)
 
         # 使用指定字体
-        font = ImageFont.truetype(font=settings.CAPTCHA_FONT_PATH, size=settings.CAPTCHA_FONT_SIZE)
+        font = cls._get_font()
 
         # 计算文本总宽度和高度
         total_width = sum(draw.textbbox((0, 0), char, font=font)[2] for char in captcha_value)
@@ -74,9 +109,7 @@ class CaptchaUtil:
             )
 
         # 将图像数据保存到内存中并转换为base64
-        buffer = BytesIO()
-        image.save(buffer, format='PNG', optimize=True)
-        base64_string = base64.b64encode(buffer.getvalue()).decode()
+        base64_string = cls._to_base64(image)
         
         return base64_string, captcha_value
     
@@ -94,7 +127,7 @@ class CaptchaUtil:
         draw = ImageDraw.Draw(image)
 
         # 设置字体
-        font = ImageFont.truetype(font=settings.CAPTCHA_FONT_PATH, size=settings.CAPTCHA_FONT_SIZE)
+        font = cls._get_font()
 
         # 生成运算数字和运算符
         operators = ['+', '-', '*']
@@ -132,8 +165,92 @@ class CaptchaUtil:
             ], fill=line_color, width=1)
 
         # 将图像数据保存到内存中并转换为base64
-        buffer = BytesIO()
-        image.save(buffer, format='PNG', optimize=True)
-        base64_string = base64.b64encode(buffer.getvalue()).decode()
+        base64_string = cls._to_base64(image)
+
+        return base64_string, captcha_value
+
+
+class CaptchaPool:
+    """
+    验证码预生成池
+
+    后台线程预先渲染算术验证码放入有界队列，接口直接取用；队列为空时回退为同步渲染。
+    取用后低于半满即唤醒后台线程补充，统计命中率用于评估池容量。
+    """
+
+    _buffer: Deque[Tuple[str, int]] = deque(maxlen=1)
+    _thread: Optional[threading.Thread] = None
+    _wakeup = threading.Event()
+    _stopped = threading.Event()
+    _hits = 0
+    _misses = 0
+
+    @classmethod
+    def start(cls) -> None:
+        """启动后台预生成线程。"""
+        if not settings.CAPTCHA_ENABLE or not settings.CAPTCHA_POOL_SIZE or cls._thread is not None:
+            return
+        cls._buffer = deque(maxlen=settings.CAPTCHA_POOL_SIZE)
+        cls._stopped.clear()
+        cls._wakeup.set()
+        cls._thread = threading.Thread(target=cls._fill_loop, name="captcha-pool", daemon=True)
+        cls._thread.start()
+
+    @classmethod
+    def stop(cls) -> None:
+        """停止后台预生成线程并清空队列。"""
+        if cls._thread is None:
+            return
+        cls._stopped.set()
+        cls._wakeup.set()
+        cls._thread.join(timeout=5)
+        cls._thread = None
+        cls._buffer.clear()
 
-        return base64_string, captcha_value
\ No newline at end of file
+    @classmethod
+    def _fill_loop(cls) -> None:
+        while not cls._stopped.is_set():
+            cls._wakeup.wait(timeout=5)
+            cls._wakeup.clear()
+            while not cls._stopped.is_set() and len(cls._buffer) < cls._buffer.maxlen:
+                try:
+                    cls._buffer.append(CaptchaUtil.captcha_arithmetic())
+                except Exception as e:
+                    logger.error(f"预生成验证码失败: {str(e)}")
+                    break
+
+    @classmethod
+    def get(cls) -> Tuple[str, int]:
+        """
+        取出一个验证码，池为空时同步渲染。
+        
+        返回:
+        - Tuple[str, int]: [base64图片字符串, 计算结果]。
+        """
+        try:
+            captcha = cls._buffer.popleft()
+            cls._hits += 1
+        except IndexError:
+            cls._misses += 1
+            captcha = CaptchaUtil.captcha_arithmetic()
+        if cls._thread is not None and len(cls._buffer) * 2 < cls._buffer.maxlen:
+            cls._wakeup.set()
+        return captcha
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        """
+        获取验证码池统计。
+        
+        返回:
+        - Dict[str, Any]: 容量、当前数量、命中/未命中次数与命中率(%)。
+        """
+        total = cls._hits + cls._misses
+        return {
+            'enabled': cls._thread is not None,
+            'capacity': cls._buffer.maxlen if cls._thread is not None else 0,
+            'size': len(cls._buffer),
+            'hits': cls._hits,
+            'misses': cls._misses,
+            'hit_rate': round(cls._hits * 100 / total, 2) if total else 0.0,
+        }
@@ -102,7 +102,7 @@ def get_parent_id_map(model_list: Sequence[DeclarativeBase]) -> Dict[int, int]:
 
 def get_parent_recursion(id: int, id_map: Dict[int, int], ids: Optional[List[int]] = None) -> List[int]:
     """
-    递归获取所有父级 ID
+    获取所有父级 ID（迭代实现，包含自身）
 
     参数:
     - id (int): 当前 ID。
@@ -112,13 +112,15 @@ def get_parent_recursion(id: int, id_map: Dict[int, int], ids: Optional[List[int
     返回:
     - List[int]: 所有父级 ID 列表。
     """
-    ids = ids or []
-    if id in ids:
-        raise CustomException(msg="递归获取父级ID失败,不可以自引用")
-    ids.append(id)
-    parent_id = id_map.get(id)
-    if parent_id:
-        get_parent_recursion(parent_id, id_map, ids)
+    ids = ids if ids is not None else []
+    visited = set(ids)
+    current: Optional[int] = id
+    while current:
+        if current in visited:
+            raise CustomException(msg="递归获取父级ID失败,不可以自引用")
+        visited.add(current)
+        ids.append(current)
+        current = id_map.get(current)
     return ids
 
 
@@ -127,7 +129,7 @@ def get_child_id_map(model_list: Sequence[DeclarativeBase]) -> Dict[int, List[in
     获取子级 ID 映射字典
 
     参数:
-    - model_list (Sequence[DeclarativeBase]): 模型列表。
+    - model_list (Sequence[DeclarativeBase]): 模型列表，也可以是包含 id、parent_id 属性的行对象。
 
     返回:
     - Dict[int, List[int]]: {id: [child_ids]} 映射字典。
@@ -142,7 +144,7 @@ def get_child_id_map(model_list: Sequence[DeclarativeBase]) -> Dict[int, List[in
 
 def get_child_recursion(id: int, id_map: Dict[int, List[int]], ids: Optional[List[int]] = None) -> List[int]:
     """
-    递归获取所有子级 ID
+    获取所有子级 ID（迭代先序遍历，包含自身）
 
     参数:
     - id (int): 当前 ID。
@@ -152,56 +154,63 @@ def get_child_recursion(id: int, id_map: Dict[int, List[int]], ids: Optional[Lis
     返回:
     - List[int]: 所有子级 ID 列表。
     """
-    ids = ids or []
-    ids.append(id)
-    for child in id_map.get(id, []):
-        get_child_recursion(child, id_map, ids)
+    ids = ids if ids is not None else []
+    visited = set(ids)
+    stack = [id]
+    while stack:
+        current = stack.pop()
+        if current in visited:
+            continue
+        visited.add(current)
+        ids.append(current)
+        # 逆序入栈以保持与递归实现一致的先序顺序
+        stack.extend(reversed(id_map.get(current, [])))
     return ids
 
 
-def traversal_to_tree(nodes: list[dict[str, Any]]) -> list[dict[str, Any]]:
+def traversal_to_tree(nodes: list[dict[str, Any]], root_id: Optional[int] = None) -> list[dict[str, Any]]:
     """
-    通过遍历算法构造树形结构
+    通过 id 索引一次遍历构造树形结构，时间复杂度 O(n)
+
+    父节点不在 nodes 中的节点会被视为根节点（便于按条件过滤后的结果成树）。
 
     参数:
     - nodes (list[dict[str, Any]]): 树节点列表。
+    - root_id (int | None): 子树根节点 ID，指定时仅返回以该节点为根的子树。
 
     返回:
     - list[dict[str, Any]]: 构造后的树形结构列表。
     """
-    tree: list[dict[str, Any]] = []
-    node_dict = {node['id']: node for node in nodes}
-
+    node_dict: dict[Any, dict[str, Any]] = {}
+    ordered: list[dict[str, Any]] = []
     for node in nodes:
+        # 重复 ID 只保留第一次出现的节点
+        if node['id'] in node_dict:
+            continue
+        node_dict[node['id']] = node
+        ordered.append(node)
         # 确保每个节点都有children字段，即使没有子节点也设置为null
-        if 'children' not in node:
-            node['children'] = None
-            
-        parent_id = node['parent_id']
-        if parent_id is None:
+        node.setdefault('children', None)
+
+    tree: list[dict[str, Any]] = []
+    for node in ordered:
+        parent_node = node_dict.get(node['parent_id']) if node['parent_id'] is not None else None
+        if parent_node is None or parent_node is node:
             tree.append(node)
-        else:
-            parent_node = node_dict.get(parent_id)
-            if parent_node is not None:
-                if 'children' not in parent_node or parent_node['children'] is None:
-                    parent_node['children'] = []
-                if node not in parent_node['children']:
-                    parent_node['children'].append(node)
-            else:
-                if node not in tree:
-                    tree.append(node)
-    
-    # 确保所有节点都有children字段
-    for node in tree:
-        if 'children' not in node:
-            node['children'] = None
+            continue
+        if parent_node['children'] is None:
+            parent_node['children'] = []
+        parent_node['children'].append(node)
 
+    if root_id is not None:
+        root = node_dict.get(root_id)
+        return [root] if root is not None else []
     return tree
 
 
 def recursive_to_tree(nodes: list[dict[str, Any]], *, parent_id: int | None = None) -> list[dict[str, Any]]:
     """
-    通过递归算法构造树形结构（性能影响较大）
+    按父级分组后递归构造树形结构，时间复杂度 O(n)
 
     参数:
     - nodes (list[dict[str, Any]]): 树节点列表。
@@ -210,14 +219,21 @@ def recursive_to_tree(nodes: list[dict[str, Any]], *, parent_id: int | None = No
     返回:
     - list[dict[str, Any]]: 构造后的树形结构列表。
     """
-    tree: list[dict[str, Any]] = []
+    group: dict[Any, list[dict[str, Any]]] = {}
     for node in nodes:
-        if node['parent_id'] == parent_id:
-            child_nodes = recursive_to_tree(nodes, parent_id=node['id'])
+        group.setdefault(node['parent_id'], []).append(node)
+
+    def _build(pid: Any, path: set) -> list[dict[str, Any]]:
+        tree = group.get(pid, [])
+        for node in tree:
+            if node['id'] in path:
+                raise CustomException(msg="构造树形结构失败,不可以自引用")
+            child_nodes = _build(node['id'], path | {node['id']})
             if child_nodes:
                 node['children'] = child_nodes
-            tree.append(node)
-    return tree
+        return tree
+
+    return _build(parent_id, set())
 
 
 def bytes2human(n: int, format_str: str = '%(value).1f%(symbol)s') -> str:
@@ -1,218 +1,437 @@
 # -*- coding: utf-8 -*-
 
-import re
-from datetime import datetime
+import calendar
+from datetime import datetime, timedelta, timezone, tzinfo
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
+from zoneinfo import ZoneInfo
 
+from apscheduler.triggers.base import BaseTrigger
+from apscheduler.util import convert_to_datetime
 
-class CronUtil:
+
+# 字段定义：(名称, 最小值, 最大值)
+CRON_FIELDS: List[Tuple[str, int, int]] = [
+    ('秒', 0, 59),
+    ('分', 0, 59),
+    ('时', 0, 23),
+    ('日', 1, 31),
+    ('月', 1, 12),
+    ('星期', 1, 7),
+    ('年', 1970, 2099),
+]
+MONTH_NAMES = {name: index for index, name in enumerate(
+    ['JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC'], start=1)}
+# Quartz 星期：1=周日 ... 7=周六
+WEEK_NAMES = {name: index for index, name in enumerate(['SUN', 'MON', 'TUE', 'WED', 'THU', 'FRI', 'SAT'], start=1)}
+
+
+def _next_bit(mask: int, value: int) -> Optional[int]:
+    """返回 mask 中不小于 value 的最小置位下标，不存在时返回 None。"""
+    rest = mask >> value
+    if not rest:
+        return None
+    return value + (rest & -rest).bit_length() - 1
+
+
+def _quartz_to_weekday(value: int) -> int:
+    """Quartz 星期(1=周日) 转 Python weekday(0=周一)。"""
+    return (value + 5) % 7
+
+
+class CronSchedule:
     """
-    Cron表达式工具类
+    编译后的 Cron 表达式(Quartz 风格：秒 分 时 日 月 星期 [年])。
+
+    各字段编译为位图，日期字段的 L/W/#/nL 等按 (年, 月) 计算当月日位图并缓存，
+    计算下次触发时间时逐级按位查找，无需逐秒/逐分钟迭代。
     """
 
-    @classmethod
-    def __valid_range(cls, search_str: str, start_range: int, end_range: int) -> bool:
-        """
-        校验范围表达式的合法性。
+    __slots__ = ('expression', 'seconds', 'minutes', 'hours', 'months', 'years',
+                 'day_mask', 'day_specials', 'week_mask', 'week_specials', 'day_any', 'week_any', '_month_days')
 
-        参数:
-        - search_str (str): 范围表达式。
-        - start_range (int): 开始范围。
-        - end_range (int): 结束范围。
+    def __init__(self, expression: str) -> None:
+        fields = expression.split()
+        if len(fields) not in (6, 7):
+            raise ValueError('Cron表达式必须为6或7个字段(秒 分 时 日 月 星期 [年])')
+        if len(fields) == 6:
+            fields.append('*')
+        self.expression = ' '.join(fields)
+        self.seconds = self._parse_field(fields[0], 0)
+        self.minutes = self._parse_field(fields[1], 1)
+        self.hours = self._parse_field(fields[2], 2)
+        self.months = self._parse_field(fields[4], 4, MONTH_NAMES)
+        self.years = self._parse_field(fields[6], 6)
+        self.day_any = fields[3] in ('*', '?')
+        self.week_any = fields[5] in ('*', '?')
+        if fields[3] == '?' and fields[5] == '?':
+            raise ValueError('日与星期字段不能同时为 ?')
+        self.day_mask, self.day_specials = self._parse_day(fields[3])
+        self.week_mask, self.week_specials = self._parse_week(fields[5])
+        self._month_days: Dict[Tuple[int, int], int] = {}
 
-        返回:
-        - bool: 校验是否通过。
-        """
-        match = re.match(r'^(\d+)-(\d+)$', search_str)
-        if match:
-            start, end = int(match.group(1)), int(match.group(2))
-            return start_range <= start < end <= end_range
-        return False
+    @staticmethod
+    def _parse_value(token: str, index: int, names: Optional[Dict[str, int]] = None) -> int:
+        name, low, high = CRON_FIELDS[index]
+        if names and token in names:
+            return names[token]
+        if not token.isdigit():
+            raise ValueError(f'{name}字段取值不合法: {token}')
+        value = int(token)
+        if not low <= value <= high:
+            raise ValueError(f'{name}字段取值超出范围({low}-{high}): {token}')
+        return value
 
     @classmethod
-    def __valid_sum(cls, search_str: str, start_range_a: int, start_range_b: int, end_range_a: int, end_range_b: int, sum_range: int) -> bool:
-        """
-        校验和表达式的合法性。
-
-        参数:
-        - search_str (str): 和表达式。
-        - start_range_a (int): 开始范围A。
-        - start_range_b (int): 开始范围B。
-        - end_range_a (int): 结束范围A。
-        - end_range_b (int): 结束范围B。
-        - sum_range (int): 总和范围。
+    def _parse_field(cls, field: str, index: int, names: Optional[Dict[str, int]] = None) -> int:
+        """解析 * a a-b a/n a-b/n 及逗号列表，返回以取值为下标的位图(年字段以1970为偏移)。"""
+        name, low, high = CRON_FIELDS[index]
+        offset = low if index == 6 else 0
+        mask = 0
+        for item in field.split(','):
+            step = 1
+            has_step = '/' in item
+            if has_step:
+                item, step_token = item.split('/', 1)
+                if not step_token.isdigit() or int(step_token) < 1:
+                    raise ValueError(f'{name}字段步长不合法: {step_token}')
+                step = int(step_token)
+            if item in ('*', '?'):
+                start, end = low, high
+            elif '-' in item:
+                start_token, end_token = item.split('-', 1)
+                start = cls._parse_value(start_token, index, names)
+                end = cls._parse_value(end_token, index, names)
+                if start > end:
+                    raise ValueError(f'{name}字段范围起始值不能大于结束值: {item}')
+            else:
+                start = cls._parse_value(item, index, names)
+                end = high if has_step else start
+            for value in range(start, end + 1, step):
+                mask |= 1 << (value - offset)
+        return mask
 
-        返回:
-        - bool: 校验是否通过。
-        """
-        match = re.match(r'^(\d+)/(\d+)$', search_str)
-        if match:
-            start, end = int(match.group(1)), int(match.group(2))
-            return (
-                start_range_a <= start <= start_range_b
-                and end_range_a <= end <= end_range_b
-                and start + end <= sum_range
-            )
-        return False
+    @classmethod
+    def _parse_day(cls, field: str) -> Tuple[int, List[Tuple[str, int]]]:
+        """解析日字段，支持 L、L-n、nW、LW。"""
+        if field in ('*', '?'):
+            return cls._parse_field('*', 3), []
+        mask, specials = 0, []
+        for item in field.split(','):
+            if item == 'L':
+                specials.append(('L', 0))
+            elif item.startswith('L-') and item[2:].isdigit() and int(item[2:]) < 31:
+                specials.append(('L', int(item[2:])))
+            elif item == 'LW':
+                specials.append(('LW', 0))
+            elif item.endswith('W'):
+                specials.append(('W', cls._parse_value(item[:-1], 3)))
+            else:
+                mask |= cls._parse_field(item, 3)
+        return mask, specials
 
     @classmethod
-    def validate_second_or_minute(cls, second_or_minute: str) -> bool:
+    def _parse_week(cls, field: str) -> Tuple[int, List[Tuple[str, int, int]]]:
+        """解析星期字段，支持 L(周六)、nL(当月最后一个星期n)、n#k(当月第k个星期n)，返回 Python weekday 位图。"""
+        if field in ('*', '?'):
+            return 0b1111111, []
+        mask, specials = 0, []
+        for item in field.split(','):
+            if item == 'L':
+                mask |= 1 << _quartz_to_weekday(7)
+            elif '#' in item:
+                week_token, nth_token = item.split('#', 1)
+                if not nth_token.isdigit() or not 1 <= int(nth_token) <= 5:
+                    raise ValueError(f'星期字段 # 序号必须为1-5: {item}')
+                specials.append(('#', _quartz_to_weekday(cls._parse_value(week_token, 5, WEEK_NAMES)), int(nth_token)))
+            elif item.endswith('L'):
+                specials.append(('L', _quartz_to_weekday(cls._parse_value(item[:-1], 5, WEEK_NAMES)), 0))
+            else:
+                quartz_mask = cls._parse_field(item, 5, WEEK_NAMES)
+                for value in range(1, 8):
+                    if quartz_mask >> value & 1:
+                        mask |= 1 << _quartz_to_weekday(value)
+        return mask, specials
+
+    def _days_of_month(self, year: int, month: int) -> int:
+        """计算并缓存指定月份中满足日/星期字段的日期位图。"""
+        key = (year, month)
+        cached = self._month_days.get(key)
+        if cached is not None:
+            return cached
+        first_weekday, last_day = calendar.monthrange(year, month)
+        valid = ((1 << (last_day + 1)) - 1) & ~1
+
+        day_mask = self.day_mask & valid
+        for kind, value in self.day_specials:
+            if kind == 'L':
+                if last_day - value >= 1:
+                    day_mask |= 1 << (last_day - value)
+            elif kind == 'LW':
+                day = last_day
+                while (first_weekday + day - 1) % 7 >= 5:
+                    day -= 1
+                day_mask |= 1 << day
+            elif kind == 'W' and value <= last_day:
+                weekday = (first_weekday + value - 1) % 7
+                day = value
+                if weekday == 5:
+                    day = value - 1 if value > 1 else value + 2
+                elif weekday == 6:
+                    day = value + 1 if value < last_day else value - 2
+                day_mask |= 1 << day
+
+        week_mask = 0
+        for day in range(1, last_day + 1):
+            if self.week_mask >> ((first_weekday + day - 1) % 7) & 1:
+                week_mask |= 1 << day
+        for kind, weekday, nth in self.week_specials:
+            first = 1 + (weekday - first_weekday) % 7
+            if kind == '#':
+                day = first + (nth - 1) * 7
+                if day <= last_day:
+                    week_mask |= 1 << day
+            else:
+                week_mask |= 1 << (first + (last_day - first) // 7 * 7)
+
+        if self.week_any:
+            days = day_mask
+        elif self.day_any:
+            days = week_mask
+        else:
+            days = day_mask & week_mask
+        self._month_days[key] = days
+        return days
+
+    def next_after(self, start: datetime) -> Optional[datetime]:
         """
-        校验秒或分钟字段的合法性。
+        计算不早于 start 的下一个触发时间(墙上时间，不含时区)。
 
         参数:
-        - second_or_minute (str): 秒或分钟值。
+        - start (datetime): 起始时间(不含时区)，不足一秒的部分向上取整。
 
         返回:
-        - bool: 校验是否通过。
+        - Optional[datetime]: 下次触发时间，2099年前无匹配时为 None。
         """
-        if (
-            second_or_minute == '*'
-            or ('-' in second_or_minute and cls.__valid_range(second_or_minute, 0, 59))
-            or ('/' in second_or_minute and cls.__valid_sum(second_or_minute, 0, 58, 1, 59, 59))
-            or re.match(r'^(?:[0-5]?\d|59)(?:,[0-5]?\d|59)*$', second_or_minute)
-        ):
-            return True
-        return False
+        if start.microsecond:
+            start = start.replace(microsecond=0) + timedelta(seconds=1)
+        year, month, day = start.year, start.month, start.day
+        hour, minute, second = start.hour, start.minute, start.second
+        while True:
+            if year < 1970:
+                year, month, day, hour, minute, second = 1970, 1, 1, 0, 0, 0
+            found = _next_bit(self.years, year - 1970)
+            if found is None:
+                return None
+            if found + 1970 != year:
+                year, month, day, hour, minute, second = found + 1970, 1, 1, 0, 0, 0
+            found = _next_bit(self.months, month)
+            if found is None or found > 12:
+                year, month, day, hour, minute, second = year + 1, 1, 1, 0, 0, 0
+                continue
+            if found != month:
+                month, day, hour, minute, second = found, 1, 0, 0, 0
+            found = _next_bit(self._days_of_month(year, month), day)
+            if found is None:
+                month, day, hour, minute, second = month + 1, 1, 0, 0, 0
+                if month > 12:
+                    year, month = year + 1, 1
+                continue
+            if found != day:
+                day, hour, minute, second = found, 0, 0, 0
+            found = _next_bit(self.hours, hour)
+            if found is None:
+                day, hour, minute, second = day + 1, 0, 0, 0
+                continue
+            if found != hour:
+                hour, minute, second = found, 0, 0
+            found = _next_bit(self.minutes, minute)
+            if found is None:
+                hour, minute, second = hour + 1, 0, 0
+                continue
+            if found != minute:
+                minute, second = found, 0
+            found = _next_bit(self.seconds, second)
+            if found is None:
+                minute, second = minute + 1, 0
+                continue
+            return datetime(year, month, day, hour, minute, found)
 
-    @classmethod
-    def validate_hour(cls, hour: str) -> bool:
+    def next_fire_times(self, n: int, start: Optional[datetime] = None, tz: Union[str, tzinfo] = 'Asia/Shanghai', end: Optional[datetime] = None) -> List[datetime]:
         """
-        校验小时字段的合法性。
+        计算从 start 起的后 n 次触发时间。
 
         参数:
-        - hour (str): 小时值。
+        - n (int): 次数。
+        - start (Optional[datetime]): 起始时间(含)，默认当前时间；带时区时先转换到 tz。
+        - tz (Union[str, tzinfo]): 时区。
+        - end (Optional[datetime]): 结束时间(含)，超过后停止。
 
         返回:
-        - bool: 校验是否通过。
+        - List[datetime]: 带时区的触发时间列表。
         """
-        if (
-            hour == '*'
-            or ('-' in hour and cls.__valid_range(hour, 0, 23))
-            or ('/' in hour and cls.__valid_sum(hour, 0, 22, 1, 23, 23))
-            or re.match(r'^(?:0|[1-9]|1\d|2[0-3])(?:,(?:0|[1-9]|1\d|2[0-3]))*$', hour)
-        ):
-            return True
-        return False
+        zone = ZoneInfo(tz) if isinstance(tz, str) else tz
+        current = (start or datetime.now(zone))
+        if current.tzinfo is not None:
+            current = current.astimezone(zone).replace(tzinfo=None)
+        result: List[datetime] = []
+        while len(result) < n:
+            naive = self.next_after(current)
+            if naive is None:
+                break
+            current = naive + timedelta(seconds=1)
+            aware = naive.replace(tzinfo=zone)
+            # 夏令时跳过的本地时间不存在，跳过该次触发
+            if aware.astimezone(timezone.utc).astimezone(zone).replace(tzinfo=None) != naive:
+                continue
+            if end is not None and aware > end:
+                break
+            result.append(aware)
+        return result
+
+
+@lru_cache(maxsize=4096)
+def _compile(expression: str) -> CronSchedule:
+    return CronSchedule(expression)
+
+
+class CronScheduleTrigger(BaseTrigger):
+    """
+    基于编译后 Cron 表达式的 APScheduler 触发器，与预览接口使用同一份计算逻辑。
+    序列化时只保存表达式，反序列化时从编译缓存取回。
+    """
+
+    __slots__ = ('expression', 'timezone', 'start_date', 'end_date', 'schedule')
+
+    def __init__(self, expression: str, start_date: Any = None, end_date: Any = None, timezone: Union[str, tzinfo] = 'Asia/Shanghai') -> None:
+        self.timezone = ZoneInfo(timezone) if isinstance(timezone, str) else timezone
+        self.schedule = CronUtil.compile(expression)
+        self.expression = self.schedule.expression
+        self.start_date = convert_to_datetime(start_date, self.timezone, 'start_date') if start_date else None
+        self.end_date = convert_to_datetime(end_date, self.timezone, 'end_date') if end_date else None
+
+    def get_next_fire_time(self, previous_fire_time: Optional[datetime], now: datetime) -> Optional[datetime]:
+        if previous_fire_time:
+            # 从上次触发之后开始计算，错过的触发由调度器按 misfire/coalesce 处理
+            start = previous_fire_time + timedelta(microseconds=1)
+        else:
+            start = max(now, self.start_date) if self.start_date else now
+        fire_times = self.schedule.next_fire_times(1, start=start, tz=self.timezone, end=self.end_date)
+        return fire_times[0] if fire_times else None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {
+            'version': 1,
+            'expression': self.expression,
+            'timezone': self.timezone,
+            'start_date': self.start_date,
+            'end_date': self.end_date,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.expression = state['expression']
+        self.timezone = state['timezone']
+        self.start_date = state['start_date']
+        self.end_date = state['end_date']
+        self.schedule = CronUtil.compile(self.expression)
+
+    def __str__(self) -> str:
+        return f"cron[{self.expression}]"
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} ({self.expression}, timezone='{self.timezone}')>"
+
+
+class CronUtil:
+    """
+    Cron表达式工具类
+    """
 
     @classmethod
-    def validate_day(cls, day: str) -> bool:
+    def compile(cls, expression: str) -> CronSchedule:
         """
-        校验日期字段的合法性。
+        编译 Cron 表达式(按规范化后的表达式缓存)。
 
         参数:
-        - day (str): 日值。
+        - expression (str): Cron 表达式(秒 分 时 日 月 星期 [年])。
 
         返回:
-        - bool: 校验是否通过。
+        - CronSchedule: 编译后的调度对象。
+
+        异常:
+        - ValueError: 表达式不合法时抛出，消息说明不合法的字段。
         """
-        if (
-            day in ['*', '?', 'L']
-            or ('-' in day and cls.__valid_range(day, 1, 31))
-            or ('/' in day and cls.__valid_sum(day, 1, 30, 1, 30, 31))
-            or ('W' in day and re.match(r'^(?:[1-9]|1\d|2\d|3[01])W$', day))
-            or re.match(r'^(?:0|[1-9]|1\d|2[0-9]|3[0-1])(?:,(?:0|[1-9]|1\d|2[0-9]|3[0-1]))*$', day)
-        ):
-            return True
-        return False
+        return _compile(' '.join(expression.upper().split()))
 
     @classmethod
-    def validate_month(cls, month: str) -> bool:
+    def validate_cron_expression(cls, cron_expression: str) -> bool:
         """
-        校验月份字段的合法性。
+        校验 Cron 表达式是否正确。
+
+        各字段合法但组合后永不触发(如 2 月 30 日)的表达式同样视为不正确：
+        编译后从当前时间查找下一次触发，查找范围以年字段上限(2099年)为界。
 
         参数:
-        - month (str): 月值。
+        - cron_expression (str): Cron 表达式。
 
         返回:
         - bool: 校验是否通过。
         """
-        if (
-            month == '*'
-            or ('-' in month and cls.__valid_range(month, 1, 12))
-            or ('/' in month and cls.__valid_sum(month, 1, 11, 1, 11, 12))
-            or re.match(r'^(?:0|[1-9]|1[0-2])(?:,(?:0|[1-9]|1[0-2]))*$', month)
-        ):
-            return True
-        return False
+        try:
+            schedule = cls.compile(cron_expression)
+        except ValueError:
+            return False
+        return schedule.next_after(datetime.now()) is not None
 
     @classmethod
-    def validate_week(cls, week: str) -> bool:
+    def next_fire_times(cls, cron_expression: str, n: int = 5, start: Optional[datetime] = None, tz: str = 'Asia/Shanghai') -> List[datetime]:
         """
-        校验星期字段的合法性。
+        计算 Cron 表达式的后 n 次触发时间。
 
         参数:
-        - week (str): 周值。
+        - cron_expression (str): Cron 表达式。
+        - n (int): 次数。
+        - start (Optional[datetime]): 起始时间，默认当前时间。
+        - tz (str): 时区。
 
         返回:
-        - bool: 校验是否通过。
+        - List[datetime]: 触发时间列表。
         """
-        if (
-            week in ['*', '?']
-            or ('-' in week and cls.__valid_range(week, 1, 7))
-            or ('#' in week and re.match(r'^[1-7]#[1-4]$', week))
-            or ('L' in week and re.match(r'^[1-7]L$', week))
-            or re.match(r'^[1-7](?:(,[1-7]))*$', week)
-        ):
-            return True
-        return False
+        return cls.compile(cron_expression).next_fire_times(n, start=start, tz=tz)
 
     @classmethod
-    def validate_year(cls, year: str) -> bool:
+    def build_trigger(cls, cron_expression: str, start_date: Any = None, end_date: Any = None, tz: str = 'Asia/Shanghai') -> CronScheduleTrigger:
         """
-        校验年份字段的合法性。
+        根据 Cron 表达式构造调度触发器。
 
         参数:
-        - year (str): 年值。
+        - cron_expression (str): Cron 表达式。
+        - start_date (Any): 开始时间。
+        - end_date (Any): 结束时间。
+        - tz (str): 时区。
 
         返回:
-        - bool: 校验是否通过。
+        - CronScheduleTrigger: 调度触发器。
         """
-        current_year = int(datetime.now().year)
-        future_years = [current_year + i for i in range(9)]
-        if (
-            year == '*'
-            or ('-' in year and cls.__valid_range(year, current_year, 2099))
-            or ('/' in year and cls.__valid_sum(year, current_year, 2098, 1, 2099 - current_year, 2099))
-            or ('#' in year and re.match(r'^[1-7]#[1-4]$', year))
-            or ('L' in year and re.match(r'^[1-7]L$', year))
-            or (
-                (len(year) == 4 or ',' in year)
-                and all(int(item) in future_years and current_year <= int(item) <= 2099 for item in year.split(','))
-            )
-        ):
-            return True
-        return False
+        return CronScheduleTrigger(cron_expression, start_date=start_date, end_date=end_date, timezone=tz)
 
     @classmethod
-    def validate_cron_expression(cls, cron_expression: str) -> bool | None:
+    @lru_cache(maxsize=1024)
+    def parse_interval(cls, interval_expression: str) -> Dict[str, int]:
         """
-        校验 Cron 表达式是否正确。
+        解析 interval 表达式(秒 分 时 天 周，* 表示0)。
 
         参数:
-        - cron_expression (str): Cron 表达式。
+        - interval_expression (str): interval 表达式。
 
         返回:
-        - bool | None: 校验是否通过。
+        - Dict[str, int]: IntervalTrigger 参数(weeks/days/hours/minutes/seconds)。
+
+        异常:
+        - ValueError: 表达式不合法时抛出。
         """
-        values = cron_expression.split()
-        if len(values) != 6 and len(values) != 7:
-            return False
-        second_validation = cls.validate_second_or_minute(values[0])
-        minute_validation = cls.validate_second_or_minute(values[1])
-        hour_validation = cls.validate_hour(values[2])
-        day_validation = cls.validate_day(values[3])
-        month_validation = cls.validate_month(values[4])
-        week_validation = cls.validate_week(values[5])
-        validation = (
-            second_validation
-            and minute_validation
-            and hour_validation
-            and day_validation
-            and month_validation
-            and week_validation
-        )
-        if len(values) == 6:
-            return validation
-        if len(values) == 7:
-            year_validation = cls.validate_year(values[6])
-            return validation and year_validation
+        fields = interval_expression.split()
+        if len(fields) != 5 or not all(field == '*' or field.isdigit() for field in fields):
+            raise ValueError("无效的 interval 表达式")
+        second, minute, hour, day, week = (int(field) if field != '*' else 0 for field in fields)
+        return {'weeks': week, 'days': day, 'hours': hour, 'minutes': minute, 'seconds': second}
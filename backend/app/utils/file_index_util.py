@@ -0,0 +1,452 @@
+# -*- coding: utf-8 -*-
+
+import os
+import asyncio
+import time
+import sqlite3
+import threading
+from stat import S_ISDIR
+from typing import Dict, List, Optional, Tuple
+
+from app.config.setting import settings
+from app.core.logger import logger
+from app.utils.fs_util import FsUtil
+
+# 目录树统计: (文件数, 目录数, 总字节数)
+TreeTotals = Tuple[int, int, int]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    path TEXT NOT NULL UNIQUE,
+    parent TEXT,
+    name TEXT NOT NULL,
+    is_dir INTEGER NOT NULL,
+    size INTEGER NOT NULL DEFAULT 0,
+    mtime REAL,
+    ctime REAL,
+    total_files INTEGER NOT NULL DEFAULT 0,
+    total_dirs INTEGER NOT NULL DEFAULT 0,
+    total_size INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_entries_parent ON entries(parent, is_dir);
+"""
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5(name, content='entries', content_rowid='rowid', tokenize='trigram');
+CREATE TRIGGER IF NOT EXISTS entries_ai AFTER INSERT ON entries BEGIN
+    INSERT INTO entries_fts(rowid, name) VALUES (new.rowid, new.name);
+END;
+CREATE TRIGGER IF NOT EXISTS entries_ad AFTER DELETE ON entries BEGIN
+    INSERT INTO entries_fts(entries_fts, rowid, name) VALUES ('delete', old.rowid, old.name);
+END;
+CREATE TRIGGER IF NOT EXISTS entries_au AFTER UPDATE OF name ON entries BEGIN
+    INSERT INTO entries_fts(entries_fts, rowid, name) VALUES ('delete', old.rowid, old.name);
+    INSERT INTO entries_fts(rowid, name) VALUES (new.rowid, new.name);
+END;
+"""
+
+_UPSERT = """
+INSERT INTO entries (path, parent, name, is_dir, size, mtime, ctime, total_files, total_dirs, total_size)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(path) DO UPDATE SET
+    is_dir = excluded.is_dir, size = excluded.size, mtime = excluded.mtime, ctime = excluded.ctime,
+    total_files = excluded.total_files, total_dirs = excluded.total_dirs, total_size = excluded.total_size
+"""
+
+
+class _WriteBatch:
+    """
+    索引写事务: 持有写锁与 BEGIN IMMEDIATE 事务，累计处理条目数达到 size 后提交并短暂释放写锁再开启新事务。
+
+    size 为 None 时整个上下文只使用一个事务。
+    """
+
+    def __init__(self, conn: sqlite3.Connection, size: Optional[int] = None) -> None:
+        self.conn = conn
+        self.size = size
+        self.pending = 0
+
+    def _begin(self) -> None:
+        with FileIndexUtil._waiters_lock:
+            FileIndexUtil._write_waiters += 1
+        FileIndexUtil._write_lock.acquire()
+        with FileIndexUtil._waiters_lock:
+            FileIndexUtil._write_waiters -= 1
+        try:
+            self.conn.execute('BEGIN IMMEDIATE')
+        except Exception:
+            FileIndexUtil._write_lock.release()
+            raise
+        self.pending = 0
+
+    def _end(self, commit: bool) -> None:
+        try:
+            self.conn.execute('COMMIT' if commit else 'ROLLBACK')
+        finally:
+            FileIndexUtil._write_lock.release()
+
+    def checkpoint(self, count: int) -> None:
+        """登记处理的条目数，达到批次大小时提交，让等待写锁的增量维护先执行。"""
+        self.pending += count
+        if self.size is not None and self.pending >= self.size:
+            self._end(commit=True)
+            # threading.Lock 不保证公平，提交后稍作等待，让正在等待写锁的增量维护先获取
+            deadline = time.monotonic() + 0.05
+            while FileIndexUtil._write_waiters and time.monotonic() < deadline:
+                time.sleep(0.001)
+            self._begin()
+
+    def __enter__(self) -> '_WriteBatch':
+        self._begin()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._end(commit=exc_type is None)
+
+
+class FileIndexUtil:
+    """
+    静态资源文件索引
+
+    将 settings.STATIC_ROOT 下的文件元数据持久化到 SQLite(WAL) 中:
+    - entries 表按相对路径存储每个文件/目录，目录行维护递归的文件数、目录数、总大小，统计查询为 O(1)
+    - entries_fts 为 FTS5 trigram 索引，支持递归的文件名子串搜索(不可用时回退为 LIKE)
+    - ResourceService 的上传、移动、复制、删除、重命名操作后调用 add_path/remove_path 增量维护
+    - 后台定期对账(reconcile)，逐个目录扫描并按文件大小与 mtime 识别变化(含原地修改的文件)，
+      写入按 RESOURCE_INDEX_BATCH_SIZE 分批提交，批次之间释放写锁，增量维护不会被长时间阻塞
+
+    所有方法均为阻塞调用，需在 FsUtil 线程池中执行。
+    """
+
+    _local = threading.local()
+    _write_lock = threading.Lock()
+    _waiters_lock = threading.Lock()
+    _write_waiters: int = 0
+    _fts: Optional[bool] = None
+    _ready: bool = False
+    _task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def _connect(cls) -> sqlite3.Connection:
+        """获取当前线程的索引库连接(WAL 模式下读写可并发)。"""
+        conn = getattr(cls._local, 'conn', None)
+        if conn is None:
+            settings.RESOURCE_INDEX_FILE.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(settings.RESOURCE_INDEX_FILE), isolation_level=None, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.executescript(_SCHEMA)
+            if cls._fts is None:
+                try:
+                    conn.executescript(_FTS_SCHEMA)
+                    cls._fts = True
+                except sqlite3.OperationalError as e:
+                    logger.warning(f"SQLite 不支持 FTS5 trigram，文件搜索回退为 LIKE: {str(e)}")
+                    cls._fts = False
+            cls._local.conn = conn
+        return conn
+
+    @classmethod
+    def is_ready(cls) -> bool:
+        """索引是否已完成首次构建。"""
+        if not cls._ready and settings.RESOURCE_INDEX_ENABLE:
+            # 持久化索引: 根目录行存在即可直接使用，后续由对账保持新鲜
+            row = cls._connect().execute("SELECT 1 FROM entries WHERE path = ''").fetchone()
+            cls._ready = row is not None
+        return cls._ready
+
+    @classmethod
+    def to_rel(cls, abs_path: str) -> str:
+        """绝对路径转为索引使用的相对路径(根目录为空字符串)。"""
+        rel = os.path.relpath(abs_path, str(settings.STATIC_ROOT))
+        return '' if rel == '.' else rel.replace(os.sep, '/')
+
+    @staticmethod
+    def _parent_of(rel: str) -> Optional[str]:
+        if rel == '':
+            return None
+        return rel.rsplit('/', 1)[0] if '/' in rel else ''
+
+    @staticmethod
+    def _prefix_range(rel: str) -> Tuple[str, str]:
+        """子路径的范围查询边界: path >= 'a/' AND path < 'a0'('0' 是 '/' 的下一个字符)。"""
+        return f'{rel}/', f'{rel}0'
+
+    @classmethod
+    def _delete_subtree(cls, conn: sqlite3.Connection, rel: str) -> None:
+        low, high = cls._prefix_range(rel)
+        conn.execute('DELETE FROM entries WHERE path = ? OR (path >= ? AND path < ?)', (rel, low, high))
+
+    @classmethod
+    def _apply_delta(cls, conn: sqlite3.Connection, rel: str, files: int, dirs: int, size: int) -> None:
+        """将子树统计的变化量累加到所有祖先目录。"""
+        parent = cls._parent_of(rel)
+        while parent is not None:
+            conn.execute(
+                'UPDATE entries SET total_files = total_files + ?, total_dirs = total_dirs + ?, total_size = total_size + ? WHERE path = ?',
+                (files, dirs, size, parent)
+            )
+            parent = cls._parent_of(parent)
+
+    @classmethod
+    def _scan_dir(cls, conn: sqlite3.Connection, rel: str, abs_path: str) -> Tuple[List[Tuple[str, str, Optional[os.stat_result]]], int]:
+        """
+        扫描单个目录的直接子项并与索引比对: 新增或大小/mtime 变化的文件写入索引，已不存在的子项删除。
+
+        返回:
+        - Tuple[List[Tuple[str, str, Optional[os.stat_result]]], int]: 子目录 (相对路径, 绝对路径, stat) 列表与处理的条目数。
+
+        异常:
+        - FileNotFoundError: 目录已不存在时抛出。
+        """
+        existing = {
+            r['name']: r for r in conn.execute('SELECT name, is_dir, size, mtime FROM entries WHERE parent = ?', (rel,))
+        }
+        subdirs: List[Tuple[str, str, Optional[os.stat_result]]] = []
+        seen = set()
+        try:
+            with os.scandir(abs_path) as it:
+                for entry in it:
+                    try:
+                        est = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    seen.add(entry.name)
+                    child_rel = f'{rel}/{entry.name}' if rel else entry.name
+                    old = existing.get(entry.name)
+                    is_dir = S_ISDIR(est.st_mode)
+                    if old is not None and bool(old['is_dir']) != is_dir:
+                        cls._delete_subtree(conn, child_rel)
+                        old = None
+                    if is_dir:
+                        subdirs.append((child_rel, entry.path, est))
+                    elif old is None or old['size'] != est.st_size or old['mtime'] != est.st_mtime:
+                        conn.execute(_UPSERT, (child_rel, rel, entry.name, 0, est.st_size, est.st_mtime, est.st_ctime, 0, 0, 0))
+        except FileNotFoundError:
+            raise
+        except OSError as e:
+            # 无法读取时保留已有索引，下次对账重试
+            logger.warning(f"扫描目录失败 {abs_path}: {str(e)}")
+            return [
+                (r['path'], os.path.join(abs_path, r['name']), None)
+                for r in conn.execute('SELECT path, name FROM entries WHERE parent = ? AND is_dir = 1', (rel,))
+            ], len(existing)
+        removed = existing.keys() - seen
+        for name in removed:
+            cls._delete_subtree(conn, f'{rel}/{name}' if rel else name)
+        return subdirs, len(seen) + len(removed)
+
+    @classmethod
+    def _write_dir_totals(cls, conn: sqlite3.Connection, rel: str, abs_path: str, st: os.stat_result) -> TreeTotals:
+        """
+        按索引中的直接子项汇总目录统计并写入目录行。
+
+        统计读取子项当前行而非扫描时的结果，批次间隙中增量钩子对子项的修改会被一并计入。
+
+        返回:
+        - TreeTotals: 该目录子树的统计。
+        """
+        files, dirs, size = conn.execute(
+            'SELECT coalesce(sum(CASE WHEN is_dir = 1 THEN total_files ELSE 1 END), 0), '
+            'coalesce(sum(CASE WHEN is_dir = 1 THEN total_dirs + 1 ELSE 0 END), 0), '
+            'coalesce(sum(CASE WHEN is_dir = 1 THEN total_size ELSE size END), 0) '
+            'FROM entries WHERE parent = ?', (rel,)
+        ).fetchone()
+        conn.execute(_UPSERT, (
+            rel, cls._parent_of(rel), os.path.basename(abs_path) if rel else '', 1, 0,
+            st.st_mtime, st.st_ctime, files, dirs, size
+        ))
+        return files, dirs, size
+
+    @classmethod
+    def _reconcile_dir(cls, batch: '_WriteBatch', rel: str, abs_path: str, st: Optional[os.stat_result]) -> Optional[TreeTotals]:
+        """
+        对账目录子树: 先扫描本目录，再递归子目录，最后汇总本目录统计。
+
+        每个目录的扫描与统计写入各自位于同一事务内，批次只在两者之间提交。
+
+        返回:
+        - Optional[TreeTotals]: 该目录子树的统计，目录已不存在时返回 None。
+        """
+        try:
+            if st is None:
+                st = os.stat(abs_path, follow_symlinks=False)
+            subdirs, count = cls._scan_dir(batch.conn, rel, abs_path)
+        except FileNotFoundError:
+            cls._delete_subtree(batch.conn, rel)
+            batch.checkpoint(1)
+            return None
+        batch.checkpoint(count)
+        for child_rel, child_abs, child_st in subdirs:
+            cls._reconcile_dir(batch, child_rel, child_abs, child_st)
+        totals = cls._write_dir_totals(batch.conn, rel, abs_path, st)
+        batch.checkpoint(1)
+        return totals
+
+    @classmethod
+    def reconcile(cls) -> TreeTotals:
+        """
+        从静态根目录构建/对账整个索引(首次调用即为全量构建)。
+
+        返回:
+        - TreeTotals: 根目录统计。
+        """
+        root = str(settings.STATIC_ROOT)
+        with _WriteBatch(cls._connect(), settings.RESOURCE_INDEX_BATCH_SIZE) as batch:
+            totals = cls._reconcile_dir(batch, '', root, os.stat(root))
+        cls._ready = True
+        return totals
+
+    @classmethod
+    def add_path(cls, abs_path: str) -> None:
+        """
+        新增/覆盖路径后的索引钩子(上传、复制、移动目标、重命名目标、创建目录)。
+
+        参数:
+        - abs_path (str): 已写入磁盘的绝对路径。
+        """
+        if not cls.is_ready():
+            return
+        try:
+            st = os.stat(abs_path, follow_symlinks=False)
+        except FileNotFoundError:
+            return
+        rel = cls.to_rel(abs_path)
+        conn = cls._connect()
+        parent = cls._parent_of(rel)
+        if parent is not None and conn.execute('SELECT 1 FROM entries WHERE path = ?', (parent,)).fetchone() is None:
+            # 父目录尚未被索引(如上传时自动创建的目录)，改为索引父目录
+            return cls.add_path(os.path.dirname(abs_path))
+        # 单个路径的变更在一个事务内完成，祖先统计与子树保持一致
+        with _WriteBatch(conn) as batch:
+            cls._remove_rel(conn, rel)
+            if S_ISDIR(st.st_mode):
+                totals = cls._reconcile_dir(batch, rel, abs_path, st)
+                if totals is not None:
+                    cls._apply_delta(conn, rel, totals[0], totals[1] + 1, totals[2])
+            else:
+                conn.execute(_UPSERT, (rel, parent, os.path.basename(abs_path), 0, st.st_size, st.st_mtime, st.st_ctime, 0, 0, 0))
+                cls._apply_delta(conn, rel, 1, 0, st.st_size)
+
+    @classmethod
+    def remove_path(cls, abs_path: str) -> None:
+        """
+        删除路径后的索引钩子(删除、移动源、重命名源)。
+
+        参数:
+        - abs_path (str): 已从磁盘移除的绝对路径。
+        """
+        if not cls.is_ready():
+            return
+        conn = cls._connect()
+        with _WriteBatch(conn):
+            cls._remove_rel(conn, cls.to_rel(abs_path))
+
+    @classmethod
+    def _remove_rel(cls, conn: sqlite3.Connection, rel: str) -> None:
+        if rel == '':
+            return
+        row = conn.execute(
+            'SELECT is_dir, size, total_files, total_dirs, total_size FROM entries WHERE path = ?', (rel,)
+        ).fetchone()
+        if row is None:
+            return
+        cls._delete_subtree(conn, rel)
+        if row['is_dir']:
+            cls._apply_delta(conn, rel, -row['total_files'], -(row['total_dirs'] + 1), -row['total_size'])
+        else:
+            cls._apply_delta(conn, rel, -1, 0, -row['size'])
+
+    @classmethod
+    def get_stats(cls, abs_path: str) -> Optional[Dict[str, int]]:
+        """
+        O(1) 获取目录的递归统计。
+
+        参数:
+        - abs_path (str): 目录绝对路径。
+
+        返回:
+        - Optional[Dict[str, int]]: {'files', 'dirs', 'size'}，索引不可用或未收录时返回None。
+        """
+        if not cls.is_ready():
+            return None
+        row = cls._connect().execute(
+            'SELECT total_files, total_dirs, total_size FROM entries WHERE path = ? AND is_dir = 1', (cls.to_rel(abs_path),)
+        ).fetchone()
+        if row is None:
+            return None
+        return {'files': row['total_files'], 'dirs': row['total_dirs'], 'size': row['total_size']}
+
+    @classmethod
+    def search(cls, keyword: str, abs_dir: Optional[str] = None, include_hidden: bool = False, limit: int = 1000) -> Optional[List[sqlite3.Row]]:
+        """
+        递归搜索文件名包含关键词的文件和目录。
+
+        参数:
+        - keyword (str): 关键词(不区分大小写)。
+        - abs_dir (Optional[str]): 搜索范围目录，默认静态根目录。
+        - include_hidden (bool): 是否包含隐藏文件。
+        - limit (int): 最大结果数。
+
+        返回:
+        - Optional[List[sqlite3.Row]]: 匹配的索引行，索引不可用时返回None。
+        """
+        if not cls.is_ready():
+            return None
+        conn = cls._connect()
+        conditions = ["e.path != ''"]
+        params: list = []
+        rel_dir = cls.to_rel(abs_dir) if abs_dir else ''
+        if rel_dir:
+            low, high = cls._prefix_range(rel_dir)
+            conditions.append('e.path >= ? AND e.path < ?')
+            params.extend([low, high])
+        if not include_hidden:
+            conditions.append("e.name NOT LIKE '.%'")
+
+        # trigram 分词要求关键词至少 3 个字符
+        if cls._fts and len(keyword) >= 3:
+            sql = (
+                'SELECT e.* FROM entries_fts f JOIN entries e ON e.rowid = f.rowid '
+                f'WHERE entries_fts MATCH ? AND {" AND ".join(conditions)} LIMIT ?'
+            )
+            params = ['"' + keyword.replace('"', '""') + '"'] + params
+        else:
+            escaped = keyword.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            conditions.append("e.name LIKE ? ESCAPE '\\'")
+            params.append(f'%{escaped}%')
+            sql = f'SELECT e.* FROM entries e WHERE {" AND ".join(conditions)} LIMIT ?'
+        params.append(limit)
+        return conn.execute(sql, params).fetchall()
+
+    @classmethod
+    async def _reconcile_loop(cls) -> None:
+        while True:
+            try:
+                files, dirs, size = await FsUtil.run(cls.reconcile)
+                logger.info(f"资源文件索引对账完成: 文件 {files}, 目录 {dirs}, 大小 {size}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"资源文件索引对账失败: {str(e)}")
+            await asyncio.sleep(settings.RESOURCE_INDEX_RECONCILE_SECONDS)
+
+    @classmethod
+    def start(cls) -> None:
+        """启动后台对账任务(首次运行时完成全量构建)。"""
+        if not settings.RESOURCE_INDEX_ENABLE or not settings.STATIC_ENABLE or cls._task is not None:
+            return
+        cls._task = asyncio.create_task(cls._reconcile_loop())
+
+    @classmethod
+    async def stop(cls) -> None:
+        """停止后台对账任务。"""
+        if cls._task is None:
+            return
+        cls._task.cancel()
+        try:
+            await cls._task
+        except asyncio.CancelledError:
+            pass
+        cls._task = None
@@ -0,0 +1,334 @@
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import time
+import uuid
+import shutil
+import asyncio
+import functools
+import threading
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+from redis.asyncio.client import Redis
+
+from app.common.enums import RedisInitKeyConfig
+from app.config.setting import settings
+from app.core.exceptions import CustomException
+from app.core.logger import logger
+
+T = TypeVar("T")
+
+# 进度回调: 每处理完 n 个文件调用一次
+ProgressCallback = Callable[[int], None]
+
+
+class FsUtil:
+    """
+    文件系统工具类
+
+    所有阻塞的文件系统调用都应通过有界线程池执行，避免阻塞事件循环：
+    - 交互式操作(列目录、单文件读写)使用 io 线程池 run()
+    - 耗时的目录树操作(复制、删除、跨设备移动)通过 FsTaskManager 提交为后台任务
+    """
+
+    _executor: Optional[ThreadPoolExecutor] = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_executor(cls) -> ThreadPoolExecutor:
+        """
+        获取(懒加载)文件系统线程池。
+
+        返回:
+        - ThreadPoolExecutor: 有界线程池。
+        """
+        if cls._executor is None:
+            with cls._lock:
+                if cls._executor is None:
+                    cls._executor = ThreadPoolExecutor(
+                        max_workers=settings.FS_THREAD_POOL_SIZE,
+                        thread_name_prefix="fs-io"
+                    )
+        return cls._executor
+
+    @classmethod
+    async def run(cls, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        在文件系统线程池中执行阻塞函数。
+
+        参数:
+        - func (Callable[..., T]): 阻塞函数。
+        - *args, **kwargs: 函数参数。
+
+        返回:
+        - T: 函数返回值。
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(cls.get_executor(), functools.partial(func, *args, **kwargs))
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """关闭文件系统线程池(等待已提交任务完成)。"""
+        with cls._lock:
+            if cls._executor is not None:
+                cls._executor.shutdown(wait=True, cancel_futures=True)
+                cls._executor = None
+        FsTaskManager.shutdown()
+
+    @staticmethod
+    def scan_tree(path: str, include_hidden: bool = False) -> Dict[str, int]:
+        """
+        基于 os.scandir 迭代统计目录树(复用 DirEntry 的 stat 结果)。
+
+        参数:
+        - path (str): 目录路径。
+        - include_hidden (bool): 是否包含隐藏文件。
+
+        返回:
+        - Dict[str, int]: {'files': 文件数, 'dirs': 目录数, 'size': 总字节数}。
+        """
+        stats = {'files': 0, 'dirs': 0, 'size': 0}
+        stack = [path]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        if not include_hidden and entry.name.startswith('.'):
+                            continue
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stats['dirs'] += 1
+                                stack.append(entry.path)
+                            else:
+                                stats['files'] += 1
+                                stats['size'] += entry.stat(follow_symlinks=False).st_size
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+        return stats
+
+    @staticmethod
+    def copy_tree(source: str, target: str, overwrite: bool = False, progress: Optional[ProgressCallback] = None) -> None:
+        """
+        复制文件或目录树，每复制一个文件回调一次进度。
+
+        参数:
+        - source (str): 源路径。
+        - target (str): 目标路径。
+        - overwrite (bool): 目标目录已存在时是否合并覆盖。
+        - progress (ProgressCallback | None): 进度回调。
+        """
+        def _copy(src: str, dst: str) -> str:
+            result = shutil.copy2(src, dst)
+            if progress:
+                progress(1)
+            return result
+
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        if os.path.isdir(source):
+            shutil.copytree(source, target, copy_function=_copy, dirs_exist_ok=overwrite)
+        else:
+            _copy(source, target)
+
+    @staticmethod
+    def remove_tree(path: str, progress: Optional[ProgressCallback] = None) -> None:
+        """
+        自底向上删除文件或目录树，每删除一个文件回调一次进度。
+
+        参数:
+        - path (str): 路径。
+        - progress (ProgressCallback | None): 进度回调。
+        """
+        if not os.path.isdir(path) or os.path.islink(path):
+            os.remove(path)
+            if progress:
+                progress(1)
+            return
+        for root, dirs, files in os.walk(path, topdown=False):
+            for name in files:
+                os.remove(os.path.join(root, name))
+                if progress:
+                    progress(1)
+            for name in dirs:
+                dir_path = os.path.join(root, name)
+                if os.path.islink(dir_path):
+                    os.remove(dir_path)
+                else:
+                    os.rmdir(dir_path)
+        os.rmdir(path)
+
+    @classmethod
+    def move_tree(cls, source: str, target: str, progress: Optional[ProgressCallback] = None) -> None:
+        """
+        移动文件或目录树。同一文件系统内直接 rename，跨设备时回退为带进度的复制+删除。
+
+        参数:
+        - source (str): 源路径。
+        - target (str): 目标路径。
+        - progress (ProgressCallback | None): 进度回调。
+        """
+        def _copy(src: str, dst: str) -> str:
+            result = shutil.copy2(src, dst)
+            if progress:
+                progress(1)
+            return result
+
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        shutil.move(source, target, copy_function=_copy)
+
+
+class FsTaskManager:
+    """
+    文件系统后台任务管理器
+
+    任务在独立的有界线程池中执行，状态保存在 Redis 中(多进程部署时任意进程均可查询进度)。
+    执行线程按 FS_TASK_PROGRESS_INTERVAL 节流写入进度，状态变化时立即写入；
+    任务记录保留 settings.FS_TASK_KEEP_SECONDS 秒后由 Redis 过期清理。
+    """
+
+    _executor: Optional[ThreadPoolExecutor] = None
+    _lock = threading.Lock()
+    _redis: Optional[Redis] = None
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @classmethod
+    def start(cls, redis: Redis) -> None:
+        """
+        绑定任务状态使用的 Redis 连接与事件循环(在 lifespan 中调用)。
+
+        参数:
+        - redis (Redis): Redis 连接。
+        """
+        cls._redis = redis
+        cls._loop = asyncio.get_running_loop()
+
+    @staticmethod
+    def _key(task_id: str) -> str:
+        return f'{RedisInitKeyConfig.FS_TASK.key}:{task_id}'
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        if cls._executor is None:
+            with cls._lock:
+                if cls._executor is None:
+                    cls._executor = ThreadPoolExecutor(
+                        max_workers=settings.FS_TASK_WORKERS,
+                        thread_name_prefix="fs-task"
+                    )
+        return cls._executor
+
+    @classmethod
+    async def _save(cls, task: Dict[str, Any]) -> None:
+        await cls._redis.set(cls._key(task['task_id']), json.dumps(task, default=str), ex=settings.FS_TASK_KEEP_SECONDS)
+
+    @classmethod
+    def _save_threadsafe(cls, task: Dict[str, Any]) -> None:
+        """在执行线程中写入任务状态(提交到事件循环执行并等待完成，保证写入顺序)。"""
+        try:
+            asyncio.run_coroutine_threadsafe(cls._save(dict(task)), cls._loop).result(timeout=5)
+        except Exception as e:
+            logger.warning(f"写入后台文件任务状态失败 {task['task_id']}: {str(e)}")
+
+    @classmethod
+    async def submit(cls, action: str, jobs: List[Tuple[str, Optional[str]]], func: Callable[[str, Optional[str], ProgressCallback], None]) -> Dict[str, Any]:
+        """
+        提交后台任务。
+
+        参数:
+        - action (str): 操作类型(copy/move/delete)。
+        - jobs (List[Tuple[str, Optional[str]]]): (源路径, 目标路径) 列表。
+        - func (Callable): 对每个 job 执行的阻塞函数 func(source, target, progress)。
+
+        返回:
+        - Dict[str, Any]: 任务快照。
+
+        异常:
+        - CustomException: 任务管理器未启动时抛出。
+        """
+        if cls._redis is None:
+            raise CustomException(msg='后台任务管理器未启动')
+        task_id = uuid.uuid4().hex
+        task: Dict[str, Any] = {
+            'task_id': task_id,
+            'action': action,
+            'status': 'pending',
+            'total': None,
+            'done': 0,
+            'error': None,
+            'created_time': datetime.now(),
+            'finished_time': None,
+        }
+        await cls._save(task)
+        last_save = time.monotonic()
+
+        def _progress(n: int) -> None:
+            nonlocal last_save
+            task['done'] += n
+            now = time.monotonic()
+            if now - last_save >= settings.FS_TASK_PROGRESS_INTERVAL:
+                last_save = now
+                cls._save_threadsafe(task)
+
+        def _run() -> None:
+            task['status'] = 'running'
+            try:
+                task['total'] = sum(
+                    FsUtil.scan_tree(source, include_hidden=True)['files'] if os.path.isdir(source) else 1
+                    for source, _ in jobs
+                )
+                cls._save_threadsafe(task)
+                for source, target in jobs:
+                    func(source, target, _progress)
+                task['status'] = 'success'
+            except Exception as e:
+                logger.error(f"后台文件任务失败 {action}: {str(e)}")
+                task['status'] = 'failed'
+                task['error'] = str(e)
+            finally:
+                task['finished_time'] = datetime.now()
+                cls._save_threadsafe(task)
+
+        cls._get_executor().submit(_run)
+        return cls._snapshot(task)
+
+    @classmethod
+    async def get(cls, task_id: str) -> Dict[str, Any]:
+        """
+        获取任务进度。
+
+        参数:
+        - task_id (str): 任务ID。
+
+        返回:
+        - Dict[str, Any]: 任务快照。
+
+        异常:
+        - CustomException: 任务不存在或已过期时抛出。
+        """
+        data = await cls._redis.get(cls._key(task_id)) if cls._redis is not None else None
+        if not data:
+            raise CustomException(msg='任务不存在或已过期')
+        return cls._snapshot(json.loads(data))
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """关闭后台任务线程池。"""
+        with cls._lock:
+            if cls._executor is not None:
+                cls._executor.shutdown(wait=False, cancel_futures=True)
+                cls._executor = None
+
+    @classmethod
+    def _snapshot(cls, task: Dict[str, Any]) -> Dict[str, Any]:
+        snapshot = dict(task)
+        total = snapshot['total']
+        if snapshot['status'] == 'success':
+            # 同文件系统内的移动为原子 rename，不逐个回调进度
+            snapshot['percent'] = 100.0
+        else:
+            snapshot['percent'] = round(min(snapshot['done'], total) * 100 / total, 2) if total else 0.0
+        return snapshot
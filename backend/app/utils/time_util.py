@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 
-import re
-from datetime import datetime
-from typing import Any, List, Dict
+from datetime import date, datetime, timedelta
+from typing import Any, List, Dict, Tuple, Union
 
 class TimeUtil:
     """
@@ -10,6 +9,33 @@ class TimeUtil:
     """
     
     DEFAULT_DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+    DEFAULT_DATE_FORMAT = '%Y-%m-%d'
+    DEFAULT_MONTH_FORMAT = '%Y-%m'
+
+    @classmethod
+    def period_range(cls, value: Union[str, date, datetime], unit: str) -> Tuple[datetime, datetime]:
+        """
+        获取值所在自然日/自然月的左闭右开时间区间 [start, end)。
+
+        参数:
+        - value (Union[str, date, datetime]): 日期值，字符串格式为 YYYY-MM-DD(day) 或 YYYY-MM(month)。
+        - unit (str): 区间粒度，day 或 month。
+
+        返回:
+        - Tuple[datetime, datetime]: 区间起止时间。
+
+        异常:
+        - ValueError: 粒度不支持或字符串格式不正确时抛出。
+        """
+        if isinstance(value, str):
+            pattern = cls.DEFAULT_MONTH_FORMAT if unit == 'month' else cls.DEFAULT_DATE_FORMAT
+            value = datetime.strptime(value.strip(), pattern)
+        start = datetime(value.year, value.month, 1 if unit == 'month' else value.day)
+        if unit == 'day':
+            return start, start + timedelta(days=1)
+        if unit == 'month':
+            return start, datetime(start.year + start.month // 12, start.month % 12 + 1, 1)
+        raise ValueError(f"不支持的时间区间粒度: {unit}")
     
     @classmethod
     def object_format_datetime(cls, obj: Any) -> Any:
@@ -63,219 +89,3 @@ class TimeUtil:
             return value
             
         return [_format_value(item) for item in dicts]
-
-    @classmethod
-    def __valid_range(cls, search_str: str, start_range: int, end_range: int) -> bool:
-        """
-        校验范围字符串是否合法。
-        
-        参数:
-        - search_str (str): 范围字符串（例如："1-5"）。
-        - start_range (int): 允许的最小范围值。
-        - end_range (int): 允许的最大范围值。
-        
-        返回:
-        - bool: 校验是否通过。
-        """
-        match = re.match(r'^(\d+)-(\d+)$', search_str)
-        if match:
-            start, end = int(match.group(1)), int(match.group(2))
-            return start_range <= start < end <= end_range
-        return False
-
-    @classmethod
-    def __valid_sum(cls, search_str: str, start_range_a: int, start_range_b: int, end_range_a: int, end_range_b: int, sum_range: int) -> bool:
-        """
-        校验和字符串是否合法。
-        
-        参数:
-        - search_str (str): 和字符串（例如："1/5"）。
-        - start_range_a (int): 允许的最小范围值A。
-        - start_range_b (int): 允许的最大范围值A。
-        - end_range_a (int): 允许的最小范围值B。
-        - end_range_b (int): 允许的最大范围值B。
-        - sum_range (int): 允许的最大和值。
-        
-        返回:
-        - bool: 校验是否通过。
-        """
-        match = re.match(r'^(\d+)/(\d+)$', search_str)
-        if match:
-            start, end = int(match.group(1)), int(match.group(2))
-            return (
-                start_range_a <= start <= start_range_b
-                and end_range_a <= end <= end_range_b
-                and start + end <= sum_range
-            )
-        return False
-
-    @classmethod
-    def validate_second_or_minute(cls, second_or_minute: str):
-        """
-        校验秒或分钟字段的合法性。
-
-        参数:
-        - second_or_minute (str): 秒或分钟值。
-
-        返回:
-        - bool: 校验是否通过。
-        """
-        if (
-            second_or_minute == '*'
-            or ('-' in second_or_minute and cls.__valid_range(second_or_minute, 0, 59))
-            or ('/' in second_or_minute and cls.__valid_sum(second_or_minute, 0, 58, 1, 59, 59))
-            or re.match(r'^(?:[0-5]?\d|59)(?:,[0-5]?\d|59)*$', second_or_minute)
-        ):
-            return True
-        return False
-
-    @classmethod
-    def validate_hour(cls, hour: str):
-        """
-        校验小时字段的合法性。
-
-        参数:
-        - hour (str): 小时值。
-
-        返回:
-        - bool: 校验是否通过。
-        """
-        if (
-            hour == '*'
-            or ('-' in hour and cls.__valid_range(hour, 0, 23))
-            or ('/' in hour and cls.__valid_sum(hour, 0, 22, 1, 23, 23))
-            or re.match(r'^(?:0|[1-9]|1\d|2[0-3])(?:,(?:0|[1-9]|1\d|2[0-3]))*$', hour)
-        ):
-            return True
-        return False
-
-    @classmethod
-    def validate_day(cls, day: str):
-        """
-        校验日期字段的合法性。
-
-        参数:
-        - day (str): 日值。
-
-        返回:
-        - bool: 校验是否通过。
-        """
-        if (
-            day in ['*', '?', 'L']
-            or ('-' in day and cls.__valid_range(day, 1, 31))
-            or ('/' in day and cls.__valid_sum(day, 1, 30, 1, 30, 31))
-            or ('W' in day and re.match(r'^(?:[1-9]|1\d|2\d|3[01])W$', day))
-            or re.match(r'^(?:0|[1-9]|1\d|2[0-9]|3[0-1])(?:,(?:0|[1-9]|1\d|2[0-9]|3[0-1]))*$', day)
-        ):
-            return True
-        return False
-
-    @classmethod
-    def validate_month(cls, month: str):
-        """
-        校验月份字段的合法性。
-
-        参数:
-        - month (str): 月值。
-
-        返回:
-        - bool: 校验是否通过。
-        """
-        if (
-            month == '*'
-            or ('-' in month and cls.__valid_range(month, 1, 12))
-            or ('/' in month and cls.__valid_sum(month, 1, 11, 1, 11, 12))
-            or re.match(r'^(?:0|[1-9]|1[0-2])(?:,(?:0|[1-9]|1[0-2]))*$', month)
-        ):
-            return True
-        return False
-
-    @classmethod
-    def validate_week(cls, week: str):
-        """
-        校验星期字段的合法性。
-
-        参数:
-        - week (str): 周值。
-
-        返回:
-        - bool: 校验是否通过。
-        """
-        if (
-            week in ['*', '?']
-            or ('-' in week and cls.__valid_range(week, 1, 7))
-            or ('#' in week and re.match(r'^[1-7]#[1-4]$', week))
-            or ('L' in week and re.match(r'^[1-7]L$', week))
-            or re.match(r'^[1-7](?:(,[1-7]))*$', week)
-        ):
-            return True
-        return False
-
-    @classmethod
-    def validate_year(cls, year: str):
-        """
-        校验年份字段的合法性。
-
-        参数:
-        - year (str): 年值。
-
-        返回:
-        - bool: 校验是否通过。
-        """
-        current_year = int(datetime.now().year)
-        future_years = [current_year + i for i in range(9)]
-        if (
-            year == '*'
-            or ('-' in year and cls.__valid_range(year, current_year, 2099))
-            or ('/' in year and cls.__valid_sum(year, current_year, 2098, 1, 2099 - current_year, 2099))
-            or ('#' in year and re.match(r'^[1-7]#[1-4]$', year))
-            or ('L' in year and re.match(r'^[1-7]L$', year))
-            or (
-                (len(year) == 4 or ',' in year)
-                and all(int(item) in future_years and current_year <= int(item) <= 2099 for item in year.split(','))
-            )
-        ):
-            return True
-        return False
-
-    @classmethod
-    def validate_cron_expression(cls, cron_expression: str):
-        """
-        校验 Cron 表达式是否正确。
-        * * * * * *
-        | | | | | |
-        | | | | | +--- 星期（0-7，0和7都表示星期日）
-        | | | | +----- 月份（1-12）
-        | | | +------- 日期（1-31）
-        | | +--------- 小时（0-23）
-        | +----------- 分钟（0-59）
-        +------------- 秒（0-59），部分环境不支持秒字段。
-
-        参数:
-        - cron_expression (str): Cron 表达式。
-
-        返回:
-        - bool: 校验是否通过。
-        """
-        values = cron_expression.split()
-        if len(values) != 6 and len(values) != 7:
-            return False
-        second_validation = cls.validate_second_or_minute(values[0])
-        minute_validation = cls.validate_second_or_minute(values[1])
-        hour_validation = cls.validate_hour(values[2])
-        day_validation = cls.validate_day(values[3])
-        month_validation = cls.validate_month(values[4])
-        week_validation = cls.validate_week(values[5])
-        validation = (
-            second_validation
-            and minute_validation
-            and hour_validation
-            and day_validation
-            and month_validation
-            and week_validation
-        )
-        if len(values) == 6:
-            return validation
-        if len(values) == 7:
-            year_validation = cls.validate_year(values[6])
-            return validation and year_validation
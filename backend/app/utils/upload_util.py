@@ -1,9 +1,15 @@
 # -*- coding: utf-8 -*-
 
+import os
+import time
+import shutil
 import random
+import hashlib
 import mimetypes
+from concurrent.futures import ThreadPoolExecutor
+from stat import S_ISREG
 from datetime import datetime
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 import aiofiles
 from fastapi import UploadFile
 from pathlib import Path
@@ -12,6 +18,7 @@ from urllib.parse import urljoin
 from app.config.setting import settings
 from app.core.exceptions import CustomException
 from app.core.logger import logger
+from app.utils.fs_util import FsUtil
 
 class UploadUtil:
     """
@@ -149,13 +156,13 @@ class UploadUtil:
         return f'{name}_{timestamp}{settings.UPLOAD_MACHINE}{cls.generate_random_number()}.{ext}'
     
     @staticmethod
-    def generate_file(filepath: Path, chunk_size: int = 8192):
+    def generate_file(filepath: Path, chunk_size: int = settings.DOWNLOAD_CHUNK_SIZE):
         """
-        根据文件生成二进制数据迭代器。
+        根据文件生成二进制数据迭代器（仅用于需要在内存中处理文件内容的场景，下载文件请使用 UploadFileResponse）。
         
         参数:
         - filepath (Path): 文件路径。
-        - chunk_size (int): 分块大小，默认 8192 字节。
+        - chunk_size (int): 分块大小，默认 settings.DOWNLOAD_CHUNK_SIZE。
         
         返回:
         - Iterator[bytes]: 文件二进制数据分块迭代器。
@@ -240,16 +247,182 @@ class UploadUtil:
         return [{"name": item.name, "is_dir": item.is_dir()} for item in Path(file_path).iterdir()]
 
     @classmethod
-    async def download_file(cls, file_path: str) -> str:
+    async def download_file(cls, file_path: str) -> Tuple[str, os.stat_result]:
         """
-        下载文件，生成新的文件名。
+        获取下载文件的文件名与文件状态，由 UploadFileResponse 直接发送文件内容。
         
         参数:
         - file_path (str): 文件路径。
         
         返回:
-        - str: 文件下载信息。
+        - Tuple[str, os.stat_result]: (文件名, 文件状态)。
+        
+        异常:
+        - CustomException: 当文件不存在或不是普通文件时抛出。
+        """
+        try:
+            st = await FsUtil.run(os.stat, file_path)
+        except OSError:
+            raise CustomException(msg='文件不存在')
+        if not S_ISREG(st.st_mode):
+            raise CustomException(msg='路径不是文件')
+        return Path(file_path).name, st
+
+    @staticmethod
+    def check_file_name_extension(filename: str) -> bool:
+        """
+        根据文件名检查文件后缀是否合法（分片上传没有 content_type）。
+        
+        参数:
+        - filename (str): 文件名。
+        
+        返回:
+        - bool: 文件后缀是否合法。
+        """
+        return os.path.splitext(filename)[1].lower() in settings.ALLOWED_EXTENSIONS
+
+    @staticmethod
+    def get_chunk_dir(upload_id: str) -> Path:
+        """
+        获取分片上传任务的临时目录。
+        
+        参数:
+        - upload_id (str): 上传任务ID。
+        
+        返回:
+        - Path: 临时目录。
+        """
+        return settings.UPLOAD_CHUNK_TEMP_PATH.joinpath(upload_id)
+
+    @classmethod
+    def get_chunk_path(cls, upload_id: str, index: int) -> Path:
+        """
+        获取分片文件路径。
+        
+        参数:
+        - upload_id (str): 上传任务ID。
+        - index (int): 分片序号(从0开始)。
+        
+        返回:
+        - Path: 分片文件路径。
+        """
+        return cls.get_chunk_dir(upload_id).joinpath(f'{index}.part')
+
+    @staticmethod
+    def _copy_range(source: Path, target_fd: int, offset: int) -> None:
+        """
+        将分片写入目标文件的指定偏移，优先使用内核态的 os.copy_file_range。
+        
+        参数:
+        - source (Path): 分片文件路径。
+        - target_fd (int): 目标文件描述符。
+        - offset (int): 写入偏移。
+        """
+        with source.open('rb') as f:
+            remaining = os.fstat(f.fileno()).st_size
+            src_offset = 0
+            if hasattr(os, 'copy_file_range'):
+                try:
+                    while remaining > 0:
+                        copied = os.copy_file_range(f.fileno(), target_fd, remaining, src_offset, offset + src_offset)
+                        if copied == 0:
+                            break
+                        src_offset += copied
+                        remaining -= copied
+                    return
+                except OSError:
+                    # 跨文件系统或文件系统不支持时回退为普通读写
+                    pass
+            f.seek(src_offset)
+            while chunk := f.read(settings.DOWNLOAD_CHUNK_SIZE):
+                os.pwrite(target_fd, chunk, offset + src_offset)
+                src_offset += len(chunk)
+
+    @staticmethod
+    def file_sha256(filepath: Path) -> str:
+        """
+        计算文件 SHA-256。
+        
+        参数:
+        - filepath (Path): 文件路径。
+        
+        返回:
+        - str: 十六进制摘要。
+        """
+        digest = hashlib.sha256()
+        with filepath.open('rb') as f:
+            while block := f.read(1024 * 1024):
+                digest.update(block)
+        return digest.hexdigest()
+
+    @classmethod
+    def assemble_chunks(cls, upload_id: str, total_chunks: int, chunk_size: int, file_size: int, target: Path) -> str:
+        """
+        并行合并分片到目标文件并返回 SHA-256（阻塞调用，需在 FsUtil 线程池中执行）。
+        
+        目标文件预先分配大小，各分片按偏移并行写入，互不依赖。
+        
+        参数:
+        - upload_id (str): 上传任务ID。
+        - total_chunks (int): 分片总数。
+        - chunk_size (int): 分片大小。
+        - file_size (int): 文件总大小。
+        - target (Path): 目标文件路径(不能已存在)。
+        
+        返回:
+        - str: 合并后文件的 SHA-256。
+        """
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        try:
+            os.ftruncate(fd, file_size)
+            workers = max(1, min(settings.UPLOAD_CHUNK_ASSEMBLE_WORKERS, total_chunks))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='chunk-assemble') as executor:
+                futures = [
+                    executor.submit(cls._copy_range, cls.get_chunk_path(upload_id, index), fd, index * chunk_size)
+                    for index in range(total_chunks)
+                ]
+                for future in futures:
+                    future.result()
+        except Exception:
+            os.close(fd)
+            target.unlink(missing_ok=True)
+            raise
+        os.close(fd)
+        return cls.file_sha256(target)
+
+    @classmethod
+    def remove_chunks(cls, upload_id: str) -> None:
+        """
+        删除分片上传任务的临时目录。
+        
+        参数:
+        - upload_id (str): 上传任务ID。
+        """
+        shutil.rmtree(cls.get_chunk_dir(upload_id), ignore_errors=True)
+
+    @staticmethod
+    def prune_chunks(expire: Optional[int] = None) -> int:
+        """
+        清理超过保留时间未完成的分片临时目录（Redis 中的任务已过期）。
+        
+        参数:
+        - expire (Optional[int]): 保留时间(秒)，默认 settings.UPLOAD_CHUNK_EXPIRE。
+        
+        返回:
+        - int: 清理的目录数。
         """
-        filename = cls.generate_file(Path(file_path))
-        return str(filename)
-    
\ No newline at end of file
+        root = settings.UPLOAD_CHUNK_TEMP_PATH
+        if not root.is_dir():
+            return 0
+        deadline = time.time() - (expire or settings.UPLOAD_CHUNK_EXPIRE)
+        removed = 0
+        with os.scandir(root) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False) and entry.stat().st_mtime < deadline:
+                        shutil.rmtree(entry.path, ignore_errors=True)
+                        removed += 1
+                except OSError:
+                    continue
+        return removed
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+"""
+批量写入基准：逐行 flush/refresh、逐行 INSERT ... RETURNING 与 bulk_create
+
+分别写入 1、100、10000 条公告，输出每种方式的语句数与中位耗时；每轮写入后回滚。
+
+用法(backend 目录下): python -m benchmarks.bench_bulk_create --sizes 1 100 10000
+"""
+
+import argparse
+import asyncio
+import itertools
+import statistics
+import time
+from typing import Awaitable, Callable, Dict, List
+
+from benchmarks.common import count_statements, create_tables, print_table
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import session_connect
+from app.api.v1.module_system.auth.schema import AuthSchema
+from app.api.v1.module_system.notice.crud import NoticeCRUD
+from app.api.v1.module_system.notice.model import NoticeModel
+
+_serial = itertools.count()
+
+
+def notices(size: int) -> List[Dict]:
+    return [{"notice_title": f"notice_{next(_serial)}", "notice_type": "1", "notice_content": "x" * 200, "status": True} for _ in range(size)]
+
+
+async def orm_flush_refresh(db: AsyncSession, auth: AuthSchema, data: List[Dict]) -> None:
+    """改造前 create 的写法：逐行 add/flush/refresh"""
+    for item in data:
+        obj = NoticeModel(**item)
+        db.add(obj)
+        await db.flush()
+        await db.refresh(obj)
+
+
+async def create_returning(db: AsyncSession, auth: AuthSchema, data: List[Dict]) -> None:
+    """逐行调用 CRUDBase.create(INSERT ... RETURNING)"""
+    crud = NoticeCRUD(auth)
+    for item in data:
+        await crud.create(data=item)
+
+
+async def bulk_create(db: AsyncSession, auth: AuthSchema, data: List[Dict]) -> None:
+    """CRUDBase.bulk_create 一次 executemany"""
+    await NoticeCRUD(auth).bulk_create(data=data)
+
+
+METHODS: Dict[str, Callable[[AsyncSession, AuthSchema, List[Dict]], Awaitable[None]]] = {
+    "flush+refresh": orm_flush_refresh,
+    "create RETURNING": create_returning,
+    "bulk_create": bulk_create,
+}
+
+
+async def run(sizes: List[int], repeat: int) -> None:
+    create_tables()
+    results = []
+    for size in sizes:
+        # 大批量只执行一次
+        rounds = max(1, min(repeat, 1000 // size))
+        for name, method in METHODS.items():
+            costs = []
+            statements = 0
+            for _ in range(rounds):
+                data = notices(size)
+                async with session_connect() as db:
+                    auth = AuthSchema.model_construct(db=db, user=None, check_data_scope=False)
+                    with count_statements() as executed:
+                        start = time.perf_counter()
+                        await method(db, auth, data)
+                        costs.append((time.perf_counter() - start) * 1000)
+                    statements = len(executed)
+                    await db.rollback()
+            results.append({"rows": size, "method": name, "statements": statements, "median_ms": f"{statistics.median(costs):.1f}"})
+    print_table("批量写入公告", results)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 100, 10000], help="每轮写入条数")
+    parser.add_argument("--repeat", type=int, default=5, help="每种方式执行次数(大批量自动减少)")
+    args = parser.parse_args()
+    asyncio.run(run(sizes=args.sizes, repeat=args.repeat))
+
+
+if __name__ == "__main__":
+    main()
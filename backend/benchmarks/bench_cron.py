@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+
+"""
+Cron 表达式基准：编译、校验与计算后续触发时间
+
+随机生成指定数量的不同 Quartz 表达式(含 L、W、#、nL 等日期字段写法)后测量:
+- 编译(清空编译缓存)与命中编译缓存
+- validate_cron_expression(编译并确认 2099 年前存在触发时间)
+- 每个表达式计算后 n 次触发时间
+另取不含特殊写法的表达式，与 APScheduler CronTrigger 逐次计算的结果比对并对比耗时。
+
+用法(backend 目录下): python -m benchmarks.bench_cron --count 5000 --fires 5
+"""
+
+import argparse
+import random
+from datetime import datetime, timedelta
+from typing import Callable, List
+from zoneinfo import ZoneInfo
+
+from benchmarks.common import measure, print_table
+
+from apscheduler.triggers.cron import CronTrigger
+
+from app.utils.cron_util import CronUtil, _compile
+
+TZ = "Asia/Shanghai"
+
+
+def _simple_field(rand: random.Random, low: int, high: int) -> str:
+    """生成 * a a-b */n a,b 形式的字段"""
+    kind = rand.randrange(5)
+    if kind == 0:
+        return "*"
+    if kind == 1:
+        return str(rand.randint(low, high))
+    if kind == 2:
+        start = rand.randint(low, high - 1)
+        return f"{start}-{rand.randint(start + 1, high)}"
+    if kind == 3:
+        return f"*/{rand.randint(2, max(2, (high - low) // 2))}"
+    first, second = sorted(rand.sample(range(low, high + 1), 2))
+    return f"{first},{second}"
+
+
+def simple_expression(rand: random.Random) -> str:
+    """不含 L/W/# 的表达式(日取 1-28，保证每月都可触发)"""
+    return " ".join([
+        _simple_field(rand, 0, 59),
+        _simple_field(rand, 0, 59),
+        _simple_field(rand, 0, 23),
+        _simple_field(rand, 1, 28),
+        _simple_field(rand, 1, 12),
+        "?",
+    ])
+
+
+def special_expression(rand: random.Random) -> str:
+    """日或星期字段使用 L、L-n、nW、LW、nL、n#k 的表达式"""
+    day, week = "?", "?"
+    if rand.random() < 0.5:
+        day = rand.choice(["L", f"L-{rand.randint(1, 5)}", f"{rand.randint(1, 28)}W", "LW"])
+    else:
+        week = rand.choice([f"{rand.randint(1, 7)}L", f"{rand.randint(1, 7)}#{rand.randint(1, 4)}", "L"])
+    return " ".join([str(rand.randint(0, 59)), str(rand.randint(0, 59)), _simple_field(rand, 0, 23), day, _simple_field(rand, 1, 12), week])
+
+
+def generate(count: int, seed: int = 0) -> List[str]:
+    """生成 count 个不同的表达式，其中约四分之一使用特殊写法"""
+    rand = random.Random(seed)
+    expressions = set()
+    while len(expressions) < count:
+        expressions.add(special_expression(rand) if rand.random() < 0.25 else simple_expression(rand))
+    return sorted(expressions)
+
+
+def compile_all(expressions: List[str]) -> None:
+    for expression in expressions:
+        CronUtil.compile(expression)
+
+
+def cold_compile_all(expressions: List[str]) -> None:
+    _compile.cache_clear()
+    compile_all(expressions)
+
+
+def validate_all(expressions: List[str]) -> None:
+    for expression in expressions:
+        assert CronUtil.validate_cron_expression(expression), expression
+
+
+def fire_times(expressions: List[str], start: datetime, n: int) -> List[List[datetime]]:
+    return [CronUtil.compile(expression).next_fire_times(n, start=start, tz=TZ) for expression in expressions]
+
+
+def apscheduler_trigger(expression: str) -> CronTrigger:
+    second, minute, hour, day, month, _ = expression.split()
+    return CronTrigger(second=second, minute=minute, hour=hour, day=day, month=month, timezone=TZ)
+
+
+def apscheduler_fire_times(triggers: List[CronTrigger], start: datetime, n: int) -> List[List[datetime]]:
+    result = []
+    for trigger in triggers:
+        times, current = [], start
+        while len(times) < n:
+            fire_time = trigger.get_next_fire_time(None, current)
+            times.append(fire_time)
+            current = fire_time + timedelta(seconds=1)
+        result.append(times)
+    return result
+
+
+def per_call(func: Callable[[], object], calls: int, repeat: int) -> str:
+    return f"{measure(func, repeat=repeat) * 1000 / calls:.2f}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=5000, help="表达式数量")
+    parser.add_argument("--fires", type=int, default=5, help="每个表达式计算的触发次数")
+    parser.add_argument("--repeat", type=int, default=5, help="每种操作执行轮数")
+    args = parser.parse_args()
+
+    expressions = generate(args.count)
+    simple = [expression for expression in expressions if not any(char in expression for char in "LW#")]
+    start = datetime.now(ZoneInfo(TZ)).replace(microsecond=0)
+    print(f"生成表达式: {len(expressions)} 个, 其中不含特殊写法 {len(simple)} 个")
+
+    compile_all(expressions)
+    print_table(f"编译与校验({len(expressions)} 个表达式)", [
+        {"operation": "编译(清空缓存)", "us_per_expr": per_call(lambda: cold_compile_all(expressions), len(expressions), args.repeat)},
+        {"operation": "编译(命中缓存)", "us_per_expr": per_call(lambda: compile_all(expressions), len(expressions), args.repeat)},
+        {"operation": "validate_cron_expression", "us_per_expr": per_call(lambda: validate_all(expressions), len(expressions), args.repeat)},
+        {"operation": f"后 {args.fires} 次触发时间", "us_per_expr": per_call(lambda: fire_times(expressions, start, args.fires), len(expressions), args.repeat)},
+    ])
+
+    triggers = [apscheduler_trigger(expression) for expression in simple]
+    expected = apscheduler_fire_times(triggers, start, args.fires)
+    assert fire_times(simple, start, args.fires) == expected, "与 APScheduler CronTrigger 的计算结果不一致"
+    print_table(f"后 {args.fires} 次触发时间(不含特殊写法的 {len(simple)} 个表达式)", [
+        {"method": "APScheduler CronTrigger", "us_per_expr": per_call(lambda: apscheduler_fire_times(triggers, start, args.fires), len(simple), args.repeat)},
+        {"method": "CronSchedule 位图", "us_per_expr": per_call(lambda: fire_times(simple, start, args.fires), len(simple), args.repeat)},
+    ])
+
+
+if __name__ == "__main__":
+    main()
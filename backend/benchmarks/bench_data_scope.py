@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+"""
+部门数据权限统计语句基准：相关 EXISTS 与非相关半连接
+
+旧写法 creator.has(UserModel.dept_id.in_(...)) 编译为相关 EXISTS，对主表每一行回查用户表；
+现写法 creator_id IN (SELECT id FROM system_users WHERE dept_id IN (...)) 子查询只执行一次。
+在 system_log 中生成指定行数后分别执行两种 COUNT，输出耗时与执行计划。
+
+用法(backend 目录下): python -m benchmarks.bench_data_scope --rows 1000000
+"""
+
+import argparse
+import asyncio
+import random
+import sqlite3
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from benchmarks.common import ameasure, create_tables, database_path, print_table
+
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import session_connect
+from app.api.v1.module_system.auth.schema import AuthSchema
+from app.api.v1.module_system.log.crud import OperationLogCRUD
+from app.api.v1.module_system.log.model import OperationLogModel
+from app.api.v1.module_system.user.model import UserModel
+
+
+def populate(rows: int, users: int, depts: int) -> None:
+    """直接写入部门、用户与日志数据"""
+    conn = sqlite3.connect(database_path())
+    now = datetime.now()
+    conn.executemany(
+        "INSERT INTO system_dept (id, name, \"order\", status, created_at, updated_at) VALUES (?, ?, ?, 1, ?, ?)",
+        [(i, f"dept_{i}", i, now, now) for i in range(1, depts + 1)],
+    )
+    conn.executemany(
+        "INSERT INTO system_users (id, username, password, name, status, is_superuser, dept_id, created_at, updated_at) "
+        "VALUES (?, ?, 'x', ?, 1, 0, ?, ?, ?)",
+        [(i, f"user_{i}", f"user_{i}", (i % depts) + 1, now, now) for i in range(1, users + 1)],
+    )
+    rand = random.Random(0)
+    batch = []
+    for i in range(1, rows + 1):
+        batch.append((1 + i % 2, "/api/v1/system/user/list", "GET", 200, rand.randint(1, users), now - timedelta(seconds=i), now))
+        if len(batch) >= 50000:
+            conn.executemany(
+                "INSERT INTO system_log (type, request_path, request_method, response_code, creator_id, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                batch,
+            )
+            batch.clear()
+    if batch:
+        conn.executemany(
+            "INSERT INTO system_log (type, request_path, request_method, response_code, creator_id, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            batch,
+        )
+    conn.commit()
+    conn.execute("ANALYZE")
+    conn.close()
+
+
+async def explain(db: AsyncSession, sql) -> str:
+    """SQLite 执行计划"""
+    compiled = sql.compile(dialect=db.get_bind().dialect, compile_kwargs={"literal_binds": True})
+    result = await db.execute(text(f"EXPLAIN QUERY PLAN {compiled}"))
+    return " / ".join(row[3] for row in result.all())
+
+
+async def run(rows: int, users: int, depts: int, scope: int, repeat: int) -> None:
+    create_tables()
+    print(f"生成数据: {rows} 行日志, {users} 个用户, {depts} 个部门")
+    populate(rows=rows, users=users, depts=depts)
+
+    scope_depts = [SimpleNamespace(id=i) for i in range(1, scope + 1)]
+    current_user = SimpleNamespace(id=1, is_superuser=False, dept_id=1, roles=[SimpleNamespace(data_scope=5, depts=scope_depts)])
+
+    async with session_connect() as db:
+        auth = AuthSchema.model_construct(db=db, user=current_user, check_data_scope=True)
+        # 当前代码生成的权限条件
+        semi_join = await OperationLogCRUD(auth)._CRUDBase__permission_condition()
+        correlated = OperationLogModel.creator.has(UserModel.dept_id.in_([dept.id for dept in scope_depts]))
+
+        results = []
+        for name, condition in (("correlated EXISTS", correlated), ("semi-join IN", semi_join)):
+            sql = select(func.count()).select_from(OperationLogModel).where(condition)
+            total = (await db.execute(sql)).scalar()
+            cost = await ameasure(lambda: db.execute(sql), repeat=repeat)
+            results.append({"plan": name, "count": total, "median_ms": f"{cost:.1f}", "query_plan": await explain(db, sql)})
+
+    assert results[0]["count"] == results[1]["count"], "两种写法统计结果不一致"
+    print_table(f"数据权限 COUNT(自定义数据权限 {scope} 个部门)", results)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000, help="日志行数")
+    parser.add_argument("--users", type=int, default=2000, help="用户数")
+    parser.add_argument("--depts", type=int, default=20, help="部门数")
+    parser.add_argument("--scope", type=int, default=3, help="数据权限包含的部门数")
+    parser.add_argument("--repeat", type=int, default=5, help="每种写法执行次数")
+    args = parser.parse_args()
+    asyncio.run(run(rows=args.rows, users=args.users, depts=args.depts, scope=args.scope, repeat=args.repeat))
+
+
+if __name__ == "__main__":
+    main()
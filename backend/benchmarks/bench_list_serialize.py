@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+"""
+列表响应序列化基准：逐行 model_dump + JSONResponse 与 models_to_json + FastJSONResponse
+
+生成指定行数的操作日志后一次查出，不分页返回全部数据，分别测量两种方式从 ORM 对象到响应体字节的耗时，
+并校验两者解析后的 JSON 一致。
+
+用法(backend 目录下): python -m benchmarks.bench_list_serialize --rows 10000
+"""
+
+import argparse
+import asyncio
+import json
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Sequence
+
+from benchmarks.common import create_tables, measure, print_table
+
+from fastapi.responses import JSONResponse
+
+from app.common.request import PaginationService
+from app.common.response import ResponseSchema, SuccessResponse
+from app.core.database import session_connect
+from app.api.v1.module_system.auth.schema import AuthSchema
+from app.api.v1.module_system.log.crud import OperationLogCRUD
+from app.api.v1.module_system.log.model import OperationLogModel
+from app.api.v1.module_system.log.schema import OperationLogOutSchema
+
+
+def legacy_body(objs: Sequence[OperationLogModel]) -> bytes:
+    """改造前的写法：逐行校验为字典，分页后经 ResponseSchema 与标准库 json 渲染"""
+    data_list = [OperationLogOutSchema.model_validate(obj).model_dump() for obj in objs]
+    result = asyncio.run(PaginationService.paginate(data_list=data_list))
+    content = ResponseSchema(code=0, msg="查询日志成功", data=result).model_dump()
+    return JSONResponse(content=content).body
+
+
+def current_body(objs: Sequence[OperationLogModel]) -> bytes:
+    """当前写法：当前页一次序列化为 JSON 片段，orjson 渲染外层"""
+    result = asyncio.run(PaginationService.paginate(data_list=list(objs), schema=OperationLogOutSchema))
+    return SuccessResponse(data=result, msg="查询日志成功").body
+
+
+async def load(rows: int) -> List[OperationLogModel]:
+    """写入并查出操作日志"""
+    now = datetime.now()
+    data: List[Dict[str, Any]] = [
+        {
+            "type": 2,
+            "request_path": f"/api/v1/system/user/{i}",
+            "request_method": "GET",
+            "request_ip": "127.0.0.1",
+            "login_location": "内网IP",
+            "request_os": "Mac OS X",
+            "request_browser": "Chrome",
+            "response_code": 200,
+            "process_time": "0.0123s",
+            "description": "查询用户",
+            "created_at": now - timedelta(seconds=i),
+            "updated_at": now,
+        }
+        for i in range(rows)
+    ]
+    async with session_connect() as db:
+        auth = AuthSchema.model_construct(db=db, user=None, check_data_scope=False)
+        await OperationLogCRUD(auth).bulk_create(data=data)
+        await db.commit()
+        objs = await OperationLogCRUD(auth).get_list_crud(order_by=[{"created_at": "desc"}])
+        # 预先加载全部字段，计时只包含序列化
+        for obj in objs:
+            OperationLogOutSchema.model_validate(obj)
+        return list(objs)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10000, help="日志行数")
+    parser.add_argument("--repeat", type=int, default=5, help="每种方式执行次数")
+    args = parser.parse_args()
+
+    create_tables()
+    objs = asyncio.run(load(args.rows))
+
+    legacy, current = legacy_body(objs), current_body(objs)
+    assert json.loads(legacy) == json.loads(current), "两种方式输出的 JSON 不一致"
+
+    print_table(f"列表响应序列化({args.rows} 行)", [
+        {"method": "model_dump + JSONResponse", "median_ms": f"{measure(lambda: legacy_body(objs), repeat=args.repeat):.1f}", "bytes": len(legacy)},
+        {"method": "models_to_json + FastJSONResponse", "median_ms": f"{measure(lambda: current_body(objs), repeat=args.repeat):.1f}", "bytes": len(current)},
+    ])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+"""
+资源文件索引基准：目录列表、目录统计与递归名称搜索
+
+在临时目录生成多层目录树(每层 fanout 个子目录，每个目录 files 个文件)以及一个大的平铺目录，
+将 STATIC_ROOT 与索引库指向该临时目录后测量:
+- 索引全量构建与无变化时的对账
+- 单层目录列表(os.scandir)
+- 目录递归统计: 遍历目录树与读取索引目录行
+- 递归名称搜索: 遍历目录树匹配、FTS5 trigram 索引与 LIKE 回退
+
+用法(backend 目录下): python -m benchmarks.bench_resource_index --depth 3 --fanout 10 --files 20
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import List
+
+from benchmarks.common import measure, print_table
+
+from app.config.setting import settings
+from app.utils.fs_util import FsUtil
+from app.utils.file_index_util import FileIndexUtil
+from app.api.v1.module_monitor.resource.service import ResourceService
+
+WORDS = ["alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel"]
+
+
+def populate(root: str, depth: int, fanout: int, files: int, flat: int) -> int:
+    """生成目录树与平铺目录，返回文件总数"""
+    count = 0
+    stack = [(root, 0)]
+    while stack:
+        current, level = stack.pop()
+        for index in range(files):
+            with open(os.path.join(current, f"file_{count:07d}_{WORDS[count % len(WORDS)]}.txt"), "wb") as f:
+                f.write(b"x" * (count % 512))
+            count += 1
+        if level < depth:
+            for index in range(fanout):
+                child = os.path.join(current, f"dir_{level}_{index}")
+                os.mkdir(child)
+                stack.append((child, level + 1))
+
+    flat_dir = os.path.join(root, "flat")
+    os.mkdir(flat_dir)
+    for index in range(flat):
+        with open(os.path.join(flat_dir, f"item_{index:07d}_{WORDS[index % len(WORDS)]}.dat"), "wb") as f:
+            f.write(b"x")
+    return count + flat
+
+
+def walk_search(root: str, keyword: str) -> List[str]:
+    """未建索引时的递归搜索: 遍历目录树逐个匹配名称"""
+    keyword = keyword.lower()
+    matches = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [name for name in dirnames if not name.startswith(".")]
+        for name in dirnames + filenames:
+            if not name.startswith(".") and keyword in name.lower():
+                matches.append(os.path.join(dirpath, name))
+    return matches
+
+
+def indexed_search(root: str, keyword: str, fts: bool) -> List:
+    """通过索引搜索，fts 为 False 时按 LIKE 回退路径执行"""
+    original = FileIndexUtil._fts
+    FileIndexUtil._fts = original and fts
+    try:
+        return FileIndexUtil.search(keyword=keyword, abs_dir=root, limit=10_000_000)
+    finally:
+        FileIndexUtil._fts = original
+
+
+def run(depth: int, fanout: int, files: int, flat: int, keyword: str, repeat: int) -> None:
+    tmp_dir = tempfile.mkdtemp(prefix="fastapiadmin-bench-resource-")
+    try:
+        root = os.path.join(tmp_dir, "static")
+        os.mkdir(root)
+        settings.STATIC_ROOT = Path(root)
+        settings.RESOURCE_INDEX_FILE = Path(tmp_dir).joinpath("resource_index.db")
+
+        total = populate(root, depth=depth, fanout=fanout, files=files, flat=flat)
+        print(f"生成数据: {total} 个文件, 深度 {depth}, 每层 {fanout} 个子目录, 平铺目录 {flat} 个文件")
+
+        build = measure(FileIndexUtil.reconcile, repeat=1)
+        reconcile = measure(FileIndexUtil.reconcile, repeat=repeat)
+        print_table("索引构建", [
+            {"operation": "全量构建", "median_ms": f"{build:.1f}"},
+            {"operation": "无变化对账", "median_ms": f"{reconcile:.1f}"},
+        ])
+
+        flat_dir = os.path.join(root, "flat")
+        listed = len(ResourceService._scan_directory(flat_dir))
+        listing = measure(lambda: ResourceService._scan_directory(flat_dir), repeat=repeat)
+        print_table("目录列表", [{"directory": "flat", "items": listed, "median_ms": f"{listing:.1f}"}])
+
+        walked = FsUtil.scan_tree(root, True)
+        indexed = FileIndexUtil.get_stats(root)
+        assert walked == indexed, f"统计结果不一致: {walked} != {indexed}"
+        print_table("目录递归统计", [
+            {"method": "scandir 遍历", "files": walked["files"], "dirs": walked["dirs"], "median_ms": f"{measure(lambda: FsUtil.scan_tree(root, True), repeat=repeat):.1f}"},
+            {"method": "索引目录行", "files": indexed["files"], "dirs": indexed["dirs"], "median_ms": f"{measure(lambda: FileIndexUtil.get_stats(root), repeat=repeat):.3f}"},
+        ])
+
+        results = []
+        expected = len(walk_search(root, keyword))
+        for method, func in (
+            ("os.walk 遍历", lambda: walk_search(root, keyword)),
+            ("FTS5 trigram", lambda: indexed_search(root, keyword, fts=True)),
+            ("LIKE 回退", lambda: indexed_search(root, keyword, fts=False)),
+        ):
+            matches = len(func())
+            assert matches == expected, f"{method} 结果数 {matches} 与遍历结果 {expected} 不一致"
+            results.append({"method": method, "matches": matches, "median_ms": f"{measure(func, repeat=repeat):.1f}"})
+        if not FileIndexUtil._fts:
+            results[1]["method"] += "(不可用，等同 LIKE)"
+        print_table(f"递归名称搜索(关键词 {keyword!r})", results)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--depth", type=int, default=3, help="目录树深度")
+    parser.add_argument("--fanout", type=int, default=10, help="每个目录的子目录数")
+    parser.add_argument("--files", type=int, default=20, help="每个目录的文件数")
+    parser.add_argument("--flat", type=int, default=20000, help="平铺目录的文件数")
+    parser.add_argument("--keyword", default="bravo", help="搜索关键词")
+    parser.add_argument("--repeat", type=int, default=5, help="每种方式执行次数")
+    args = parser.parse_args()
+    run(depth=args.depth, fanout=args.fanout, files=args.files, flat=args.flat, keyword=args.keyword, repeat=args.repeat)
+
+
+if __name__ == "__main__":
+    main()
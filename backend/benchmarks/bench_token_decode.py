@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+
+"""
+令牌解析基准：每次请求验签解析与按令牌摘要命中本地缓存
+
+按登录流程签发访问令牌后重复调用 decode_session_token，分别测量关闭缓存(每次验签、解析载荷与会话 JSON)
+与命中缓存时的单次耗时；并测量多个令牌轮流访问(缓存容量内)的情况。
+
+另在临时库中写入用户后端到端调用 get_current_user 依赖(解析令牌、会话检查、查询用户及其关联)，
+对比关闭缓存与命中缓存时每个请求的耗时。会话检查默认使用进程内的会话哈希，传入 --redis-url 时使用真实 Redis。
+
+用法(backend 目录下): python -m benchmarks.bench_token_decode --calls 20000 --requests 2000
+"""
+
+import argparse
+import asyncio
+import sqlite3
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from benchmarks.common import ameasure, create_tables, database_path, measure, print_table
+
+from redis import asyncio as aioredis
+from starlette.requests import Request
+
+from app.config.setting import settings
+from app.core.database import session_connect
+from app.core.dependencies import get_current_user
+from app.core.security import TokenPayloadCache, create_access_token, decode_access_token, decode_session_token
+from app.core.session_store import SessionStore
+from app.api.v1.module_system.auth.schema import JWTPayloadSchema
+from app.api.v1.module_monitor.online.schema import OnlineOutSchema
+
+
+def issue_token(user_id: int) -> str:
+    """按登录流程签发访问令牌"""
+    session_info = OnlineOutSchema(
+        session_id=uuid.uuid4().hex,
+        user_id=user_id,
+        name=f"user_{user_id}",
+        user_name=f"user_{user_id}",
+        ipaddr="127.0.0.1",
+        login_location="内网IP",
+        os="Mac OS X",
+        browser="Chrome",
+        login_time=datetime.now(),
+        login_type="PC端",
+    ).model_dump_json()
+    return create_access_token(payload=JWTPayloadSchema(
+        sub=session_info,
+        is_refresh=False,
+        exp=datetime.now() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
+        jti=uuid.uuid4().hex,
+    ))
+
+
+def decode_all(tokens: List[str], calls: int) -> None:
+    for index in range(calls):
+        decode_session_token(tokens[index % len(tokens)])
+
+
+class SessionHashes:
+    """进程内的会话哈希，只实现 get_current_user 会话检查用到的 hget"""
+
+    def __init__(self) -> None:
+        self.hashes: Dict[str, Dict[str, str]] = {}
+
+    async def hset(self, name: str, mapping: Dict[str, str]) -> None:
+        self.hashes.setdefault(name, {}).update(mapping)
+
+    async def hget(self, name: str, key: str) -> Optional[str]:
+        return self.hashes.get(name, {}).get(key)
+
+    async def aclose(self) -> None:
+        self.hashes.clear()
+
+
+def create_user(user_id: int) -> None:
+    """直接写入 get_current_user 查询的用户"""
+    conn = sqlite3.connect(database_path())
+    now = datetime.now()
+    conn.execute(
+        "INSERT INTO system_users (id, username, password, name, status, is_superuser, created_at, updated_at) "
+        "VALUES (?, ?, 'x', ?, 1, 0, ?, ?)",
+        (user_id, f"user_{user_id}", f"user_{user_id}", now, now),
+    )
+    conn.commit()
+    conn.close()
+
+
+async def bench_current_user(requests: int, repeat: int, redis_url: Optional[str]) -> None:
+    """端到端调用 get_current_user，对比关闭缓存与命中缓存"""
+    create_tables()
+    create_user(1)
+    token = issue_token(1)
+    payload = decode_access_token(token)
+    session_id = decode_session_token(token)[1]["session_id"]
+
+    redis = aioredis.from_url(redis_url, decode_responses=True) if redis_url else SessionHashes()
+    await redis.hset(SessionStore.key(session_id), mapping={SessionStore.ACCESS_JTI: payload.jti})
+    cache_size = settings.TOKEN_CACHE_SIZE
+
+    async def call_all() -> None:
+        for _ in range(requests):
+            async with session_connect() as db:
+                auth = await get_current_user(request=Request({"type": "http"}), db=db, redis=redis, token=f"Bearer {token}")
+            assert auth.user.username == "user_1"
+
+    results = []
+    try:
+        for name, size in (("关闭缓存", 0), ("命中缓存", cache_size)):
+            settings.TOKEN_CACHE_SIZE = size
+            TokenPayloadCache.clear()
+            await call_all()
+            cost = await ameasure(call_all, repeat=repeat)
+            results.append({"case": name, "us_per_request": f"{cost * 1000 / requests:.1f}"})
+    finally:
+        settings.TOKEN_CACHE_SIZE = cache_size
+        if redis_url:
+            await redis.delete(SessionStore.key(session_id))
+        await redis.aclose()
+
+    session_check = "Redis" if redis_url else "进程内会话哈希"
+    print_table(f"get_current_user({requests} 次请求/轮, 会话检查: {session_check})", results)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=20000, help="每轮解析次数")
+    parser.add_argument("--tokens", type=int, default=1000, help="多令牌轮流访问时的令牌数")
+    parser.add_argument("--requests", type=int, default=2000, help="get_current_user 每轮请求数")
+    parser.add_argument("--redis-url", default=None, help="会话检查使用的 Redis 地址，默认使用进程内会话哈希")
+    parser.add_argument("--repeat", type=int, default=5, help="每种情况执行轮数")
+    args = parser.parse_args()
+
+    single = [issue_token(1)]
+    many = [issue_token(user_id) for user_id in range(1, args.tokens + 1)]
+    cache_size = settings.TOKEN_CACHE_SIZE
+
+    results = []
+    for name, tokens, size in (
+        ("1 个令牌, 关闭缓存", single, 0),
+        ("1 个令牌, 命中缓存", single, cache_size),
+        (f"{args.tokens} 个令牌, 关闭缓存", many, 0),
+        (f"{args.tokens} 个令牌, 命中缓存", many, cache_size),
+    ):
+        settings.TOKEN_CACHE_SIZE = size
+        TokenPayloadCache.clear()
+        # 预热：开启缓存时先写入全部令牌
+        decode_all(tokens, len(tokens))
+        cost = measure(lambda: decode_all(tokens, args.calls), repeat=args.repeat)
+        results.append({"case": name, "us_per_call": f"{cost * 1000 / args.calls:.2f}"})
+    settings.TOKEN_CACHE_SIZE = cache_size
+
+    print_table(f"decode_session_token({args.calls} 次/轮, TOKEN_CACHE_SIZE={cache_size})", results)
+
+    asyncio.run(bench_current_user(requests=args.requests, repeat=args.repeat, redis_url=args.redis_url))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+"""
+基准测试公共工具
+
+各脚本在 backend 目录下以模块方式运行(如 python -m benchmarks.bench_data_scope)，
+须在导入 app 之前导入本模块：数据库指向临时 SQLite 文件，不影响开发库。
+"""
+
+import atexit
+import gc
+import os
+import shutil
+import statistics
+import tempfile
+import time
+import unicodedata
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Iterator, List
+
+os.environ["DATABASE_TYPE"] = "sqlite"
+_tmp_dir = tempfile.mkdtemp(prefix="fastapiadmin-bench-")
+atexit.register(shutil.rmtree, _tmp_dir, ignore_errors=True)
+os.environ["DATABASE_NAME"] = os.path.join(_tmp_dir, "fastapiadmin")
+# 关闭分页总数缓存，每次都执行统计语句
+os.environ["COUNT_CACHE_TTL"] = "0"
+
+from sqlalchemy import create_engine, event
+
+from main import create_app
+from app.config.setting import settings
+from app.core.base_model import MappedBase
+from app.core.database import async_engine
+
+# 注册路由时导入全部模型
+create_app()
+
+
+def database_path() -> str:
+    """临时数据库文件路径"""
+    return os.environ["DATABASE_NAME"] + ".db"
+
+
+def create_tables() -> None:
+    """创建全部数据表"""
+    engine = create_engine(settings.DB_URI)
+    MappedBase.metadata.create_all(engine)
+    engine.dispose()
+
+
+@contextmanager
+def count_statements() -> Iterator[List[str]]:
+    """统计代码块内发往数据库的语句(executemany 计为一条)"""
+    statements: List[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
+def measure(func: Callable[[], Any], repeat: int = 5) -> float:
+    """
+    多次执行取中位耗时，与 timeit 一样计时期间关闭垃圾回收
+
+    参数:
+    - func (Callable[[], Any]): 被测函数。
+    - repeat (int): 执行次数。
+
+    返回:
+    - float: 中位耗时(毫秒)。
+    """
+    costs = []
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            func()
+            costs.append((time.perf_counter() - start) * 1000)
+        finally:
+            gc.enable()
+    return statistics.median(costs)
+
+
+async def ameasure(func: Callable[[], Awaitable[Any]], repeat: int = 5) -> float:
+    """
+    多次执行协程取中位耗时
+
+    参数:
+    - func (Callable[[], Awaitable[Any]]): 返回被测协程的函数。
+    - repeat (int): 执行次数。
+
+    返回:
+    - float: 中位耗时(毫秒)。
+    """
+    costs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await func()
+        costs.append((time.perf_counter() - start) * 1000)
+    return statistics.median(costs)
+
+
+def _width(value: Any) -> int:
+    """终端显示宽度，中文等全角字符占两列"""
+    return sum(2 if unicodedata.east_asian_width(char) in ("W", "F") else 1 for char in str(value))
+
+
+def _pad(value: Any, width: int) -> str:
+    return str(value) + " " * (width - _width(value))
+
+
+def print_table(title: str, rows: List[Dict[str, Any]]) -> None:
+    """按列对齐打印结果"""
+    print(f"\n{title}")
+    if not rows:
+        return
+    headers = list(rows[0].keys())
+    widths = {key: max(_width(key), *(_width(row[key]) for row in rows)) for key in headers}
+    print("  ".join(_pad(key, widths[key]) for key in headers).rstrip())
+    for row in rows:
+        print("  ".join(_pad(row[key], widths[key]) for key in headers).rstrip())
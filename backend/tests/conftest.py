@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import Iterator, List
+
+import pytest
+
+# 测试使用临时 SQLite 数据库，需在导入 app 之前设置
+os.environ["DATABASE_TYPE"] = "sqlite"
+os.environ["DATABASE_NAME"] = os.path.join(tempfile.mkdtemp(prefix="fastapiadmin-test-"), "fastapiadmin")
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from main import create_app
+from app.config.setting import settings
+from app.core.base_model import MappedBase
+from app.core.database import async_engine, session_connect
+from app.api.v1.module_system.auth.schema import AuthSchema
+
+# 注册路由时导入全部模型
+create_app()
+
+
+@pytest.fixture(scope="session")
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def create_tables() -> None:
+    """创建全部数据表"""
+    engine = create_engine(settings.DB_URI)
+    MappedBase.metadata.create_all(engine)
+    engine.dispose()
+
+
+@pytest.fixture
+async def db() -> AsyncSession:
+    """数据库会话，用例结束后回滚"""
+    async with session_connect() as session:
+        yield session
+        await session.rollback()
+
+
+@pytest.fixture
+def auth(db: AsyncSession) -> AuthSchema:
+    """不校验数据权限的认证信息"""
+    return AuthSchema.model_construct(db=db, user=None, check_data_scope=False)
+
+
+@pytest.fixture
+def count_statements():
+    """统计代码块内发往数据库的语句数"""
+
+    @contextmanager
+    def counter() -> Iterator[List[str]]:
+        statements: List[str] = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+            statements.append(statement)
+
+        event.listen(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+    return counter
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+
+"""AI 客户端：共享连接、流式合并、上游流关闭与并发限制(上游为本地伪造的 OpenAI 接口)"""
+
+import json
+from typing import AsyncIterator, Dict, List
+
+import httpx
+import pytest
+from openai import AsyncOpenAI
+
+from app.config.setting import settings
+from app.core.exceptions import CustomException
+from app.utils.ai_util import AIClient
+
+pytestmark = pytest.mark.anyio
+
+
+class FakeStream(httpx.AsyncByteStream):
+    """按 SSE 格式逐个输出 token 的响应体，记录是否被关闭"""
+
+    def __init__(self, tokens: List[str]) -> None:
+        self.tokens = tokens
+        self.sent = 0
+        self.closed = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for token in self.tokens:
+            chunk = {
+                "id": "chatcmpl-fake",
+                "object": "chat.completion.chunk",
+                "created": 0,
+                "model": "fake-model",
+                "choices": [{"index": 0, "delta": {"content": token}, "finish_reason": None}],
+            }
+            self.sent += 1
+            yield f"data: {json.dumps(chunk)}\n\n".encode()
+        yield b"data: [DONE]\n\n"
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+class FakeOpenAI:
+    """伪造的 OpenAI 接口，记录请求与响应流"""
+
+    def __init__(self) -> None:
+        self.tokens: List[str] = []
+        self.status_code = 200
+        self.requests: List[Dict] = []
+        self.streams: List[FakeStream] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(json.loads(request.content))
+        if self.status_code != 200:
+            return httpx.Response(self.status_code, json={"error": {"message": "invalid api key", "type": "invalid_request_error"}})
+        stream = FakeStream(self.tokens)
+        self.streams.append(stream)
+        return httpx.Response(200, headers={"content-type": "text/event-stream"}, stream=stream)
+
+
+@pytest.fixture
+async def fake_openai(monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[FakeOpenAI]:
+    """以伪造接口替换共享客户端"""
+    fake = FakeOpenAI()
+    monkeypatch.setattr(settings, "OPENAI_MODEL", "fake-model")
+    monkeypatch.setattr(settings, "AI_STREAM_FLUSH_CHARS", 64)
+    # 只按字符数合并，结果与执行快慢无关
+    monkeypatch.setattr(settings, "AI_STREAM_FLUSH_INTERVAL", 3600.0)
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(fake.handler))
+    monkeypatch.setattr(AIClient, "_http_client", http_client)
+    monkeypatch.setattr(AIClient, "_client", AsyncOpenAI(api_key="sk-fake", base_url="http://fake-openai/v1", http_client=http_client, max_retries=0))
+    yield fake
+    await AIClient.stop()
+
+
+async def test_stream_is_coalesced(fake_openai: FakeOpenAI) -> None:
+    fake_openai.tokens = [f"{index % 10}" for index in range(200)]
+
+    frames = [frame async for frame in AIClient.process("你好")]
+
+    assert "".join(frames) == "".join(fake_openai.tokens)
+    assert [len(frame) for frame in frames] == [64, 64, 64, 8]
+    assert fake_openai.requests[0]["stream"] is True
+
+
+async def test_client_is_shared(fake_openai: FakeOpenAI) -> None:
+    fake_openai.tokens = ["ok"]
+    client = AIClient.get_client()
+
+    for _ in range(3):
+        assert [frame async for frame in AIClient.process("你好")] == ["ok"]
+
+    assert AIClient.get_client() is client
+    assert len(fake_openai.requests) == 3
+
+
+async def test_upstream_closed_when_consumer_stops(fake_openai: FakeOpenAI) -> None:
+    fake_openai.tokens = ["x" * 64] * 100
+
+    generator = AIClient.process("你好")
+    assert await generator.__anext__() == "x" * 64
+    await generator.aclose()
+
+    stream = fake_openai.streams[0]
+    assert stream.closed
+    assert stream.sent < len(fake_openai.tokens)
+
+
+async def test_upstream_error_is_friendly(fake_openai: FakeOpenAI) -> None:
+    fake_openai.status_code = 401
+
+    frames = [frame async for frame in AIClient.process("你好")]
+
+    assert frames == ["鉴权失败，API Key 无效或已过期。请检查系统配置中的 API Key。"]
+
+
+async def test_user_concurrency_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "OPENAI_USER_CONCURRENCY", 2)
+
+    async with AIClient.acquire("user:1"), AIClient.acquire("user:1"):
+        with pytest.raises(CustomException):
+            async with AIClient.acquire("user:1"):
+                pass
+        # 其他用户不受影响
+        async with AIClient.acquire("user:2"):
+            pass
+
+    async with AIClient.acquire("user:1"):
+        pass
+    assert AIClient._inflight == {}
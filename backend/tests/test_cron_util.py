@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+
+"""Cron 表达式校验"""
+
+import pytest
+
+from app.utils.cron_util import CronUtil
+
+
+@pytest.mark.parametrize("expression", ["0 */5 * * * ?", "0 0 0 29 2 ?", "0 0 0 L 2 ?", "0 0 12 ? * 6#5", "0 0 0 LW * ?"])
+def test_valid_expression(expression: str) -> None:
+    assert CronUtil.validate_cron_expression(expression)
+
+
+@pytest.mark.parametrize(
+    "expression",
+    ["0 0 0 30 2 ?", "0 0 0 31 4,6,9,11 ?", "0 0 0 1 1 ? 2000", "0 0 0 ? * ?", "0 60 * * * ?", "0 0 0 * *"],
+    ids=["feb-30", "short-month-31", "past-year", "double-question", "out-of-range", "too-few-fields"],
+)
+def test_invalid_expression(expression: str) -> None:
+    assert not CronUtil.validate_cron_expression(expression)
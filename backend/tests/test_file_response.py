@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+"""
+UploadFileResponse 的条件请求与 Range 行为
+
+该响应覆盖了 Starlette FileResponse 的私有方法，升级 starlette 后这里的用例应先于线上暴露不兼容。
+"""
+
+import inspect
+from pathlib import Path
+
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import FileResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app.common.response import UploadFileResponse
+
+CONTENT = bytes(range(256)) * 4
+
+
+@pytest.fixture
+def client(tmp_path: Path) -> TestClient:
+    path = tmp_path / "data.bin"
+    path.write_bytes(CONTENT)
+
+    async def download(request):
+        return UploadFileResponse(file_path=str(path), filename="data.bin")
+
+    return TestClient(Starlette(routes=[Route("/download", download, methods=["GET", "HEAD"])]))
+
+
+def test_private_hooks_match_starlette() -> None:
+    # 被覆盖的私有方法在当前 starlette 中存在且参数一致
+    for name in ("_handle_simple", "_handle_single_range", "_handle_multiple_ranges", "_should_use_range"):
+        assert hasattr(FileResponse, name), f"starlette FileResponse 不再提供 {name}"
+        expected = list(inspect.signature(getattr(FileResponse, name)).parameters)
+        actual = list(inspect.signature(getattr(UploadFileResponse, name)).parameters)
+        assert actual == expected, name
+
+
+def test_full_download_and_not_modified(client: TestClient) -> None:
+    response = client.get("/download")
+    assert response.status_code == 200
+    assert response.content == CONTENT
+    assert response.headers["content-length"] == str(len(CONTENT))
+    etag = response.headers["etag"]
+
+    response = client.get("/download", headers={"If-None-Match": f'W/{etag}'})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+
+    response = client.get("/download", headers={"If-Modified-Since": response.headers["last-modified"]})
+    assert response.status_code == 304
+
+    response = client.head("/download")
+    assert response.status_code == 200
+    assert response.content == b""
+
+
+def test_single_and_multiple_ranges(client: TestClient) -> None:
+    response = client.get("/download", headers={"Range": "bytes=10-19"})
+    assert response.status_code == 206
+    assert response.content == CONTENT[10:20]
+    assert response.headers["content-range"] == f"bytes 10-19/{len(CONTENT)}"
+
+    response = client.get("/download", headers={"Range": "bytes=0-3,100-103"})
+    assert response.status_code == 206
+    assert response.headers["content-type"].startswith("multipart/byteranges; boundary=")
+    assert int(response.headers["content-length"]) == len(response.content)
+    assert CONTENT[0:4] in response.content and CONTENT[100:104] in response.content
+
+
+def test_if_range_requires_current_validator(client: TestClient) -> None:
+    etag = client.get("/download").headers["etag"]
+
+    response = client.get("/download", headers={"Range": "bytes=0-9", "If-Range": etag})
+    assert response.status_code == 206
+    assert response.content == CONTENT[:10]
+
+    # 校验器不一致时忽略 Range 返回完整内容
+    response = client.get("/download", headers={"Range": "bytes=0-9", "If-Range": '"stale"'})
+    assert response.status_code == 200
+    assert response.content == CONTENT
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+
+"""RawJSON 片段在响应序列化中原样拼接"""
+
+from datetime import datetime
+
+import orjson
+import pytest
+
+from app.common.response import RawJSON, json_dumps
+
+
+def test_raw_json_inside_dict_and_list() -> None:
+    content = {
+        "rows": [RawJSON(b'{"id":1}'), {"children": RawJSON("[2,3]")}, 4],
+        "pair": (RawJSON("null"), "x"),
+        "time": datetime(2024, 1, 1, 8, 30),
+    }
+
+    assert orjson.loads(json_dumps(content)) == {
+        "rows": [{"id": 1}, {"children": [2, 3]}, 4],
+        "pair": [None, "x"],
+        "time": "2024-01-01 08:30:00",
+    }
+    assert json_dumps([RawJSON("[]"), RawJSON('{"a":1}')]) == b'[[],{"a":1}]'
+
+
+def test_raw_json_in_unsupported_container_is_rejected() -> None:
+    # 不能被编码为带引号的字符串
+    with pytest.raises(TypeError):
+        json_dumps({"values": {RawJSON("1")}})
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+
+"""MongoDB 批量写入缓冲：失败重试、重试后丢弃与缓冲上限"""
+
+import asyncio
+import itertools
+from typing import Dict, List, Optional
+
+import pytest
+from pymongo import ReturnDocument
+from pymongo.errors import AutoReconnect, BulkWriteError
+
+from app.core.mongo_crud import MongoSink
+from app.api.v1.module_system.log.crud import OperationLogMongoCRUD
+
+pytestmark = pytest.mark.anyio
+
+
+class FlakyWriter:
+    """前 failures 次调用失败的写入函数"""
+
+    def __init__(self, failures: int) -> None:
+        self.failures = failures
+        self.calls = 0
+        self.written: List[Dict] = []
+
+    async def __call__(self, documents: List[Dict]) -> int:
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise ConnectionError("mongodb unavailable")
+        self.written.extend(documents)
+        return len(documents)
+
+
+async def test_failed_batch_is_retried() -> None:
+    writer = FlakyWriter(failures=2)
+    sink = MongoSink(name="test", writer=writer, batch_size=10, max_buffer=100, max_retries=3, retry_backoff=0.01)
+    for index in range(25):
+        sink.put({"n": index})
+
+    # 首次失败后处于退避期，不会立即重试
+    assert await sink.flush() == 0
+    assert writer.calls == 1
+    assert await sink.flush() == 0
+
+    await asyncio.sleep(0.02)
+    assert await sink.flush() == 0
+    assert writer.calls == 2
+
+    await asyncio.sleep(0.03)
+    assert await sink.flush() == 25
+    assert [document["n"] for document in writer.written] == list(range(25))
+
+
+async def test_batch_is_dropped_after_retries() -> None:
+    writer = FlakyWriter(failures=100)
+    sink = MongoSink(name="test", writer=writer, batch_size=10, max_buffer=100, max_retries=2, retry_backoff=0.001)
+    for index in range(15):
+        sink.put({"n": index})
+
+    sink.start()
+    await sink.stop()
+
+    # 第一批重试 2 次后丢弃，停止时不再写入剩余文档
+    assert writer.calls == 3
+    assert writer.written == []
+    assert not sink._buffer
+
+
+async def test_stop_waits_for_retry() -> None:
+    writer = FlakyWriter(failures=1)
+    sink = MongoSink(name="test", writer=writer, batch_size=10, max_buffer=100, max_retries=3, retry_backoff=0.01)
+    for index in range(5):
+        sink.put({"n": index})
+
+    assert await sink.flush() == 0
+    sink.start()
+    await sink.stop()
+
+    assert [document["n"] for document in writer.written] == list(range(5))
+
+
+async def test_requeue_is_bounded_by_max_buffer() -> None:
+    sink: MongoSink
+
+    async def writer(documents: List[Dict]) -> int:
+        # 写入期间又放入 15 条新文档
+        for _ in range(15):
+            sink.put({"n": "new"})
+        raise ConnectionError("mongodb unavailable")
+
+    sink = MongoSink(name="test", writer=writer, batch_size=10, max_buffer=20, max_retries=3, retry_backoff=1)
+    for index in range(10):
+        sink.put({"n": index})
+
+    await sink.flush()
+
+    # 放回的批次在队首，只保留放得下的 5 条
+    assert len(sink._buffer) == 20
+    assert [document["n"] for document in sink._buffer][:6] == [0, 1, 2, 3, 4, "new"]
+
+
+class FakeCollection:
+    """内存集合：_id 与 id 唯一，可在写入 fail_after 条后断开连接"""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.documents: Dict[object, Dict] = {}
+        self.fail_after: Optional[int] = None
+        self._object_ids = itertools.count(1)
+
+    async def find_one_and_update(self, filter: Dict, update: Dict, upsert: bool, return_document: ReturnDocument) -> Dict:
+        document = self.documents.setdefault(filter["_id"], {"_id": filter["_id"], "seq": 0})
+        document["seq"] += update["$inc"]["seq"]
+        return dict(document)
+
+    async def insert_many(self, documents: List[Dict], ordered: bool) -> None:
+        errors, inserted = [], 0
+        for index, document in enumerate(documents):
+            if self.fail_after is not None and inserted == self.fail_after:
+                self.fail_after = None
+                raise AutoReconnect("connection reset")
+            # 与 pymongo 一样在客户端为文档生成 _id
+            document.setdefault("_id", next(self._object_ids))
+            for key in ("_id", "id"):
+                if any(stored.get(key) == document[key] for stored in self.documents.values()):
+                    errors.append({"index": index, "code": 11000, "keyPattern": {key: 1}, "errmsg": "duplicate key"})
+                    break
+            else:
+                self.documents[document["_id"]] = dict(document)
+                inserted += 1
+        if errors:
+            raise BulkWriteError({"writeErrors": errors, "nInserted": inserted})
+
+
+class FakeDatabase:
+    def __init__(self) -> None:
+        self.collections: Dict[str, FakeCollection] = {}
+
+    def __getitem__(self, name: str) -> FakeCollection:
+        return self.collections.setdefault(name, FakeCollection(name))
+
+
+async def test_partially_written_batch_is_not_duplicated() -> None:
+    db = FakeDatabase()
+    crud = OperationLogMongoCRUD(db)
+    sink = MongoSink(name="test", writer=crud.create_many_crud, batch_size=10, max_buffer=100, max_retries=3, retry_backoff=0.01)
+    for index in range(5):
+        sink.put({"n": index})
+
+    # 首次写入 3 条后连接断开，整批放回重试
+    crud.collection.fail_after = 3
+    assert await sink.flush() == 0
+    assert len(crud.collection.documents) == 3
+
+    await asyncio.sleep(0.02)
+    # 重试时已写入的 3 条触发唯一索引冲突，计为成功
+    assert await sink.flush() == 5
+
+    stored = sorted(crud.collection.documents.values(), key=lambda document: document["id"])
+    assert [(document["id"], document["n"]) for document in stored] == [(1, 0), (2, 1), (3, 2), (4, 3), (5, 4)]
+    # id 只预留一次
+    assert db[OperationLogMongoCRUD.COUNTER_COLLECTION].documents[crud.collection.name]["seq"] == 5
+    assert not sink._buffer
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+"""按日/按月过滤编译为左闭右开区间后可使用复合索引"""
+
+from typing import Any, List, Tuple
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.base_crud import CRUDBase
+from app.core.database import async_engine
+from app.api.v1.module_system.auth.schema import AuthSchema
+from app.api.v1.module_system.log.model import OperationLogModel
+
+pytestmark = pytest.mark.anyio
+
+
+async def _query_plan(db: AsyncSession, auth: AuthSchema, search: dict) -> str:
+    """执行列表查询并返回其主查询的 EXPLAIN QUERY PLAN"""
+    captured: List[Tuple[str, Any]] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        captured.append((statement, parameters))
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        await CRUDBase(OperationLogModel, auth).list(search=search)
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+    statement, parameters = next(item for item in captured if "FROM system_log" in item[0])
+    conn = await db.connection()
+    rows = (await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)).all()
+    return "\n".join(row[-1] for row in rows)
+
+
+@pytest.mark.parametrize(
+    "search, index",
+    [
+        ({"type": 1, "created_at": ("date", "2024-02-29")}, "ix_system_log_type_created_at"),
+        ({"request_ip": "127.0.0.1", "created_at": ("month", "2024-12")}, "ix_system_log_request_ip_created_at"),
+        ({"response_code": 200, "created_at": ("date", "2024-12-31")}, "ix_system_log_response_code_created_at"),
+        ({"created_at": ("month", "2024-02")}, "ix_system_log_created_at"),
+    ],
+    ids=["type-date", "request-ip-month", "response-code-date", "month"],
+)
+async def test_period_filter_uses_index(db: AsyncSession, auth: AuthSchema, search: dict, index: str) -> None:
+    plan = await _query_plan(db, auth, search)
+
+    # 区间条件作为索引的范围约束，而不是对 date(created_at) 逐行计算后全表扫描
+    assert f"SEARCH system_log USING INDEX {index} (" in plan, plan
+    assert "created_at>? AND created_at<?)" in plan, plan
+    assert "SCAN system_log" not in plan, plan
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+
+"""批量删除与批量设置状态接口的语句数不随ID数量增长"""
+
+import itertools
+from typing import Any, Awaitable, Callable, List
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.common.enums import RedisInitKeyConfig
+from app.core.base_schema import BatchSetAvailable
+from app.core.exceptions import CustomException
+from app.api.v1.module_system.auth.schema import AuthSchema
+from app.api.v1.module_system.user.model import UserModel
+from app.api.v1.module_system.user.service import UserService
+from app.api.v1.module_system.role.model import RoleModel
+from app.api.v1.module_system.role.service import RoleService
+from app.api.v1.module_system.position.model import PositionModel
+from app.api.v1.module_system.position.service import PositionService
+from app.api.v1.module_system.dept.model import DeptModel
+from app.api.v1.module_system.dept.service import DeptService
+from app.api.v1.module_system.menu.model import MenuModel
+from app.api.v1.module_system.menu.service import MenuService
+from app.api.v1.module_system.dict.model import DictDataModel, DictTypeModel
+from app.api.v1.module_system.dict.service import DictDataService, DictTypeService
+from app.api.v1.module_system.notice.model import NoticeModel
+from app.api.v1.module_system.notice.service import NoticeService
+from app.api.v1.module_system.params.model import ParamsModel
+from app.api.v1.module_system.params.service import ParamsService
+
+pytestmark = pytest.mark.anyio
+
+_serial = itertools.count()
+
+
+class RecordingRedis:
+    """记录被删除缓存键的 Redis 替身"""
+
+    def __init__(self) -> None:
+        self.deleted: List[str] = []
+
+    async def delete(self, *keys: str) -> int:
+        self.deleted.extend(keys)
+        return len(keys)
+
+
+def _user(index: int) -> UserModel:
+    return UserModel(username=f"qc_user_{index}", password="x", name=f"qc_user_{index}", status=False)
+
+
+def _role(index: int) -> RoleModel:
+    return RoleModel(name=f"qc_role_{index}", code=f"qc_role_{index}")
+
+
+def _position(index: int) -> PositionModel:
+    return PositionModel(name=f"qc_position_{index}")
+
+
+def _dept(index: int) -> DeptModel:
+    return DeptModel(name=f"qc_dept_{index}", code=f"qc_dept_{index}")
+
+
+def _menu(index: int) -> MenuModel:
+    return MenuModel(name=f"qc_menu_{index}")
+
+
+def _dict_type(index: int) -> DictTypeModel:
+    return DictTypeModel(dict_name=f"qc_dict_{index}", dict_type=f"qc_dict_{index}")
+
+
+def _dict_data(index: int) -> DictDataModel:
+    return DictDataModel(dict_label=f"qc_label_{index}", dict_value=str(index), dict_type="qc_dict_data")
+
+
+def _notice(index: int) -> NoticeModel:
+    return NoticeModel(notice_title=f"qc_notice_{index}", notice_type="1")
+
+
+def _params(index: int) -> ParamsModel:
+    return ParamsModel(config_name=f"qc_param_{index}", config_key=f"qc_param_{index}", config_value="1", config_type=False)
+
+
+async def _seed(db: AsyncSession, factory: Callable[[int], Any], size: int) -> List[int]:
+    objs = [factory(next(_serial)) for _ in range(size)]
+    db.add_all(objs)
+    await db.flush()
+    return [obj.id for obj in objs]
+
+
+def _available(ids: List[int]) -> BatchSetAvailable:
+    return BatchSetAvailable(ids=ids, status=True)
+
+
+CASES = [
+    ("user-delete", _user, lambda auth, redis, ids: UserService.delete_user_service(auth=auth, ids=ids)),
+    ("user-available", _user, lambda auth, redis, ids: UserService.set_user_available_service(auth=auth, data=_available(ids))),
+    ("role-delete", _role, lambda auth, redis, ids: RoleService.delete_role_service(auth=auth, ids=ids)),
+    ("role-available", _role, lambda auth, redis, ids: RoleService.set_role_available_service(auth=auth, data=_available(ids))),
+    ("position-delete", _position, lambda auth, redis, ids: PositionService.delete_position_service(auth=auth, ids=ids)),
+    ("position-available", _position, lambda auth, redis, ids: PositionService.set_position_available_service(auth=auth, data=_available(ids))),
+    ("dept-delete", _dept, lambda auth, redis, ids: DeptService.delete_dept_service(auth=auth, ids=ids)),
+    ("dept-available", _dept, lambda auth, redis, ids: DeptService.batch_set_available_service(auth=auth, data=_available(ids))),
+    ("menu-delete", _menu, lambda auth, redis, ids: MenuService.delete_menu_service(auth=auth, ids=ids)),
+    ("menu-available", _menu, lambda auth, redis, ids: MenuService.set_menu_available_service(auth=auth, data=_available(ids))),
+    ("dict-type-delete", _dict_type, lambda auth, redis, ids: DictTypeService.delete_obj_service(auth=auth, redis=redis, ids=ids)),
+    ("dict-type-available", _dict_type, lambda auth, redis, ids: DictTypeService.set_obj_available_service(auth=auth, data=_available(ids))),
+    ("dict-data-delete", _dict_data, lambda auth, redis, ids: DictDataService.delete_obj_service(auth=auth, redis=redis, ids=ids)),
+    ("dict-data-available", _dict_data, lambda auth, redis, ids: DictDataService.set_obj_available_service(auth=auth, data=_available(ids))),
+    ("notice-delete", _notice, lambda auth, redis, ids: NoticeService.delete_notice_service(auth=auth, ids=ids)),
+    ("notice-available", _notice, lambda auth, redis, ids: NoticeService.set_notice_available_service(auth=auth, data=_available(ids))),
+    ("params-delete", _params, lambda auth, redis, ids: ParamsService.delete_obj_service(auth=auth, redis=redis, ids=ids)),
+]
+
+
+@pytest.mark.parametrize("factory, call", [case[1:] for case in CASES], ids=[case[0] for case in CASES])
+async def test_statement_count_is_constant(
+    db: AsyncSession,
+    auth: AuthSchema,
+    count_statements,
+    factory: Callable[[int], Any],
+    call: Callable[[AuthSchema, RecordingRedis, List[int]], Awaitable[None]],
+) -> None:
+    counts = []
+    for size in (1, 50):
+        ids = await _seed(db, factory, size)
+        with count_statements() as statements:
+            await call(auth, RecordingRedis(), ids)
+        counts.append(len(statements))
+        db.expunge_all()
+
+    assert counts[0] == counts[1], f"1 个ID执行 {counts[0]} 条语句，50 个ID执行 {counts[1]} 条语句"
+
+
+async def test_dict_type_delete_checks_data_by_dict_type(db: AsyncSession, auth: AuthSchema) -> None:
+    used, unused = await _seed(db, _dict_type, 2)
+    used_type = (await db.get(DictTypeModel, used)).dict_type
+    unused_type = (await db.get(DictTypeModel, unused)).dict_type
+    # 字典数据的主键与字典类型ID错开，确保检查依据的是字典类型编码
+    db.add(DictDataModel(id=unused + 1000, dict_label="qc", dict_value="1", dict_type=used_type))
+    await db.flush()
+    db.expunge_all()
+
+    with pytest.raises(CustomException, match="存在字典数据"):
+        await DictTypeService.delete_obj_service(auth=auth, redis=RecordingRedis(), ids=[used, unused])
+
+    redis = RecordingRedis()
+    await DictTypeService.delete_obj_service(auth=auth, redis=redis, ids=[unused])
+    assert redis.deleted == [f"{RedisInitKeyConfig.SYSTEM_DICT.key}:{unused_type}"]
+
+
+async def test_params_delete_does_not_reread_rows(db: AsyncSession, auth: AuthSchema, count_statements) -> None:
+    ids = await _seed(db, _params, 3)
+    keys = [f"{RedisInitKeyConfig.SYSTEM_CONFIG.key}:{(await db.get(ParamsModel, id)).config_key}" for id in ids]
+    db.expunge_all()
+
+    redis = RecordingRedis()
+    with count_statements() as statements:
+        await ParamsService.delete_obj_service(auth=auth, redis=redis, ids=ids)
+
+    # 删除之后不再查询参数表，缓存键取自删除前的一次查询
+    delete_index = next(index for index, sql in enumerate(statements) if sql.lstrip().upper().startswith("DELETE"))
+    assert not any("system_params" in sql and sql.lstrip().upper().startswith("SELECT") for sql in statements[delete_index + 1:])
+    assert sorted(redis.deleted) == sorted(keys)
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+"""读写分离：只读接口走副本、会话写入后读主库、副本不可用时回退主库(主库与副本为两个 SQLite 文件)"""
+
+import os
+import tempfile
+from typing import List
+
+import pytest
+from sqlalchemy import create_engine, delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.base_model import MappedBase
+from app.core.database import ReplicaRouter, session_connect
+from app.core.dependencies import AuthPermission, read_only_db_getter
+from app.api.v1.module_system.auth.schema import AuthSchema
+from app.api.v1.module_system.notice.model import NoticeModel
+
+pytestmark = pytest.mark.anyio
+
+
+def _notice(title: str) -> NoticeModel:
+    return NoticeModel(notice_title=title, notice_type="1")
+
+
+@pytest.fixture(scope="module")
+def replica_path() -> str:
+    """副本库：表结构与主库一致，仅包含一条副本公告"""
+    path = os.path.join(tempfile.mkdtemp(prefix="fastapiadmin-replica-"), "replica.db")
+    engine = create_engine(f"sqlite:///{path}")
+    MappedBase.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(NoticeModel.__table__.insert().values(notice_title="replica", notice_type="1", status=True))
+    engine.dispose()
+    return path
+
+
+@pytest.fixture
+async def primary_notice() -> None:
+    """主库写入一条主库公告"""
+    async with session_connect() as session:
+        async with session.begin():
+            session.add(_notice("primary"))
+    yield
+    async with session_connect() as session:
+        async with session.begin():
+            await session.execute(delete(NoticeModel))
+
+
+@pytest.fixture
+async def replica(monkeypatch: pytest.MonkeyPatch, replica_path: str):
+    """登记副本引擎，用例结束后移除"""
+    monkeypatch.setattr(ReplicaRouter, "engines", [])
+    monkeypatch.setattr(ReplicaRouter, "_down_until", {})
+
+    async def register(url: str):
+        engine = ReplicaRouter.register(url)
+        engines.append(engine)
+        return engine
+
+    engines = []
+    yield register
+    for engine in engines:
+        await engine.dispose()
+
+
+async def _titles(session: AsyncSession) -> List[str]:
+    return list((await session.execute(select(NoticeModel.notice_title).order_by(NoticeModel.id))).scalars())
+
+
+async def test_read_only_dependency_reads_replica(primary_notice, replica, replica_path: str) -> None:
+    await replica(f"sqlite+aiosqlite:///{replica_path}")
+
+    # 只读会话依赖
+    getter = read_only_db_getter()
+    session = await getter.__anext__()
+    assert await _titles(session) == ["replica"]
+    await getter.aclose()
+
+    # 只读权限依赖
+    async with session_connect() as session:
+        auth = await AuthPermission(read_only=True)(auth=AuthSchema(db=session))
+        assert await _titles(auth.db) == ["replica"]
+
+    # 普通会话始终读主库
+    async with session_connect() as session:
+        assert await _titles(session) == ["primary"]
+
+
+async def test_reads_after_write_use_primary(primary_notice, replica, replica_path: str) -> None:
+    await replica(f"sqlite+aiosqlite:///{replica_path}")
+
+    getter = read_only_db_getter()
+    session = await getter.__anext__()
+    assert await _titles(session) == ["replica"]
+
+    session.add(_notice("written"))
+    await session.flush()
+    # 写入后本会话读主库，能读到未提交的写入
+    assert await _titles(session) == ["primary", "written"]
+    await session.rollback()
+    await getter.aclose()
+
+
+async def test_unreachable_replica_falls_back_to_primary(primary_notice, replica) -> None:
+    missing = os.path.join(tempfile.mkdtemp(prefix="fastapiadmin-replica-"), "missing", "replica.db")
+    engine = await replica(f"sqlite+aiosqlite:///{missing}")
+
+    getter = read_only_db_getter()
+    session = await getter.__anext__()
+    assert await _titles(session) == ["primary"]
+    await getter.aclose()
+
+    # 副本在重试间隔内不再被选择
+    assert ReplicaRouter.choose() is None
+    assert engine.sync_engine in ReplicaRouter._down_until
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+"""定时任务主节点：接管失败释放租约、接管期间的命令不丢失、后端接口完整性"""
+
+import asyncio
+import json
+from typing import List, Tuple
+
+import pytest
+
+from app.core.ap_scheduler import SchedulerUtil, scheduler
+from app.core.scheduler_leader import LeaderBackend, LocalLeaderBackend, SchedulerLeader
+from app.config.setting import settings
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def leader(monkeypatch: pytest.MonkeyPatch):
+    """使用进程内选举后端，用例结束后停止调度"""
+    monkeypatch.setattr(settings, "SCHEDULER_LEADER_BACKEND", "local")
+    # 每个用例运行在新的事件循环上，调度器首次启动时绑定的循环已关闭
+    monkeypatch.setattr(scheduler, "_eventloop", asyncio.get_running_loop())
+    yield SchedulerLeader
+    await SchedulerLeader.stop()
+
+
+async def test_lease_released_when_load_fails(leader, monkeypatch: pytest.MonkeyPatch) -> None:
+    async def load_jobs() -> int:
+        raise RuntimeError("database unavailable")
+
+    monkeypatch.setattr(SchedulerUtil, "load_jobs", load_jobs)
+
+    await leader.start()
+
+    assert not leader.is_leader()
+    assert leader._listen_task is None
+    # 租约已释放，其他节点可以立即接管
+    other = LocalLeaderBackend()
+    assert await other.acquire("other-node", settings.SCHEDULER_LEADER_TTL)
+    await other.release("other-node")
+
+
+async def test_command_during_load_is_applied(leader, monkeypatch: pytest.MonkeyPatch) -> None:
+    applied: List[Tuple[str, object, bool]] = []
+
+    async def load_jobs() -> int:
+        # 加载任务期间其他进程发布了命令
+        await LocalLeaderBackend().publish(json.dumps({"action": "pause", "job_id": 7, "node": "other-node"}))
+        await asyncio.sleep(0)
+        return 0
+
+    async def apply(action: str, job_id=None, job_info=None) -> None:
+        applied.append((action, job_id, leader.is_leader()))
+
+    monkeypatch.setattr(SchedulerUtil, "load_jobs", load_jobs)
+    monkeypatch.setattr(SchedulerLeader, "_apply", apply)
+
+    await leader.start()
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+    assert leader.is_leader()
+    # 命令在任务加载完成、成为主节点后才应用
+    assert applied == [("pause", 7, True)]
+
+
+def test_incomplete_backend_fails_on_construction() -> None:
+    class IncompleteBackend(LeaderBackend):
+        async def acquire(self, token: str, ttl: int) -> bool:
+            return True
+
+    with pytest.raises(TypeError):
+        IncompleteBackend()
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+
+"""已有数据库升级：启动时由 TextSearch.ensure 补建全文检索索引"""
+
+import os
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+from app.core.base_model import MappedBase
+from app.core.text_search import TextSearch
+
+pytestmark = pytest.mark.skipif(not TextSearch.SQLITE_TRIGRAM, reason="SQLite 不支持 FTS5 trigram")
+
+
+def test_ensure_adds_missing_index_and_backfills(tmp_path) -> None:
+    engine = create_engine(f"sqlite:///{os.path.join(tmp_path, 'legacy.db')}")
+    try:
+        with engine.begin() as conn:
+            MappedBase.metadata.create_all(conn)
+            # 模拟加入检索索引之前的库：只有数据表与已有数据
+            for table_name, columns in TextSearch._registry.items():
+                for statement in TextSearch.drop_statements(table_name, columns, "sqlite"):
+                    conn.execute(text(statement))
+            conn.execute(text("INSERT INTO system_notice (notice_title, notice_type, status, created_at, updated_at) "
+                              "VALUES ('系统升级公告', '1', 1, '2024-01-01', '2024-01-01')"))
+        assert TextSearch.fts_table("system_notice") not in inspect(engine).get_table_names()
+
+        with engine.begin() as conn:
+            TextSearch.ensure(conn)
+            # 再次调用不重复创建
+            TextSearch.ensure(conn)
+
+        tables = set(inspect(engine).get_table_names())
+        assert {TextSearch.fts_table(table_name) for table_name in TextSearch._registry} <= tables
+        with engine.connect() as conn:
+            # 已有数据写入索引，新数据由触发器同步
+            conn.execute(text("INSERT INTO system_notice (notice_title, notice_type, status, created_at, updated_at) "
+                              "VALUES ('维护通知', '1', 1, '2024-01-02', '2024-01-02')"))
+            fts = TextSearch.fts_table("system_notice")
+            matched = conn.execute(text(f"SELECT rowid FROM {fts} WHERE {fts} MATCH :q"), {"q": 'notice_title : "升级公"'}).all()
+            assert len(matched) == 1
+            matched = conn.execute(text(f"SELECT rowid FROM {fts} WHERE {fts} MATCH :q"), {"q": 'notice_title : "维护通"'}).all()
+            assert len(matched) == 1
+    finally:
+        engine.dispose()
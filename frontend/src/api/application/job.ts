@@ -74,6 +74,23 @@ const JobAPI = {
     });
   },
 
+  // 预览触发器的后 N 次执行时间
+  previewJob(params: JobPreviewQuery) {
+    return request<ApiResponse<string[]>>({
+      url: `${API_PATH}/preview`,
+      method: "get",
+      params,
+    });
+  },
+
+  // 获取调度执行器与任务运行指标
+  getJobMetrics() {
+    return request<ApiResponse<JobMetrics>>({
+      url: `${API_PATH}/metrics`,
+      method: "get",
+    });
+  },
+
   // 获取定时任务日志详情
   getJobLogDetail(id: number) {
     return request<ApiResponse<JobLogDetail>>({
@@ -160,6 +177,7 @@ export interface JobTable {
   max_instances?: number;
   jobstore?: string;
   executor?: string;
+  timeout?: number;
   trigger_args?: string;
   start_date?: string;
   end_date?: string;
@@ -168,6 +186,18 @@ export interface JobTable {
   created_at?: string;
   updated_at?: string;
   creator?: creatorType;
+  stats?: JobStats;
+}
+
+// 定时任务执行统计（耗时单位：毫秒）
+export interface JobStats {
+  last_run_time?: string;
+  last_status?: boolean;
+  last_duration?: number;
+  success_count: number;
+  failure_count: number;
+  p50_duration?: number;
+  p95_duration?: number;
 }
 
 export interface JobForm {
@@ -181,6 +211,7 @@ export interface JobForm {
   max_instances?: number;
   jobstore?: string;
   executor?: string;
+  timeout?: number;
   trigger_args?: string;
   start_date?: string;
   end_date?: string;
@@ -188,6 +219,40 @@ export interface JobForm {
   description?: string;
 }
 
+export interface JobPreviewQuery {
+  trigger: string;
+  trigger_args: string;
+  start_date?: string;
+  end_date?: string;
+  count?: number;
+}
+
+// 执行器运行指标（耗时单位：毫秒）
+export interface JobExecutorMetrics {
+  max_workers?: number;
+  running: number;
+  queued: number;
+  completed: number;
+  failed: number;
+  timeouts: number;
+  avg_duration?: number;
+  max_duration?: number;
+}
+
+// 单个任务运行指标
+export interface JobRunMetrics {
+  running: number;
+  missed: number;
+  max_instances: number;
+  timeouts: number;
+}
+
+export interface JobMetrics {
+  node: { is_leader: boolean; node: string; backend: string };
+  executors: Record<string, JobExecutorMetrics>;
+  jobs: Record<string, JobRunMetrics>;
+}
+
 // 定时任务运行日志接口（对应Scheduler实时状态）
 export interface JobRunLog {
   id: string;
@@ -78,6 +78,17 @@ export const ResourceAPI = {
     });
   },
 
+  /**
+   * 获取后台任务进度（复制/移动/删除目录）
+   * @param taskId 任务ID
+   */
+  getTaskProgress(taskId: string) {
+    return request<ApiResponse<ResourceTask>>({
+      url: `${API_PATH}/task/${taskId}`,
+      method: "get",
+    });
+  },
+
   /**
    * 重命名文件或目录
    * @param body 重命名参数
@@ -230,6 +241,30 @@ export interface ResourceCopyQuery {
   overwrite?: boolean;
 }
 
+/**
+ * 后台文件任务
+ */
+export interface ResourceTask {
+  /** 任务ID */
+  task_id: string;
+  /** 操作类型 */
+  action: "copy" | "move" | "delete";
+  /** 任务状态 */
+  status: "pending" | "running" | "success" | "failed";
+  /** 待处理文件总数 */
+  total?: number | null;
+  /** 已处理文件数 */
+  done: number;
+  /** 进度百分比 */
+  percent: number;
+  /** 错误信息 */
+  error?: string | null;
+  /** 创建时间 */
+  created_time: string;
+  /** 结束时间 */
+  finished_time?: string | null;
+}
+
 /**
  * 资源重命名参数
  */
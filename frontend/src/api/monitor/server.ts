@@ -58,10 +58,21 @@ export interface SysFile {
   usage: number;
 }
 
+// 验证码预生成池统计（当前进程）
+export interface CaptchaPool {
+  enabled: boolean;
+  capacity: number;
+  size: number;
+  hits: number;
+  misses: number;
+  hit_rate: number;
+}
+
 export interface ServerInfo {
   cpu: Cpu;
   mem: Memory;
   sys: System;
   py: Python;
   disks: SysFile[];
+  captcha?: CaptchaPool;
 }